@@ -10,11 +10,13 @@ from modules.utils.db import DBConnect
 from modules.auth.api import auth_blueprint
 from modules.ocp.api import ocp_blueprint
 from modules.summarizer.api import summarizer_blueprint
-from modules.merch.api import merch_blueprint
+from modules.merch.api import merch_blueprint, inventory_service as merch_inventory_service
+from modules.merch.inventory import HOLD_SWEEP_INTERVAL_SECONDS
 from modules.bot.api import game_blueprint
 from modules.calendar.api import calendar_blueprint
 from modules.organizations.api import organizations_blueprint
 from modules.superadmin.api import superadmin_blueprint
+from modules.sync.api import sync_blueprint
 from modules.merch.api import merch_blueprint
 # Removed all view blueprint imports - keeping only API blueprints
 
@@ -36,6 +38,8 @@ app.multi_org_calendar_service = multi_org_calendar_service
 # Instantiate and attach UnifiedSyncService after app is defined
 unified_sync_service = UnifiedSyncService(logger)
 app.unified_sync_service = unified_sync_service
+# Persisted sync runs; shares the unified service's calendar and OCP services
+app.sync_job_service = unified_sync_service.job_service
 
 # Health endpoint
 @app.route('/health')
@@ -54,6 +58,7 @@ app.register_blueprint(ocp_blueprint, url_prefix="/api/ocp")
 app.register_blueprint(organizations_blueprint, url_prefix="/api/organizations")
 app.register_blueprint(superadmin_blueprint, url_prefix="/api/superadmin")
 app.register_blueprint(merch_blueprint, url_prefix="/api/merch")
+app.register_blueprint(sync_blueprint, url_prefix="/api/sync")
 # # Configure static file serving
 # @app.route('/', defaults={'path': ''})
 # @app.route('/<path:path>')
@@ -71,23 +76,26 @@ def unified_sync_job():
     with app.app_context():
         logger.info("Running scheduled unified Notion sync (Calendar + OCP)...")
         try:
-            # Use the unified sync service to run both syncs
-            logger.info("Starting unified sync: calling unified_sync_service.sync_notion_to_all()")
-            sync_result = unified_sync_service.sync_notion_to_all()
-            logger.info(f"Unified sync result: {sync_result}")
-            # Log OCP sync details if present
-            ocp_details = sync_result.get('ocp', sync_result.get('details', None))
-            if ocp_details:
-                logger.info(f"OCP sync details: {ocp_details}")
+            # Finish runs cut short by a restart before starting a new one
+            app.sync_job_service.resume_interrupted_runs()
+            sync_result = app.sync_job_service.run(trigger="scheduled")
+            summary = sync_result.get("run", {}).get("summary", {})
             if sync_result.get("status") == "success":
-                logger.info(f"Scheduled unified sync completed successfully: {sync_result.get('message')}")
-            elif sync_result.get("status") == "warning":
-                logger.warning(f"Scheduled unified sync completed with warnings: {sync_result.get('message')}")
+                logger.info(f"Scheduled unified sync completed successfully: {summary}")
+            elif sync_result.get("status") == "partial_success":
+                logger.warning(f"Scheduled unified sync completed with failures: {summary}")
             else:
-                logger.error(f"Scheduled unified sync failed: {sync_result.get('message')}")
+                logger.error(f"Scheduled unified sync failed: {sync_result.get('message') or summary}")
         except Exception as e:
             logger.error(f"Error during scheduled unified sync: {e}", exc_info=True)
 
+def merch_hold_sweep_job():
+    """Job function to return the stock of expired merch checkout holds."""
+    try:
+        merch_inventory_service.sweep_expired_holds()
+    except Exception as e:
+        logger.error(f"Error during merch stock hold sweep: {e}", exc_info=True)
+
 # --- Bot Thread Functions ---
 def run_summarizer_bot_in_thread():
     loop = asyncio.new_event_loop()
@@ -153,10 +161,18 @@ def initialize_app():
     auth_thread.start()
     logger.info("Auth bot thread initiated")
 
-    # Run sync job every 60 minutes
-    scheduler.add_job(unified_sync_job, 'interval', minutes=120, id='unified_notion_sync_job')
+    # Run the full sync on an interval; targeted page syncs arrive through the Notion webhook.
+    # With SYNC_IN_PROCESS=false the schedule is owned by sync_worker.py instead.
+    if config.SYNC_IN_PROCESS:
+        scheduler.add_job(unified_sync_job, 'interval', minutes=config.NOTION_SYNC_INTERVAL_MINUTES, id='unified_notion_sync_job')
+        logger.info("APScheduler job added for Notion-Google Calendar sync.")
+    else:
+        logger.info("In-process sync scheduler disabled; expecting sync_worker.py to run syncs.")
+    # Merch checkout holds are created by this process, so it also returns their stock when they expire
+    scheduler.add_job(merch_hold_sweep_job, 'interval', seconds=HOLD_SWEEP_INTERVAL_SECONDS, id='merch_hold_sweep_job',
+                      max_instances=1, coalesce=True)
     scheduler.start()
-    logger.info("APScheduler started for Notion-Google Calendar sync.")
+    logger.info("APScheduler started.")
 
     # Start Flask app
     # Enable debug and reloader based on IS_PROD environment variable
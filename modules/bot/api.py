@@ -1,6 +1,16 @@
+import concurrent.futures
+import threading
+from typing import Dict, Optional, Tuple
+
 from flask import jsonify, request, Blueprint, current_app
 from modules.utils.logging_config import get_logger
 from shared import db_connect as db
+from modules.bot.discord_modules.dispatcher import BotBusy, BotCallTimeout, BotDispatchError
+from modules.bot.discord_modules.cogs.GameCog import GameCogUnavailable, NoGameSession
+from modules.bot.game_library import GameLibrary, is_valid_game_json
+from modules.bot.models import JeopardyGame as JeopardyGameRecord
+from modules.organizations.models import Organization
+from sqlalchemy.schema import CreateIndex
 import json
 
 # Get module logger
@@ -12,8 +22,131 @@ game_blueprint = Blueprint("game", __name__, template_folder=None, static_folder
 # Let's assume for now these endpoints manage a conceptual bot state if needed by frontend,
 # but actual bot lifecycle is managed in main.py threads.
 
+game_library = GameLibrary(db)
+
+# Indexes added after the tables were first created are not picked up by create_all.
+# checkfirst cannot see expression indexes on SQLite, so let the database skip existing ones.
+with db.engine.begin() as connection:
+    for index in JeopardyGameRecord.__table__.indexes:
+        connection.execute(CreateIndex(index, if_not_exists=True))
+
 logger.info("Bot API module initialized (game_blueprint)")
 
+
+def get_ready_bot(endpoint):
+    """Return (bot, None) when the auth bot is ready, otherwise (None, error_response)."""
+    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
+    if not bot or not bot.is_ready():
+        logger.warning(f"Auth bot not ready or not available for {endpoint}")
+        return None, (jsonify({"error": "Auth bot is not available or not ready."}), 503)
+    return bot, None
+
+
+def get_org_guild_id(org_prefix):
+    """
+    Return (guild_id, None) for the Discord server of the organization with this prefix,
+    otherwise (None, error_response). Routes without a prefix get (None, None), which plays in the
+    bot's first server.
+    """
+    if org_prefix is None:
+        return None, None
+    session = db.SessionLocal()
+    try:
+        organization = session.query(Organization).filter_by(prefix=org_prefix, is_active=True).first()
+    finally:
+        session.close()
+    if not organization:
+        return None, (jsonify({"error": "Organization not found"}), 404)
+    return int(organization.guild_id), None
+
+
+def call_game_session(bot, guild_id, method_name, *args, **kwargs):
+    """
+    Run a method of a server's game session on the bot's event loop and wait for its result.
+
+    The sessions and their Discord objects belong to the bot thread, so every call from a request
+    handler goes through the bot's dispatcher and GameCog.run, which serializes calls per server.
+    Raises NoGameSession when the server has no game and GameCogUnavailable when the cog or method
+    does not exist. Errors raised by the method itself propagate unchanged.
+    """
+    cog = bot.get_cog("GameCog")
+    if cog is None:
+        raise GameCogUnavailable("GameCog not found on auth_bot")
+    return bot.dispatcher.run(cog.run, guild_id, method_name, *args, **kwargs)
+
+
+class GameCallInProgress(Exception):
+    """Raised when a background game call is submitted while the same call is still running."""
+
+
+# Setup and teardown run in the background and report their progress; this only stops a stuck call
+BACKGROUND_CALL_TIMEOUT = 30 * 60
+# Latest background call of each (guild_id, method) pair; guild_id None is the bot's first server
+_background_calls: Dict[Tuple[Optional[int], str], concurrent.futures.Future] = {}
+_background_lock = threading.Lock()
+
+
+def submit_game_session(bot, guild_id, method_name):
+    """
+    Start a long method of a server's game session on the bot's event loop without waiting for it.
+
+    Checks the server has a game first (raising NoGameSession / GameCogUnavailable like
+    call_game_session) and raises GameCallInProgress if the same call is still running.
+    Progress is reported by the session's get_progress and background_call_report.
+    """
+    cog = bot.get_cog("GameCog")
+    if cog is None:
+        raise GameCogUnavailable("GameCog not found on auth_bot")
+    bot.dispatcher.run(cog.run, guild_id, "is_setup")
+
+    key = (guild_id, method_name)
+    with _background_lock:
+        running = _background_calls.get(key)
+        if running is not None and not running.done():
+            raise GameCallInProgress(f"{method_name} is already running for this server")
+        future = bot.dispatcher.submit(cog.run, guild_id, method_name, timeout=BACKGROUND_CALL_TIMEOUT)
+        _background_calls[key] = future
+
+    def log_failure(done):
+        if done.cancelled():
+            logger.error(f"Background {method_name} for guild {guild_id} was cancelled")
+        elif done.exception() is not None:
+            logger.error(f"Background {method_name} for guild {guild_id} failed: {done.exception()}",
+                         exc_info=done.exception())
+    future.add_done_callback(log_failure)
+    return future
+
+
+def background_call_report(guild_id):
+    """Status ("running", "done", "failed") and error of the latest background calls of a server."""
+    with _background_lock:
+        calls = {method_name: future for (call_guild_id, method_name), future in _background_calls.items()
+                 if call_guild_id == guild_id}
+    report = {}
+    for method_name, future in calls.items():
+        if not future.done():
+            report[method_name] = {"status": "running"}
+        elif future.cancelled():
+            report[method_name] = {"status": "failed", "error": "Cancelled"}
+        elif future.exception() is not None:
+            report[method_name] = {"status": "failed", "error": str(future.exception())}
+        else:
+            report[method_name] = {"status": "done"}
+    return report
+
+
+def dispatch_error_response(error):
+    """HTTP response for a call the bot could not run in time (or at all)."""
+    if isinstance(error, BotCallTimeout):
+        logger.error(f"Bot call timed out: {error}")
+        return jsonify({"error": "The bot did not respond in time"}), 504
+    if isinstance(error, BotBusy):
+        logger.warning(f"Bot call rejected: {error}")
+        return jsonify({"error": "The bot is busy, try again shortly"}), 503
+    logger.warning(f"Bot call failed: {error}")
+    return jsonify({"error": "Auth bot is not available or not ready."}), 503
+
+
 @game_blueprint.route("/", methods=["GET"])
 def game_index():
     logger.debug("Game API index endpoint called")
@@ -46,17 +179,7 @@ def game_index():
 def get_available_games():
     logger.info("Getting available games")
     try:
-        games = db.get_all_games()
-        game_data = []
-        for game in games:
-            game_ = game["game"]
-            game_data.append(
-                {
-                    "name": game_["name"],
-                    "description": game_["description"],
-                    "uuid": game_["uuid"],
-                }
-            )
+        game_data = game_library.list_games()
         logger.debug(f"Retrieved {len(game_data)} games")
         return jsonify(game_data), 200
     except Exception as e:
@@ -69,9 +192,14 @@ def get_game_data():
     file_name = request.args.get("file_name")
     logger.info(f"Getting game data for file: {file_name}")
     try:
-        with open(f"./data/{file_name}.json") as f:
-            game_data = json.load(f)
+        # Uploaded games are served from the library; files are parsed once per change
+        game_data = game_library.get_package(name=file_name)
+        if game_data is None:
+            game_data = game_library.load_file(file_name)
         return jsonify(game_data)
+    except FileNotFoundError:
+        logger.warning(f"Game data not found: {file_name}")
+        return jsonify({"error": "Game not found"}), 404
     except Exception as e:
         logger.error(f"Error retrieving game data: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
@@ -82,7 +210,9 @@ def start_game():
     game_name = request.form["name"]
     logger.info(f"Starting game: {game_name}")
     try:
-        game_data = db.get_game(game_name)
+        game_data = game_library.get_package(name=game_name)
+        if game_data is None:
+            return jsonify({"error": "Game not found"}), 404
         # Implement game start logic here
         return jsonify({"message": f"Game {game_name} started", "status": "success"}), 200
     except Exception as e:
@@ -101,23 +231,6 @@ def stop_game():
         return jsonify({"error": str(e)}), 400
 
 
-def is_valid_game_json(data):
-    if "game" not in data or "questions" not in data:
-        return False
-    game_info = data["game"]
-    required_game_keys = {
-        "name", "description", "players", "categories", "per_category", "teams", "uuid",
-    }
-    if not all(key in game_info for key in required_game_keys):
-        return False
-    for category, questions in data["questions"].items():
-        for question in questions:
-            required_question_keys = {"question", "answer", "value", "uuid"}
-            if not all(key in question for key in required_question_keys):
-                return False
-    return True
-
-
 @game_blueprint.route("/uploadgame", methods=["POST"])
 def upload_game():
     if "file" not in request.files:
@@ -136,13 +249,16 @@ def upload_game():
             logger.warning("Invalid game JSON format")
             return jsonify({"error": "Invalid game JSON format"}), 400
         
-        db.add_or_update_game(game_data)
+        game_library.add_or_update(game_data)
         logger.info(f"Game {game_data['game']['name']} uploaded successfully")
         return jsonify({"message": "File uploaded and validated successfully"}), 200
 
     except json.JSONDecodeError:
         logger.error("Invalid JSON in uploaded file", exc_info=True)
         return jsonify({"error": "Invalid JSON"}), 400
+    except ValueError as e:
+        logger.warning(f"Invalid game package: {str(e)}")
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Error uploading game: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
@@ -153,13 +269,9 @@ def get_game():
     name = request.args.get("name")
     logger.info(f"Getting game data for: {name}")
     try:
-        games = db.get_all_games()
-        data = {}
-        for game_doc in games: # renamed to avoid conflict with blueprint name
-            if game_doc["game"]["name"] == name:
-                data["info"] = game_doc["game"]
-                data["questions"] = game_doc["questions"]
-                return jsonify(data), 200
+        game_doc = game_library.get_package(name=name, uuid=request.args.get("uuid"))
+        if game_doc is not None:
+            return jsonify({"info": game_doc["game"], "questions": game_doc["questions"]}), 200
         logger.warning(f"Game not found: {name}")
         return jsonify({"error": "Game not found"}), 404
     except Exception as e:
@@ -168,11 +280,14 @@ def get_game():
 
 
 @game_blueprint.route("/setactivegame", methods=["POST"])
-async def set_active_game():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /setactivegame")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/setactivegame", methods=["POST"])
+def set_active_game(org_prefix=None):
+    bot, error_response = get_ready_bot("/setactivegame")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
     
     name = request.args.get("name")
     date = request.args.get("date")
@@ -180,220 +295,305 @@ async def set_active_game():
     logger.info(f"Setting active game: {name} for date: {date}, time: {time}")
     
     try:
-        games = db.get_all_games()
-        game_to_set = None
-        for g in games:
-            if g["game"]["name"] == name:
-                game_to_set = {"game": g["game"], "questions": g["questions"]}
-                break
+        game_to_set = game_library.new_game(name=name, uuid=request.args.get("uuid"))
         
         if game_to_set:
-            cog = bot.get_cog("GameCog")
-            if cog:
-                cog.set_game(game_to_set, date, time)
-                logger.info(f"Active game set successfully: {name}")
-                return jsonify({"message": "Active game set successfully"}), 200
-            else:
-                logger.error("GameCog not found on auth_bot")
-                return jsonify({"error": "GameCog not found"}), 500
+            call_game_session(bot, guild_id, "set_game", game_to_set, date, time)
+            logger.info(f"Active game set successfully: {name}")
+            return jsonify({"message": "Active game set successfully"}), 200
         else:
             logger.warning(f"Game not found for setactivegame: {name}")
             return jsonify({"error": "Game not found"}), 404
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error setting active game {name}: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/getactivegame", methods=["GET"])
-async def get_active_game():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /getactivegame")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/getactivegame", methods=["GET"])
+def get_active_game(org_prefix=None):
+    bot, error_response = get_ready_bot("/getactivegame")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
         
     logger.info("Getting active game state from auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog:
-            game_data = cog.get_game()
-            if game_data not in [None, ""]:
-                return jsonify(game_data), 200
-            else:
-                logger.info("No active game set in GameCog")
-                return jsonify({"error": "No active game set"}), 404
+        game_data = call_game_session(bot, guild_id, "get_game")
+        if game_data not in [None, ""]:
+            return jsonify(game_data), 200
         else:
-            logger.error("GameCog not found on auth_bot")
-            return jsonify({"error": "GameCog not found"}), 500
+            logger.info("No active game set in GameCog")
+            return jsonify({"error": "No active game set"}), 404
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error retrieving active game: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/cleanactivegame", methods=["POST"])
-async def clean_active_game():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /cleanactivegame")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/cleanactivegame", methods=["POST"])
+def clean_active_game(org_prefix=None):
+    bot, error_response = get_ready_bot("/cleanactivegame")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
 
     logger.info("Cleaning active game via auth_bot")
     try:
-        # Assuming `clean_game` might be a direct method on the bot or a cog method
-        # If it's a cog method, need to get cog first.
-        # For now, assuming it's a method on a cog or bot that `execute` can handle if it were there.
-        # Let's assume it is on GameCog for consistency
-        cog = bot.get_cog("GameCog")
-        if cog and hasattr(cog, 'clear_game'): # clear_game seems more appropriate based on GameCog.py
-            await cog.clear_game()
-            logger.info("Active game cleaned successfully via GameCog")
-            return jsonify({"message": "Active game cleaned successfully"}), 200
-        elif hasattr(bot, 'clean_game'): # Fallback if it was a direct bot method
-             await bot.clean_game() # This method does not exist on discord.Bot by default
-             logger.info("Active game cleaned successfully via bot.clean_game()")
-             return jsonify({"message": "Active game cleaned successfully"}), 200
-        else:
-            logger.error("clean_game method or GameCog not found on auth_bot")
-            return jsonify({"error": "Functionality not found"}), 500
+        # Tearing down channels and roles takes many Discord calls; poll /getactivegameprogress
+        submit_game_session(bot, guild_id, "clear_game")
+        logger.info("Active game cleanup started via GameCog")
+        return jsonify({"message": "Active game cleanup started"}), 202
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except GameCallInProgress as e:
+        return jsonify({"error": str(e)}), 409
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "Functionality not found"}), 500
     except Exception as e:
         logger.error(f"Error cleaning active game: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/getactivegamestate", methods=["GET"])
-def get_active_game_state():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /getactivegamestate")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/getactivegamestate", methods=["GET"])
+def get_active_game_state(org_prefix=None):
+    bot, error_response = get_ready_bot("/getactivegamestate")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
         
     logger.info("Getting active game state from auth_bot")
     try:
-        # Accessing bot.active_game directly is not safe if it's not a public/stable API of your BotFork or GameCog
-        # Prefer using a method from the cog if possible
-        cog = bot.get_cog("GameCog")
-        if cog and hasattr(cog, 'game') and cog.game is not None and hasattr(cog.game, 'get_state'):
-            state = cog.game.get_state()
+        state = call_game_session(bot, guild_id, "get_state")
+        if state is not None:
             return jsonify(state), 200
-        # Fallback for direct access if `active_game` was a custom attribute on your bot instance
-        elif hasattr(bot, 'active_game') and bot.active_game not in [None, ""]:
-             return jsonify(bot.active_game.get_state()), 200
         else:
-            logger.info("No active game or state found in GameCog or bot")
+            logger.info("No active game or state found in GameCog")
             return jsonify({"error": "No active game set or state unavailable"}), 404
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error retrieving active game state: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
+@game_blueprint.route("/getactivegameprogress", methods=["GET"])
+@game_blueprint.route("/<string:org_prefix>/getactivegameprogress", methods=["GET"])
+def get_active_game_progress(org_prefix=None):
+    bot, error_response = get_ready_bot("/getactivegameprogress")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
+
+    try:
+        # Served while a long setup or cleanup call is still running
+        progress = call_game_session(bot, guild_id, "get_progress")
+        return jsonify({**progress, "background": background_call_report(guild_id)}), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        # A finished cleanup drops the session; its outcome is still reported
+        background = background_call_report(guild_id)
+        if background:
+            return jsonify({"background": background}), 200
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
+    except Exception as e:
+        logger.error(f"Error retrieving game setup progress: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 400
+
+
+@game_blueprint.route("/activesessions", methods=["GET"])
+def get_active_sessions():
+    bot, error_response = get_ready_bot("/activesessions")
+    if error_response:
+        return error_response
+
+    try:
+        cog = bot.get_cog("GameCog")
+        if cog is None:
+            raise GameCogUnavailable("GameCog not found on auth_bot")
+        return jsonify(bot.dispatcher.run(cog.sessions_report)), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
+    except Exception as e:
+        logger.error(f"Error listing game sessions: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 400
+
+
 @game_blueprint.route("/startactivegame", methods=["POST"])
-async def start_active_game():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /startactivegame")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/startactivegame", methods=["POST"])
+def start_active_game(org_prefix=None):
+    bot, error_response = get_ready_bot("/startactivegame")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
 
     logger.info("Starting active game via auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog:
-            await cog.start_game()
-            logger.info("Active game started successfully via GameCog")
-            return jsonify({"message": "Active game started successfully"}), 200
-        else:
-            logger.error("GameCog not found on auth_bot")
-            return jsonify({"error": "GameCog not found"}), 500
+        # Assigning team roles takes a Discord call per member; poll /getactivegameprogress
+        submit_game_session(bot, guild_id, "start_game")
+        logger.info("Active game start submitted via GameCog")
+        return jsonify({"message": "Active game is starting"}), 202
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except GameCallInProgress as e:
+        return jsonify({"error": str(e)}), 409
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error starting active game: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/endactivegame", methods=["POST"])
-async def end_active_game(): # Changed to async to align with potential async cog methods
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /endactivegame")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/endactivegame", methods=["POST"])
+def end_active_game(org_prefix=None):
+    bot, error_response = get_ready_bot("/endactivegame")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
 
     logger.info("Ending active game via auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog and hasattr(cog, 'end_game'): # end_game is in GameCog.py
-            await cog.end_game()
-            logger.info("Active game ended successfully via GameCog")
-            return jsonify({"message": "Active game ended successfully"}), 200
-        else:
-            logger.error("end_game method or GameCog not found on auth_bot")
-            return jsonify({"error": "Functionality not found"}), 500
+        call_game_session(bot, guild_id, "end_game")
+        logger.info("Active game ended successfully via GameCog")
+        return jsonify({"message": "Active game ended successfully"}), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "Functionality not found"}), 500
     except Exception as e:
         logger.error(f"Error ending active game: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/revealquestion", methods=["POST"])
-async def reveal_question(): # Changed to async
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /revealquestion")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/revealquestion", methods=["POST"])
+def reveal_question(org_prefix=None):
+    bot, error_response = get_ready_bot("/revealquestion")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
         
     uuid = request.args.get("uuid")
     logger.info(f"Revealing question with UUID: {uuid} via auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog:
-            await cog.show_question(uuid) # show_question is async in GameCog
-            logger.info(f"Question {uuid} revealed successfully via GameCog")
-            return jsonify({"message": "Question revealed successfully"}), 200
-        else:
-            logger.error("GameCog not found on auth_bot")
-            return jsonify({"error": "GameCog not found"}), 500
+        call_game_session(bot, guild_id, "show_question", uuid)
+        logger.info(f"Question {uuid} revealed successfully via GameCog")
+        return jsonify({"message": "Question revealed successfully"}), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error revealing question {uuid}: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/revealanswer", methods=["POST"])
-async def reveal_answer():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /revealanswer")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/revealanswer", methods=["POST"])
+def reveal_answer(org_prefix=None):
+    bot, error_response = get_ready_bot("/revealanswer")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
         
     uuid = request.args.get("uuid")
     logger.info(f"Revealing answer for question UUID: {uuid} via auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog:
-            await cog.show_answer(uuid)
-            logger.info(f"Answer for question {uuid} revealed successfully via GameCog")
-            return jsonify({"message": "Answer revealed successfully"}), 200
-        else:
-            logger.error("GameCog not found on auth_bot")
-            return jsonify({"error": "GameCog not found"}), 500
+        call_game_session(bot, guild_id, "show_answer", uuid)
+        logger.info(f"Answer for question {uuid} revealed successfully via GameCog")
+        return jsonify({"message": "Answer revealed successfully"}), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error revealing answer for question {uuid}: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
 
 
 @game_blueprint.route("/awardpoints", methods=["POST"])
-async def award_points():
-    bot = current_app.auth_bot if hasattr(current_app, 'auth_bot') else None
-    if not bot or not bot.is_ready():
-        logger.warning("Auth bot not ready or not available for /awardpoints")
-        return jsonify({"error": "Auth bot is not available or not ready."}), 503
+@game_blueprint.route("/<string:org_prefix>/awardpoints", methods=["POST"])
+def award_points(org_prefix=None):
+    bot, error_response = get_ready_bot("/awardpoints")
+    if error_response:
+        return error_response
+    guild_id, error_response = get_org_guild_id(org_prefix)
+    if error_response:
+        return error_response
         
     team = request.args.get("team")
     points = request.args.get("points")
     logger.info(f"Awarding {points} points to team: {team} via auth_bot")
     try:
-        cog = bot.get_cog("GameCog")
-        if cog:
-            await cog.award_points(team, points) # award_points is async in GameCog
-            logger.info(f"Awarded {points} to team {team} successfully via GameCog")
-            return jsonify({"message": "Points awarded successfully"}), 200
-        else:
-            logger.error("GameCog not found on auth_bot")
-            return jsonify({"error": "GameCog not found"}), 500
+        call_game_session(bot, guild_id, "award_points", team, points)
+        logger.info(f"Awarded {points} to team {team} successfully via GameCog")
+        return jsonify({"message": "Points awarded successfully"}), 200
+    except BotDispatchError as e:
+        return dispatch_error_response(e)
+    except NoGameSession:
+        return jsonify({"error": "No active game set"}), 404
+    except GameCogUnavailable as e:
+        logger.error(str(e))
+        return jsonify({"error": "GameCog not found"}), 500
     except Exception as e:
         logger.error(f"Error awarding points to team {team}: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 400
@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 import inspect
-import asyncio
-import nest_asyncio
+from modules.bot.discord_modules.dispatcher import BotDispatcher
 from modules.bot.discord_modules.cogs.HelperCog import HelperCog
 from modules.bot.discord_modules.cogs.GameCog import GameCog
 from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
@@ -17,6 +16,7 @@ class BotFork(commands.Bot):
         setup (bool): Indicates if the bot has been set up.
         active_game (Any): Stores the current active game instance.
         token (str): Discord bot token.
+        dispatcher (BotDispatcher): Runs calls from other threads (the API) on the bot's event loop.
     """
 
     def __init__(self, *args, **kwargs):
@@ -29,6 +29,7 @@ class BotFork(commands.Bot):
         """
         self.active_game = None
         super().__init__(*args, **kwargs, guild_ids=[])
+        self.dispatcher = BotDispatcher(self.loop)
         # super().add_cog(HelperCog(self))
         # super().add_cog(GameCog(self))
 
@@ -73,8 +74,19 @@ class BotFork(commands.Bot):
         """
         await self.change_presence(status=discord.Status.offline)
 
+    async def close(self):
+        """Cancels calls still waiting on the bot before closing the connection."""
+        self.dispatcher.shutdown()
+        await super().close()
+
     def execute(self, cog_name, command, *args, priority="NORMAL", **kwargs):
-        """Executes a command in the specified cog with optional priority."""
+        """
+        Executes a command in the specified cog with optional priority.
+
+        On the bot's own loop, coroutine commands are scheduled as tasks (await the returned task to
+        wait for them). From any other thread the command runs on the bot loop through the
+        dispatcher: priority "NOW" waits for the result, other priorities return a future.
+        """
         cog = self.get_cog(cog_name)
         if cog is None:
             raise ValueError(f"Cog {cog_name} not found")
@@ -83,14 +95,14 @@ class BotFork(commands.Bot):
         if method is None:
             raise ValueError(f"Command {command} not found in cog {cog_name}")
 
-        if inspect.iscoroutinefunction(method):
+        if not self.dispatcher.in_loop_thread():
             if priority == "NOW":
-                # For highest priority, run the coroutine immediately
-                nest_asyncio.apply()
-                return asyncio.run(method(*args, **kwargs))
-            else:
-                # For normal priority, schedule it in the event loop
-                return self.loop.create_task(method(*args, **kwargs))
+                return self.dispatcher.run(method, *args, **kwargs)
+            return self.dispatcher.submit(method, *args, **kwargs)
+
+        if inspect.iscoroutinefunction(method):
+            # Schedule it in the event loop
+            return self.loop.create_task(method(*args, **kwargs))
         else:
             # If the method is not a coroutine, just call it directly
             return method(*args, **kwargs)
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+# Discord snowflakes count milliseconds from 2015-01-01T00:00:00Z in their top 42 bits
+DISCORD_EPOCH_MS = 1420070400000
+# Seconds buzzes are collected after the first one before the winner is picked
+DEFAULT_BUZZ_WINDOW = 0.3
+
+
+def snowflake_time_ms(snowflake: int) -> int:
+    """Unix time in milliseconds at which Discord created the object with this id."""
+    return (int(snowflake) >> 22) + DISCORD_EPOCH_MS
+
+
+class BuzzIn:
+    """One press of a question's buzzer."""
+
+    __slots__ = ("member_id", "role_id", "interaction_id", "created_ms", "received_at")
+
+    def __init__(self, member_id: int, role_id: Any, interaction_id: Optional[int], received_at: float):
+        self.member_id = member_id
+        self.role_id = role_id
+        self.interaction_id = interaction_id
+        # Discord stamps the interaction when the click reaches it, before any delay on our side
+        self.created_ms = snowflake_time_ms(interaction_id) if interaction_id else None
+        self.received_at = received_at
+
+    def sort_key(self):
+        # Discord's time decides; presses in the same millisecond go by receipt, then by id
+        created = self.created_ms if self.created_ms is not None else float("inf")
+        return (created, self.received_at, self.interaction_id or 0)
+
+
+class BuzzResult:
+    """Outcome of a buzz: "won", "lost", "excluded" (team already answered) or "closed"."""
+
+    __slots__ = ("status", "winner")
+
+    def __init__(self, status: str, winner: Optional[BuzzIn] = None):
+        self.status = status
+        self.winner = winner
+
+    @property
+    def won(self) -> bool:
+        return self.status == "won"
+
+
+class _Round:
+    __slots__ = ("excluded", "attempts", "decision", "winner")
+
+    def __init__(self, excluded: Iterable[Any]):
+        self.excluded: Set[Any] = set(excluded)
+        self.attempts: List[BuzzIn] = []
+        self.decision: Optional[asyncio.Future] = None
+        self.winner: Optional[BuzzIn] = None
+
+
+class BuzzArbiter:
+    """
+    Decides who buzzed in first on each question.
+
+    Button clicks reach the bot in whatever order the gateway and the event loop deliver them,
+    so the first handler to run is not necessarily the first player to click. Each buzz is stamped
+    on receipt with its interaction's snowflake time and a monotonic clock; the first buzz of a
+    round opens a short window, and when it closes every buzz in it is ranked and a single winner
+    is picked. Teams that already answered the question are excluded, and the winner's team is
+    added to them. Must be used from the bot's event loop.
+    """
+
+    def __init__(self, window: float = DEFAULT_BUZZ_WINDOW, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._rounds: Dict[str, _Round] = {}
+
+    def open(self, question_uuid: str, excluded_roles: Iterable[Any] = ()):
+        """Opens (or reopens) a question for buzzing, excluding the given team roles."""
+        previous = self._rounds.get(question_uuid)
+        if previous is not None and previous.decision is not None and not previous.decision.done():
+            previous.decision.cancel()
+        self._rounds[question_uuid] = _Round(excluded_roles)
+
+    def close(self, question_uuid: str):
+        """Stops accepting buzzes for a question (it was answered)."""
+        round_ = self._rounds.pop(question_uuid, None)
+        if round_ is not None and round_.decision is not None and not round_.decision.done():
+            round_.decision.cancel()
+
+    def reset(self):
+        for question_uuid in list(self._rounds):
+            self.close(question_uuid)
+
+    def is_excluded(self, question_uuid: str, role_id: Any) -> bool:
+        round_ = self._rounds.get(question_uuid)
+        return round_ is not None and role_id in round_.excluded
+
+    async def buzz(self, question_uuid: str, member_id: int, role_id: Any,
+                   interaction_id: Optional[int] = None) -> BuzzResult:
+        """
+        Registers a buzz and waits for the round to be decided.
+
+        Returns:
+            BuzzResult: "won" for the single winner, "lost" for the other buzzes of the window,
+            "excluded" if the team already answered and "closed" if the question is not open or
+            was already won.
+        """
+        received_at = self.clock()
+        round_ = self._rounds.get(question_uuid)
+        if round_ is None or round_.winner is not None:
+            return BuzzResult("closed", round_.winner if round_ else None)
+        if role_id in round_.excluded:
+            return BuzzResult("excluded")
+
+        attempt = BuzzIn(member_id, role_id, interaction_id, received_at)
+        round_.attempts.append(attempt)
+        if round_.decision is None:
+            loop = asyncio.get_running_loop()
+            round_.decision = loop.create_future()
+            loop.call_later(self.window, self._resolve, round_)
+        decision = round_.decision
+        try:
+            winner = await asyncio.shield(decision)
+        except asyncio.CancelledError:
+            if decision.cancelled():
+                # The question was closed or reopened while the window was open
+                return BuzzResult("closed")
+            raise
+        return BuzzResult("won" if winner is attempt else "lost", winner)
+
+    def _resolve(self, round_: _Round):
+        if round_.decision.done():
+            return
+        winner = min(round_.attempts, key=BuzzIn.sort_key)
+        round_.winner = winner
+        round_.excluded.add(winner.role_id)
+        round_.decision.set_result(winner)
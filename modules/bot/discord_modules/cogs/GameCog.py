@@ -4,19 +4,36 @@ from typing import Optional, List, Dict, Any, Union, Tuple, Callable, Awaitable
 import discord
 import random
 import asyncio
+import inspect
 from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
 from modules.bot.discord_modules.cogs.jeopardy.JeopardyQuestion import JeopardyQuestion
 from modules.bot.discord_modules.cogs.jeopardy.Team import Team
 from modules.bot.discord_modules.cogs.UI import QuestionPost
+from modules.bot.discord_modules.render_scheduler import RenderScheduler
+from modules.bot.discord_modules.op_runner import DiscordOpRunner
+from modules.bot.discord_modules.buzzer import BuzzArbiter
+from modules.utils.logging_config import get_logger
 
+# Get module logger
+logger = get_logger("bot.gamecog")
 
-class GameCog(commands.Cog):
+
+class NoGameSession(Exception):
+    """Raised when a guild has no game session."""
+
+
+class GameCogUnavailable(Exception):
+    """Raised when a call names a GameCog or GameSession method that does not exist."""
+
+
+class GameSession:
     """
-    A cog for managing a game (Jeopardy-style) within a Discord server. It handles game setup,
-    participant management, and environment cleanup.
+    A game (Jeopardy-style) running in one Discord server. It handles game setup, participant
+    management, and environment cleanup for that server.
 
     Attributes:
-        bot (commands.Bot): The instance of the bot that this cog is part of.
+        bot (commands.Bot): The bot the game runs on.
+        guild_id (int): The id of the server the game runs in.
         game (JeopardyGame): The current game instance.
         game_category (discord.CategoryChannel): The category under which game channels are created.
         roles (list): A list of roles created for the game.
@@ -24,16 +41,25 @@ class GameCog(commands.Cog):
         voice_channels (list): List of voice channels created for the game.
         scoreboard_channel (discord.TextChannel): The channel for displaying the game scoreboard.
         scoreboard (Any): The scoreboard object for the game.
+        renderer (RenderScheduler): Coalesces and rate-limits scoreboard and gameboard edits.
+        operations (DiscordOpRunner): Runs setup and teardown calls concurrently and tracks their progress.
+        buzzer (BuzzArbiter): Picks the first team to buzz in on each question.
+        store (GameStore): Persists game actions so the game can be resumed after a restart.
     """
 
-    def __init__(self, bot: commands.Bot):
+    def __init__(self, bot: commands.Bot, guild_id: int, store=None):
         """
-        Initializes the GameCog instance.
+        Initializes the GameSession instance.
 
         Args:
-            bot (commands.Bot): The instance of the bot that this cog is part of.
+            bot (commands.Bot): The bot the game runs on.
+            guild_id (int): The id of the server the game runs in.
+            store (GameStore, optional): Where this server's game is persisted; None keeps it in memory only.
         """
         self.bot = bot
+        self.guild_id = guild_id
+        self.store = store
+        self.enroll_message = None
         self.game = None
         self.game_category = None
         self.roles = []
@@ -47,20 +73,33 @@ class GameCog(commands.Cog):
         self.question_post = {}
         self.stage = None
         self.guild = None
+        self.operations = DiscordOpRunner()
+        self.buzzer = BuzzArbiter()
+        self.renderer = RenderScheduler()
+        self.renderer.register(
+            "scoreboard", self._scoreboard_embed, self._publish_scoreboard,
+            bucket_key=lambda: getattr(self.scoreboard_channel, "id", None),
+        )
+        self.renderer.register(
+            "gameboard", self._gameboard_embed, self._publish_gameboard,
+            bucket_key=lambda: getattr(self.announcement_channel, "id", None),
+        )
 
-    def set_game(self, game: dict, date: str, time: str) -> bool:
+    def set_game(self, game: Union[dict, JeopardyGame], date: str, time: str) -> bool:
         """
         Sets the game instance for the cog.
 
         Args:
-            game (dict): The game data.
+            game (dict or JeopardyGame): The game data, or a game built from the game library.
 
         Returns:
             bool: True if the game is set successfully.
         """
-        self.game = JeopardyGame(game)
+        self.game = game if isinstance(game, JeopardyGame) else JeopardyGame(game)
         self.date = date
         self.time = time
+        if self.store:
+            self.store.start(self.game, date, time)
         return True
 
     def get_game(self) -> Optional[dict]:
@@ -86,27 +125,39 @@ class GameCog(commands.Cog):
     async def clear_game(self):
         """
         Asynchronously clears the game environment from the Discord server.
-        """
-        for role in self.roles:
-            await self.bot.execute("HelperCog", "delete_role", role)
-        for channel in self.voice_channels:
-            await self.bot.execute("HelperCog", "delete_voice_channel", channel)
 
-        await self.bot.execute("HelperCog", "delete_category", self.game_category)
-        await self.bot.execute(
-            "HelperCog", "delete_text_channel", self.announcement_channel
-        )
-        await self.bot.execute(
-            "HelperCog", "delete_text_channel", self.scoreboard_channel
-        )
+        Roles and channels are deleted concurrently; the category goes last, once it is empty.
+        """
+        channels = [
+            channel
+            for channel in [*self.voice_channels, self.stage, self.announcement_channel, self.scoreboard_channel]
+            if channel is not None
+        ]
+        await self.operations.run("clear", [
+            *(self._operation(f"delete role {role.name}", role.delete, "roles") for role in self.roles),
+            *(self._operation(f"delete channel {channel.name}", channel.delete, "channels") for channel in channels),
+        ])
+        if self.game_category is not None:
+            await self.operations.run("clear_category", [
+                self._operation("delete category", self.game_category.delete, "channels")
+            ])
 
         # Resetting attributes
+        if self.store:
+            self.store.clear()
+        if self.enroll_message is not None:
+            self.bot.execute("HelperCog", "remove_from_listner", self.enroll_message, "✅")
+        self.renderer.reset()
+        self.buzzer.reset()
+        self.enroll_message = None
         self.roles = []
         self.voice_channels = []
         self.game_category = None
+        self.stage = None
         self.announcement_channel = None
         self.scoreboard_channel = None
         self.scoreboard = None
+        self.gameboard = None
         self.game = None
         self.question_post = {}
         return True
@@ -122,6 +173,7 @@ class GameCog(commands.Cog):
             bool: True if the member is added successfully.
         """
         self.game.add_member(member)
+        self._record("join", member_id=member.id)
         return True
 
     def remove_member(self, member: discord.User) -> bool:
@@ -136,6 +188,7 @@ class GameCog(commands.Cog):
             bool: True if the member is removed successfully.
         """
         self.game.remove_member(member)
+        self._record("leave", member_id=member.id)
         return True
 
     async def start_game(self):
@@ -143,72 +196,104 @@ class GameCog(commands.Cog):
         Asynchronously starts the game.
         """
         self.game.start()
+        self._record("start")
+        if self.enroll_message is not None:
+            # Enrollment closes once teams are drawn
+            self.bot.execute("HelperCog", "remove_from_listner", self.enroll_message, "✅")
         self.scoreboard_channel = await self.guild.create_text_channel(
             "scoreboard", category=self.game_category
         )
         self.game.attach_roles(self.roles)
         self.balance_teams()
+        self._record("teams", teams={
+            team.name: [member.id for member in team.members] for team in self.game.teams
+        })
+        self._save_discord_state()
         await self.assign_roles()
         await self.update_scoreboard()
         await self.update_gameboard()
+        # Post both boards right away instead of after the coalescing window
+        await self.renderer.flush()
         return True
 
     def balance_teams(self):
         """
         Balances the teams in the game.
         """
-        members = self.game.get_members()
+        members = list(self.game.get_members())  # copy, so the recorded join order stays intact
         random.shuffle(
             members
         )  # Shuffle the members list to randomize team assignments
 
-        player_count = len(members)
         team_count = len(self.game.teams)
 
         if team_count == 0:
             raise ValueError("No teams are set up in the game.")
 
-        team_size = player_count // team_count
-
         # Clear current members from each team
         for team in self.game.teams:
             team.members.clear()
 
-        # Distribute members evenly across teams
+        # Distribute members evenly across teams; when the division isn't exact the first teams get one more
         for i, member in enumerate(members):
             self.game.teams[i % team_count].members.append(member)
 
-        # Handle any remaining members if the division isn't exact
-        remaining_members = player_count % team_count
-        if remaining_members > 0:
-            extra_members = members[-remaining_members:]
-            for i, member in enumerate(extra_members):
-                self.game.teams[i].members.append(member)
-
     async def assign_roles(self):
         """
-        Assigns roles to each team.
+        Assigns roles to each team, several members at a time.
         """
-        for team in self.game.teams:
-            for member in team.members:
-                await member.add_roles(team.role)
+        await self.operations.run("assign_roles", [
+            self._operation(f"add {team.name} role to {member}", member.add_roles, "member_roles", team.role)
+            for team in self.game.teams
+            for member in team.members
+        ])
+
+    @staticmethod
+    def _operation(label, call, bucket, *args, **kwargs):
+        """
+        Builds an operation for the DiscordOpRunner; the call is started again on each retry.
+        """
+        return (label, lambda: call(*args, **kwargs), bucket)
+
+    def get_progress(self) -> dict:
+        """
+        Retrieves the progress of the latest setup, role assignment and cleanup runs.
+
+        Returns:
+            dict: Progress per run name.
+        """
+        return self.operations.progress_report()
 
     async def setup_game(self):
         """
         Asynchronously sets up the game environment in the Discord server.
         """
-        self.guild = self.bot.guilds[0]
+        self.guild = self.bot.get_guild(self.guild_id)
+        if self.guild is None:
+            raise ValueError(f"The bot is not in guild {self.guild_id}")
 
         category = await self.guild.create_category("Jeopardy")
         await category.edit(position=0)
         self.game_category = category
-        self.stage = await self.guild.create_stage_channel(
-            name="Game Stage", topic=self.game.name, category=category
-        )
-        for team in self.game.teams:
-            role = await self.guild.create_role(name=team.get_name())
-            self.roles.append(role)
 
+        # Roles first, since each team's voice channel grants its role access
+        stage, *roles = await self.operations.run("setup_roles", [
+            self._operation(
+                "create stage", self.guild.create_stage_channel, "channels",
+                name="Game Stage", topic=self.game.name, category=category,
+            ),
+            *(
+                self._operation(f"create role {team.get_name()}", self.guild.create_role, "roles", name=team.get_name())
+                for team in self.game.teams
+            ),
+        ])
+        # Keep whatever was created so clear_game can remove it if setup stops here
+        self.stage = None if isinstance(stage, Exception) else stage
+        self.roles = [role for role in roles if not isinstance(role, Exception)]
+        self.operations.raise_for_failures("setup_roles")
+
+        operations = []
+        for team, role in zip(self.game.teams, self.roles):
             overwrites = {
                 self.guild.default_role: discord.PermissionOverwrite(
                     view_channel=True, connect=False, speak=False
@@ -217,15 +302,20 @@ class GameCog(commands.Cog):
                     view_channel=True, connect=True, speak=True
                 ),
             }
-            channel = await self.guild.create_voice_channel(
-                team.get_name(), overwrites=overwrites, category=category
-            )
-            self.voice_channels.append(channel)
-
-        self.announcement_channel = await self.guild.create_text_channel(
-            "announcements", category=category
-        )
+            operations.append(self._operation(
+                f"create voice channel {team.get_name()}", self.guild.create_voice_channel, "channels",
+                team.get_name(), overwrites=overwrites, category=category,
+            ))
+        operations.append(self._operation(
+            "create announcements", self.guild.create_text_channel, "channels", "announcements", category=category
+        ))
+        *voice_channels, announcement_channel = await self.operations.run("setup_channels", operations)
+        self.voice_channels = [channel for channel in voice_channels if not isinstance(channel, Exception)]
+        if not isinstance(announcement_channel, Exception):
+            self.announcement_channel = announcement_channel
+        self.operations.raise_for_failures("setup_channels")
         self.game.is_announced = True
+        self._record("announce")
         embed = discord.Embed(
             title="🌟 JEOPARDY GAME NIGHT ANNOUNCEMENT 🌟",
             description="Get ready for an exciting evening of trivia and fun!",
@@ -238,7 +328,11 @@ class GameCog(commands.Cog):
         embed.set_footer(text="React with ✅ to enroll!")
         message = await self.announcement_channel.send(embed=embed)
         await message.add_reaction("✅")
-        self.bot.execute("HelperCog", "add_to_listner", message, "✅")
+        # Enrollment stays open until the game starts, however far off it is; starting or clearing
+        # the game removes the listener
+        self.bot.execute("HelperCog", "add_to_listner", message, "✅", ttl=None)
+        self.enroll_message = message
+        self._save_discord_state()
         return True
 
     async def show_question(self, uuid: str):
@@ -265,6 +359,7 @@ class GameCog(commands.Cog):
                 avoid=self.question_post[uuid]["rolesAnswered"],
                 question_uuid=uuid,
             )
+            self.buzzer.open(uuid, [role.id for role in self.question_post[uuid]["rolesAnswered"] if role])
             await self.question_post[uuid]["message_id"].edit(
                 embed=embed, view=question
             )
@@ -285,12 +380,16 @@ class GameCog(commands.Cog):
                 question_uuid=uuid,
                 avoid=[],
             )
+            self.buzzer.open(uuid)
             self.question_post[uuid] = {
                 "message_id": await self.announcement_channel.send(
                     embed=embed, view=question
                 ),
                 "rolesAnswered": [],
             }
+            question_data.revealed = True
+            self._record("reveal", uuid=uuid)
+            self._save_discord_state()
             await self.update_gameboard()
             return True
 
@@ -304,6 +403,8 @@ class GameCog(commands.Cog):
 
         boolean, question_data = self.game.answer_question(uuid)
         if boolean:
+            self.buzzer.close(uuid)
+            self._record("answer", uuid=uuid)
             embed = discord.Embed(
                 title="🌟ANSWER🌟",
                 description="Here is the answer! \n",
@@ -314,6 +415,7 @@ class GameCog(commands.Cog):
             embed.add_field(name="Question", value=question_data.question, inline=False)
             embed.add_field(name="Answer", value=question_data.answer, inline=False)
             await self.announcement_channel.send(embed=embed)
+            await self.update_gameboard()
 
             return True
         else:
@@ -327,64 +429,62 @@ class GameCog(commands.Cog):
             team_name (str): The name of the team to award points to.
             points (int): The number of points to award.
         """
-        self.game.award_points(team_name, points)
+        if self.game.award_points(team_name, points):
+            self._record("award", team=team_name, points=int(points))
         await self.update_scoreboard()
         return True
 
     async def update_scoreboard(self):
-        if self.game.is_started:
-            if self.scoreboard is None:
-                embed = discord.Embed(
-                    title="🌟SCOREBOARD🌟",
-                    description="Here is the scoreboard! \n",
-                    color=discord.Color.blurple(),
-                )
-                for team in self.game.teams:
-                    embed.add_field(name=team.name, value=team.score, inline=True)
-
-                self.scoreboard = await self.scoreboard_channel.send(embed=embed)
-            else:
-                embed = discord.Embed(
-                    title="🌟SCOREBOARD🌟",
-                    description="Here is the scoreboard! \n",
-                    color=discord.Color.blurple(),
-                )
-                for team in self.game.teams:
-                    embed.add_field(name=team.name, value=team.score, inline=True)
-                await self.scoreboard.edit(embed=embed)
-        else:
-            pass
+        """
+        Schedules a scoreboard render; bursts of updates are coalesced into one edit.
+        """
+        self.renderer.mark_dirty("scoreboard")
 
     async def update_gameboard(self):
-        if self.game.is_started:
-            if self.gameboard is None:
-                data = self.game.get_board()
-                embed = discord.Embed(
-                    title=f"Jeopardy Game: {self.game.name}",
-                    description=self.game.description,
-                    color=0x1E90FF,
-                )
-                for category in data.keys():
-                    question_data = data[category]
-                    embed.add_field(
-                        name=category, value=str(question_data), inline=False
-                    )
-                self.gameboard = await self.announcement_channel.send(embed=embed)
-
-            else:
-                data = self.game.get_board()
-                embed = discord.Embed(
-                    title=f"Jeopardy Game: {self.game.name}",
-                    description=self.game.description,
-                    color=0x1E90FF,
-                )
-                for category in data.keys():
-                    question_data = data[category]
-
-                    embed.add_field(
-                        name=category, value=str(question_data), inline=False
-                    )
-                await self.gameboard.edit(embed=embed)
+        """
+        Schedules a gameboard render; bursts of updates are coalesced into one edit.
+        """
+        self.renderer.mark_dirty("gameboard")
+
+    def _scoreboard_embed(self) -> Optional[discord.Embed]:
+        if self.game is None or not self.game.is_started:
+            return None
+        embed = discord.Embed(
+            title="🌟SCOREBOARD🌟",
+            description="Here is the scoreboard! \n",
+            color=discord.Color.blurple(),
+        )
+        for team in self.game.teams:
+            embed.add_field(name=team.name, value=team.score, inline=True)
+        return embed
+
+    async def _publish_scoreboard(self, embed: discord.Embed):
+        if self.scoreboard is None:
+            self.scoreboard = await self.scoreboard_channel.send(embed=embed)
+            self._save_discord_state()
+        else:
+            await self.scoreboard.edit(embed=embed)
+
+    def _gameboard_embed(self) -> Optional[discord.Embed]:
+        if self.game is None or not self.game.is_started:
+            return None
+        data = self.game.get_board()
+        embed = discord.Embed(
+            title=f"Jeopardy Game: {self.game.name}",
+            description=self.game.description,
+            color=0x1E90FF,
+        )
+        for category in data.keys():
+            question_data = data[category]
+            embed.add_field(name=category, value=str(question_data), inline=False)
+        return embed
+
+    async def _publish_gameboard(self, embed: discord.Embed):
+        if self.gameboard is None:
+            self.gameboard = await self.announcement_channel.send(embed=embed)
+            self._save_discord_state()
+        else:
+            await self.gameboard.edit(embed=embed)
 
     async def end_game(self):
         """
@@ -395,6 +495,7 @@ class GameCog(commands.Cog):
             description="Thanks for playing! \n",
             color=discord.Color.green(),
         )
+        await self.renderer.flush()
         winners = self.game.get_winners()
         if len(winners) == 1:
             embed.add_field(name="Winner", value=winners[0], inline=False)
@@ -418,3 +519,309 @@ class GameCog(commands.Cog):
             if role in member.roles:
                 return role
         return None
+
+    def _record(self, event_type: str, **payload):
+        """
+        Persists a game action (see JeopardyGame.apply_event) if a store is configured.
+        """
+        if self.store and self.game is not None:
+            self.store.record(self.game, event_type, payload)
+
+    def _discord_state(self) -> dict:
+        """
+        Collects the Discord ids of everything the game created, for re-binding on resume.
+        """
+        def object_id(obj):
+            return getattr(obj, "id", None)
+
+        return {
+            "guild_id": object_id(self.guild),
+            "date": self.date,
+            "time": self.time,
+            "category_id": object_id(self.game_category),
+            "stage_id": object_id(self.stage),
+            "announcement_channel_id": object_id(self.announcement_channel),
+            "scoreboard_channel_id": object_id(self.scoreboard_channel),
+            "voice_channel_ids": [channel.id for channel in self.voice_channels],
+            "role_ids": [role.id for role in self.roles],
+            "enroll_message_id": object_id(self.enroll_message),
+            "scoreboard_message_id": object_id(self.scoreboard),
+            "gameboard_message_id": object_id(self.gameboard),
+            "question_posts": {
+                uuid: {
+                    "message_id": object_id(post["message_id"]),
+                    "roles_answered": [object_id(role) for role in post["rolesAnswered"] if role is not None],
+                }
+                for uuid, post in self.question_post.items()
+            },
+        }
+
+    def _save_discord_state(self):
+        if self.store and self.game is not None:
+            self.store.save_helper(self._discord_state())
+
+    def get_state(self) -> Optional[dict]:
+        """
+        Retrieves the current game's state (teams with their members and scores, and the
+        revealed and answered questions).
+
+        Returns:
+            dict: The game state, or None if no game is set.
+        """
+        if self.game is None:
+            return None
+        return self.game.to_state()
+
+    async def resume_game(self) -> bool:
+        """
+        Rebuilds the game from its snapshot and recorded actions, and re-binds the channels,
+        roles, members and messages it uses by their Discord ids.
+
+        Returns:
+            bool: True if a stored game was resumed.
+        """
+        loaded = self.store.load() if self.store else None
+        if loaded is None:
+            return False
+        game_data, events, helper = loaded
+        game = JeopardyGame.from_state(game_data["state"])
+        for event_type, payload in events:
+            game.apply_event(event_type, payload)
+
+        guild = self.bot.get_guild(self.guild_id) if helper.get("guild_id") else None
+        self.game = game
+        self.date = game_data.get("date")
+        self.time = game_data.get("time")
+        if guild is None:
+            # Set but never set up: nothing on Discord to re-bind
+            logger.info(f"Resumed game {game.name} (not set up on Discord yet)")
+            return True
+
+        self.guild = guild
+        self.game_category = guild.get_channel(helper.get("category_id") or 0)
+        self.stage = guild.get_channel(helper.get("stage_id") or 0)
+        self.announcement_channel = guild.get_channel(helper.get("announcement_channel_id") or 0)
+        self.scoreboard_channel = guild.get_channel(helper.get("scoreboard_channel_id") or 0)
+        self.voice_channels = [
+            channel for channel in map(guild.get_channel, helper.get("voice_channel_ids", [])) if channel
+        ]
+        self.roles = [role for role in map(guild.get_role, helper.get("role_ids", [])) if role]
+        self.game.attach_roles(self.roles)
+        missing = self.game.bind_members(guild.get_member)
+        if missing:
+            logger.warning(f"{len(missing)} players of {game.name} are no longer in the server")
+
+        async def fetch(channel, message_id):
+            if channel is None or not message_id:
+                return None
+            try:
+                return await channel.fetch_message(message_id)
+            except discord.NotFound:
+                return None
+
+        posts = helper.get("question_posts", {})
+        messages = await self.operations.run("resume", [
+            self._operation("fetch enroll message", fetch, "messages", self.announcement_channel, helper.get("enroll_message_id")),
+            self._operation("fetch scoreboard", fetch, "messages", self.scoreboard_channel, helper.get("scoreboard_message_id")),
+            self._operation("fetch gameboard", fetch, "messages", self.announcement_channel, helper.get("gameboard_message_id")),
+            *(
+                self._operation(f"fetch question {uuid}", fetch, "messages", self.announcement_channel, post["message_id"])
+                for uuid, post in posts.items()
+            ),
+        ])
+        messages = [None if isinstance(message, Exception) else message for message in messages]
+        self.enroll_message, self.scoreboard, self.gameboard, *question_messages = messages
+
+        roles_by_id = {role.id: role for role in self.roles}
+        self.question_post = {}
+        for (uuid, post), message in zip(posts.items(), question_messages):
+            if message is None:
+                continue
+            self.question_post[uuid] = {
+                "message_id": message,
+                "rolesAnswered": [roles_by_id[i] for i in post.get("roles_answered", []) if i in roles_by_id],
+            }
+
+        # Buttons of unanswered questions stop working with the old process; attach new views
+        for uuid, post in self.question_post.items():
+            question = self.game.get_question_by_uuid(uuid)
+            if question and not question.answered:
+                self.buzzer.open(uuid, [role.id for role in post["rolesAnswered"]])
+        await self.operations.run("resume_views", [
+            self._operation(
+                f"re-attach question {uuid}", post["message_id"].edit, "messages",
+                view=QuestionPost(
+                    question=self.game.get_question_by_uuid(uuid), voice=self.stage, cog=self,
+                    avoid=post["rolesAnswered"], question_uuid=uuid,
+                ),
+            )
+            for uuid, post in self.question_post.items()
+            if self.game.get_question_by_uuid(uuid) and not self.game.get_question_by_uuid(uuid).answered
+        ])
+        if self.enroll_message is not None and not self.game.is_started:
+            self.bot.execute("HelperCog", "add_to_listner", self.enroll_message, "✅", ttl=None)
+
+        self._save_discord_state()
+        await self.update_scoreboard()
+        await self.update_gameboard()
+        logger.info(f"Resumed game {game.name} with {len(events)} replayed actions")
+        return True
+
+
+class GameCog(commands.Cog):
+    """
+    A cog that runs one game session per Discord server, so several organizations can play at
+    the same time on one bot.
+
+    Sessions are created when a server's game is set and dropped when it is cleared. Calls into a
+    session go through ``run``, which holds that session's lock while the call (and any Discord
+    requests it awaits) runs: actions on one server's game are applied one at a time, while games
+    in other servers carry on. Reads are served without waiting for the lock, so progress can be
+    polled while a long setup is running.
+
+    Attributes:
+        bot (commands.Bot): The instance of the bot that this cog is part of.
+        sessions (dict): The game session of each server, by guild id.
+        store (GameStore): Persists each server's game so it can be resumed after a restart.
+    """
+
+    # Session methods that only read state and do not wait for the session lock
+    READ_ONLY = {"get_game", "get_state", "get_progress", "is_setup"}
+
+    def __init__(self, bot: commands.Bot, store=None):
+        """
+        Initializes the GameCog instance.
+
+        Args:
+            bot (commands.Bot): The instance of the bot that this cog is part of.
+            store (GameStore, optional): Where games are persisted; None keeps them in memory only.
+        """
+        self.bot = bot
+        self.store = store
+        self.sessions: Dict[int, GameSession] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    def default_guild_id(self) -> Optional[int]:
+        """
+        The id of the first server the bot is in, used by requests that do not name a server.
+        """
+        return self.bot.guilds[0].id if self.bot.guilds else None
+
+    def get_session(self, guild_id: int, create: bool = False) -> GameSession:
+        """
+        Retrieves the game session of a server.
+
+        Args:
+            guild_id (int): The id of the server.
+            create (bool): Create the session if the server has none.
+
+        Returns:
+            GameSession: The session. Raises NoGameSession if there is none and create is False.
+        """
+        session = self.sessions.get(guild_id)
+        if session is None:
+            if not create:
+                raise NoGameSession(f"No game session for guild {guild_id}")
+            store = self.store.for_guild(guild_id) if self.store else None
+            session = self.sessions[guild_id] = GameSession(self.bot, guild_id, store=store)
+            self._locks[guild_id] = asyncio.Lock()
+        return session
+
+    async def run(self, guild_id: Optional[int], method_name: str, *args, **kwargs):
+        """
+        Calls a method of a server's game session while holding that session's lock.
+
+        Setting a game creates the session; clearing it drops the session once the cleanup is done.
+
+        Args:
+            guild_id (int, optional): The id of the server; None uses the bot's first server.
+            method_name (str): The GameSession method to call.
+
+        Returns:
+            Any: What the method returned. Raises NoGameSession if the server has no game and
+            GameCogUnavailable if the method does not exist.
+        """
+        if guild_id is None:
+            guild_id = self.default_guild_id()
+        if not hasattr(GameSession, method_name) or method_name.startswith("_"):
+            raise GameCogUnavailable(f"GameSession.{method_name} not found")
+        session = self.get_session(guild_id, create=method_name == "set_game")
+        if method_name in self.READ_ONLY:
+            return await self._call(getattr(session, method_name), *args, **kwargs)
+
+        async with self._locks[guild_id]:
+            result = await self._call(getattr(session, method_name), *args, **kwargs)
+            if method_name == "clear_game" and self.sessions.get(guild_id) is session:
+                del self.sessions[guild_id]
+                del self._locks[guild_id]
+            return result
+
+    @staticmethod
+    async def _call(method, *args, **kwargs):
+        result = method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def sessions_report(self) -> List[dict]:
+        """
+        Summarizes the game session of every server.
+
+        Returns:
+            list: guild_id, game name and whether the game was set up and started, per session.
+        """
+        return [
+            {
+                "guild_id": guild_id,
+                "game": session.game.name if session.game else None,
+                "is_setup": bool(session.game and session.game.is_announced),
+                "is_started": bool(session.game and session.game.is_started),
+                "busy": self._locks[guild_id].locked(),
+            }
+            for guild_id, session in self.sessions.items()
+        ]
+
+    def add_member(self, member: discord.Member) -> bool:
+        """
+        Adds a member to the game of their server (enrollment reactions land here).
+
+        Returns:
+            bool: True if the server has a game and the member was added.
+        """
+        session = self.sessions.get(member.guild.id)
+        if session is None or session.game is None:
+            return False
+        return session.add_member(member)
+
+    def remove_member(self, member: discord.Member) -> bool:
+        """
+        Removes a member from the game of their server.
+
+        Returns:
+            bool: True if the server has a game and the member was removed.
+        """
+        session = self.sessions.get(member.guild.id)
+        if session is None or session.game is None:
+            return False
+        return session.remove_member(member)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """
+        Resumes the persisted games after a restart (a reconnect keeps the in-memory games).
+        """
+        if not self.store:
+            return
+        for guild_id in self.store.stored_guild_ids():
+            if guild_id in self.sessions:
+                continue
+            session = self.get_session(guild_id, create=True)
+            try:
+                async with self._locks[guild_id]:
+                    resumed = await session.resume_game()
+            except Exception as e:
+                logger.error(f"Error resuming the stored game of guild {guild_id}: {e}", exc_info=True)
+                resumed = session.game is not None
+            if not resumed and self.sessions.get(guild_id) is session:
+                del self.sessions[guild_id]
+                del self._locks[guild_id]
@@ -5,6 +5,7 @@ from typing import Optional, List, Dict, Any, Union, Tuple, Callable, Awaitable
 import random
 import asyncio
 from modules.utils.logging_config import get_logger
+from modules.bot.discord_modules.reactions import ReactionRegistry
 
 # Get module logger
 logger = get_logger("bot.helpercog")
@@ -17,7 +18,7 @@ class HelperCog(commands.Cog):
     Attributes:
             bot (commands.Bot): The instance of the bot that this cog is part of.
             announcement_channel (discord.TextChannel): A channel for announcements.
-            message_listen_for (list): A list of messages to listen for reactions.
+            reactions (ReactionRegistry): Reaction listeners keyed by (message id, emoji).
     """
 
     def __init__(self, bot: commands.Bot):
@@ -29,7 +30,7 @@ class HelperCog(commands.Cog):
         """
         self.bot = bot
         self.announcement_channel = None
-        self.message_listen_for = []
+        self.reactions = ReactionRegistry()
         logger.info("HelperCog initialized")
 
     async def create_category(
@@ -238,61 +239,112 @@ class HelperCog(commands.Cog):
         logger.debug(f"Added reaction {emoji} to message {message.id}")
         return message
 
-    def add_to_listner(self, message: discord.Message, emoji: str):
+    def add_to_listner(self, message: discord.Message, emoji: str, on_add=None, on_remove=None, **kwargs):
         """
-        Adds a message to the list of messages to listen for reactions.
+        Listens for reactions with an emoji on a message.
+
+        By default adding the reaction enrolls the user in the game and removing it withdraws them.
 
         Args:
-        message (discord.Message): The message to add.
+        message (discord.Message): The message to listen on.
         emoji (str): The emoji to listen for.
-        """
-        self.message_listen_for.append({"message": message, "emoji": emoji})
+        on_add (callable, optional): Called with the member who added the reaction.
+        on_remove (callable, optional): Called with the member who removed the reaction.
+        ttl (float, optional): Seconds until the listener expires (see ReactionRegistry.register).
+        """
+        self.reactions.register(
+            message.id, emoji,
+            on_add=on_add or self._enroll,
+            on_remove=on_remove or self._withdraw,
+            **kwargs,
+        )
         logger.debug(f"Added message {message.id} to reaction listener with emoji {emoji}")
 
     def remove_from_listner(self, message: discord.Message, emoji: str):
         """
-        Removes a message from the list of messages to listen for reactions.
+        Stops listening for reactions with an emoji on a message.
 
         Args:
-        message (discord.Message): The message to remove.
+        message (discord.Message): The message to stop listening on.
         emoji (str): The emoji to stop listening for.
         """
-        for msg_info in self.message_listen_for: # Renamed loop variable
-            if msg_info["message"] == message and msg_info["emoji"] == emoji:
-                self.message_listen_for.remove(msg_info)
-                logger.debug(f"Removed message {message.id} from reaction listener with emoji {emoji}")
-                return True
-        return False
+        removed = self.reactions.unregister(message.id, emoji)
+        if removed:
+            logger.debug(f"Removed message {message.id} from reaction listener with emoji {emoji}")
+        return removed
+
+    def _enroll(self, member):
+        self.bot.execute("GameCog", "add_member", member)
+
+    def _withdraw(self, member):
+        self.bot.execute("GameCog", "remove_member", member)
+
+    def _listener_for(self, payload: discord.RawReactionActionEvent):
+        """
+        The listener for a raw reaction event, or None. Only ids are compared, so reactions on
+        other messages cost two dict lookups and never fetch anything.
+        """
+        if payload.message_id not in self.reactions:
+            return None
+        if self.bot.user is not None and payload.user_id == self.bot.user.id:
+            return None
+        self.reactions.purge_expired()
+        return self.reactions.get(payload.message_id, payload.emoji)
+
+    async def _resolve_member(self, payload: discord.RawReactionActionEvent):
+        """
+        The member behind a reaction: sent with the event for additions, otherwise taken from
+        the member cache and only fetched when it is not cached. None when the reaction is not
+        in a server the bot is in or the user has left it, since callbacks need member.guild.
+        """
+        if payload.member is not None:
+            return payload.member
+        guild = self.bot.get_guild(payload.guild_id) if payload.guild_id else None
+        if guild is None:
+            return None
+        member = guild.get_member(payload.user_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(payload.user_id)
+            except discord.NotFound:
+                return None
+        return member
 
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """
-        Asynchronous event handler for when a reaction is added to a message.
+        Asynchronous event handler for when a reaction is added to any message (cached or not).
 
         Args:
-        reaction (discord.Reaction): The reaction that was added.
-        user (discord.User): The user that added the reaction.
-        """
-        logger.info(f"Reaction {reaction.emoji} added by {user.name} to message {reaction.message.id}")
-        for message in self.message_listen_for:
-            if reaction.message.id == message["message"].id:
-                if reaction.emoji == message["emoji"]:
-                    self.bot.execute("GameCog", "add_member", user)
+        payload (discord.RawReactionActionEvent): The reaction event.
+        """
+        listener = self._listener_for(payload)
+        if listener is None or listener.on_add is None:
+            return
+        member = await self._resolve_member(payload)
+        if member is None:
+            logger.warning(f"Ignoring reaction {payload.emoji} on message {payload.message_id}: member {payload.user_id} not found")
+            return
+        logger.info(f"Reaction {payload.emoji} added by {payload.user_id} to message {payload.message_id}")
+        listener.on_add(member)
 
     @commands.Cog.listener()
-    async def on_reaction_remove(self, reaction: discord.Reaction, user: discord.User):
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
         """
-        Asynchronous event handler for when a reaction is removed from a message.
+        Asynchronous event handler for when a reaction is removed from any message (cached or not).
 
         Args:
-        reaction (discord.Reaction): The reaction that was removed.
-        user (discord.User): The user that removed the reaction.
-        """
-        logger.info(f"Reaction {reaction.emoji} removed by {user.name} from message {reaction.message.id}")
-        for message in self.message_listen_for:
-            if reaction.message.id == message["message"].id:
-                if reaction.emoji == message["emoji"]:
-                    self.bot.execute("GameCog", "remove_member", user)
+        payload (discord.RawReactionActionEvent): The reaction event.
+        """
+        listener = self._listener_for(payload)
+        if listener is None or listener.on_remove is None:
+            return
+        member = await self._resolve_member(payload)
+        if member is None:
+            logger.warning(f"Ignoring reaction {payload.emoji} on message {payload.message_id}: member {payload.user_id} not found")
+            return
+        logger.info(f"Reaction {payload.emoji} removed by {payload.user_id} from message {payload.message_id}")
+        listener.on_remove(member)
 
     @discord.slash_command(
         name="clear",
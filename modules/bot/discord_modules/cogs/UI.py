@@ -24,7 +24,7 @@ class QuestionPost(discord.ui.View):
         Args:
             question (JeopardyQuestion): The question to display.
             voice (discord.StageChannel): The voice channel to move the user to.
-            cog (GameCog): The GameCog instance.
+            cog (GameSession): The game session the question belongs to.
             question_uuid (Optional[str]): The UUID of the question.
             avoid (Optional[str]): The roles to avoid.
         """
@@ -39,19 +39,38 @@ class QuestionPost(discord.ui.View):
     async def button_callback(
         self, button: discord.ui.Button, interaction: discord.Interaction
     ):
+        # Acknowledge first: the arbitration window must never push us past Discord's 3s deadline
+        await interaction.response.defer()
         member_role = self.cog.get_member_role(interaction.user)
+        if member_role is None:
+            await interaction.followup.send("You are not on a team!", ephemeral=True)
+            return
         if member_role in self.avoid:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "You are not allowed to buzz in!", ephemeral=True
             )
+            return
+
+        result = await self.cog.buzzer.buzz(
+            self.question_uuid, interaction.user.id, member_role.id, interaction.id
+        )
+        if result.status == "excluded":
+            await interaction.followup.send(
+                "You are not allowed to buzz in!", ephemeral=True
+            )
+        elif not result.won:
+            await interaction.followup.send(
+                "Someone else buzzed in first!", ephemeral=True
+            )
         else:
             self.cog.question_post[self.question_uuid]["rolesAnswered"].append(
                 member_role
             )
+            self.cog._save_discord_state()
             button.disabled = True
             user = interaction.user
             button.label = f"{user.name} buzzed in!"
-            await interaction.response.edit_message(view=self)
+            await interaction.edit_original_response(view=self)
             await user.move_to(self.voice)
             await user.request_to_speak()
 
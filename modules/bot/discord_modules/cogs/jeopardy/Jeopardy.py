@@ -4,8 +4,21 @@ from modules.bot.discord_modules.cogs.jeopardy.JeopardyQuestion import JeopardyQ
 import uuid
 import discord
 
-import uuid
-import discord
+# Board cell shown in place of the value once a question has been answered
+ANSWERED_CELL = "XXXX"
+
+
+def _member_id(member) -> Any:
+    """Discord id of a member, or the value itself when it is already an id."""
+    return getattr(member, "id", member)
+
+
+def _points(question: JeopardyQuestion) -> float:
+    """Sort key for the board; values that are not numbers go last."""
+    try:
+        return float(question.value)
+    except (TypeError, ValueError):
+        return float("inf")
 
 
 class JeopardyGame:
@@ -13,6 +26,9 @@ class JeopardyGame:
     Manages a Jeopardy-style game in a Discord environment. It handles game initialization,
     team and player management, question handling, and game state tracking.
 
+    Questions and teams are indexed by uuid and name, and the board is kept up to date as
+    questions are answered, so lookups, reveals and awards do not depend on the board size.
+
     Attributes:
         name (str): The name of the Jeopardy game.
         description (str): A description of the game.
@@ -20,7 +36,7 @@ class JeopardyGame:
         players (list): A list of Discord Members participating in the game.
         categories (list): Categories of questions in the game.
         per_category (int): Number of questions per category.
-        questions (dict): A dictionary mapping categories to their respective questions.
+        questions (list): The JeopardyQuestion objects of the game, in category order.
         uuid (uuid.UUID): A unique identifier for the game.
         is_announced (bool): Flag indicating if the game has been announced.
         is_started (bool): Flag indicating if the game has started.
@@ -45,6 +61,27 @@ class JeopardyGame:
         self.is_announced = False
         self.is_started = False
         self.messages = []
+        self._index()
+
+    def _index(self):
+        """
+        Builds the uuid -> question and name -> team indexes and the board view.
+
+        The board lists each category's questions by value; every question remembers its cell
+        so answering it updates a single entry.
+        """
+        self._questions_by_id = {question.id: question for question in self.questions}
+        self._teams_by_name = {team.name: team for team in self.teams}
+        self._board = {}
+        self._board_cells = {}
+        by_category = {}
+        for question in self.questions:
+            by_category.setdefault(question.category, []).append(question)
+        for category, questions in by_category.items():
+            questions.sort(key=_points)
+            self._board[category] = [ANSWERED_CELL if q.answered else q.value for q in questions]
+            for position, question in enumerate(questions):
+                self._board_cells[question.id] = (category, position)
 
     def to_json(self):
         """
@@ -81,22 +118,21 @@ class JeopardyGame:
             questions_data (dict): Question data categorized by their categories.
 
         Returns:
-            dict: Organized questions by category.
+            list: The questions, in category order.
         """
-        print(questions_data)
-        queations = []
-        for categoory in questions_data.keys():
-            for question in questions_data[categoory]:
-                queations.append(
+        questions = []
+        for category in questions_data.keys():
+            for question in questions_data[category]:
+                questions.append(
                     JeopardyQuestion(
-                        categoory,
+                        category,
                         question["question"],
                         question["answer"],
                         question["value"],
                     )
                 )
-                self.category_name = categoory
-        return queations
+                self.category_name = category
+        return questions
 
     def _create_teams(self, data):
         """
@@ -108,28 +144,39 @@ class JeopardyGame:
         Returns:
             list: A list of initialized Team objects.
         """
-        return [Team(team_data) for team_data in data]
+        # Teams are names in uploaded games and {"name", ...} dicts in to_json() output
+        return [
+            Team(team_data["name"] if isinstance(team_data, dict) else team_data)
+            for team_data in data
+        ]
 
     def get_question(self, uuid):
         """
-        Retrieves an unanswered question of a specific value from a given category.
+        Retrieves a question by its UUID.
 
         Args:
-            category (str): The category of the question.
-            value (int): The value of the question.
+            uuid (str): The UUID of the question.
 
         Returns:
             JeopardyQuestion or None: The question object if found, otherwise None.
         """
-        for questions in self.questions.values():
-            for question in questions:
-                if question.id == uuid:
-                    return question
-        return None
+        return self._questions_by_id.get(uuid)
+
+    def get_team(self, team_name: str) -> Optional[Team]:
+        """
+        Retrieves a team by its name.
+
+        Args:
+            team_name (str): The name of the team.
+
+        Returns:
+            Team or None: The team if found, otherwise None.
+        """
+        return self._teams_by_name.get(team_name)
 
     def mark_question_as_answered(self, category, value):
         """
-        Marks a question as answered in a specific category and value.
+        Marks the first unanswered question of a specific category and value as answered.
 
         Args:
             category (str): The category of the question.
@@ -138,10 +185,15 @@ class JeopardyGame:
         Returns:
             bool: True if the question was successfully marked as answered, False otherwise.
         """
-        question = self.get_question(category, value)
+        question = next(
+            (
+                q for q in self.questions
+                if q.category == category and str(q.value) == str(value) and not q.answered
+            ),
+            None,
+        )
         if question:
-            question.answered = True
-            return True
+            return self.answer_question(question.id)[0]
         return False
 
     def add_member_to_team(self, team_name, member):
@@ -155,9 +207,9 @@ class JeopardyGame:
         Returns:
             bool: True if the member was successfully added, False otherwise.
         """
-        team = next((team for team in self.teams if team.name == team_name), None)
+        team = self._teams_by_name.get(team_name)
         if team:
-            team.add_member(member)
+            team.add_team_member(member)
             return True
         return False
 
@@ -172,7 +224,7 @@ class JeopardyGame:
         Returns:
             bool: True if points were successfully awarded, False otherwise.
         """
-        team = next((team for team in self.teams if team.name == team_name), None)
+        team = self._teams_by_name.get(team_name)
         if team:
             team.add_points(points)
             return True
@@ -196,6 +248,13 @@ class JeopardyGame:
         """
         self.players.append(member)
 
+    def remove_member(self, member: discord.Member):
+        """
+        Removes a player (by Discord id, so a rebound member object matches too)
+        """
+        member_id = _member_id(member)
+        self.players = [player for player in self.players if _member_id(player) != member_id]
+
     def get_question_by_uuid(self, uuid: str) -> Optional[JeopardyQuestion]:
         """
         Retrieves a question by its UUID.
@@ -206,49 +265,46 @@ class JeopardyGame:
         Returns:
             JeopardyQuestion or None: The question object if found, otherwise None.
         """
-        for question in self.questions:
-            if question.id == uuid:
-                return question
-        return None
+        return self._questions_by_id.get(uuid)
 
-    def answer_question(self, uuid: str) -> bool:
+    def answer_question(self, uuid: str) -> Tuple[bool, Optional[JeopardyQuestion]]:
         """
-        Marks a question as answered in a specific category and value.
+        Marks a question as answered and crosses it off the board.
 
         Args:
             uuid (uuid.UUID): The UUID of the question.
 
         Returns:
-            bool: True if the question was successfully marked as answered, False otherwise.
+            tuple: (True, question) if the question was found, otherwise (False, None).
         """
-        question = self.get_question_by_uuid(uuid)
+        question = self._questions_by_id.get(uuid)
         if question:
             question.answered = True
+            category, position = self._board_cells[uuid]
+            self._board[category][position] = ANSWERED_CELL
             return True, question
-        return False
+        return False, None
 
     def get_winners(self) -> List[str]:
         """
         Retrieves the winning team(s).
 
         Returns:
-            list: A list of winning Team objects.
+            list: The names of the teams with the highest score.
         """
-        winners = []
-        max_points = max([team.points for team in self.teams])
-        for team in self.teams:
-            if team.points == max_points:
-                for member in team.members:
-                    winners.append(member)
+        if not self.teams:
+            return []
+        max_points = max(team.score for team in self.teams)
+        return [team.name for team in self.teams if team.score == max_points]
 
     def attach_roles(self, roles: List[discord.Role]) -> None:
         """
         Attaches roles to teams
         """
-        for team in self.teams:
-            for role in roles:
-                if team.name == role.name:
-                    team.attach_role(role)
+        for role in roles:
+            team = self._teams_by_name.get(role.name)
+            if team:
+                team.attach_role(role)
 
     def get_members(self):
         """
@@ -258,30 +314,166 @@ class JeopardyGame:
 
     def get_board(self):
         """
-        Retrieves the board
-        """
-        data = {}
-        for question in self.questions:
-            if question.category not in data.keys():
-                data[question.category] = []
-            if not question.answered:
-                data[question.category].append(question.value)
-            else:
-                data[question.category].append("XXXX")
+        Retrieves the board: each category's values by points, with answered questions crossed out.
 
-        return data
+        The returned dict is the live board view; treat it as read-only.
+        """
+        return self._board
 
     def get_questions_in_sorted_categories_and_by_points(self):
         """
         Retrieves the questions in sorted categories and by points
         """
-        data = {}
-        for question in self.questions:
-            if question.category not in data.keys():
-                data[question.category] = []
-            if not question.answered:
-                data[question.category].append(question.value)
-            else:
-                data[question.category].append("XXXX")
-
-        return data
+        return self._board
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Serializes the full game state, with members and roles stored as Discord ids.
+
+        Returns:
+            dict: State that from_state() turns back into an equal game.
+        """
+        return {
+            "game": {
+                "name": self.name,
+                "description": self.description,
+                "categories": self.categories,
+                "per_category": self.per_category,
+                "uuid": str(self.uuid),
+                "announced": self.is_announced,
+                "started": self.is_started,
+            },
+            "teams": [
+                {
+                    "name": team.name,
+                    "score": team.score,
+                    "members": [_member_id(member) for member in team.members],
+                }
+                for team in self.teams
+            ],
+            "players": [_member_id(player) for player in self.players],
+            "questions": [
+                {
+                    "id": question.id,
+                    "category": question.category,
+                    "question": question.question,
+                    "answer": question.answer,
+                    "value": question.value,
+                    "answered": question.answered,
+                    "revealed": question.revealed,
+                }
+                for question in self.questions
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "JeopardyGame":
+        """
+        Rebuilds a game from to_state() output. Players and team members are Discord ids until
+        bind_members() is called.
+
+        Args:
+            state (dict): The serialized game state.
+
+        Returns:
+            JeopardyGame: The restored game.
+        """
+        game = cls.__new__(cls)
+        info = state["game"]
+        game.name = info["name"]
+        game.description = info["description"]
+        game.categories = info["categories"]
+        game.per_category = info["per_category"]
+        game.category_name = ()
+        game.uuid = uuid.UUID(info["uuid"])
+        game.is_announced = info["announced"]
+        game.is_started = info["started"]
+        game.messages = []
+        game.teams = []
+        for team_state in state["teams"]:
+            team = Team(team_state["name"])
+            team.score = team_state["score"]
+            team.members = list(team_state["members"])
+            game.teams.append(team)
+        game.players = list(state["players"])
+        game.questions = []
+        for question_state in state["questions"]:
+            question = JeopardyQuestion(
+                question_state["category"],
+                question_state["question"],
+                question_state["answer"],
+                question_state["value"],
+                id=question_state["id"],
+            )
+            question.answered = question_state["answered"]
+            question.revealed = question_state["revealed"]
+            game.questions.append(question)
+        game._index()
+        return game
+
+    def copy(self) -> "JeopardyGame":
+        """
+        Returns an independent game with the same state (question ids included).
+        """
+        return JeopardyGame.from_state(self.to_state())
+
+    def apply_event(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Applies a recorded game action; replaying the events recorded after a snapshot brings
+        the restored game up to date.
+
+        Args:
+            event_type (str): One of announce, start, join, leave, teams, reveal, answer, award.
+            payload (dict): The event data.
+        """
+        if event_type == "announce":
+            self.announce()
+        elif event_type == "start":
+            self.start()
+        elif event_type == "join":
+            self.add_member(payload["member_id"])
+        elif event_type == "leave":
+            self.remove_member(payload["member_id"])
+        elif event_type == "teams":
+            for team in self.teams:
+                team.members = list(payload["teams"].get(team.name, []))
+        elif event_type == "reveal":
+            question = self.get_question_by_uuid(payload["uuid"])
+            if question:
+                question.revealed = True
+        elif event_type == "answer":
+            self.answer_question(payload["uuid"])
+        elif event_type == "award":
+            self.award_points(payload["team"], payload["points"])
+        else:
+            raise ValueError(f"Unknown game event: {event_type}")
+
+    def bind_members(self, resolve: Callable[[int], Optional[discord.Member]]) -> List[int]:
+        """
+        Replaces the Discord ids of players and team members with member objects.
+
+        Args:
+            resolve (callable): Returns the member for an id, or None if they are gone.
+
+        Returns:
+            list: Ids that could not be resolved (dropped from the game).
+        """
+        missing = []
+        resolved = {}
+
+        def bind(values):
+            bound = []
+            for value in values:
+                member_id = _member_id(value)
+                if member_id not in resolved:
+                    resolved[member_id] = resolve(member_id) if value is member_id else value
+                    if resolved[member_id] is None:
+                        missing.append(member_id)
+                if resolved[member_id] is not None:
+                    bound.append(resolved[member_id])
+            return bound
+
+        self.players = bind(self.players)
+        for team in self.teams:
+            team.members = bind(team.members)
+        return missing
@@ -15,14 +15,17 @@ class JeopardyQuestion:
         id (uuid.UUID): Unique identifier for the question.
     """
 
-    def __init__(self, category, question, answer, value):
+    # A board can hold thousands of these; slots keep each one small
+    __slots__ = ("category", "question", "answer", "value", "answered", "revealed", "id")
+
+    def __init__(self, category, question, answer, value, id=None):
         self.category = category
         self.question = question
         self.answer = answer
         self.value = value
         self.answered = False
         self.revealed = False
-        self.id = str(uuid.uuid4())
+        self.id = id or str(uuid.uuid4())
 
     def to_json(self):
         """
@@ -14,6 +14,8 @@ import discord
 
 
 class Team:
+    __slots__ = ("name", "role", "members", "score")
+
     def __init__(self, name: str, role: Optional[discord.Role] = None) -> None:
         if role is None:
             self.name = name
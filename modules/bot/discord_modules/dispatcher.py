@@ -0,0 +1,128 @@
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Default seconds an API call may wait for the bot before giving up
+DEFAULT_CALL_TIMEOUT = 15.0
+# Calls that may be waiting on or running in the bot loop at once; more are rejected
+DEFAULT_MAX_PENDING = 32
+
+
+class BotDispatchError(Exception):
+    """Base class for failures to run a call on the bot's event loop."""
+
+
+class BotUnavailable(BotDispatchError):
+    """The bot's event loop is not running (not started yet, or shut down)."""
+
+
+class BotBusy(BotDispatchError):
+    """Too many calls are already waiting for the bot."""
+
+
+class BotCallTimeout(BotDispatchError):
+    """The call did not finish in time and was cancelled."""
+
+
+class BotDispatcher:
+    """
+    Runs callables on the bot's event loop from other threads (Flask request handlers).
+
+    Discord objects belong to the loop of the bot thread, so coroutines touching them must be
+    created and awaited there. ``submit`` schedules a call with ``run_coroutine_threadsafe`` and
+    returns a ``concurrent.futures.Future``; ``run`` waits for it. Plain functions are run on the loop
+    too, so they never race with the bot's own handlers. Each call has a timeout after which it is
+    cancelled on the loop, and at most ``max_pending`` calls can be in flight; further calls fail
+    fast with BotBusy instead of piling up behind a slow Discord API.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int = DEFAULT_MAX_PENDING,
+                 default_timeout: float = DEFAULT_CALL_TIMEOUT):
+        self.loop = loop
+        self.max_pending = max_pending
+        self.default_timeout = default_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures: Set[concurrent.futures.Future] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of calls submitted and not finished yet."""
+        with self._lock:
+            return len(self._futures)
+
+    def in_loop_thread(self) -> bool:
+        """True when called from the bot loop's own thread (where blocking on a call would deadlock)."""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def submit(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None,
+               **kwargs) -> concurrent.futures.Future:
+        """
+        Schedule ``fn(*args, **kwargs)`` on the bot loop and return a future for its result.
+
+        Raises BotUnavailable when the loop is not running and BotBusy when ``max_pending`` calls
+        are already in flight. The call is cancelled on the loop once ``timeout`` seconds pass.
+        """
+        if self._closed or self.loop is None or self.loop.is_closed() or not self.loop.is_running():
+            raise BotUnavailable("Bot event loop is not running")
+        if not self._slots.acquire(blocking=False):
+            raise BotBusy(f"Bot is busy ({self.max_pending} calls pending)")
+
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._call(fn, args, kwargs, timeout), self.loop)
+        except RuntimeError as e:
+            self._slots.release()
+            raise BotUnavailable(str(e)) from e
+
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._finished)
+        return future
+
+    def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run ``fn`` on the bot loop and wait for its result; errors raised by ``fn`` propagate."""
+        if self.in_loop_thread():
+            raise RuntimeError("BotDispatcher.run cannot be called from the bot loop; await the call instead")
+        timeout = self.default_timeout if timeout is None else timeout
+        future = self.submit(fn, *args, timeout=timeout, **kwargs)
+        try:
+            # The loop enforces the timeout itself; the grace period covers scheduling delay
+            return future.result(timeout + 1.0)
+        except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError, asyncio.TimeoutError) as e:
+            future.cancel()
+            raise BotCallTimeout(f"{getattr(fn, '__name__', fn)} did not finish within {timeout}s") from e
+
+    def cancel_all(self) -> int:
+        """Cancel every call still pending. Returns how many were cancelled."""
+        with self._lock:
+            futures = list(self._futures)
+        return sum(1 for future in futures if future.cancel())
+
+    def shutdown(self):
+        """Refuse new calls and cancel the pending ones."""
+        self._closed = True
+        cancelled = self.cancel_all()
+        if cancelled:
+            logger.info(f"Cancelled {cancelled} pending bot calls on shutdown")
+
+    async def _call(self, fn, args, kwargs, timeout):
+        # Created here, on the bot loop, so coroutines are bound to the loop that owns the Discord objects
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await asyncio.wait_for(result, timeout)
+        return result
+
+    def _finished(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from modules.bot.discord_modules.ratelimit import RateLimitBucket, retry_after
+
+logger = logging.getLogger(__name__)
+
+# Discord calls in flight at once for one batch
+DEFAULT_CONCURRENCY = 8
+# Attempts per call before it is reported as failed
+DEFAULT_MAX_ATTEMPTS = 4
+# Requests per period of the buckets the game uses, kept under Discord's per-route limits
+# (role changes on members are limited per guild to about 10 per second)
+BUCKET_RATES: Dict[Hashable, Tuple[int, float]] = {
+    "member_roles": (10, 1.0),
+    "roles": (5, 1.0),
+    "channels": (5, 1.0),
+}
+# Any other bucket (e.g. a channel id)
+DEFAULT_BUCKET_RATE = 5
+DEFAULT_BUCKET_PER = 1.0
+# Discord's global limit, shared by every bucket
+GLOBAL_RATE = (50, 1.0)
+# Failures kept per batch for the progress report
+MAX_REPORTED_ERRORS = 20
+
+# (label, zero-argument callable returning an awaitable, bucket key)
+Operation = Tuple[str, Callable[[], Awaitable[Any]], Hashable]
+
+
+class DiscordOperationError(Exception):
+    """Raised when some operations of a batch still failed after retrying."""
+
+    def __init__(self, progress: "OperationProgress"):
+        super().__init__(f"{progress.failed} of {progress.total} operations failed in {progress.name}")
+        self.progress = progress
+
+
+class OperationProgress:
+    """Progress of one batch, as reported to the API."""
+
+    __slots__ = ("name", "total", "done", "failed", "retries", "errors", "started_at", "finished_at")
+
+    def __init__(self, name: str, total: int):
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.retries = 0
+        self.errors: List[str] = []
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "retries": self.retries,
+            "errors": list(self.errors),
+            "finished": self.finished,
+            "elapsed_seconds": round((self.finished_at or time.time()) - self.started_at, 3),
+        }
+
+
+def _is_retryable_server_error(error: Exception) -> bool:
+    status = getattr(error, "status", None)
+    return isinstance(status, int) and status >= 500
+
+
+class DiscordOpRunner:
+    """
+    Runs batches of independent Discord calls (create/delete channels and roles, add roles to
+    members) with bounded concurrency.
+
+    At most ``concurrency`` calls are in flight. Every call names a rate-limit bucket (for
+    example "roles" or a channel id) with its own rate from ``BUCKET_RATES``, and all calls also
+    stay under Discord's global limit. A 429 pauses the whole bucket for ``retry_after`` before the
+    call is retried, and 5xx responses are retried with exponential backoff. A failed call does not
+    stop the rest of the batch. Progress of the latest batch of each name is kept for the API.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 bucket_rate: int = DEFAULT_BUCKET_RATE, bucket_per: float = DEFAULT_BUCKET_PER,
+                 bucket_rates: Optional[Dict[Hashable, Tuple[int, float]]] = None,
+                 global_rate: Tuple[int, float] = GLOBAL_RATE, backoff: float = 0.5):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.bucket_rate = bucket_rate
+        self.bucket_per = bucket_per
+        self.bucket_rates = {**BUCKET_RATES, **(bucket_rates or {})}
+        self.backoff = backoff
+        self._buckets: Dict[Hashable, RateLimitBucket] = {}
+        self._global = RateLimitBucket(*global_rate)
+        self.progress: Dict[str, OperationProgress] = {}
+
+    def progress_report(self) -> Dict[str, Dict[str, Any]]:
+        """Progress of the latest batch of each name."""
+        return {name: progress.to_dict() for name, progress in self.progress.items()}
+
+    def raise_for_failures(self, name: str):
+        """Raise DiscordOperationError if the latest batch called ``name`` had failed calls."""
+        progress = self.progress.get(name)
+        if progress is not None and progress.failed:
+            raise DiscordOperationError(progress)
+
+    async def run(self, name: str, operations: Iterable[Operation], raise_on_error: bool = False) -> List[Any]:
+        """
+        Run the operations and return their results in order (the exception for failed ones).
+
+        Args:
+            name (str): Batch name for progress reporting (e.g. "setup", "assign_roles").
+            operations (iterable): (label, factory, bucket key) tuples; factory() starts the call
+                and is called again for each retry.
+            raise_on_error (bool): Raise DiscordOperationError after the batch if any call failed.
+        """
+        operations = list(operations)
+        progress = OperationProgress(name, len(operations))
+        self.progress[name] = progress
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(label, factory, bucket_key):
+            async with semaphore:
+                try:
+                    return await self._attempt(progress, label, factory, bucket_key)
+                except Exception as e:
+                    progress.failed += 1
+                    if len(progress.errors) < MAX_REPORTED_ERRORS:
+                        progress.errors.append(f"{label}: {e}")
+                    logger.error(f"Discord operation {label} in {name} failed: {e}")
+                    return e
+                finally:
+                    progress.done += 1
+
+        try:
+            results = await asyncio.gather(*(run_one(*operation) for operation in operations))
+        finally:
+            progress.finished_at = time.time()
+        logger.info(f"{name}: {progress.done - progress.failed}/{progress.total} Discord operations succeeded "
+                    f"in {progress.finished_at - progress.started_at:.1f}s")
+        if raise_on_error:
+            self.raise_for_failures(name)
+        return results
+
+    def _bucket(self, key: Hashable) -> RateLimitBucket:
+        if key not in self._buckets:
+            rate, per = self.bucket_rates.get(key, (self.bucket_rate, self.bucket_per))
+            self._buckets[key] = RateLimitBucket(rate, per)
+        return self._buckets[key]
+
+    async def _attempt(self, progress, label, factory, bucket_key):
+        bucket = self._bucket(bucket_key)
+        attempt = 1
+        while True:
+            delay = max(bucket.delay(), self._global.delay())
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = max(bucket.delay(), self._global.delay())
+            bucket.consume()
+            self._global.consume()
+            try:
+                return await factory()
+            except Exception as e:
+                wait = retry_after(e)
+                if wait is None and _is_retryable_server_error(e):
+                    wait = self.backoff * 2 ** (attempt - 1)
+                if wait is None or attempt >= self.max_attempts:
+                    raise
+                if retry_after(e) is not None:
+                    # The whole bucket is limited, not only this call
+                    bucket.block(wait)
+                else:
+                    await asyncio.sleep(wait)
+                progress.retries += 1
+                attempt += 1
+                logger.warning(f"Retrying Discord operation {label} (attempt {attempt}) in {wait}s: {e}")
@@ -0,0 +1,51 @@
+import time
+from collections import deque
+from typing import Optional
+
+
+class RateLimitBucket:
+    """
+    Client-side view of a Discord rate-limit bucket: at most ``rate`` requests per ``per`` seconds.
+
+    Callers ask ``delay()`` before sending and ``consume()`` when they do, so requests are spread
+    out instead of being queued (and eventually 429'd) by Discord. ``block()`` records a
+    ``retry_after`` the API returned, which overrides the local estimate.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._sent = deque()
+        self._blocked_until = 0.0
+
+    def delay(self, now: Optional[float] = None) -> float:
+        """Seconds to wait before the next request may be sent (0 when it can go now)."""
+        now = time.monotonic() if now is None else now
+        while self._sent and self._sent[0] <= now - self.per:
+            self._sent.popleft()
+        wait = self._blocked_until - now
+        if len(self._sent) >= self.rate:
+            wait = max(wait, self._sent[0] + self.per - now)
+        return max(wait, 0.0)
+
+    def consume(self, now: Optional[float] = None):
+        """Record a request sent now."""
+        self._sent.append(time.monotonic() if now is None else now)
+
+    def block(self, retry_after: float, now: Optional[float] = None):
+        """Hold every request for ``retry_after`` seconds, as told by a 429 response."""
+        now = time.monotonic() if now is None else now
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """The ``retry_after`` of a 429 error raised by the Discord client, or None for other errors."""
+    if getattr(error, "status", None) != 429:
+        return None
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = getattr(error, "retry_after", None) or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else 1.0
+    except (TypeError, ValueError):
+        return 1.0
@@ -0,0 +1,128 @@
+import heapq
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Listeners without an explicit ttl stop after a day
+DEFAULT_LISTENER_TTL = 24 * 60 * 60
+_DEFAULT_TTL = object()
+
+
+def _weak(callback: Optional[Callable]) -> Optional[Callable[[], Optional[Callable]]]:
+    """Weak reference to a callback; bound methods are tracked through their instance."""
+    if callback is None:
+        return None
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
+
+class ReactionListener:
+    """Callbacks registered for one emoji on one message."""
+
+    __slots__ = ("message_id", "emoji", "expires_at", "_on_add", "_on_remove")
+
+    def __init__(self, message_id: int, emoji: str, on_add, on_remove, expires_at: Optional[float]):
+        self.message_id = message_id
+        self.emoji = emoji
+        self.expires_at = expires_at
+        self._on_add = _weak(on_add)
+        self._on_remove = _weak(on_remove)
+
+    @property
+    def on_add(self) -> Optional[Callable]:
+        return self._on_add() if self._on_add else None
+
+    @property
+    def on_remove(self) -> Optional[Callable]:
+        return self._on_remove() if self._on_remove else None
+
+    def is_dead(self, now: float) -> bool:
+        """Expired, or every callback it had was garbage collected."""
+        if self.expires_at is not None and self.expires_at <= now:
+            return True
+        refs = [ref for ref in (self._on_add, self._on_remove) if ref is not None]
+        return bool(refs) and all(ref() is None for ref in refs)
+
+
+class ReactionRegistry:
+    """
+    Reaction listeners keyed by (message id, emoji).
+
+    Raw gateway reaction events only carry ids, so ``get`` answers whether a reaction matters
+    with two dict lookups and without fetching the message; reactions on every other message in
+    every guild are dropped right away. Callbacks are held weakly (an unloaded cog does not stay
+    alive through its listeners) and listeners expire after their ttl.
+    """
+
+    def __init__(self, default_ttl: Optional[float] = DEFAULT_LISTENER_TTL, clock: Callable[[], float] = time.monotonic):
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._by_message: Dict[int, Dict[str, ReactionListener]] = {}
+        self._expiry: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        return sum(len(listeners) for listeners in self._by_message.values())
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._by_message
+
+    def register(self, message_id: int, emoji: str, on_add: Optional[Callable] = None,
+                 on_remove: Optional[Callable] = None, ttl: Any = _DEFAULT_TTL) -> ReactionListener:
+        """
+        Listen for ``emoji`` on a message, replacing any listener for the same pair.
+
+        Args:
+            message_id (int): The message to watch.
+            emoji (str): The emoji, as str(emoji) (unicode character or <:name:id>).
+            on_add (callable, optional): Called with the member who added the reaction.
+            on_remove (callable, optional): Called with the member who removed the reaction.
+            ttl (float, optional): Seconds until the listener expires; None never expires,
+                the default uses ``default_ttl``.
+        """
+        ttl = self.default_ttl if ttl is _DEFAULT_TTL else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        listener = ReactionListener(message_id, str(emoji), on_add, on_remove, expires_at)
+        self._by_message.setdefault(message_id, {})[listener.emoji] = listener
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, message_id, listener.emoji))
+        return listener
+
+    def unregister(self, message_id: int, emoji: Optional[str] = None) -> bool:
+        """Stop listening for an emoji on a message (every emoji when none is given)."""
+        listeners = self._by_message.get(message_id)
+        if not listeners:
+            return False
+        if emoji is None:
+            del self._by_message[message_id]
+            return True
+        removed = listeners.pop(str(emoji), None) is not None
+        if not listeners:
+            del self._by_message[message_id]
+        return removed
+
+    def get(self, message_id: int, emoji: Any) -> Optional[ReactionListener]:
+        """The live listener for a reaction, or None if nobody is listening."""
+        listeners = self._by_message.get(message_id)
+        if listeners is None:
+            return None
+        listener = listeners.get(str(emoji))
+        if listener is None:
+            return None
+        if listener.is_dead(self.clock()):
+            self.unregister(message_id, listener.emoji)
+            return None
+        return listener
+
+    def purge_expired(self) -> int:
+        """Drop expired listeners. Returns how many were removed."""
+        now = self.clock()
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, message_id, emoji = heapq.heappop(self._expiry)
+            listener = self._by_message.get(message_id, {}).get(emoji)
+            # A newer registration of the same pair has its own heap entry
+            if listener is not None and listener.is_dead(now):
+                self.unregister(message_id, emoji)
+                removed += 1
+        return removed
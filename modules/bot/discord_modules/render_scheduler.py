@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from modules.bot.discord_modules.ratelimit import RateLimitBucket, retry_after
+
+logger = logging.getLogger(__name__)
+
+# Seconds to collect changes before rendering a dirty board
+DEFAULT_RENDER_WINDOW = 0.5
+# Discord allows roughly 5 message edits per 5 seconds in a channel
+DEFAULT_EDIT_RATE = 5
+DEFAULT_EDIT_PER = 5.0
+
+
+def payload_digest(payload: Any) -> str:
+    """Content hash of a render payload (a discord.Embed or anything JSON-serializable)."""
+    if hasattr(payload, "to_dict"):
+        payload = payload.to_dict()
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class _Target:
+    __slots__ = ("name", "build", "publish", "bucket_key", "dirty", "last_digest", "task", "lock")
+
+    def __init__(self, name, build, publish, bucket_key):
+        self.name = name
+        self.build = build
+        self.publish = publish
+        self.bucket_key = bucket_key
+        self.dirty = False
+        self.last_digest = None
+        self.task = None
+        self.lock = asyncio.Lock()
+
+
+class RenderScheduler:
+    """
+    Coalesces re-renders of live Discord messages (scoreboard, gameboard).
+
+    Callers ``mark_dirty`` a board whenever its state changes. The board is rendered once the
+    ``window`` has passed, so a burst of changes becomes a single edit; edits whose content hash
+    matches what is already shown are skipped, and edits wait for their channel's rate-limit bucket
+    instead of queueing up in the HTTP client. Changes made while an edit waits are folded into it,
+    so the visible board converges to the latest state. Must be used from the bot's event loop.
+    """
+
+    def __init__(self, window: float = DEFAULT_RENDER_WINDOW, rate: int = DEFAULT_EDIT_RATE,
+                 per: float = DEFAULT_EDIT_PER):
+        self.window = window
+        self.rate = rate
+        self.per = per
+        self._targets: Dict[str, _Target] = {}
+        self._buckets: Dict[Hashable, RateLimitBucket] = {}
+        self.stats = {"requested": 0, "published": 0, "unchanged": 0, "rate_limited": 0, "failed": 0}
+
+    def register(self, name: str, build: Callable[[], Any], publish: Callable[[Any], Awaitable[Any]],
+                 bucket_key: Optional[Callable[[], Hashable]] = None):
+        """
+        Register a board.
+
+        Args:
+            name (str): Name used with mark_dirty / flush.
+            build (callable): Returns the current payload (e.g. an Embed), or None when there is nothing to show.
+            publish (coroutine function): Sends or edits the message with the payload.
+            bucket_key (callable): Returns the rate-limit bucket (e.g. the channel id) the edit counts against.
+        """
+        self._targets[name] = _Target(name, build, publish, bucket_key)
+
+    def mark_dirty(self, *names: str):
+        """Schedule a render of the named boards (all boards when no name is given)."""
+        for name in names or tuple(self._targets):
+            target = self._targets[name]
+            target.dirty = True
+            self.stats["requested"] += 1
+            if target.task is None or target.task.done():
+                target.task = asyncio.get_running_loop().create_task(self._drain(target))
+
+    async def flush(self, *names: str):
+        """Render the named boards (all when no name is given) now if they are dirty."""
+        for name in names or tuple(self._targets):
+            await self._render(self._targets[name])
+
+    def reset(self):
+        """Cancel pending renders and forget what was shown (the messages are gone, e.g. after a game ends)."""
+        for target in self._targets.values():
+            if target.task is not None and not target.task.done():
+                target.task.cancel()
+            target.task = None
+            target.dirty = False
+            target.last_digest = None
+        self._buckets.clear()
+
+    def _bucket(self, target: _Target) -> Optional[RateLimitBucket]:
+        key = target.bucket_key() if target.bucket_key else target.name
+        if key is None:
+            return None
+        if key not in self._buckets:
+            self._buckets[key] = RateLimitBucket(self.rate, self.per)
+        return self._buckets[key]
+
+    async def _drain(self, target: _Target):
+        await asyncio.sleep(self.window)
+        while target.dirty:
+            await self._render(target)
+
+    async def _render(self, target: _Target):
+        async with target.lock:
+            while target.dirty:
+                bucket = self._bucket(target)
+                delay = bucket.delay() if bucket else 0.0
+                if delay > 0:
+                    # Anything marked dirty while waiting is picked up by the same edit
+                    await asyncio.sleep(delay)
+                    continue
+
+                target.dirty = False
+                payload = target.build()
+                if payload is None:
+                    return
+                digest = payload_digest(payload)
+                if digest == target.last_digest:
+                    self.stats["unchanged"] += 1
+                    return
+
+                if bucket:
+                    bucket.consume()
+                try:
+                    await target.publish(payload)
+                except Exception as e:
+                    wait = retry_after(e)
+                    if wait is None:
+                        self.stats["failed"] += 1
+                        logger.error(f"Failed to render {target.name}: {e}")
+                        return
+                    self.stats["rate_limited"] += 1
+                    logger.warning(f"Rate limited rendering {target.name}, retrying in {wait}s")
+                    if bucket:
+                        bucket.block(wait)
+                    else:
+                        await asyncio.sleep(wait)
+                    target.dirty = True
+                    continue
+                target.last_digest = digest
+                self.stats["published"] += 1
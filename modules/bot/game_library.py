@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, literal_column
+
+from modules.bot.models import JeopardyGame as JeopardyGameRecord
+from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
+
+logger = logging.getLogger(__name__)
+
+# Parsed games kept in memory
+GAME_CACHE_SIZE = 16
+# Directory /gamedata reads game files from
+GAME_FILES_DIR = "./data"
+
+REQUIRED_GAME_KEYS = {"name", "description", "players", "categories", "per_category", "teams", "uuid"}
+REQUIRED_QUESTION_KEYS = {"question", "answer", "value", "uuid"}
+
+# Same expression as the ix_jeopardy_game_uuid index, so lookups by uuid use it
+_GAME_UUID = func.json_extract(JeopardyGameRecord.data, literal_column("'$.game.uuid'"))
+_GAME_DESCRIPTION = func.json_extract(JeopardyGameRecord.data, literal_column("'$.game.description'"))
+
+
+def is_valid_game_json(data):
+    if not isinstance(data, dict) or "game" not in data or "questions" not in data:
+        return False
+    game_info = data["game"]
+    if not isinstance(game_info, dict) or not isinstance(data["questions"], dict):
+        return False
+    if not all(key in game_info for key in REQUIRED_GAME_KEYS):
+        return False
+    for category, questions in data["questions"].items():
+        for question in questions:
+            if not isinstance(question, dict) or not all(key in question for key in REQUIRED_QUESTION_KEYS):
+                return False
+    return True
+
+
+def _value(question: Dict[str, Any]) -> int:
+    return question["value"]
+
+
+def normalize_game_package(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a game package and return it in the stored form.
+
+    Names and ids are strings, point values and per_category are integers, each category's
+    questions are ordered by value and ``categories`` lists the categories that have questions.
+    Raises ValueError for a package that is not a valid game.
+    """
+    if not is_valid_game_json(data):
+        raise ValueError("Invalid game JSON format")
+    game = dict(data["game"])
+    game["name"] = str(game["name"]).strip()
+    if not game["name"]:
+        raise ValueError("Game name must not be empty")
+    game["uuid"] = str(game["uuid"])
+    try:
+        game["per_category"] = int(game["per_category"])
+        questions = {
+            str(category): sorted(
+                ({**question, "value": int(question["value"]), "uuid": str(question["uuid"])} for question in items),
+                key=_value,
+            )
+            for category, items in data["questions"].items()
+        }
+    except (TypeError, ValueError):
+        raise ValueError("per_category and question values must be integers")
+    game["categories"] = list(questions)
+    return {"game": game, "questions": questions}
+
+
+class GameLibrary:
+    """
+    Stored Jeopardy game packages, looked up by name or uuid.
+
+    Packages are validated and normalized once when uploaded. Both keys are indexed in the
+    jeopardy_game table, and the most recently used games are kept parsed in an LRU, so selecting
+    a game for play is a dictionary lookup. ``new_game`` hands out a copy, so the cached game is
+    never mutated by play.
+    """
+
+    def __init__(self, db_connect, cache_size: int = GAME_CACHE_SIZE):
+        self.db_connect = db_connect
+        self.cache_size = cache_size
+        self._games: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], JeopardyGame]]" = OrderedDict()
+        self._files: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def list_games(self) -> List[Dict[str, Any]]:
+        """Name, description and uuid of every stored game, without loading the packages."""
+        db = self.db_connect.SessionLocal()
+        try:
+            rows = db.query(JeopardyGameRecord.name, _GAME_DESCRIPTION, _GAME_UUID).order_by(JeopardyGameRecord.name)
+            return [{"name": name, "description": description, "uuid": uuid} for name, description, uuid in rows]
+        finally:
+            db.close()
+
+    def get_package(self, name: Optional[str] = None, uuid: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The stored package of a game, by name or uuid, or None if there is no such game."""
+        entry = self._get(name, uuid)
+        return entry[0] if entry else None
+
+    def new_game(self, name: Optional[str] = None, uuid: Optional[str] = None) -> Optional[JeopardyGame]:
+        """A fresh JeopardyGame for a stored game, by name or uuid, or None if there is no such game."""
+        entry = self._get(name, uuid)
+        return entry[1].copy() if entry else None
+
+    def add_or_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate and store a game package. A game with the same uuid, or else the same name, is
+        replaced. Raises ValueError for an invalid package.
+        """
+        package = normalize_game_package(data)
+        info = package["game"]
+        db = self.db_connect.SessionLocal()
+        try:
+            record = db.query(JeopardyGameRecord).filter(_GAME_UUID == info["uuid"]).first()
+            if record is None:
+                record = db.query(JeopardyGameRecord).filter(JeopardyGameRecord.name == info["name"]).first()
+            if record is None:
+                record = JeopardyGameRecord()
+                db.add(record)
+                status = "created"
+            else:
+                status = "updated"
+            record.name = info["name"]
+            record.data = package
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error storing game {info['name']}: {e}")
+            raise
+        finally:
+            db.close()
+
+        with self._lock:
+            # Old entries may be cached under the previous name or uuid
+            self._games.clear()
+        logger.info(f"Game {info['name']} {status}")
+        return {"status": status, "message": f"Game {info['name']} {status}", "name": info["name"], "uuid": info["uuid"]}
+
+    def load_file(self, file_name: str) -> Any:
+        """
+        Parsed contents of ``<GAME_FILES_DIR>/<file_name>.json``, re-read only when the file changes.
+        Raises FileNotFoundError for a missing file or a name that leaves the directory.
+        """
+        if not file_name or os.path.basename(file_name) != file_name:
+            raise FileNotFoundError(f"No game file named {file_name!r}")
+        path = os.path.join(GAME_FILES_DIR, f"{file_name}.json")
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._files:
+                self._files.move_to_end(key)
+                return self._files[key]
+        with open(path) as f:
+            data = json.load(f)
+        with self._lock:
+            self._files[key] = data
+            while len(self._files) > self.cache_size:
+                self._files.popitem(last=False)
+        return data
+
+    def _get(self, name: Optional[str], uuid: Optional[str]):
+        key = ("uuid", str(uuid)) if uuid else ("name", (name or "").strip())
+        with self._lock:
+            entry = self._games.get(key)
+            if entry is not None:
+                self._games.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry
+            self.stats["misses"] += 1
+
+        db = self.db_connect.SessionLocal()
+        try:
+            query = db.query(JeopardyGameRecord.data)
+            if key[0] == "uuid":
+                query = query.filter(_GAME_UUID == key[1])
+            else:
+                query = query.filter(JeopardyGameRecord.name == key[1])
+            row = query.order_by(JeopardyGameRecord.id).first()
+        finally:
+            db.close()
+        if row is None:
+            return None
+
+        package = row[0]
+        entry = (package, JeopardyGame(package))
+        info = package["game"]
+        with self._lock:
+            for cache_key in (("name", info["name"]), ("uuid", str(info["uuid"]))):
+                self._games[cache_key] = entry
+                self._games.move_to_end(cache_key)
+            while len(self._games) > self.cache_size * 2:
+                self._games.popitem(last=False)
+        return entry
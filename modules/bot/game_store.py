@@ -0,0 +1,206 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, literal_column
+
+from modules.bot.models import ActiveGame, ActiveGameEvent
+
+logger = logging.getLogger(__name__)
+
+# Events recorded before the game state is snapshotted and older events are dropped
+SNAPSHOT_EVERY = 50
+
+_GUILD_ID = func.json_extract(ActiveGame.game_data, literal_column("'$.guild_id'"))
+
+
+class GameStore:
+    """
+    Persists the active Jeopardy game so it survives a bot reconnect or process restart.
+
+    The active_game row holds a snapshot of the game (game_data, with the sequence number of the
+    last event it includes) and the Discord ids of everything the game created (helper_data).
+    Every game action after the snapshot is appended to active_game_events; every
+    ``snapshot_every`` events the snapshot is rewritten and the events it covers are deleted, so
+    resuming replays a bounded number of events.
+
+    Each guild runs its own game: ``for_guild`` returns a store that only sees that guild's row
+    (its id is kept in game_data), so starting or clearing a game leaves other guilds' games alone.
+
+    Persistence errors are logged and never interrupt the running game.
+    """
+
+    def __init__(self, db_connect, snapshot_every: int = SNAPSHOT_EVERY, guild_id: Optional[int] = None):
+        self.db_connect = db_connect
+        self.snapshot_every = snapshot_every
+        self.guild_id = guild_id
+        self.active_game_id: Optional[int] = None
+        self.seq = 0
+        self.snapshot_seq = 0
+
+    def for_guild(self, guild_id: int) -> "GameStore":
+        """A store for the game of one guild, sharing this store's database."""
+        return GameStore(self.db_connect, self.snapshot_every, guild_id)
+
+    def stored_guild_ids(self) -> List[int]:
+        """Ids of the guilds that have a stored game."""
+        db = self.db_connect.SessionLocal()
+        try:
+            return [guild_id for (guild_id,) in db.query(_GUILD_ID).filter(_GUILD_ID.isnot(None)).distinct()]
+        except Exception as e:
+            logger.error(f"Error listing stored games: {e}")
+            return []
+        finally:
+            db.close()
+
+    def _games(self, db):
+        guild_filter = _GUILD_ID.is_(None) if self.guild_id is None else _GUILD_ID == self.guild_id
+        return db.query(ActiveGame).filter(guild_filter)
+
+    def _delete_games(self, db):
+        ids = [row_id for (row_id,) in self._games(db).with_entities(ActiveGame.id)]
+        if ids:
+            db.query(ActiveGameEvent).filter(ActiveGameEvent.active_game_id.in_(ids)).delete(synchronize_session=False)
+            db.query(ActiveGame).filter(ActiveGame.id.in_(ids)).delete(synchronize_session=False)
+
+    def start(self, game, date: str, time: str) -> Optional[int]:
+        """
+        Starts persisting a new game, replacing any previously stored one.
+
+        Returns:
+            int: The active_game id, or None if it could not be stored.
+        """
+        db = self.db_connect.SessionLocal()
+        try:
+            self._delete_games(db)
+            row = ActiveGame(
+                name=game.name,
+                game_data={"guild_id": self.guild_id, "seq": 0, "date": date, "time": time, "state": game.to_state()},
+                helper_data={},
+            )
+            db.add(row)
+            db.commit()
+            self.active_game_id, self.seq, self.snapshot_seq = row.id, 0, 0
+            logger.info(f"Persisting active game {game.name} as active_game {row.id}")
+            return row.id
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error storing active game {game.name}: {e}")
+            self.active_game_id = None
+            return None
+        finally:
+            db.close()
+
+    def record(self, game, event_type: str, payload: Dict[str, Any]) -> bool:
+        """
+        Appends a game action, snapshotting the game every ``snapshot_every`` events.
+
+        Args:
+            game (JeopardyGame): The game after the action was applied (used for snapshots).
+            event_type (str): The action (see JeopardyGame.apply_event).
+            payload (dict): The action data.
+        """
+        if self.active_game_id is None:
+            return False
+        db = self.db_connect.SessionLocal()
+        try:
+            db.add(ActiveGameEvent(
+                active_game_id=self.active_game_id, seq=self.seq + 1, type=event_type, payload=payload
+            ))
+            db.commit()
+            self.seq += 1
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error recording {event_type} event for active_game {self.active_game_id}: {e}")
+            return False
+        finally:
+            db.close()
+
+        if self.seq - self.snapshot_seq >= self.snapshot_every:
+            self.snapshot(game)
+        return True
+
+    def snapshot(self, game) -> bool:
+        """Stores the full game state and drops the events it includes."""
+        if self.active_game_id is None:
+            return False
+        db = self.db_connect.SessionLocal()
+        try:
+            row = db.get(ActiveGame, self.active_game_id)
+            if row is None:
+                return False
+            # JSON columns only notice reassignment, so build a new dict
+            row.game_data = {**(row.game_data or {}), "seq": self.seq, "state": game.to_state()}
+            db.query(ActiveGameEvent).filter(
+                ActiveGameEvent.active_game_id == self.active_game_id,
+                ActiveGameEvent.seq <= self.seq
+            ).delete(synchronize_session=False)
+            db.commit()
+            self.snapshot_seq = self.seq
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error snapshotting active_game {self.active_game_id}: {e}")
+            return False
+        finally:
+            db.close()
+
+    def save_helper(self, helper: Dict[str, Any]) -> bool:
+        """Stores the Discord ids of the channels, roles and messages the game uses."""
+        if self.active_game_id is None:
+            return False
+        db = self.db_connect.SessionLocal()
+        try:
+            row = db.get(ActiveGame, self.active_game_id)
+            if row is None:
+                return False
+            row.helper_data = helper
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error saving Discord state of active_game {self.active_game_id}: {e}")
+            return False
+        finally:
+            db.close()
+
+    def load(self) -> Optional[Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any]]], Dict[str, Any]]]:
+        """
+        Loads the stored game and continues recording after its last event.
+
+        Returns:
+            tuple: (game_data with the snapshot "state", "date" and "time", events after the
+            snapshot as (type, payload) in order, helper_data), or None if no game is stored.
+        """
+        db = self.db_connect.SessionLocal()
+        try:
+            row = self._games(db).order_by(ActiveGame.id.desc()).first()
+            if row is None or not (row.game_data or {}).get("state"):
+                return None
+            events = db.query(ActiveGameEvent).filter(
+                ActiveGameEvent.active_game_id == row.id,
+                ActiveGameEvent.seq > row.game_data.get("seq", 0)
+            ).order_by(ActiveGameEvent.seq).all()
+            self.active_game_id = row.id
+            self.snapshot_seq = row.game_data.get("seq", 0)
+            self.seq = events[-1].seq if events else self.snapshot_seq
+            return row.game_data, [(event.type, event.payload or {}) for event in events], row.helper_data or {}
+        except Exception as e:
+            logger.error(f"Error loading the stored active game: {e}")
+            return None
+        finally:
+            db.close()
+
+    def clear(self) -> bool:
+        """Forgets the stored game (it was cleaned up)."""
+        db = self.db_connect.SessionLocal()
+        try:
+            self._delete_games(db)
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error clearing the stored active game: {e}")
+            return False
+        finally:
+            self.active_game_id, self.seq, self.snapshot_seq = None, 0, 0
+            db.close()
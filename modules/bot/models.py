@@ -1,5 +1,6 @@
 from modules.utils.base import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, JSON, DateTime, UniqueConstraint, Index, func, literal_column
+from datetime import datetime
 
 
 class JeopardyGame(Base):
@@ -9,6 +10,12 @@ class JeopardyGame(Base):
     name = Column(String)
     data = Column(JSON)
 
+    __table_args__ = (
+        Index("ix_jeopardy_game_name", "name"),
+        # The uuid lives in the package itself; an expression index makes lookups by it keyed
+        Index("ix_jeopardy_game_uuid", func.json_extract(data, literal_column("'$.game.uuid'"))),
+    )
+
 
 class ActiveGame(Base):
     __tablename__ = "active_game"
@@ -17,3 +24,17 @@ class ActiveGame(Base):
     name = Column(String)
     game_data = Column(JSON)
     helper_data = Column(JSON)
+
+
+class ActiveGameEvent(Base):
+    """Game action recorded after the snapshot in ActiveGame.game_data; replayed on resume."""
+    __tablename__ = "active_game_events"
+
+    id = Column(Integer, primary_key=True)
+    active_game_id = Column(Integer, ForeignKey("active_game.id", ondelete="CASCADE"), nullable=False, index=True)
+    seq = Column(Integer, nullable=False)
+    type = Column(String, nullable=False)
+    payload = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (UniqueConstraint("active_game_id", "seq", name="uq_active_game_event_seq"),)
@@ -1,12 +1,16 @@
 # modules/calendar/api.py
 from flask import Blueprint, jsonify, request, current_app # Add current_app
+import hashlib
+import hmac
 
 # Assuming shared resources are correctly set up
 from shared import logger, config, db_connect # Remove calendar_service import
-from sentry_sdk import start_transaction, capture_exception, set_tag
+from sentry_sdk import capture_exception, set_tag
+from modules.utils.tracing import start_transaction, finish_transaction
 
 # Import the new service and error handler
 from .errors import APIErrorHandler
+from .read_model import parse_range_boundary
 from modules.organizations.models import Organization
 from modules.auth.decoraters import auth_required
 
@@ -37,6 +41,8 @@ def get_organization_events(org_prefix):
     """
     Public endpoint to get events for a specific organization.
     Accessible via: /api/calendar/{org_prefix}/events
+    Optional query params: start, end (YYYY-MM-DD or ISO 8601) to limit the date range.
+    Supports conditional requests via ETag / If-None-Match.
     """
     transaction = start_transaction(op="api", name="get_org_events")
     route_error_handler.transaction = transaction
@@ -45,6 +51,17 @@ def get_organization_events(org_prefix):
     set_tag("request_type", "GET")
     set_tag("organization_prefix", org_prefix)
 
+    try:
+        range_start = parse_range_boundary(request.args.get("start"))
+        range_end = parse_range_boundary(request.args.get("end"), is_end=True)
+    except ValueError:
+        route_error_handler.transaction = None
+        finish_transaction(transaction)
+        return jsonify({
+            "status": "error",
+            "message": "Invalid 'start' or 'end' parameter, expected YYYY-MM-DD or ISO 8601"
+        }), 400
+
     try:
         with next(db_connect.get_db()) as session:
             # Get organization by prefix
@@ -81,32 +98,130 @@ def get_organization_events(org_prefix):
 
             # Get events using multi-org service
             events_result = current_app.multi_org_calendar_service.get_organization_events_for_frontend(
-                org.id, transaction
+                org.id, transaction, start=range_start, end=range_end
             )
 
             if events_result.get("status") == "error":
                 logger.error(f"Failed to get events for org {org_prefix}: {events_result.get('message')}")
                 return jsonify(events_result), 500
+
+            # The snapshot etag identifies the content; fold in the requested range
+            snapshot_etag = events_result.pop("etag", "")
+            range_key = f"{request.args.get('start', '')}|{request.args.get('end', '')}"
+            etag = hashlib.sha1(f"{snapshot_etag}|{range_key}".encode("utf-8")).hexdigest()
+
+            if request.if_none_match and etag in request.if_none_match:
+                logger.info(f"Events for org {org_prefix} not modified")
+                response = current_app.response_class(status=304)
             else:
                 logger.info(f"Successfully prepared {len(events_result.get('events', []))} events for org {org_prefix}")
-                return jsonify(events_result), 200
+                response = jsonify(events_result)
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "public, max-age=60"
+            return response
 
     except Exception as e:
         route_error_handler.handle_generic_error(e)
         return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
         if session:
             session.close()
 
+def _verify_notion_webhook(raw_body: bytes) -> bool:
+    """Check the request carries the shared secret, either as a Notion signature or a plain header."""
+    secret = config.NOTION_WEBHOOK_SECRET
+    signature = request.headers.get("X-Notion-Signature", "")
+    if signature:
+        expected = "sha256=" + hmac.new(secret.encode("utf-8"), raw_body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature, expected)
+    return hmac.compare_digest(request.headers.get("X-Webhook-Secret", ""), secret)
+
+def _extract_page_ids(payload: dict) -> list:
+    """Collect Notion page IDs from a notification (explicit list, integration event or automation)."""
+    page_ids = [page_id for page_id in payload.get("page_ids") or [] if isinstance(page_id, str)]
+    entity = payload.get("entity") or {}
+    if entity.get("type") == "page" and entity.get("id"):
+        page_ids.append(entity["id"])
+    data = payload.get("data") or {}
+    if data.get("object") == "page" and data.get("id"):
+        page_ids.append(data["id"])
+    return list(dict.fromkeys(page_ids))
+
+@calendar_blueprint.route("/<org_prefix>/notion-webhook", methods=["POST"])
+def organization_notion_webhook(org_prefix):
+    """
+    Change notifications for specific Notion pages of an organization.
+    Accessible via: /api/calendar/{org_prefix}/notion-webhook
+    Requires NOTION_WEBHOOK_SECRET, sent as X-Webhook-Secret or used to sign X-Notion-Signature.
+    The subscription's verification request is answered (and its token logged) before that check.
+    Pages are debounced and coalesced, then synced to Google Calendar and OCP in the background.
+    """
+    transaction = start_transaction(op="webhook", name="org_notion_webhook")
+    route_error_handler.transaction = transaction
+    route_error_handler.operation_name = "org_notion_webhook"
+    set_tag("request_type", "POST")
+    set_tag("organization_prefix", org_prefix)
+
+    try:
+        raw_body = request.get_data()
+        payload = request.get_json(silent=True) or {}
+
+        # Notion sends a one-off verification token when a webhook subscription is created. It is the
+        # secret that signs later notifications, so it is accepted before any secret is configured and
+        # logged for the operator to set as NOTION_WEBHOOK_SECRET and confirm in Notion.
+        if "verification_token" in payload:
+            logger.warning(
+                f"Received Notion webhook verification token for org {org_prefix}: {payload['verification_token']} "
+                "- set it as NOTION_WEBHOOK_SECRET and paste it into Notion to verify the subscription"
+            )
+            return jsonify({"status": "success", "message": "Verification token received"}), 200
+
+        if not config.NOTION_WEBHOOK_SECRET:
+            logger.warning("Notion webhook called but NOTION_WEBHOOK_SECRET is not configured")
+            return jsonify({"status": "error", "message": "Webhook not configured"}), 503
+
+        if not _verify_notion_webhook(raw_body):
+            logger.warning(f"Rejected Notion webhook for org {org_prefix}: invalid secret or signature")
+            return jsonify({"status": "error", "message": "Unauthorized"}), 401
+
+        page_ids = _extract_page_ids(payload)
+        if not page_ids:
+            return jsonify({"status": "error", "message": "No Notion page IDs in payload"}), 400
+
+        with next(db_connect.get_db()) as session:
+            org = session.query(Organization).filter(
+                Organization.prefix == org_prefix,
+                Organization.is_active == True
+            ).first()
+            if not org:
+                return jsonify({"status": "error", "message": "Organization not found"}), 404
+            org_id = org.id
+
+        pending = current_app.unified_sync_service.queue_page_changes(org_id, page_ids)
+        logger.info(f"Queued {len(page_ids)} changed Notion pages for org {org_prefix} ({pending} pending)")
+        return jsonify({
+            "status": "accepted",
+            "organization_id": org_id,
+            "queued_pages": page_ids,
+            "pending_pages": pending
+        }), 202
+
+    except Exception as e:
+        route_error_handler.handle_generic_error(e)
+        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
+    finally:
+        route_error_handler.transaction = None
+        finish_transaction(transaction)
+
 @calendar_blueprint.route("/<org_prefix>/sync", methods=["POST"])
 @auth_required
 def sync_organization_calendar(org_prefix):
     """
     Admin endpoint to sync Notion to Google Calendar for a specific organization.
     Accessible via: /api/calendar/{org_prefix}/sync
+    Optional query param: reconcile=true to rebuild the event link index from Google Calendar.
     Requires authentication.
     """
     transaction = start_transaction(op="admin", name="sync_org_calendar")
@@ -128,25 +243,40 @@ def sync_organization_calendar(org_prefix):
                 logger.warning(f"Organization with prefix '{org_prefix}' not found or inactive")
                 return jsonify({"status": "error", "message": "Organization not found"}), 404
 
-            # Sync using multi-org service
-            sync_result = current_app.multi_org_calendar_service.sync_organization_notion_to_google(
-                org.id, transaction
-            )
+            # Sync runs only include organizations with a Notion database, so check it up front
+            if not org.notion_database_id:
+                return jsonify({
+                    "status": "error",
+                    "message": f"Organization '{org_prefix}' has no Notion database configured"
+                }), 400
 
-            if sync_result.get("status") == "error":
-                logger.error(f"Failed to sync org {org_prefix}: {sync_result.get('message')}")
-                return jsonify(sync_result), 500
-            else:
-                logger.info(f"Successfully synced calendar for org {org_prefix}")
-                return jsonify(sync_result), 200
+            org_id = org.id
+
+        # Run as a recorded sync run so it shares the per-organization lock with scheduled syncs;
+        # ?reconcile=true also re-lists the whole Google Calendar
+        reconcile = request.args.get("reconcile", "false").lower() == "true"
+        sync_result = current_app.sync_job_service.run(
+            trigger="manual", organization_ids=[org_id], stages=("calendar",),
+            transaction=transaction, reconcile=reconcile
+        )
+
+        checkpoints = sync_result.get("run", {}).get("organizations", [])
+        if checkpoints and checkpoints[0]["status"] == "skipped":
+            logger.info(f"Sync already in progress for org {org_prefix}")
+            return jsonify({"status": "error", "message": checkpoints[0]["message"], "run": sync_result["run"]}), 409
+        if sync_result.get("status") in ("error", "failed"):
+            logger.error(f"Failed to sync org {org_prefix}: {sync_result.get('message') or checkpoints}")
+            return jsonify(sync_result), 500
+
+        logger.info(f"Successfully synced calendar for org {org_prefix}")
+        return jsonify(sync_result), 200
 
     except Exception as e:
         route_error_handler.handle_generic_error(e)
         return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @calendar_blueprint.route("/<org_prefix>/setup", methods=["POST"])
 @auth_required
@@ -197,8 +327,7 @@ def setup_organization_calendar(org_prefix):
         return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @calendar_blueprint.route("/sync-all", methods=["POST"])
 @auth_required
@@ -230,8 +359,7 @@ def sync_all_organizations():
         return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 # Legacy endpoints for backward compatibility (deprecated)
 @calendar_blueprint.route("/notion-webhook", methods=["POST"])
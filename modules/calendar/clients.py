@@ -109,7 +109,7 @@ class GoogleCalendarClient:
 
             try:
                 with operation_span(transaction, op="api_call", description="events.insert", logger=self.logger) as span:
-                    self.logger.debug(f"Attempting to create Google Calendar event for Notion ID {notion_page_id} with data: {event_data}")
+                    self.logger.debug("Attempting to create Google Calendar event for Notion ID %s with data: %s", notion_page_id, event_data)
                     created_event = service.events().insert(
                         calendarId=calendar_id,
                         body=event_data
@@ -165,7 +165,7 @@ class GoogleCalendarClient:
 
             try:
                 with operation_span(transaction, op="api_call", description="events.update", logger=self.logger) as span:
-                    self.logger.debug(f"Attempting to update Google Calendar event {event_id} for Notion ID {notion_page_id} with data: {event_data}")
+                    self.logger.debug("Attempting to update Google Calendar event %s for Notion ID %s with data: %s", event_id, notion_page_id, event_data)
                     updated_event = service.events().update(
                         calendarId=calendar_id,
                         eventId=event_id,
@@ -244,6 +244,43 @@ class GoogleCalendarClient:
                 self.error_handler.transaction = None # Clear transaction from handler if it was set
 
 
+    def find_events_by_notion_id(self, calendar_id: str, notion_page_id: str, parent_transaction=None) -> Optional[List[Dict]]:
+        """Find the managed events linked to a single Notion page. Returns list of events or None on error."""
+        op_name = "find_events_by_notion_id"
+        self.error_handler.operation_name = op_name
+
+        current_transaction = parent_transaction or start_transaction(op="google", name=f"{op_name}_independent")
+
+        with operation_span(current_transaction, op="google_api", description=op_name, logger=self.logger) as transaction:
+            self.error_handler.transaction = transaction
+            service = self.get_service(parent_transaction=transaction)
+            if not service:
+                self.logger.error(f"{op_name}: Failed to get Google Calendar service.")
+                return None
+
+            context_data = {"calendar_id": calendar_id, "notion_page_id": notion_page_id}
+            set_context("gcal_event_lookup", context_data)
+
+            try:
+                with operation_span(transaction, op="api_call", description="events.list by notionPageId", logger=self.logger) as span:
+                    events_result = service.events().list(
+                        calendarId=calendar_id,
+                        privateExtendedProperty=f"notionPageId={notion_page_id}",
+                        showDeleted=False,
+                        maxResults=50
+                    ).execute()
+                    items = events_result.get('items', [])
+                    span.set_data("matched_event_count", len(items))
+                return items
+
+            except HttpError as e:
+                return self.error_handler.handle_http_error(e, context_data)
+            except Exception as e:
+                return self.error_handler.handle_generic_error(e, context_data)
+            finally:
+                self.error_handler.transaction = None
+
+
     def batch_delete_events(self, calendar_id: str, event_ids: List[str], description: str = "batch_delete", parent_transaction=None) -> Tuple[int, int]: # Accept parent transaction
         """Delete events in batches using the utility function."""
         op_name = f"batch_delete_{description}"
@@ -410,8 +447,11 @@ class NotionCalendarClient:
         self.notion: NotionClient = notion_shared_client # Use shared Notion client instance
         self.error_handler = APIErrorHandler(self.logger, "NotionCalendarClient")
 
-    def fetch_events(self, database_id: str, parent_transaction=None) -> Optional[List[Dict]]: # Accept parent transaction
-        """Fetch published events from Notion with pagination and error handling."""
+    def fetch_events(self, database_id: str, parent_transaction=None, since: Optional[str] = None) -> Optional[List[Dict]]: # Accept parent transaction
+        """
+        Fetch published events from Notion with pagination and error handling.
+        ``since`` (ISO date) restricts the query to events starting on or after that date.
+        """
         op_name = "fetch_notion_events"
         self.error_handler.operation_name = op_name
 
@@ -419,18 +459,25 @@ class NotionCalendarClient:
 
         with operation_span(current_transaction, op="notion_api", description=op_name, logger=self.logger) as transaction: # Use operation_span
             self.error_handler.transaction = transaction
-            context_data = {"database_id": database_id}
+            context_data = {"database_id": database_id, "since": since}
             set_context("notion_query", context_data)
-            self.logger.info(f"Fetching all published Notion events from database {database_id} using pagination.")
+            self.logger.info(f"Fetching published Notion events from database {database_id}" + (f" starting from {since}" if since else "") + " using pagination.")
 
             try:
-                # Define the filter - Fetch ALL published events
+                # Define the filter - Fetch published events, within the sync horizon if given
                 query_filter = {
                     "property": "Published", # Make sure this property name is correct
                     "checkbox": {
                         "equals": True
                     }
                 }
+                if since:
+                    query_filter = {
+                        "and": [
+                            query_filter,
+                            {"property": "Date", "date": {"on_or_after": since}}
+                        ]
+                    }
 
                 # Use collect_paginated_api to handle pagination automatically
                 with operation_span(transaction, op="api_call", description="notion.databases.query", logger=self.logger) as span:
@@ -454,6 +501,37 @@ class NotionCalendarClient:
                 self.error_handler.transaction = None # Clear transaction from handler if it was set
 
 
+    def fetch_page(self, page_id: str, parent_transaction=None) -> Optional[Dict]:
+        """
+        Fetch a single Notion page. Returns the page, or None on error.
+        Pages that no longer exist (or are no longer shared) are returned as an archived stub
+        so callers can treat them as deleted.
+        """
+        op_name = "fetch_notion_page"
+        self.error_handler.operation_name = op_name
+
+        current_transaction = parent_transaction or start_transaction(op="notion", name=f"{op_name}_independent")
+
+        with operation_span(current_transaction, op="notion_api", description=op_name, logger=self.logger) as transaction:
+            self.error_handler.transaction = transaction
+            context_data = {"notion_page_id": page_id}
+            set_context("notion_page_fetch", context_data)
+
+            try:
+                with operation_span(transaction, op="api_call", description="notion.pages.retrieve", logger=self.logger):
+                    return self.notion.pages.retrieve(page_id=page_id)
+
+            except APIResponseError as error:
+                if error.code == APIErrorCode.ObjectNotFound:
+                    self.logger.info(f"Notion page {page_id} not found, treating it as deleted.")
+                    return {"object": "page", "id": page_id, "archived": True}
+                return self.error_handler.handle_notion_error(error, context_data)
+            except Exception as e:
+                return self.error_handler.handle_generic_error(e, context_data)
+            finally:
+                self.error_handler.transaction = None
+
+
     def update_page_with_gcal_id(self, page_id: str, gcal_id: str, gcal_link: Optional[str] = None, parent_transaction=None) -> bool: # Accept parent transaction
         """Update Notion page with Google Calendar ID and optionally the HTML link."""
         op_name = "update_notion_page_gcal_id"
@@ -488,7 +566,7 @@ class NotionCalendarClient:
                         "url": gcal_link
                     }
                 else:
-                    self.logger.info(f"Skipping adding Google Calendar link to Notion page {page_id}: NOTION_GCAL_LINK_PROPERTY not configured")
+                    self.logger.debug(f"Skipping adding Google Calendar link to Notion page {page_id}: NOTION_GCAL_LINK_PROPERTY not configured")
 
 
             try:
@@ -3,21 +3,39 @@ from notion_client import APIErrorCode, APIResponseError
 from googleapiclient.errors import HttpError
 from sentry_sdk import capture_exception, set_tag, set_context
 
+from modules.utils.tracing import ContextLocal, get_current_transaction
+
 # Assuming logger is configured elsewhere, e.g., in shared.py
 # If not, initialize a default logger:
 # logger = logging.getLogger(__name__)
 
 class APIErrorHandler:
-    """Standardized error handling for API operations."""
+    """
+    Standardized error handling for API operations.
+
+    ``transaction`` and ``operation_name`` are context-local: module-level handlers are shared by
+    every request thread, so a value assigned while serving one request is never seen by another.
+    Contexts that never assigned them see the constructor values.
+    """
+
+    transaction = ContextLocal()
+    operation_name = ContextLocal()
 
     def __init__(self, logger, operation_name, transaction=None):
         self.logger = logger
-        self.operation_name = operation_name
-        self.transaction = transaction # Optional transaction context for Sentry
+        APIErrorHandler.operation_name.set_default(self, operation_name)
+        APIErrorHandler.transaction.set_default(self, transaction) # Optional transaction context for Sentry
+
+    def _mark_transaction_failed(self):
+        """Flag the transaction of the current request as failed, if there is one."""
+        transaction = self.transaction or get_current_transaction()
+        if transaction is not None:
+            transaction.set_status("internal_error")
 
     def handle_http_error(self, error: HttpError, context_data=None):
         """Handle HttpError consistently."""
         capture_exception(error)
+        self._mark_transaction_failed()
         details = getattr(error, 'error_details', str(error)) # Get details if available
         status = error.resp.status if hasattr(error, 'resp') else 'Unknown'
         self.logger.error(f"HTTP error during {self.operation_name}: {status} - {details}")
@@ -43,6 +61,7 @@ class APIErrorHandler:
     def handle_notion_error(self, error: APIResponseError, context_data=None):
         """Handle Notion API errors consistently."""
         capture_exception(error)
+        self._mark_transaction_failed()
         self.logger.error(f"Notion API Error during {self.operation_name}: {error.code} - {str(error)}")
         set_context("notion_error", {
             "code": error.code,
@@ -63,6 +82,7 @@ class APIErrorHandler:
     def handle_generic_error(self, error: Exception, context_data=None):
         """Handle general exceptions consistently."""
         capture_exception(error)
+        self._mark_transaction_failed()
         self.logger.error(f"Unexpected error during {self.operation_name}: {str(error)}")
         set_tag("error_type", "unexpected")
         if context_data:
@@ -4,7 +4,7 @@ from datetime import datetime
 from dataclasses import dataclass, field # Added field
 from typing import Dict, Optional, Any
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from modules.utils.base import Base
 
@@ -158,4 +158,73 @@ class CalendarEventLink(Base):
             "event_metadata": self.event_metadata,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        }
+
+class CalendarEventSnapshot(Base):
+    """Persisted read model of an organization's frontend events, refreshed by the sync job."""
+    __tablename__ = 'calendar_event_snapshots'
+
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, unique=True, index=True)
+    organization_name = Column(String(100), nullable=True)
+    events = Column(JSON, nullable=False, default=list)  # Events in frontend format, sorted by start
+    event_count = Column(Integer, default=0)
+    etag = Column(String(64), nullable=False)  # Content hash of the events payload
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CalendarEventSnapshot(org_id={self.organization_id}, events={self.event_count})>"
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        return {
+            "organization_id": self.organization_id,
+            "organization_name": self.organization_name,
+            "events": self.events or [],
+            "event_count": self.event_count,
+            "etag": self.etag,
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None
+        }
+
+class CalendarEventArchive(Base):
+    """Frozen copy of an event that fell behind the organization's sync horizon."""
+    __tablename__ = 'calendar_event_archive'
+    __table_args__ = (
+        UniqueConstraint('organization_id', 'notion_page_id', name='uq_calendar_archive_org_page'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
+    notion_page_id = Column(String(255), nullable=False)
+    google_calendar_event_id = Column(String(255), nullable=True)  # Left in Google Calendar, no longer synced
+    google_calendar_id = Column(String(255), nullable=True)
+    event = Column(JSON, nullable=True)  # Last known event in frontend format
+    start = Column(String(64), nullable=True, index=True)  # ISO date or datetime, as in the frontend format
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<CalendarEventArchive(org_id={self.organization_id}, notion_id={self.notion_page_id})>"
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        return {
+            "organization_id": self.organization_id,
+            "notion_page_id": self.notion_page_id,
+            "google_calendar_event_id": self.google_calendar_event_id,
+            "google_calendar_id": self.google_calendar_id,
+            "event": self.event,
+            "start": self.start,
+            "archived_at": self.archived_at.isoformat() if self.archived_at else None
+        }
+
+
+class CalendarArchiveBackfill(Base):
+    """Marks an organization whose events before the sync horizon were archived by a full Notion fetch."""
+    __tablename__ = 'calendar_archive_backfill'
+
+    organization_id = Column(Integer, ForeignKey("organizations.id"), primary_key=True)
+    archived_count = Column(Integer, nullable=False, default=0)
+    backfilled_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<CalendarArchiveBackfill(org_id={self.organization_id}, archived={self.archived_count})>"
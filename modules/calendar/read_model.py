@@ -0,0 +1,190 @@
+# modules/calendar/read_model.py
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import pytz
+from sentry_sdk import capture_exception
+
+# Assuming shared resources are correctly set up
+from shared import config, logger, db_connect
+
+from .models import CalendarEventSnapshot
+
+# Snapshots younger than this are served as-is; older ones are served and refreshed in the background
+SNAPSHOT_FRESH_SECONDS = 300
+
+# Organizations with a background refresh in flight (shared by every service instance in the process)
+_REFRESHING: set = set()
+_REFRESHING_LOCK = threading.Lock()
+
+
+def parse_range_boundary(value: Optional[str], is_end: bool = False) -> Optional[datetime]:
+    """Parse a date-range query parameter ('YYYY-MM-DD' or ISO 8601) into an aware datetime.
+
+    Date-only end boundaries are inclusive, so they are moved to the start of the next day.
+    Raises ValueError on malformed input.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if len(value) == 10:
+        boundary = datetime.strptime(value, '%Y-%m-%d')
+        if is_end:
+            boundary += timedelta(days=1)
+    else:
+        boundary = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return _as_aware(boundary)
+
+
+def _as_aware(dt: datetime) -> datetime:
+    """Localize naive datetimes to the configured organization timezone."""
+    if dt.tzinfo is not None:
+        return dt
+    try:
+        return pytz.timezone(config.TIMEZONE).localize(dt)
+    except pytz.UnknownTimeZoneError:
+        return pytz.utc.localize(dt)
+
+
+def parse_event_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an event date or datetime string ('YYYY-MM-DD' or ISO 8601) into an aware datetime, or None."""
+    try:
+        return _as_aware(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def event_bounds(event: Dict[str, Any]):
+    """Return (start, end) aware datetimes for a frontend-format event, or (None, None)."""
+    start = parse_event_time(event.get('start'))
+    if start is None:
+        return None, None
+    end = parse_event_time(event.get('end')) or start
+    return start, max(start, end)
+
+
+def filter_events_by_range(events: List[Dict[str, Any]], start: Optional[datetime] = None,
+                           end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Keep events overlapping [start, end). Events with unparseable dates are kept only when unfiltered."""
+    if start is None and end is None:
+        return events
+
+    filtered = []
+    for event in events:
+        event_start, event_end = event_bounds(event)
+        if event_start is None:
+            continue
+        # Ends are exclusive (all-day events end at midnight of the following day)
+        if start is not None and (event_end < start or (event_end == start and event_end > event_start)):
+            continue
+        if end is not None and event_start >= end:
+            continue
+        filtered.append(event)
+    return filtered
+
+
+def compute_etag(events: List[Dict[str, Any]]) -> str:
+    """Stable content hash of an events payload."""
+    payload = json.dumps(events, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class CalendarReadModel:
+    """
+    Persisted, per-organization snapshot of frontend calendar events.
+
+    The sync job stores a snapshot after every Notion fetch. Public reads are served from the
+    stored snapshot (shared by every worker process through the database) and, once a snapshot
+    is older than ``fresh_seconds``, a single background refresh is started while the stale copy
+    keeps being served (stale-while-revalidate).
+    """
+
+    def __init__(self, refresh_fn: Callable[[int], Optional[Dict[str, Any]]], logger_instance=None,
+                 fresh_seconds: int = SNAPSHOT_FRESH_SECONDS):
+        """
+        Args:
+            refresh_fn: Callable taking an organization ID that re-fetches the events and stores a
+                        new snapshot, returning the snapshot dict or None on failure.
+            logger_instance: Optional logger, defaults to the shared logger.
+            fresh_seconds: Age in seconds after which a snapshot is considered stale.
+        """
+        self.logger = logger_instance or logger
+        self.db_connect = db_connect
+        self.refresh_fn = refresh_fn
+        self.fresh_seconds = fresh_seconds
+
+    def get_snapshot(self, organization_id: int) -> Optional[Dict[str, Any]]:
+        """Load the stored snapshot for an organization, or None if none has been written yet."""
+        db = next(self.db_connect.get_db())
+        try:
+            snapshot = db.query(CalendarEventSnapshot).filter(
+                CalendarEventSnapshot.organization_id == organization_id
+            ).first()
+            return snapshot.to_dict() if snapshot else None
+        finally:
+            db.close()
+
+    def store_snapshot(self, organization_id: int, organization_name: Optional[str],
+                       events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write (or replace) the snapshot for an organization and return it."""
+        events = sorted(events, key=lambda ev: ev.get('start') or '')
+        etag = compute_etag(events)
+        db = next(self.db_connect.get_db())
+        try:
+            snapshot = db.query(CalendarEventSnapshot).filter(
+                CalendarEventSnapshot.organization_id == organization_id
+            ).first()
+            if snapshot is None:
+                snapshot = CalendarEventSnapshot(organization_id=organization_id)
+                db.add(snapshot)
+            snapshot.organization_name = organization_name
+            snapshot.events = events
+            snapshot.event_count = len(events)
+            snapshot.etag = etag
+            snapshot.refreshed_at = datetime.utcnow()
+            db.commit()
+            self.logger.info(f"Stored calendar snapshot for organization {organization_id}: {len(events)} events (etag {etag[:12]})")
+            return snapshot.to_dict()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def is_stale(self, snapshot: Dict[str, Any]) -> bool:
+        """Whether a snapshot is older than the freshness window."""
+        refreshed_at = snapshot.get('refreshed_at')
+        if not refreshed_at:
+            return True
+        age = datetime.utcnow() - datetime.fromisoformat(refreshed_at)
+        return age.total_seconds() > self.fresh_seconds
+
+    def schedule_refresh(self, organization_id: int) -> bool:
+        """Start a background refresh unless one is already running for this organization."""
+        with _REFRESHING_LOCK:
+            if organization_id in _REFRESHING:
+                return False
+            _REFRESHING.add(organization_id)
+
+        thread = threading.Thread(
+            target=self._run_refresh,
+            args=(organization_id,),
+            name=f"CalendarSnapshotRefresh-{organization_id}",
+            daemon=True
+        )
+        thread.start()
+        return True
+
+    def _run_refresh(self, organization_id: int):
+        try:
+            self.logger.info(f"Refreshing stale calendar snapshot for organization {organization_id} in background")
+            self.refresh_fn(organization_id)
+        except Exception as e:
+            capture_exception(e)
+            self.logger.error(f"Background calendar snapshot refresh failed for organization {organization_id}: {e}")
+        finally:
+            with _REFRESHING_LOCK:
+                _REFRESHING.discard(organization_id)
@@ -1,26 +1,32 @@
 # modules/calendar/service.py
+import hashlib
+import json
 import logging
 from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from sentry_sdk import capture_exception, set_tag, set_context, start_transaction
-from cachetools import TTLCache, cached, keys
 
 # Assuming shared resources are correctly set up
 from shared import config, logger, db_connect
 
 # Import custom modules
 from .clients import GoogleCalendarClient, NotionCalendarClient
-from .models import CalendarEventDTO
+from .models import CalendarEventDTO, CalendarEventLink, CalendarEventArchive, CalendarArchiveBackfill
+from .read_model import CalendarReadModel, filter_events_by_range, parse_event_time
 from .utils import operation_span
+from modules.utils.logging_config import log_event
 from .errors import APIErrorHandler
 from googleapiclient.errors import HttpError
 
 # Import organization models
 from modules.organizations.models import Organization
+from modules.organizations.config import OrganizationSettings
 
-# Create a global cache for the frontend events with a 5-minute TTL
-_FRONTEND_CACHE = TTLCache(maxsize=100, ttl=300)  # Increased maxsize for multiple orgs
+# How often a sync lists the whole Google Calendar to repair the CalendarEventLink index
+RECONCILE_INTERVAL = timedelta(hours=24)
+# Last reconciliation per (organization_id, calendar_id) in this process; a restart reconciles once
+_LAST_RECONCILED: Dict[Tuple[Optional[int], str], datetime] = {}
 
 class MultiOrgCalendarService:
     """Service layer for multi-organization calendar operations."""
@@ -30,6 +36,7 @@ class MultiOrgCalendarService:
         self.gcal_client = GoogleCalendarClient(self.logger)
         self.notion_client = NotionCalendarClient(self.logger)
         self.db_connect = db_connect
+        self.read_model = CalendarReadModel(self.refresh_organization_events_snapshot, self.logger)
         
     def ensure_organization_calendar(self, organization_id: int, organization_name: str, parent_transaction=None) -> Optional[str]:
         """Ensure a Google Calendar exists for the organization, create if needed."""
@@ -85,8 +92,11 @@ class MultiOrgCalendarService:
                 if db:
                     db.close()
     
-    def sync_organization_notion_to_google(self, organization_id: int, parent_transaction=None) -> Dict[str, Any]:
-        """Sync Notion events to Google Calendar for a specific organization."""
+    def sync_organization_notion_to_google(self, organization_id: int, parent_transaction=None, reconcile: bool = False) -> Dict[str, Any]:
+        """
+        Sync Notion events to Google Calendar for a specific organization.
+        ``reconcile`` forces a full Google Calendar listing; it also runs once every RECONCILE_INTERVAL.
+        """
         op_name = "sync_organization_notion_to_google"
         
         current_transaction = parent_transaction or start_transaction(op="calendar", name=op_name)
@@ -109,16 +119,21 @@ class MultiOrgCalendarService:
                         return {"status": "error", "message": f"Failed to create calendar for organization {organization_id}"}
                     org.google_calendar_id = calendar_id
                 
-                # Fetch events from Notion
-                notion_events = self.notion_client.fetch_events(org.notion_database_id, transaction)
-                if notion_events is None:
+                # Fetch events from Notion, limited to the organization's sync horizon
+                horizon = self.get_sync_horizon(org)
+                parsed_events = self._fetch_published_events(org, horizon, transaction)
+                if parsed_events is None:
                     return {"status": "error", "message": "Failed to fetch events from Notion"}
                 
-                # Parse events
-                parsed_events = self.parse_notion_events(notion_events)
-                
                 # Update Google Calendar
-                results = self.update_organization_google_calendar(parsed_events, org.google_calendar_id, org.notion_database_id, transaction)
+                reconcile = reconcile or self.needs_reconciliation(organization_id, org.google_calendar_id)
+                results = self.update_organization_google_calendar(
+                    parsed_events, org.google_calendar_id, org.notion_database_id, transaction,
+                    organization_id=organization_id, reconcile=reconcile, horizon=horizon
+                )
+                
+                # Refresh the frontend read model from the events we already fetched (plus any just archived)
+                self._store_events_snapshot(organization_id, org.name, parsed_events)
                 
                 # Update organization sync timestamp
                 org.last_sync_at = datetime.now()
@@ -140,18 +155,249 @@ class MultiOrgCalendarService:
                 if db:
                     db.close()
     
-    def update_organization_google_calendar(self, parsed_events: List[CalendarEventDTO], calendar_id: str, notion_database_id: str, parent_transaction=None) -> List[Dict]:
-        """Update Google Calendar for a specific organization."""
-        results = []
+    def sync_organization_pages(self, organization_id: int, page_ids: List[str], parent_transaction=None) -> Dict[str, Any]:
+        """
+        Targeted sync of specific Notion pages to an organization's Google Calendar.
+
+        Each page is re-fetched from Notion (the notification payload is never trusted), then its
+        Google Calendar event is created, updated, or deleted when the page is unpublished or gone.
+        The frontend snapshot is patched in place. Returns the published pages in ``pages`` and the
+        ids of unpublished or deleted pages in ``unpublished_page_ids`` so the caller can feed them
+        to other consumers (OCP) without fetching them again.
+        """
+        op_name = "sync_organization_pages"
+        
+        current_transaction = parent_transaction or start_transaction(op="calendar", name=op_name)
+        
+        with operation_span(current_transaction, op="org_page_sync", description=op_name, logger=self.logger) as transaction:
+            db = None
+            try:
+                db = next(self.db_connect.get_db())
+                org = db.query(Organization).filter(Organization.id == organization_id).first()
+                if not org:
+                    return {"status": "error", "message": f"Organization {organization_id} not found"}
+                
+                if not org.notion_database_id or not org.google_calendar_id:
+                    return {"status": "error", "message": f"Organization {organization_id} has no calendar sync configured"}
+                
+                transaction.set_data("page_count", len(page_ids))
+                horizon = self.get_sync_horizon(org)
+                org_database_id = org.notion_database_id.replace("-", "")
+                results = []
+                published_pages = []
+                published_events = []
+                unpublished_ids = []
+                changed_ids = set()
+                
+                for page_id in page_ids:
+                    page = self.notion_client.fetch_page(page_id, transaction)
+                    if page is None:
+                        results.append({"notion_page_id": page_id, "status": "failed", "reason": "fetch_failed"})
+                        continue
+                    
+                    parent_db = (page.get("parent") or {}).get("database_id")
+                    if parent_db and parent_db.replace("-", "") != org_database_id:
+                        self.logger.warning(f"Notion page {page_id} does not belong to organization {organization_id}'s database, skipping")
+                        results.append({"notion_page_id": page_id, "status": "skipped", "reason": "foreign_database"})
+                        continue
+                    
+                    page_id = page.get("id", page_id)
+                    link = db.query(CalendarEventLink).filter(
+                        CalendarEventLink.organization_id == organization_id,
+                        CalendarEventLink.google_calendar_id == org.google_calendar_id,
+                        CalendarEventLink.notion_page_id == page_id
+                    ).first()
+                    
+                    if link is None:
+                        # Not indexed yet: adopt an existing managed event instead of creating a duplicate
+                        existing = self.gcal_client.find_events_by_notion_id(org.google_calendar_id, page_id, transaction)
+                        if existing is None:
+                            results.append({"notion_page_id": page_id, "status": "failed", "reason": "gcal_lookup_failed"})
+                            continue
+                        if existing:
+                            link = CalendarEventLink(
+                                organization_id=organization_id,
+                                notion_page_id=page_id,
+                                google_calendar_event_id=existing[0]["id"],
+                                notion_database_id=org.notion_database_id,
+                                google_calendar_id=org.google_calendar_id
+                            )
+                            db.add(link)
+                            if len(existing) > 1:
+                                self.gcal_client.batch_delete_events(
+                                    org.google_calendar_id, [ev["id"] for ev in existing[1:]], "delete_duplicates", transaction
+                                )
+                    
+                    changed_ids.add(page_id)
+                    is_published = (
+                        not page.get("archived")
+                        and not page.get("in_trash")
+                        and (page.get("properties", {}).get("Published") or {}).get("checkbox", False)
+                    )
+                    event_dto = CalendarEventDTO.from_notion(page) if is_published else None
+                    
+                    if event_dto and self._is_frozen(event_dto.to_frontend_format(), horizon):
+                        results.append({"notion_page_id": page_id, "status": "skipped", "reason": "before_sync_horizon"})
+                        continue
+                    
+                    if not event_dto:
+                        # Unpublished, deleted, or no longer a valid event: remove it from the calendar
+                        unpublished_ids.append(page_id)
+                        if link is not None:
+                            if link.google_calendar_event_id:
+                                self.gcal_client.batch_delete_events(
+                                    org.google_calendar_id, [link.google_calendar_event_id], "delete_unpublished", transaction
+                                )
+                            db.delete(link)
+                        results.append({"notion_page_id": page_id, "status": "deleted" if link is not None else "unchanged"})
+                        continue
+                    
+                    published_pages.append(page)
+                    published_events.append(event_dto)
+                    result = self._sync_event_with_link(
+                        db, event_dto, link, organization_id, org.google_calendar_id, org.notion_database_id, transaction
+                    )
+                    results.append(result or {"notion_page_id": page_id, "status": "failed", "reason": "gcal_write_failed"})
+                
+                db.commit()
+                
+                if changed_ids:
+                    self._patch_events_snapshot(organization_id, org.name, changed_ids, published_events)
+                
+                failed = sum(1 for r in results if r.get("status") == "failed")
+                return {
+                    "status": "success" if not failed else "partial_success",
+                    "message": f"Synced {len(results) - failed}/{len(results)} pages for organization {organization_id}",
+                    "organization_id": organization_id,
+                    "events_processed": results,
+                    "pages": published_pages,
+                    "unpublished_page_ids": unpublished_ids
+                }
+                
+            except Exception as e:
+                capture_exception(e)
+                self.logger.error(f"Error syncing pages for organization {organization_id}: {e}")
+                return {"status": "error", "message": str(e)}
+            finally:
+                if transaction:
+                    transaction.finish()
+                if db:
+                    db.close()
+    
+    def _patch_events_snapshot(self, organization_id: int, organization_name: str, changed_ids: set, published_events: List[CalendarEventDTO]):
+        """Replace the changed pages in the frontend snapshot. Without a snapshot the next read builds one."""
+        snapshot = self.read_model.get_snapshot(organization_id)
+        if snapshot is None:
+            return
+        events = [ev for ev in snapshot["events"] if ev.get("id") not in changed_ids]
+        events.extend(event_dto.to_frontend_format() for event_dto in published_events)
+        try:
+            self.read_model.store_snapshot(organization_id, organization_name, events)
+        except Exception as e:
+            capture_exception(e)
+            self.logger.error(f"Failed to patch calendar snapshot for organization {organization_id}: {e}")
+    
+    def update_organization_google_calendar(self, parsed_events: List[CalendarEventDTO], calendar_id: str, notion_database_id: str,
+                                            parent_transaction=None, organization_id: Optional[int] = None, reconcile: bool = False,
+                                            horizon: Optional[datetime] = None) -> List[Dict]:
+        """
+        Update Google Calendar for a specific organization.
+
+        ``CalendarEventLink`` is the notion→gcal index: events whose content hash is unchanged are
+        skipped, changed ones are updated by their linked ID and removed pages are deleted, so the
+        Google API cost of a run follows the number of changes. The full calendar listing is only
+        used to reconcile (``reconcile=True``, or when the organization has no links yet and
+        ``needs_reconciliation`` says a listing is due).
+        Events that started before ``horizon`` are not part of ``parsed_events``; their links are
+        archived instead of deleted and their Google Calendar events are left alone.
+        """
         op_name = "update_organization_google_calendar"
         self.logger.info(f"Starting {op_name} with {len(parsed_events)} parsed Notion events for calendar {calendar_id}.")
+        results = []
+
+        db = next(self.db_connect.get_db())
+        try:
+            links = self._load_event_links(db, organization_id, calendar_id)
+
+            # An organization without links is reconciled on its schedule like any other; an empty
+            # calendar never gets a link, so ``not links`` alone would list it on every run
+            if reconcile or (not links and self.needs_reconciliation(organization_id, calendar_id)):
+                links = self._reconcile_event_links(
+                    db, parsed_events, links, organization_id, calendar_id, notion_database_id, parent_transaction, horizon
+                )
+                if links is None:
+                    return []
+
+            with operation_span(parent_transaction, op="process_events", description="sync_linked_events", logger=self.logger) as span:
+                current_page_ids = set()
+                for event_dto in parsed_events:
+                    current_page_ids.add(event_dto.notion_page_id)
+                    result = self._sync_event_with_link(
+                        db, event_dto, links.get(event_dto.notion_page_id), organization_id, calendar_id, notion_database_id, parent_transaction
+                    )
+                    if result:
+                        results.append(result)
+                statuses = [r["status"] for r in results]
+                for status in ("created", "updated", "unchanged"):
+                    span.set_data(f"events_{status}", statuses.count(status))
+
+            # Pages that fell behind the horizon are frozen; the rest disappeared from Notion (deleted or unpublished)
+            missing_links = [link for page_id, link in links.items() if page_id not in current_page_ids]
+            frozen_links = [link for link in missing_links if self._is_frozen((link.event_metadata or {}).get("event"), horizon)]
+            # Without a recorded event there is no way to tell; drop the link and leave the event to reconciliation
+            unknown_links = [link for link in missing_links if not (link.event_metadata or {}).get("event")]
+            removed_links = [link for link in missing_links if link not in frozen_links and link not in unknown_links]
+            if frozen_links:
+                self._archive_links(db, frozen_links)
+            for link in unknown_links:
+                db.delete(link)
+            if removed_links:
+                with operation_span(parent_transaction, op="cleanup", description="delete_removed_events", logger=self.logger) as span:
+                    event_ids = [link.google_calendar_event_id for link in removed_links if link.google_calendar_event_id]
+                    deleted_count, failed_count = self.gcal_client.batch_delete_events(
+                        calendar_id, event_ids, "delete_removed", parent_transaction
+                    )
+                    for link in removed_links:
+                        db.delete(link)
+                    span.set_data("removed_deleted", deleted_count)
+                    span.set_data("removed_failed", failed_count)
+                    self.logger.info(f"Removed {deleted_count} events no longer published in Notion, {failed_count} failed.")
+
+            db.commit()
+            return results
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _load_event_links(self, db, organization_id: Optional[int], calendar_id: str) -> Dict[str, CalendarEventLink]:
+        """Load the notion_page_id → CalendarEventLink index for one organization calendar."""
+        query = db.query(CalendarEventLink).filter(CalendarEventLink.google_calendar_id == calendar_id)
+        if organization_id is not None:
+            query = query.filter(CalendarEventLink.organization_id == organization_id)
+        return {link.notion_page_id: link for link in query.all()}
+
+    def _reconcile_event_links(self, db, parsed_events: List[CalendarEventDTO], links: Dict[str, CalendarEventLink],
+                               organization_id: Optional[int], calendar_id: str, notion_database_id: str,
+                               parent_transaction=None, horizon: Optional[datetime] = None) -> Optional[Dict[str, CalendarEventLink]]:
+        """
+        Rebuild the link index from a full Google Calendar listing.
+
+        Removes duplicate events and managed events whose page is gone, and re-points links at the
+        surviving events. Content hashes are cleared so every event is rewritten once. Only events
+        ending after ``horizon`` are listed, and those that started before it are never touched.
+        Returns the new index, or None if the calendar could not be listed.
+        """
+        op_name = "reconcile_event_links"
 
-        # Fetch existing Google Calendar events
         with operation_span(parent_transaction, op="fetch_gcal", description="fetch_existing_gcal_events", logger=self.logger) as span:
-            all_gcal_events_raw = self.gcal_client.get_all_events(calendar_id, time_min=None, parent_transaction=parent_transaction)
+            all_gcal_events_raw = self.gcal_client.get_all_events(
+                calendar_id, time_min=horizon.isoformat() if horizon else None, parent_transaction=parent_transaction
+            )
             if all_gcal_events_raw is None:
                 self.logger.error(f"{op_name}: Failed to fetch existing Google Calendar events. Aborting update.")
-                return []
+                return None
 
             # Filter for events managed by this sync
             managed_gcal_events = [
@@ -162,111 +408,271 @@ class MultiOrgCalendarService:
             span.set_data("fetched_managed_gcal_event_count", len(managed_gcal_events))
             self.logger.info(f"Fetched {len(managed_gcal_events)} managed GCal events (out of {len(all_gcal_events_raw)} total).")
 
-        # Build lookup dictionaries for GCal events & handle duplicates
-        gcal_events_by_gcal_id: Dict[str, Dict] = {}
+        current_page_ids = {event_dto.notion_page_id for event_dto in parsed_events}
         gcal_events_by_notion_id: Dict[str, Dict] = {}
-        duplicates_to_delete: set[str] = set()
+        to_delete: set[str] = set()
 
         with operation_span(parent_transaction, op="process_gcal", description="build_gcal_lookups_handle_duplicates", logger=self.logger) as span:
-            temp_gcal_by_notion_id: Dict[str, List[Dict]] = {}
-
             for event in managed_gcal_events:
                 gcal_id = event.get('id')
-                notion_page_id = event.get('extendedProperties', {}).get('private', {}).get('notionPageId')
-
-                if gcal_id:
-                    gcal_events_by_gcal_id[gcal_id] = event
-
-                if notion_page_id:
-                    if notion_page_id not in temp_gcal_by_notion_id:
-                        temp_gcal_by_notion_id[notion_page_id] = []
-                    temp_gcal_by_notion_id[notion_page_id].append(event)
-
-            # Handle duplicates - keep the first one, mark others for deletion
-            for notion_id, events in temp_gcal_by_notion_id.items():
-                if len(events) > 1:
-                    self.logger.warning(f"Found {len(events)} duplicate events for Notion page {notion_id}")
-                    # Keep the first one, mark the rest for deletion
-                    gcal_events_by_notion_id[notion_id] = events[0]
-                    for duplicate_event in events[1:]:
-                        duplicates_to_delete.add(duplicate_event['id'])
+                notion_page_id = event['extendedProperties']['private']['notionPageId']
+                if not gcal_id:
+                    continue
+                start = event.get('start', {})
+                if self._is_frozen({"start": start.get('dateTime', start.get('date'))}, horizon):
+                    continue  # Started before the horizon, so absent from the Notion query by design
+                if notion_page_id not in current_page_ids:
+                    to_delete.add(gcal_id)  # Orphan: page deleted or unpublished in Notion
+                elif notion_page_id in gcal_events_by_notion_id:
+                    self.logger.warning(f"Found duplicate event {gcal_id} for Notion page {notion_page_id}")
+                    to_delete.add(gcal_id)  # Keep the first one
                 else:
-                    gcal_events_by_notion_id[notion_id] = events[0]
-
-            span.set_data("duplicates_found", len(duplicates_to_delete))
-
-        # Process each Notion event
-        for event_dto in parsed_events:
-            result = self._process_single_event(event_dto, gcal_events_by_notion_id, calendar_id, parent_transaction)
-            if result:
-                results.append(result)
+                    gcal_events_by_notion_id[notion_page_id] = event
+            span.set_data("events_to_delete", len(to_delete))
 
-        # Clean up duplicates
-        if duplicates_to_delete:
-            with operation_span(parent_transaction, op="cleanup", description="delete_duplicate_events", logger=self.logger) as span:
+        if to_delete:
+            with operation_span(parent_transaction, op="cleanup", description="delete_duplicate_and_orphaned_events", logger=self.logger) as span:
                 deleted_count, failed_count = self.gcal_client.batch_delete_events(
-                    calendar_id, list(duplicates_to_delete), "delete_duplicates", parent_transaction
+                    calendar_id, list(to_delete), "delete_duplicates_and_orphans", parent_transaction
                 )
-                span.set_data("duplicates_deleted", deleted_count)
-                span.set_data("duplicates_failed", failed_count)
-                self.logger.info(f"Cleaned up {deleted_count} duplicate events, {failed_count} failed.")
-
-        # Clean up orphaned events (events in GCal but not in Notion)
-        orphaned_events = set(gcal_events_by_gcal_id.keys()) - set(gcal_events_by_notion_id.keys())
-        if orphaned_events:
-            with operation_span(parent_transaction, op="cleanup", description="delete_orphaned_events", logger=self.logger) as span:
-                deleted_count, failed_count = self.gcal_client.batch_delete_events(
-                    calendar_id, list(orphaned_events), "delete_orphaned", parent_transaction
+                span.set_data("deleted", deleted_count)
+                span.set_data("failed", failed_count)
+                self.logger.info(f"Cleaned up {deleted_count} duplicate/orphaned events, {failed_count} failed.")
+
+        reconciled: Dict[str, CalendarEventLink] = {}
+        stale_links = [link for page_id, link in links.items() if page_id not in gcal_events_by_notion_id]
+        frozen_links = [link for link in stale_links if self._is_frozen((link.event_metadata or {}).get("event"), horizon)]
+        if frozen_links:
+            self._archive_links(db, frozen_links)
+        for link in stale_links:
+            if link not in frozen_links:
+                db.delete(link)
+        for page_id, event in gcal_events_by_notion_id.items():
+            link = links.get(page_id)
+            if link is None:
+                link = CalendarEventLink(
+                    organization_id=organization_id,
+                    notion_page_id=page_id,
+                    notion_database_id=notion_database_id,
+                    google_calendar_id=calendar_id
                 )
-                span.set_data("orphaned_deleted", deleted_count)
-                span.set_data("orphaned_failed", failed_count)
-                self.logger.info(f"Cleaned up {deleted_count} orphaned events, {failed_count} failed.")
+                db.add(link)
+            link.google_calendar_event_id = event['id']
+            link.event_metadata = None
+            reconciled[page_id] = link
 
-        return results
+        _LAST_RECONCILED[(organization_id, calendar_id)] = datetime.utcnow()
+        self.logger.info(f"Reconciled {len(reconciled)} event links for calendar {calendar_id}.")
+        return reconciled
 
-    def _process_single_event(self, event_dto: CalendarEventDTO, gcal_events_by_notion_id: Dict[str, Dict], calendar_id: str, parent_transaction=None) -> Optional[Dict]:
-        """Process a single event DTO."""
+    def _sync_event_with_link(self, db, event_dto: CalendarEventDTO, link: Optional[CalendarEventLink], organization_id: Optional[int],
+                              calendar_id: str, notion_database_id: str, parent_transaction=None) -> Optional[Dict]:
+        """Create or update one event through its link, skipping the API call when its content is unchanged."""
         notion_page_id = event_dto.notion_page_id
-        existing_gcal_event = gcal_events_by_notion_id.get(notion_page_id)
-
         event_data = event_dto.to_gcal_format()
-        
-        if existing_gcal_event:
-            # Update existing event
-            gcal_event_id = existing_gcal_event['id']
-            result = self.gcal_client.update_event(calendar_id, gcal_event_id, event_data, notion_page_id, parent_transaction)
-            if result:
+        content_hash = hashlib.sha1(json.dumps(event_data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+        if link is not None and link.google_calendar_event_id:
+            gcal_event_id = link.google_calendar_event_id
+            if (link.event_metadata or {}).get("content_hash") == content_hash:
+                if not link.event_metadata.get("event"):
+                    link.event_metadata = {**link.event_metadata, "event": event_dto.to_frontend_format()}
                 return {
                     "notion_page_id": notion_page_id,
                     "gcal_event_id": gcal_event_id,
-                    "status": "updated",
+                    "status": "unchanged",
                     "summary": event_dto.summary
                 }
+            jump_url = self.gcal_client.update_event(calendar_id, gcal_event_id, event_data, notion_page_id, parent_transaction)
+            if not jump_url:
+                return None  # Hash left untouched so the next run retries; reconciliation repairs dangling links
+            status = "updated"
         else:
-            # Create new event
-            result = self.gcal_client.create_event(calendar_id, event_data, notion_page_id, parent_transaction)
-            if result:
-                gcal_event_id, jump_url = result
-                return {
-                    "notion_page_id": notion_page_id,
-                    "gcal_event_id": gcal_event_id,
-                    "status": "created",
-                    "summary": event_dto.summary,
-                    "jump_url": jump_url
-                }
-        
-        return None
+            created = self.gcal_client.create_event(calendar_id, event_data, notion_page_id, parent_transaction)
+            if not created:
+                return None
+            jump_url, gcal_event_id = created
+            if link is None:
+                link = CalendarEventLink(
+                    organization_id=organization_id,
+                    notion_page_id=notion_page_id,
+                    notion_database_id=notion_database_id,
+                    google_calendar_id=calendar_id
+                )
+                db.add(link)
+            link.google_calendar_event_id = gcal_event_id
+            status = "created"
+
+        link.event_metadata = {"content_hash": content_hash, "summary": event_dto.summary, "event": event_dto.to_frontend_format()}
+        return {
+            "notion_page_id": notion_page_id,
+            "gcal_event_id": gcal_event_id,
+            "status": status,
+            "summary": event_dto.summary,
+            "jump_url": jump_url
+        }
+
+    def get_sync_horizon(self, org: Organization) -> Optional[datetime]:
+        """The organization's calendar sync horizon from its settings, or None to sync all history."""
+        return OrganizationSettings.from_dict(org.config or {}).calendar_sync_horizon()
 
-    @cached(cache=_FRONTEND_CACHE, key=lambda self, org_id, transaction=None: keys.hashkey(org_id))
-    def get_organization_events_for_frontend(self, organization_id: int, parent_transaction=None) -> Dict[str, Any]:
-        """Get events for frontend display for a specific organization."""
+    @staticmethod
+    def _is_frozen(event: Optional[Dict[str, Any]], horizon: Optional[datetime]) -> bool:
+        """Whether a frontend-format event started before the sync horizon."""
+        if horizon is None or not event:
+            return False
+        start = parse_event_time(event.get("start"))
+        return start is not None and start < horizon
+
+    def _archive_links(self, db, links: List[CalendarEventLink]):
+        """Move links of frozen events to the archive. Their Google Calendar events are kept as they are."""
+        for link in links:
+            metadata = link.event_metadata or {}
+            archive = db.query(CalendarEventArchive).filter(
+                CalendarEventArchive.organization_id == link.organization_id,
+                CalendarEventArchive.notion_page_id == link.notion_page_id
+            ).first()
+            if archive is None:
+                archive = CalendarEventArchive(organization_id=link.organization_id, notion_page_id=link.notion_page_id)
+                db.add(archive)
+            archive.google_calendar_event_id = link.google_calendar_event_id
+            archive.google_calendar_id = link.google_calendar_id
+            archive.event = metadata.get("event")
+            archive.start = (metadata.get("event") or {}).get("start")
+            archive.archived_at = datetime.utcnow()
+            db.delete(link)
+        self.logger.info(f"Archived {len(links)} events that fell behind the sync horizon.")
+
+    def _fetch_published_events(self, org: Organization, horizon: Optional[datetime], transaction=None) -> Optional[List[CalendarEventDTO]]:
+        """
+        Fetch and parse the organization's published Notion events that start on or after the horizon.
+
+        The archive is otherwise only filled as links fall behind the horizon, so until it has been
+        backfilled for the organization all history is fetched once and the older events are archived.
+        Returns None when Notion could not be queried.
+        """
+        backfill = horizon is not None and not self._archive_backfilled(org.id)
+        since = horizon.date().isoformat() if horizon and not backfill else None
+        notion_events = self.notion_client.fetch_events(org.notion_database_id, transaction, since=since)
+        if notion_events is None:
+            return None
+        parsed_events = self.parse_notion_events(notion_events)
+        if not backfill:
+            return parsed_events
+
+        # Split on the start date, like the Notion query does once the archive is backfilled
+        older, current = [], []
+        for event in parsed_events:
+            start = parse_event_time(event.to_frontend_format().get("start"))
+            (older if start is not None and start.date() < horizon.date() else current).append(event)
+        self._backfill_archive(org.id, older)
+        return current
+
+    def _archive_backfilled(self, organization_id: int) -> bool:
+        db = next(self.db_connect.get_db())
+        try:
+            return db.get(CalendarArchiveBackfill, organization_id) is not None
+        finally:
+            db.close()
+
+    def _backfill_archive(self, organization_id: int, events: List[CalendarEventDTO]):
+        """
+        Archive events that started before the sync horizon and mark the organization as backfilled.
+        Existing archive entries keep their Google Calendar IDs; links are left to the regular sync,
+        which archives them as frozen. Failures are logged and the backfill is retried on the next fetch.
+        """
+        db = next(self.db_connect.get_db())
+        try:
+            archives = {
+                archive.notion_page_id: archive
+                for archive in db.query(CalendarEventArchive).filter(CalendarEventArchive.organization_id == organization_id)
+            }
+            for event_dto in events:
+                page_id = event_dto.notion_page_id
+                event = event_dto.to_frontend_format()
+                archive = archives.get(page_id)
+                if archive is None:
+                    archive = CalendarEventArchive(organization_id=organization_id, notion_page_id=page_id)
+                    db.add(archive)
+                    archives[page_id] = archive
+                archive.event = event
+                archive.start = event.get("start")
+                archive.archived_at = datetime.utcnow()
+            marker = db.get(CalendarArchiveBackfill, organization_id)
+            if marker is None:
+                marker = CalendarArchiveBackfill(organization_id=organization_id)
+                db.add(marker)
+            marker.archived_count = len(events)
+            marker.backfilled_at = datetime.utcnow()
+            db.commit()
+            log_event(self.logger, logging.INFO, "calendar_archive.backfilled",
+                      organization_id=organization_id, archived=len(events))
+        except Exception as e:
+            db.rollback()
+            capture_exception(e)
+            self.logger.error(f"Failed to backfill the calendar archive for organization {organization_id}: {e}")
+        finally:
+            db.close()
+
+    def needs_reconciliation(self, organization_id: int, calendar_id: str) -> bool:
+        """Whether the full Google Calendar listing is due for this organization calendar."""
+        last = _LAST_RECONCILED.get((organization_id, calendar_id))
+        return last is None or datetime.utcnow() - last > RECONCILE_INTERVAL
+
+    def get_organization_events_for_frontend(self, organization_id: int, parent_transaction=None,
+                                             start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Get events for frontend display for a specific organization.
+
+        Events are served from the persisted snapshot. A missing snapshot is built synchronously;
+        a stale one is returned immediately while a background refresh rebuilds it.
+        Optional ``start``/``end`` restrict the result to events overlapping that range.
+        """
         op_name = "get_organization_events_for_frontend"
         
         current_transaction = parent_transaction or start_transaction(op="calendar", name=op_name)
         
         with operation_span(current_transaction, op="org_frontend", description=op_name, logger=self.logger) as transaction:
             try:
-                # Get organization
+                snapshot = self.read_model.get_snapshot(organization_id)
+                if snapshot is None:
+                    self.logger.info(f"No calendar snapshot for organization {organization_id}, building it now")
+                    refresh_result = self.refresh_organization_events_snapshot(organization_id, transaction)
+                    if refresh_result.get("status") != "success":
+                        return refresh_result
+                    snapshot = refresh_result["snapshot"]
+                elif self.read_model.is_stale(snapshot):
+                    set_tag("calendar.snapshot_stale", True)
+                    self.read_model.schedule_refresh(organization_id)
+                
+                events = filter_events_by_range(snapshot["events"], start, end)
+                
+                return {
+                    "status": "success",
+                    "organization_id": organization_id,
+                    "organization_name": snapshot["organization_name"],
+                    "events": events,
+                    "total_events": len(events),
+                    "last_refreshed_at": snapshot["refreshed_at"],
+                    "etag": snapshot["etag"]
+                }
+                
+            except Exception as e:
+                self.logger.error(f"Error getting organization events: {e}")
+                return {"status": "error", "message": str(e)}
+            finally:
+                if transaction:
+                    transaction.finish()
+    
+    def refresh_organization_events_snapshot(self, organization_id: int, parent_transaction=None) -> Dict[str, Any]:
+        """Fetch an organization's events from Notion and store them as the frontend snapshot."""
+        op_name = "refresh_organization_events_snapshot"
+        
+        current_transaction = parent_transaction or start_transaction(op="calendar", name=op_name)
+        
+        with operation_span(current_transaction, op="org_snapshot_refresh", description=op_name, logger=self.logger) as transaction:
+            db = None
+            try:
                 db = next(self.db_connect.get_db())
                 org = db.query(Organization).filter(Organization.id == organization_id).first()
                 if not org:
@@ -275,31 +681,47 @@ class MultiOrgCalendarService:
                 if not org.notion_database_id:
                     return {"status": "error", "message": f"Organization {organization_id} has no Notion database configured"}
                 
-                # Fetch events from Notion
-                notion_events = self.notion_client.fetch_events(org.notion_database_id, transaction)
-                if notion_events is None:
+                horizon = self.get_sync_horizon(org)
+                parsed_events = self._fetch_published_events(org, horizon, transaction)
+                if parsed_events is None:
                     return {"status": "error", "message": "Failed to fetch events from Notion"}
                 
-                # Parse events
-                parsed_events = self.parse_notion_events(notion_events)
+                snapshot = self._store_events_snapshot(organization_id, org.name, parsed_events)
+                if snapshot is None:
+                    return {"status": "error", "message": "Failed to store calendar snapshot"}
                 
-                # Convert to frontend format
-                frontend_events = [event.to_frontend_format() for event in parsed_events]
-                
-                return {
-                    "status": "success",
-                    "organization_id": organization_id,
-                    "organization_name": org.name,
-                    "events": frontend_events,
-                    "total_events": len(frontend_events)
-                }
+                return {"status": "success", "snapshot": snapshot}
                 
             except Exception as e:
-                self.logger.error(f"Error getting organization events: {e}")
+                capture_exception(e)
+                self.logger.error(f"Error refreshing calendar snapshot for organization {organization_id}: {e}")
                 return {"status": "error", "message": str(e)}
             finally:
                 if transaction:
                     transaction.finish()
+                if db:
+                    db.close()
+    
+    def _store_events_snapshot(self, organization_id: int, organization_name: str, parsed_events: List[CalendarEventDTO]) -> Optional[Dict[str, Any]]:
+        """Persist parsed and archived events as the organization's frontend snapshot. Failures are logged, not raised."""
+        try:
+            frontend_events = [event.to_frontend_format() for event in parsed_events]
+            live_ids = {event["id"] for event in frontend_events}
+            db = next(self.db_connect.get_db())
+            try:
+                archived = db.query(CalendarEventArchive.event).filter(
+                    CalendarEventArchive.organization_id == organization_id
+                ).all()
+            finally:
+                db.close()
+            frontend_events.extend(
+                event for (event,) in archived if event and event.get("id") not in live_ids
+            )
+            return self.read_model.store_snapshot(organization_id, organization_name, frontend_events)
+        except Exception as e:
+            capture_exception(e)
+            self.logger.error(f"Failed to store calendar snapshot for organization {organization_id}: {e}")
+            return None
     
     def parse_notion_events(self, notion_events_raw: List[Dict]) -> List[CalendarEventDTO]:
         """Parse raw Notion events into CalendarEventDTO objects."""
@@ -308,15 +730,15 @@ class MultiOrgCalendarService:
         if not notion_events_raw:
             return []
 
-        self.logger.info(f"Parsing {len(notion_events_raw)} raw Notion events.")
         for event_data in notion_events_raw:
             parsed_dto = CalendarEventDTO.from_notion(event_data)
             if parsed_dto:
                 parsed_events.append(parsed_dto)
-        else:
+            else:
                 failed_count += 1
 
-        self.logger.info(f"Successfully parsed {len(parsed_events)} events, failed to parse {failed_count}.")
+        log_event(self.logger, logging.INFO, "calendar_parse.summary",
+                  events=len(notion_events_raw), parsed=len(parsed_events), failed=failed_count)
         return parsed_events
 
     def sync_all_organizations(self, parent_transaction=None) -> Dict[str, Any]:
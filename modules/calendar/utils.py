@@ -5,7 +5,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, List, Any, Tuple
 import pytz
 
+import sentry_sdk
 from sentry_sdk import capture_exception, set_context
+from modules.utils.tracing import get_current_transaction
 from shared import config, logger # Assuming logger and config are available in shared
 
 # If logger is not in shared, initialize it here:
@@ -13,11 +15,20 @@ from shared import config, logger # Assuming logger and config are available in
 
 @contextmanager
 def operation_span(transaction, op, description, logger=None):
-    """Context manager for transaction spans with standardized logging."""
+    """
+    Context manager for transaction spans with standardized logging.
+
+    When ``transaction`` is None the span is attached to the current request's transaction
+    (see modules.utils.tracing), or started as a standalone span if there is none.
+    """
     # Ensure logger is available
     current_logger = logger if logger else logging.getLogger(__name__)
 
-    span = transaction.start_child(op=op, description=description)
+    transaction = transaction or get_current_transaction()
+    if transaction is not None:
+        span = transaction.start_child(op=op, description=description)
+    else:
+        span = sentry_sdk.start_span(op=op, description=description)
     try:
         yield span
     except Exception as e:
@@ -1,10 +1,23 @@
-from flask import Blueprint, request, jsonify
+import hashlib
+from urllib.parse import urlencode
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from modules.auth.decoraters import auth_required, member_required, error_handler
 from modules.utils.db import DBConnect
 from modules.merch.models import Product, Order, OrderItem
+from modules.merch.inventory import InventoryService, StockReservationError, aggregate_quantities
+from modules.merch.storefront import StorefrontCache, STOREFRONT_MAX_PAGE_SIZE
+from modules.merch.bulk import MAX_BULK_OPERATIONS, apply_product_operations
+from modules.merch.orders import ORDER_STATUSES, iter_orders, order_to_dict, orders_csv, parse_order_filters, query_orders
 
 merch_blueprint = Blueprint("merch", __name__)
 db_connect = DBConnect()
+storefront_cache = StorefrontCache()
+inventory_service = InventoryService(db_connect, on_stock_change=storefront_cache.apply_stock_deltas)
+
+# Indexes added after the tables were first created are not picked up by create_all
+for index in [*Product.__table__.indexes, *Order.__table__.indexes]:
+    index.create(db_connect.engine, checkfirst=True)
 
 # Helper function to get organization by prefix
 def get_organization_by_prefix(db, org_prefix):
@@ -14,6 +27,71 @@ def get_organization_by_prefix(db, org_prefix):
         return None
     return org
 
+def order_items_from_request(items):
+    """
+    OrderItem rows for the items of an order request.
+
+    Returns (order_items, None), or (None, error_response) when an item is incomplete or has a
+    product ID, quantity or price that is not a valid number.
+    """
+    if not all(k in item for item in items for k in ['product_id', 'quantity', 'price']):
+        return None, (jsonify({"error": "Each item must have product_id, quantity, and price"}), 400)
+    try:
+        aggregate_quantities(items)
+    except StockReservationError as e:
+        return None, (jsonify({"error": e.message}), e.status_code)
+    try:
+        prices = [float(item['price']) for item in items]
+    except (TypeError, ValueError):
+        return None, (jsonify({"error": "Each item price must be a number"}), 400)
+    return [
+        OrderItem(product_id=int(item['product_id']), quantity=int(item['quantity']), price_at_time=price)
+        for item, price in zip(items, prices)
+    ], None
+
+def place_order(db, organization_id, new_order, order_items, hold_token=None):
+    """
+    Reserve stock and create the order in a single transaction.
+
+    Returns (order, None) on success or (None, error_response) when the stock cannot be reserved.
+    """
+    try:
+        deltas = inventory_service.reserve_for_order(db, organization_id, aggregate_quantities(order_items), hold_token)
+    except StockReservationError as e:
+        db.rollback()
+        return None, (jsonify({"error": e.message}), e.status_code)
+    created_order = db_connect.create_merch_order(db, new_order, order_items, organization_id)
+    inventory_service.notify_stock_change(organization_id, deltas)
+    return created_order, None
+
+def get_page_args():
+    """Read the storefront limit/offset query parameters; raises ValueError when they are invalid."""
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', 0, type=int)
+    if (limit is not None and not 1 <= limit <= STOREFRONT_MAX_PAGE_SIZE) or offset < 0:
+        raise ValueError(f"limit must be between 1 and {STOREFRONT_MAX_PAGE_SIZE} and offset must not be negative")
+    return limit, offset
+
+def storefront_response(payload, page, etag_parts, cache_control):
+    """JSON response with ETag/Last-Modified that answers matching conditional GETs with 304."""
+    response = jsonify(payload)
+    etag_source = "|".join([page['etag'], *(str(part) for part in etag_parts)])
+    response.set_etag(hashlib.sha1(etag_source.encode("utf-8")).hexdigest())
+    if page['last_modified']:
+        response.last_modified = page['last_modified']
+    response.headers["Cache-Control"] = cache_control
+    return response.make_conditional(request)
+
+def order_list_response(orders, next_cursor, **serialize_kwargs):
+    """JSON array of orders; the cursor for the next page goes in X-Next-Cursor and a Link header."""
+    response = jsonify([order_to_dict(o, **serialize_kwargs) for o in orders])
+    if next_cursor:
+        args = request.args.to_dict()
+        args['cursor'] = next_cursor
+        response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['Link'] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return response
+
 # PRODUCT ENDPOINTS
 @merch_blueprint.route("/<string:org_prefix>/products", methods=["GET"])
 @error_handler
@@ -98,6 +176,7 @@ def create_product(org_prefix):
             return jsonify({"error": "Organization not found"}), 404
             
         created_product = db_connect.create_merch_product(db, new_product, org.id)
+        storefront_cache.invalidate(org.id)
         return jsonify({
             'message': 'Product created successfully', 
             'id': created_product.id,
@@ -114,6 +193,37 @@ def create_product(org_prefix):
     finally:
         db.close()
 
+@merch_blueprint.route("/<string:org_prefix>/products/bulk", methods=["POST"])
+@auth_required
+@error_handler
+def bulk_update_products(org_prefix):
+    """
+    Apply a batch of product operations in one transaction.
+    Body: {"operations": [{"op": "create", "name", "price", "stock", ...},
+                          {"op": "update", "id", <fields>}, {"op": "stock", "id", "delta"}]}
+    Returns a result per operation; if any operation fails nothing is applied.
+    """
+    data = request.get_json() or {}
+    operations = data.get('operations')
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"error": "operations must be a non-empty list"}), 400
+    if len(operations) > MAX_BULK_OPERATIONS:
+        return jsonify({"error": f"At most {MAX_BULK_OPERATIONS} operations per request"}), 400
+
+    db = next(db_connect.get_db())
+    try:
+        org = get_organization_by_prefix(db, org_prefix)
+        if not org:
+            return jsonify({"error": "Organization not found"}), 404
+
+        result = apply_product_operations(db, org.id, operations)
+        if result["status"] != "success":
+            return jsonify({"error": result["message"], "results": result["results"]}), 400
+        storefront_cache.invalidate(org.id)
+        return jsonify({"message": result["message"], "results": result["results"]}), 200
+    finally:
+        db.close()
+
 @merch_blueprint.route("/<string:org_prefix>/products/<int:product_id>", methods=["PUT"])
 @auth_required
 @error_handler
@@ -144,6 +254,7 @@ def update_product(org_prefix, product_id):
             product.image_url = data['image_url']
         
         db.commit()
+        storefront_cache.invalidate(org.id)
         return jsonify({
             'message': 'Product updated successfully',
             'product': {
@@ -173,6 +284,7 @@ def delete_product(org_prefix, product_id):
         success = db_connect.delete_merch_product(db, product_id, org.id)
         if not success:
             return jsonify({"error": "Product not found"}), 404
+        storefront_cache.invalidate(org.id)
             
         return jsonify({'message': 'Product deleted successfully'}), 200
     finally:
@@ -183,34 +295,57 @@ def delete_product(org_prefix, product_id):
 @auth_required
 @error_handler
 def get_orders(org_prefix):
-    """Get all orders for an organization"""
+    """
+    Get orders for an organization, newest first.
+    Optional query params: status (comma-separated), user_id, start/end (YYYY-MM-DD or ISO 8601),
+    limit and cursor (from the X-Next-Cursor header of the previous page).
+    """
+    try:
+        filters = parse_order_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     db = next(db_connect.get_db())
     try:
         org = get_organization_by_prefix(db, org_prefix)
         if not org:
             return jsonify({"error": "Organization not found"}), 404
             
-        orders = db_connect.get_merch_orders(db, org.id)
-        return jsonify([{
-            'id': o.id,
-            'user_id': o.user_id,
-            'total_amount': o.total_amount,
-            'status': o.status,
-            'message': o.message,
-            'created_at': o.created_at.isoformat(),
-            'updated_at': o.updated_at.isoformat() if o.updated_at else None,
-            'organization_id': o.organization_id,
-            'user_name': o.user.name if o.user else 'Unknown User',
-            'items': [{
-                'id': item.id,
-                'product_id': item.product_id,
-                'quantity': item.quantity,
-                'price_at_time': item.price_at_time
-            } for item in o.items]
-        } for o in orders]), 200
+        orders, next_cursor = query_orders(db, org.id, **filters)
+        return order_list_response(orders, next_cursor), 200
     finally:
         db.close()
 
+@merch_blueprint.route("/<string:org_prefix>/orders/export", methods=["GET"])
+@auth_required
+@error_handler
+def export_orders(org_prefix):
+    """Stream orders as CSV (one row per item); accepts the same filters as the order listing"""
+    try:
+        filters = parse_order_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    db = next(db_connect.get_db())
+    org = get_organization_by_prefix(db, org_prefix)
+    if not org:
+        db.close()
+        return jsonify({"error": "Organization not found"}), 404
+    organization_id = org.id
+
+    def generate():
+        # The session stays open while the response streams and is closed when it ends
+        try:
+            yield from orders_csv(iter_orders(db, organization_id, **filters))
+        finally:
+            db.close()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{org_prefix}-orders.csv"'}
+    )
+
 @merch_blueprint.route("/<string:org_prefix>/orders/<int:order_id>", methods=["GET"])
 @auth_required
 @error_handler
@@ -265,15 +400,9 @@ def create_order(org_prefix):
     )
     
     # Prepare order items
-    order_items = []
-    for item in data['items']:
-        if not all(k in item for k in ['product_id', 'quantity', 'price']):
-            return jsonify({"error": "Each item must have product_id, quantity, and price"}), 400
-        order_items.append(OrderItem(
-            product_id=int(item['product_id']),
-            quantity=int(item['quantity']),
-            price_at_time=float(item['price'])
-        ))
+    order_items, error_response = order_items_from_request(data['items'])
+    if error_response:
+        return error_response
     
     db = next(db_connect.get_db())
     try:
@@ -281,18 +410,10 @@ def create_order(org_prefix):
         if not org:
             return jsonify({"error": "Organization not found"}), 404
             
-        # Validate that all products exist and have sufficient stock
-        for item in order_items:
-            product = db_connect.get_merch_product(db, item.product_id, org.id)
-            if not product:
-                return jsonify({"error": f"Product {item.product_id} not found"}), 404
-            if product.stock < item.quantity:
-                return jsonify({"error": f"Insufficient stock for product {product.name}"}), 400
-            
-            # Update stock
-            product.stock -= item.quantity
-            
-        created_order = db_connect.create_merch_order(db, new_order, order_items, org.id)
+        # Reserve stock atomically; fails without side effects if any product is missing or short
+        created_order, error_response = place_order(db, org.id, new_order, order_items, data.get('hold_token'))
+        if error_response:
+            return error_response
         return jsonify({
             'message': 'Order created successfully', 
             'id': created_order.id,
@@ -325,10 +446,22 @@ def update_order_status(org_prefix, order_id):
         data = request.get_json()
         
         # Update status if provided
+        stock_deltas = {}
         if 'status' in data:
-            valid_statuses = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
-            if data['status'] not in valid_statuses:
-                return jsonify({"error": f"Invalid status. Must be one of: {', '.join(valid_statuses)}"}), 400
+            if data['status'] not in ORDER_STATUSES:
+                return jsonify({"error": f"Invalid status. Must be one of: {', '.join(ORDER_STATUSES)}"}), 400
+            # Cancelling returns the order's stock; reopening a cancelled order has to reserve it again
+            if data['status'] == 'cancelled' and order.status not in ['cancelled', 'delivered']:
+                stock_deltas = aggregate_quantities(order.items)
+                inventory_service.release(db, org.id, stock_deltas)
+            elif order.status == 'cancelled' and data['status'] != 'cancelled':
+                try:
+                    quantities = aggregate_quantities(order.items)
+                    inventory_service.reserve(db, org.id, quantities)
+                except StockReservationError as e:
+                    db.rollback()
+                    return jsonify({"error": e.message}), e.status_code
+                stock_deltas = {pid: -qty for pid, qty in quantities.items()}
             order.status = data['status']
         
         # Update message if provided
@@ -336,6 +469,7 @@ def update_order_status(org_prefix, order_id):
             order.message = data['message']
         
         db.commit()
+        inventory_service.notify_stock_change(org.id, stock_deltas)
         return jsonify({
             'message': 'Order updated successfully',
             'order': {
@@ -365,15 +499,15 @@ def delete_order(org_prefix, order_id):
         if not order:
             return jsonify({"error": "Order not found"}), 404
             
-        # Restore stock for cancelled orders
+        # Return stock still reserved by the order (cancelled orders already gave theirs back)
+        stock_deltas = {}
         if order.status not in ['cancelled', 'delivered']:
-            for item in order.items:
-                product = db_connect.get_merch_product(db, item.product_id, org.id)
-                if product:
-                    product.stock += item.quantity
+            stock_deltas = aggregate_quantities(order.items)
+            inventory_service.release(db, org.id, stock_deltas)
             
         db.delete(order)
         db.commit()
+        inventory_service.notify_stock_change(org.id, stock_deltas)
         return jsonify({'message': 'Order deleted successfully'}), 200
     finally:
         db.close()
@@ -382,32 +516,79 @@ def delete_order(org_prefix, order_id):
 @merch_blueprint.route("/<string:org_prefix>/store", methods=["GET"])
 @error_handler
 def get_store_products(org_prefix):
-    """Get all available products for public store front"""
+    """Get available products for public store front (optional limit/offset; supports conditional GETs)"""
+    try:
+        limit, offset = get_page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     db = next(db_connect.get_db())
     try:
         org = get_organization_by_prefix(db, org_prefix)
         if not org:
             return jsonify({"error": "Organization not found"}), 404
             
-        products = db_connect.get_merch_products(db, org.id)
-        # Only return products with stock > 0 for the store front
-        available_products = [p for p in products if p.stock > 0]
+        # In-stock products only, served from the per-organization storefront cache
+        page = storefront_cache.get_page(db, org.id, limit, offset)
         
-        return jsonify({
+        return storefront_response({
             'organization': {
                 'name': org.name,
                 'prefix': org.prefix,
                 'description': org.description
             },
             'products': [{
-                'id': p.id,
-                'name': p.name,
-                'description': p.description,
-                'price': p.price,
-                'stock': p.stock,
-                'image_url': p.image_url
-            } for p in available_products]
-        }), 200
+                'id': p['id'],
+                'name': p['name'],
+                'description': p['description'],
+                'price': p['price'],
+                'stock': p['stock'],
+                'image_url': p['image_url']
+            } for p in page['products']],
+            'total': page['total'],
+            'limit': limit,
+            'offset': offset
+        }, page, [org.name, org.prefix, org.description], "public, max-age=15")
+    finally:
+        db.close()
+
+@merch_blueprint.route("/<string:org_prefix>/store/holds", methods=["POST"])
+@error_handler
+def create_stock_hold(org_prefix):
+    """Set stock aside for a checkout; pass the returned token as hold_token when placing the order"""
+    data = request.get_json() or {}
+    if not data.get('items'):
+        return jsonify({"error": "Hold items are required"}), 400
+    if not all(k in item for item in data['items'] for k in ['product_id', 'quantity']):
+        return jsonify({"error": "Each item must have product_id and quantity"}), 400
+
+    db = next(db_connect.get_db())
+    try:
+        org = get_organization_by_prefix(db, org_prefix)
+        if not org:
+            return jsonify({"error": "Organization not found"}), 404
+
+        try:
+            hold = inventory_service.create_hold(db, org.id, aggregate_quantities(data['items']), data.get('user_id'))
+        except StockReservationError as e:
+            return jsonify({"error": e.message}), e.status_code
+        return jsonify({'message': 'Stock held successfully', 'hold': hold}), 201
+    finally:
+        db.close()
+
+@merch_blueprint.route("/<string:org_prefix>/store/holds/<string:token>", methods=["DELETE"])
+@error_handler
+def release_stock_hold(org_prefix, token):
+    """Give up a checkout hold before it expires"""
+    db = next(db_connect.get_db())
+    try:
+        org = get_organization_by_prefix(db, org_prefix)
+        if not org:
+            return jsonify({"error": "Organization not found"}), 404
+
+        if not inventory_service.release_hold(db, org.id, token):
+            return jsonify({"error": "Stock hold not found or expired"}), 404
+        return jsonify({'message': 'Stock hold released successfully'}), 200
     finally:
         db.close()
 
@@ -430,13 +611,17 @@ def get_member_store(org_prefix, **kwargs):
     from modules.points.api import get_or_create_user
     user = get_or_create_user(user_discord_id, organization.id)
     
+    try:
+        limit, offset = get_page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     db = next(db_connect.get_db())
     try:
-        products = db_connect.get_merch_products(db, organization.id)
-        # Only return products with stock > 0 for the store front
-        available_products = [p for p in products if p.stock > 0]
+        # In-stock products only, served from the per-organization storefront cache
+        page = storefront_cache.get_page(db, organization.id, limit, offset)
         
-        return jsonify({
+        return storefront_response({
             'organization': {
                 'name': organization.name,
                 'prefix': organization.prefix,
@@ -447,17 +632,12 @@ def get_member_store(org_prefix, **kwargs):
                 'user_id': user.id if user else None,
                 'is_member': True
             },
-            'products': [{
-                'id': p.id,
-                'name': p.name,
-                'description': p.description,
-                'price': p.price,
-                'stock': p.stock,
-                'image_url': p.image_url,
-                'created_at': p.created_at.isoformat() if p.created_at else None,
-                'updated_at': p.updated_at.isoformat() if p.updated_at else None
-            } for p in available_products]
-        }), 200
+            'products': page['products'],
+            'total': page['total'],
+            'limit': limit,
+            'offset': offset
+        }, page, [organization.name, organization.prefix, organization.description, user_discord_id,
+                  user.id if user else None], "private, max-age=15")
     finally:
         db.close()
 
@@ -476,30 +656,17 @@ def get_member_orders(org_prefix, **kwargs):
     if not user:
         return jsonify({"error": "Could not create or find user"}), 500
     
+    try:
+        filters = parse_order_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    # Members only ever see their own orders
+    filters['user_id'] = user.id
+    
     db = next(db_connect.get_db())
     try:
-        # Get orders for this specific user in this organization
-        from modules.merch.models import Order
-        orders = db.query(Order).filter(
-            Order.organization_id == organization.id,
-            Order.user_id == user.id
-        ).order_by(Order.created_at.desc()).all()
-        
-        return jsonify([{
-            'id': o.id,
-            'total_amount': o.total_amount,
-            'status': o.status,
-            'message': o.message,
-            'created_at': o.created_at.isoformat(),
-            'updated_at': o.updated_at.isoformat() if o.updated_at else None,
-            'items': [{
-                'id': item.id,
-                'product_id': item.product_id,
-                'quantity': item.quantity,
-                'price_at_time': item.price_at_time,
-                'product_name': item.product.name if item.product else 'Unknown Product'
-            } for item in o.items]
-        } for o in orders]), 200
+        orders, next_cursor = query_orders(db, organization.id, **filters)
+        return order_list_response(orders, next_cursor, include_user=False), 200
     finally:
         db.close()
 
@@ -534,30 +701,16 @@ def create_member_order(org_prefix, **kwargs):
     )
     
     # Prepare order items
-    order_items = []
-    for item in data['items']:
-        if not all(k in item for k in ['product_id', 'quantity', 'price']):
-            return jsonify({"error": "Each item must have product_id, quantity, and price"}), 400
-        order_items.append(OrderItem(
-            product_id=int(item['product_id']),
-            quantity=int(item['quantity']),
-            price_at_time=float(item['price'])
-        ))
+    order_items, error_response = order_items_from_request(data['items'])
+    if error_response:
+        return error_response
     
     db = next(db_connect.get_db())
     try:
-        # Validate that all products exist and have sufficient stock
-        for item in order_items:
-            product = db_connect.get_merch_product(db, item.product_id, organization.id)
-            if not product:
-                return jsonify({"error": f"Product {item.product_id} not found"}), 404
-            if product.stock < item.quantity:
-                return jsonify({"error": f"Insufficient stock for product {product.name}"}), 400
-            
-            # Update stock
-            product.stock -= item.quantity
-            
-        created_order = db_connect.create_merch_order(db, new_order, order_items, organization.id)
+        # Reserve stock atomically; fails without side effects if any product is missing or short
+        created_order, error_response = place_order(db, organization.id, new_order, order_items, data.get('hold_token'))
+        if error_response:
+            return error_response
         return jsonify({
             'message': 'Order created successfully', 
             'id': created_order.id,
@@ -0,0 +1,149 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+
+from modules.merch.models import Product
+
+logger = logging.getLogger(__name__)
+
+# Largest batch accepted by the bulk product endpoint
+MAX_BULK_OPERATIONS = 500
+BULK_OPERATIONS = ('create', 'update', 'stock')
+EDITABLE_FIELDS = ('name', 'description', 'price', 'stock', 'image_url')
+
+
+def _clean_fields(operation: Dict[str, Any], require_core: bool) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Validated product fields of a create/update operation, or an error message."""
+    fields = {key: operation[key] for key in EDITABLE_FIELDS if key in operation}
+    if require_core:
+        missing = [key for key in ('name', 'price', 'stock') if fields.get(key) in (None, '')]
+        if missing:
+            return {}, f"Missing required fields: {', '.join(missing)}"
+    elif not fields:
+        return {}, f"Nothing to update; expected one of: {', '.join(EDITABLE_FIELDS)}"
+
+    if 'name' in fields and not str(fields['name']).strip():
+        return {}, "Product name must not be empty"
+    try:
+        if 'price' in fields:
+            fields['price'] = float(fields['price'])
+            if fields['price'] < 0:
+                return {}, "Price must not be negative"
+        if 'stock' in fields:
+            fields['stock'] = int(fields['stock'])
+            if fields['stock'] < 0:
+                return {}, "Stock must not be negative"
+    except (TypeError, ValueError):
+        return {}, "Price must be a number and stock an integer"
+    return fields, None
+
+
+def validate_operations(db, organization_id: int, operations: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[int, Product]]:
+    """
+    Check every operation without changing anything.
+
+    Returns one result per operation (``status`` is "valid" or "error") and the organization's
+    products referenced by the batch, loaded with a single IN query.
+    """
+    ids = set()
+    for operation in operations:
+        try:
+            if isinstance(operation, dict) and operation.get('id') is not None:
+                ids.add(int(operation['id']))
+        except (TypeError, ValueError):
+            pass
+    products = {}
+    if ids:
+        products = {p.id: p for p in db.query(Product).filter(
+            Product.organization_id == organization_id,
+            Product.id.in_(ids)
+        )}
+
+    results = []
+    for index, operation in enumerate(operations):
+        result = {"index": index, "op": operation.get('op') if isinstance(operation, dict) else None}
+        error = None
+        if not isinstance(operation, dict) or operation.get('op') not in BULK_OPERATIONS:
+            error = f"op must be one of: {', '.join(BULK_OPERATIONS)}"
+        elif operation['op'] == 'create':
+            _, error = _clean_fields(operation, require_core=True)
+        else:
+            try:
+                product_id = int(operation.get('id'))
+            except (TypeError, ValueError):
+                product_id = None
+            result["id"] = product_id
+            if product_id not in products:
+                error = f"Product {operation.get('id')} not found"
+            elif operation['op'] == 'update':
+                _, error = _clean_fields(operation, require_core=False)
+            else:
+                try:
+                    if int(operation.get('delta')) == 0:
+                        error = "delta must not be zero"
+                except (TypeError, ValueError):
+                    error = "delta must be an integer"
+        result.update({"status": "error", "error": error} if error else {"status": "valid"})
+        results.append(result)
+    return results, products
+
+
+def apply_product_operations(db, organization_id: int, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply a batch of product create / update / stock-delta operations in one transaction.
+
+    Operations run in order. If any operation is invalid, or a negative stock delta would take a
+    product below zero, nothing is written and the per-item results say why. Stock deltas use a
+    conditional UPDATE, so they compose with concurrent orders instead of overwriting them.
+    """
+    results, products = validate_operations(db, organization_id, operations)
+    if any(result["status"] == "error" for result in results):
+        return {"status": "error", "message": "Some operations are invalid; nothing was applied", "results": results}
+
+    try:
+        created = []
+        for operation, result in zip(operations, results):
+            if operation['op'] == 'create':
+                fields, _ = _clean_fields(operation, require_core=True)
+                product = Product(organization_id=organization_id, **fields)
+                db.add(product)
+                created.append((product, result))
+            elif operation['op'] == 'update':
+                fields, _ = _clean_fields(operation, require_core=False)
+                product = products[result["id"]]
+                for key, value in fields.items():
+                    setattr(product, key, value)
+            else:
+                delta = int(operation['delta'])
+                # Pending attribute changes must reach the database before the SQL-side update
+                db.flush()
+                updated = db.execute(
+                    update(Product)
+                    .where(
+                        Product.id == result["id"],
+                        Product.organization_id == organization_id,
+                        Product.stock + delta >= 0
+                    )
+                    .values(stock=Product.stock + delta)
+                ).rowcount
+                if updated != 1:
+                    db.rollback()
+                    for applied in results:
+                        if applied["status"] == "ok":
+                            applied["status"] = "valid"
+                    result.update({"status": "error", "error": "Stock would go below zero"})
+                    return {"status": "error", "message": "Some operations failed; nothing was applied", "results": results}
+            result["status"] = "ok"
+
+        db.flush()
+        for product, result in created:
+            result["id"] = product.id
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error applying bulk product operations for organization {organization_id}: {e}")
+        raise
+
+    logger.info(f"Applied {len(operations)} bulk product operations for organization {organization_id}")
+    return {"status": "success", "message": f"Applied {len(operations)} operations", "results": results}
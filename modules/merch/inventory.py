@@ -0,0 +1,255 @@
+import logging
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import delete, update
+
+from modules.merch.models import Product, StockHold
+
+logger = logging.getLogger(__name__)
+
+# How long a checkout hold keeps its stock before the sweeper returns it
+HOLD_TTL = timedelta(minutes=10)
+# How often the sweeper looks for expired holds, and how many hold rows it releases per pass
+HOLD_SWEEP_INTERVAL_SECONDS = 60
+HOLD_SWEEP_BATCH_SIZE = 500
+
+
+class StockReservationError(Exception):
+    """A reservation could not be made; ``status_code`` is the HTTP status the API should answer with."""
+
+    def __init__(self, message: str, status_code: int = 400, product_id: Optional[int] = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.product_id = product_id
+
+
+def _whole_number(value: Any, field: str) -> int:
+    """An order item field as an int; raises StockReservationError (400) unless it is a whole number."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = None
+    if number is None or isinstance(value, bool) or (isinstance(value, float) and value != number):
+        raise StockReservationError(f"{field} must be a whole number, got {value!r}", 400)
+    return number
+
+
+def aggregate_quantities(items: Iterable[Any]) -> Dict[int, int]:
+    """
+    Total quantity per product for order items (objects or dicts with product_id and quantity).
+    Raises StockReservationError (400) for IDs or quantities that are not whole numbers, or quantities below one.
+    """
+    quantities = Counter()
+    for item in items:
+        product_id = _whole_number(item["product_id"] if isinstance(item, dict) else item.product_id, "product_id")
+        quantity = _whole_number(item["quantity"] if isinstance(item, dict) else item.quantity, "quantity")
+        if quantity <= 0:
+            raise StockReservationError(f"Quantity for product {product_id} must be positive", 400, product_id)
+        quantities[product_id] += quantity
+    return dict(quantities)
+
+
+class InventoryService:
+    """
+    Race-free stock reservation for merch orders.
+
+    Stock is never checked in Python and written back: each product is decremented with a single
+    conditional ``UPDATE ... SET stock = stock - :qty WHERE stock >= :qty``, so two buyers of the last
+    item cannot both succeed. Reservation methods do not commit; the caller commits them together
+    with the order (or rolls everything back), so an order and its stock change are one transaction.
+
+    Holds set stock aside for a checkout in progress. They are claimed when the order is placed and
+    returned to stock by ``sweep_expired_holds`` if the buyer never completes the purchase.
+
+    ``on_stock_change(organization_id, deltas)`` is called after every commit made here, with the
+    change in stock per product ID; callers committing reservations themselves report them.
+    """
+
+    def __init__(self, db_connect, hold_ttl: timedelta = HOLD_TTL,
+                 on_stock_change: Optional[Callable[[int, Dict[int, int]], None]] = None):
+        self.db_connect = db_connect
+        self.hold_ttl = hold_ttl
+        self.on_stock_change = on_stock_change
+
+    def notify_stock_change(self, organization_id: int, deltas: Dict[int, int]):
+        """Report committed stock changes; listener errors never fail the caller."""
+        if self.on_stock_change is None or not deltas:
+            return
+        try:
+            self.on_stock_change(organization_id, deltas)
+        except Exception as e:
+            logger.error(f"Error notifying stock change for organization {organization_id}: {e}")
+
+    def load_products(self, db, organization_id: int, product_ids: Iterable[int]) -> Dict[int, Product]:
+        """Products of an organization by ID, loaded with one IN query."""
+        product_ids = set(product_ids)
+        if not product_ids:
+            return {}
+        products = db.query(Product).filter(
+            Product.organization_id == organization_id,
+            Product.id.in_(product_ids)
+        ).all()
+        return {product.id: product for product in products}
+
+    def reserve(self, db, organization_id: int, quantities: Dict[int, int]) -> Dict[int, Product]:
+        """
+        Take stock for every product in ``quantities`` or raise StockReservationError.
+
+        Does not commit. On error some products may already be decremented, so the caller must roll
+        back the session.
+        """
+        products = self.load_products(db, organization_id, quantities)
+        for product_id in sorted(quantities):
+            if product_id not in products:
+                raise StockReservationError(f"Product {product_id} not found", 404, product_id)
+
+        # Always update in product order so concurrent reservations take row locks in the same order
+        for product_id in sorted(quantities):
+            quantity = quantities[product_id]
+            result = db.execute(
+                update(Product)
+                .where(
+                    Product.id == product_id,
+                    Product.organization_id == organization_id,
+                    Product.stock >= quantity
+                )
+                .values(stock=Product.stock - quantity)
+            )
+            if result.rowcount != 1:
+                raise StockReservationError(f"Insufficient stock for product {products[product_id].name}", 400, product_id)
+        return products
+
+    def release(self, db, organization_id: int, quantities: Dict[int, int]):
+        """Return stock for every product in ``quantities``. Does not commit."""
+        for product_id in sorted(quantities):
+            if quantities[product_id] > 0:
+                db.execute(
+                    update(Product)
+                    .where(Product.id == product_id, Product.organization_id == organization_id)
+                    .values(stock=Product.stock + quantities[product_id])
+                )
+
+    def reserve_for_order(self, db, organization_id: int, quantities: Dict[int, int],
+                          hold_token: Optional[str] = None) -> Dict[int, int]:
+        """
+        Reserve the stock for a new order, using a checkout hold first when one is given.
+
+        Quantities beyond the hold are reserved now and held quantities the order does not use are
+        returned to stock. Does not commit. Returns the resulting change in stock per product.
+        """
+        held = self.claim_hold(db, organization_id, hold_token) if hold_token else {}
+        extra = {pid: qty - held.get(pid, 0) for pid, qty in quantities.items() if qty > held.get(pid, 0)}
+        unused = {pid: qty - quantities.get(pid, 0) for pid, qty in held.items() if qty > quantities.get(pid, 0)}
+        self.reserve(db, organization_id, extra)
+        self.release(db, organization_id, unused)
+        return {**{pid: -qty for pid, qty in extra.items()}, **unused}
+
+    # Checkout holds
+    def create_hold(self, db, organization_id: int, quantities: Dict[int, int],
+                    user_id: Optional[int] = None) -> Dict[str, Any]:
+        """Reserve stock for a checkout and record it as a hold that expires after ``hold_ttl``. Commits."""
+        if not quantities:
+            raise StockReservationError("Hold items are required", 400)
+        token = str(uuid.uuid4())
+        expires_at = datetime.utcnow() + self.hold_ttl
+        try:
+            self.reserve(db, organization_id, quantities)
+            db.add_all([
+                StockHold(
+                    token=token,
+                    organization_id=organization_id,
+                    product_id=product_id,
+                    user_id=user_id,
+                    quantity=quantity,
+                    expires_at=expires_at
+                )
+                for product_id, quantity in sorted(quantities.items())
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        logger.info(f"Created stock hold {token} for organization {organization_id} ({sum(quantities.values())} items)")
+        self.notify_stock_change(organization_id, {pid: -qty for pid, qty in quantities.items()})
+        return {
+            "token": token,
+            "expires_at": expires_at.isoformat(),
+            "items": [{"product_id": pid, "quantity": qty} for pid, qty in sorted(quantities.items())]
+        }
+
+    def claim_hold(self, db, organization_id: int, token: str) -> Dict[int, int]:
+        """
+        Consume an unexpired hold and return its quantities per product. Does not commit.
+
+        The hold rows are deleted with a guarded DELETE, so a hold can be used by exactly one order
+        and never both claimed and swept.
+        """
+        holds = db.query(StockHold).filter(
+            StockHold.token == token,
+            StockHold.organization_id == organization_id,
+            StockHold.expires_at > datetime.utcnow()
+        ).all()
+        if not holds:
+            raise StockReservationError("Stock hold not found or expired", 410)
+        deleted = db.execute(
+            delete(StockHold).where(StockHold.id.in_([hold.id for hold in holds]))
+        ).rowcount
+        if deleted != len(holds):
+            raise StockReservationError("Stock hold was already used or expired", 409)
+        return aggregate_quantities(holds)
+
+    def release_hold(self, db, organization_id: int, token: str) -> bool:
+        """Cancel a hold and return its stock. Commits. Returns False if the hold does not exist."""
+        try:
+            held = self.claim_hold(db, organization_id, token)
+        except StockReservationError:
+            db.rollback()
+            return False
+        try:
+            self.release(db, organization_id, held)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        logger.info(f"Released stock hold {token} for organization {organization_id}")
+        self.notify_stock_change(organization_id, held)
+        return True
+
+    def sweep_expired_holds(self, now: Optional[datetime] = None) -> int:
+        """Return the stock of expired holds. Returns the number of hold rows released."""
+        now = now or datetime.utcnow()
+        db = self.db_connect.SessionLocal()
+        try:
+            expired = db.query(StockHold).filter(StockHold.expires_at <= now).order_by(
+                StockHold.id
+            ).limit(HOLD_SWEEP_BATCH_SIZE).all()
+            if not expired:
+                return 0
+
+            returned = {}
+            released = 0
+            for hold in expired:
+                # A hold claimed by an order since the SELECT is gone; only return stock we actually removed
+                if db.execute(delete(StockHold).where(StockHold.id == hold.id)).rowcount != 1:
+                    continue
+                quantities = returned.setdefault(hold.organization_id, Counter())
+                quantities[hold.product_id] += hold.quantity
+                released += 1
+            for organization_id, quantities in returned.items():
+                self.release(db, organization_id, quantities)
+            db.commit()
+            if released:
+                logger.info(f"Released {released} expired stock holds")
+            for organization_id, quantities in returned.items():
+                self.notify_stock_change(organization_id, dict(quantities))
+            return released
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error sweeping expired stock holds: {e}")
+            raise
+        finally:
+            db.close()
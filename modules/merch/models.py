@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from modules.utils.base import Base
@@ -6,6 +6,10 @@ from modules.utils.base import Base
 # Database Models
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Storefront listings filter on organization and stock > 0
+        Index("ix_products_org_stock", "organization_id", "stock"),
+    )
     
     id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=False)
@@ -26,6 +30,10 @@ class Product(Base):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Order listings are keyset-paginated newest first within an organization
+        Index("ix_orders_org_created_id", "organization_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=False)
@@ -61,4 +69,26 @@ class OrderItem(Base):
     product = relationship("Product", back_populates="order_items")
     
     def __repr__(self):
-        return f"<OrderItem(id={self.id}, order_id={self.order_id}, product_id={self.product_id}, quantity={self.quantity}, org_id={self.organization_id})>" 
\ No newline at end of file
+        return f"<OrderItem(id={self.id}, order_id={self.order_id}, product_id={self.product_id}, quantity={self.quantity}, org_id={self.organization_id})>" 
+
+class StockHold(Base):
+    """Stock set aside for a checkout that has not been turned into an order yet."""
+    __tablename__ = "merch_stock_holds"
+    __table_args__ = (
+        Index("ix_merch_stock_holds_expires_at", "expires_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    token = Column(String(36), nullable=False, index=True)  # Shared by all items of one hold
+    organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=False)
+    product_id = Column(Integer, ForeignKey('products.id'), nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=True)
+    quantity = Column(Integer, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    product = relationship("Product")
+
+    def __repr__(self):
+        return f"<StockHold(id={self.id}, token='{self.token}', product_id={self.product_id}, quantity={self.quantity}, org_id={self.organization_id})>"
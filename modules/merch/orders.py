@@ -0,0 +1,175 @@
+import base64
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload, selectinload
+
+from modules.merch.models import Order, OrderItem
+
+ORDER_STATUSES = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+# Upper bound for the ``limit`` query parameter, and the page size used when exporting
+ORDER_MAX_PAGE_SIZE = 500
+CSV_COLUMNS = ['order_id', 'created_at', 'status', 'user_id', 'user_name', 'total_amount',
+               'product_id', 'product_name', 'quantity', 'price_at_time', 'message']
+
+
+def encode_cursor(order: Order) -> str:
+    """Opaque keyset cursor pointing just after ``order`` in newest-first order."""
+    raw = f"{order.created_at.isoformat()}|{order.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; raises ValueError for malformed cursors."""
+    try:
+        created_at, order_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(order_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def parse_order_filters(args) -> Dict[str, Any]:
+    """
+    Read order filters from request query parameters; raises ValueError when one is invalid.
+
+    Supported: ``status`` (comma-separated), ``user_id``, ``start``/``end`` (YYYY-MM-DD, inclusive, or
+    ISO 8601; values with an offset are converted to UTC), ``limit`` and ``cursor``.
+    """
+    filters: Dict[str, Any] = {}
+    if args.get('status'):
+        statuses = [status.strip() for status in args['status'].split(',') if status.strip()]
+        invalid = [status for status in statuses if status not in ORDER_STATUSES]
+        if invalid:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(ORDER_STATUSES)}")
+        filters['statuses'] = statuses
+    if args.get('user_id'):
+        filters['user_id'] = int(args['user_id'])
+    for name in ('start', 'end'):
+        value = (args.get(name) or '').strip()
+        if not value:
+            continue
+        if len(value) == 10:
+            boundary = datetime.strptime(value, '%Y-%m-%d')
+            if name == 'end':
+                boundary += timedelta(days=1)
+        else:
+            boundary = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if boundary.tzinfo is not None:
+                # Orders are stored in naive UTC
+                boundary = boundary.astimezone(timezone.utc).replace(tzinfo=None)
+        filters[name] = boundary
+    if args.get('limit'):
+        limit = int(args['limit'])
+        if not 1 <= limit <= ORDER_MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {ORDER_MAX_PAGE_SIZE}")
+        filters['limit'] = limit
+    if args.get('cursor'):
+        filters['cursor'] = decode_cursor(args['cursor'])
+    return filters
+
+
+def query_orders(db, organization_id: int, statuses: Optional[Sequence[str]] = None, user_id: Optional[int] = None,
+                 start: Optional[datetime] = None, end: Optional[datetime] = None, limit: Optional[int] = None,
+                 cursor: Optional[Tuple[datetime, int]] = None) -> Tuple[List[Order], Optional[str]]:
+    """
+    Orders of an organization, newest first, with items, products and users loaded up front.
+
+    Pages are keyset-paginated on (created_at, id): pass the returned cursor to get the next page.
+    The cursor is None on the last page or when ``limit`` is None (everything is returned).
+    """
+    query = db.query(Order).options(
+        joinedload(Order.user),
+        selectinload(Order.items).selectinload(OrderItem.product)
+    ).filter(Order.organization_id == organization_id)
+
+    if statuses:
+        query = query.filter(Order.status.in_(statuses))
+    if user_id is not None:
+        query = query.filter(Order.user_id == user_id)
+    if start is not None:
+        query = query.filter(Order.created_at >= start)
+    if end is not None:
+        query = query.filter(Order.created_at < end)
+    if cursor is not None:
+        created_at, order_id = cursor
+        query = query.filter(or_(
+            Order.created_at < created_at,
+            and_(Order.created_at == created_at, Order.id < order_id)
+        ))
+
+    query = query.order_by(Order.created_at.desc(), Order.id.desc())
+    if limit is None:
+        return query.all(), None
+
+    orders = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(orders[limit - 1]) if len(orders) > limit else None
+    return orders[:limit], next_cursor
+
+
+def iter_orders(db, organization_id: int, page_size: int = ORDER_MAX_PAGE_SIZE, **filters) -> Iterator[Order]:
+    """Every order matching ``filters``, fetched one keyset page at a time."""
+    filters.pop('limit', None)
+    cursor = filters.pop('cursor', None)
+    while True:
+        orders, next_cursor = query_orders(db, organization_id, limit=page_size, cursor=cursor, **filters)
+        yield from orders
+        if next_cursor is None:
+            return
+        cursor = decode_cursor(next_cursor)
+        # Loaded pages are not needed again; keep memory flat on large exports
+        db.expunge_all()
+
+
+def order_to_dict(order: Order, include_user: bool = True) -> Dict[str, Any]:
+    """JSON representation of an order and its items."""
+    data = {
+        'id': order.id,
+        'user_id': order.user_id,
+        'total_amount': order.total_amount,
+        'status': order.status,
+        'message': order.message,
+        'created_at': order.created_at.isoformat(),
+        'updated_at': order.updated_at.isoformat() if order.updated_at else None,
+        'organization_id': order.organization_id,
+        'items': [{
+            'id': item.id,
+            'product_id': item.product_id,
+            'quantity': item.quantity,
+            'price_at_time': item.price_at_time,
+            'product_name': item.product.name if item.product else 'Unknown Product'
+        } for item in order.items]
+    }
+    if include_user:
+        data['user_name'] = order.user.name if order.user else 'Unknown User'
+    return data
+
+
+def orders_csv(orders: Iterator[Order]) -> Iterator[str]:
+    """CSV text for orders, one row per order item, produced incrementally for streaming."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return text
+
+    writer.writerow(CSV_COLUMNS)
+    yield flush()
+    for order in orders:
+        base = [order.id, order.created_at.isoformat(), order.status, order.user_id,
+                order.user.name if order.user else '', order.total_amount]
+        items = order.items or [None]
+        for item in items:
+            writer.writerow(base + [
+                item.product_id if item else '',
+                (item.product.name if item.product else '') if item else '',
+                item.quantity if item else '',
+                item.price_at_time if item else '',
+                order.message or ''
+            ])
+        yield flush()
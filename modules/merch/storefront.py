@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from modules.merch.models import Product
+
+logger = logging.getLogger(__name__)
+
+# Cached listings older than this are reloaded, so stock changed outside the API process shows up
+STOREFRONT_CACHE_TTL_SECONDS = 300
+# Organizations with more in-stock products than this are paginated straight from the database
+STOREFRONT_CACHE_MAX_PRODUCTS = 1000
+# Upper bound for the ``limit`` query parameter
+STOREFRONT_MAX_PAGE_SIZE = 200
+
+
+def product_payload(product: Product) -> Dict[str, Any]:
+    """Storefront representation of a product."""
+    return {
+        'id': product.id,
+        'name': product.name,
+        'description': product.description,
+        'price': product.price,
+        'stock': product.stock,
+        'image_url': product.image_url,
+        'created_at': product.created_at.isoformat() if product.created_at else None,
+        'updated_at': product.updated_at.isoformat() if product.updated_at else None
+    }
+
+
+class _Listing:
+    """In-stock products of one organization, ordered by product ID."""
+
+    __slots__ = ("products", "generation", "version", "last_modified", "loaded_at")
+
+    def __init__(self, products: Dict[int, Dict[str, Any]]):
+        self.products = products
+        # Distinguishes reloads (and process restarts) that would otherwise restart at the same version
+        self.generation = uuid.uuid4().hex
+        self.version = 0
+        self.last_modified = datetime.utcnow().replace(microsecond=0)
+        self.loaded_at = time.monotonic()
+
+    def touch(self):
+        self.version += 1
+        self.last_modified = datetime.utcnow().replace(microsecond=0)
+
+
+class StorefrontCache:
+    """
+    Per-organization read cache for the merch storefront.
+
+    Each organization's in-stock products are loaded with one indexed query
+    (``organization_id = :org AND stock > 0``) and served from memory until a product changes.
+    Product edits call ``invalidate``. Orders, holds and cancellations call ``apply_stock_deltas``
+    after they commit: the cached stock is adjusted in place, sold-out products drop out of the
+    listing, and only a product coming back into stock forces a reload. Every change bumps the
+    listing version, which feeds the ETag and Last-Modified headers.
+    """
+
+    def __init__(self, ttl_seconds: float = STOREFRONT_CACHE_TTL_SECONDS,
+                 max_products: int = STOREFRONT_CACHE_MAX_PRODUCTS):
+        self.ttl_seconds = ttl_seconds
+        self.max_products = max_products
+        self._listings: Dict[int, _Listing] = {}
+        # Bumped on every change so a load that raced with a change is not cached
+        self._epochs: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_page(self, db, organization_id: int, limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """
+        One page of an organization's in-stock products.
+
+        Returns ``{"products", "total", "etag", "last_modified"}``. ``limit=None`` returns every
+        product from ``offset`` on.
+        """
+        listing = self._get_listing(db, organization_id)
+        if listing is None:
+            return self._query_page(db, organization_id, limit, offset)
+
+        with self._lock:
+            products = list(listing.products.values())
+            end = None if limit is None else offset + limit
+            page = [dict(p) for p in products[offset:end]]
+            state = f"{listing.generation}|{listing.version}"
+            last_modified = listing.last_modified
+        return {
+            "products": page,
+            "total": len(products),
+            "etag": hashlib.sha1(f"{organization_id}|{state}|{limit}|{offset}".encode("utf-8")).hexdigest(),
+            "last_modified": last_modified
+        }
+
+    def invalidate(self, organization_id: int):
+        """Drop an organization's listing; the next request reloads it."""
+        with self._lock:
+            self._epochs[organization_id] = self._epochs.get(organization_id, 0) + 1
+            self._listings.pop(organization_id, None)
+
+    def apply_stock_deltas(self, organization_id: int, deltas: Dict[int, int]):
+        """Apply committed stock changes (product ID -> change in stock) to a cached listing."""
+        deltas = {product_id: delta for product_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        with self._lock:
+            self._epochs[organization_id] = self._epochs.get(organization_id, 0) + 1
+            listing = self._listings.get(organization_id)
+            if listing is None:
+                return
+            for product_id, delta in deltas.items():
+                product = listing.products.get(product_id)
+                if product is None:
+                    if delta > 0:
+                        # A sold-out product is back; its details are not cached, so reload
+                        self._listings.pop(organization_id, None)
+                        return
+                    continue
+                product['stock'] += delta
+                if product['stock'] <= 0:
+                    del listing.products[product_id]
+            listing.touch()
+
+    def _get_listing(self, db, organization_id: int) -> Optional[_Listing]:
+        with self._lock:
+            listing = self._listings.get(organization_id)
+            if listing is not None and time.monotonic() - listing.loaded_at < self.ttl_seconds:
+                return listing
+            epoch = self._epochs.get(organization_id, 0)
+
+        products = db.query(Product).filter(
+            Product.organization_id == organization_id,
+            Product.stock > 0
+        ).order_by(Product.id).limit(self.max_products + 1).all()
+        if len(products) > self.max_products:
+            return None
+
+        listing = _Listing({product.id: product_payload(product) for product in products})
+        with self._lock:
+            if self._epochs.get(organization_id, 0) == epoch:
+                self._listings[organization_id] = listing
+        logger.debug(f"Loaded storefront listing for organization {organization_id}: {len(products)} products")
+        return listing
+
+    def _query_page(self, db, organization_id: int, limit: Optional[int], offset: int) -> Dict[str, Any]:
+        """Uncached page for organizations too large to keep in memory."""
+        query = db.query(Product).filter(
+            Product.organization_id == organization_id,
+            Product.stock > 0
+        )
+        total = query.count()
+        page = query.order_by(Product.id).offset(offset)
+        if limit is not None:
+            page = page.limit(limit)
+        rows = page.all()
+        products = [product_payload(product) for product in rows]
+        last_modified = max((p.updated_at for p in rows if p.updated_at), default=None)
+        signature = ",".join(f"{p['id']}:{p['stock']}:{p['updated_at']}" for p in products)
+        return {
+            "products": products,
+            "total": total,
+            "etag": hashlib.sha1(f"{organization_id}|{total}|{signature}|{limit}|{offset}".encode("utf-8")).hexdigest(),
+            "last_modified": last_modified.replace(microsecond=0) if last_modified else None
+        }
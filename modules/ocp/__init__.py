@@ -1,8 +1,23 @@
-from .api import ocp_blueprint
-from .service import OCPService
-from .db import OCPDBConnect
-from .models import Officer, OfficerPoints
-from .notion_sync_service import NotionOCPSyncService
+import importlib
+
+from .models import Officer, OfficerPoints, OfficerAlias
+from .identity import OfficerIdentityIndex
+
+# The blueprint and services need the app's shared configuration, so they are imported on first
+# use; the models and the pure helpers (identity, points) stay importable on their own.
+_LAZY_EXPORTS = {
+    'ocp_blueprint': '.api',
+    'OCPService': '.service',
+    'OCPDBConnect': '.db',
+    'NotionOCPSyncService': '.notion_sync_service',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ocp_blueprint',
@@ -10,5 +25,7 @@ __all__ = [
     'OCPDBConnect',
     'Officer',
     'OfficerPoints',
+    'OfficerAlias',
+    'OfficerIdentityIndex',
     'NotionOCPSyncService'
-] 
\ No newline at end of file
+]
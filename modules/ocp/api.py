@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request, current_app
-from sentry_sdk import start_transaction, capture_exception, set_tag
+from sentry_sdk import capture_exception, set_tag
+from modules.utils.tracing import start_transaction, finish_transaction
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -52,8 +53,7 @@ def sync_from_notion(org_prefix):
         return jsonify({"status": "error", "message": "An unexpected error occurred processing the webhook."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/debug-sync-from-notion", methods=["POST"])
 def debug_sync_from_notion():
@@ -134,15 +134,15 @@ def debug_sync_from_notion():
         return jsonify({"status": "error", "message": "An unexpected error occurred processing the debug sync."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/diagnose-unknown-officers", methods=["GET", "POST"])
 @auth_required
 def diagnose_unknown_officers():
     """
     Endpoint to diagnose issues with officers missing names in the database.
-    Lists all events with missing UUIDs or officers with "Unknown" names.
+    Lists all events with missing UUIDs or officers with "Unknown" names, and names, emails or
+    Notion people claimed by more than one officer. Optional query param: organization_id.
     Ignores issues with missing emails or department information.
     Supports both GET and POST methods to ensure compatibility with frontend.
     """
@@ -154,7 +154,9 @@ def diagnose_unknown_officers():
     
     try:
         # Call the diagnostic function from the service
-        diagnosis_result = ocp_service.diagnose_unknown_officers()
+        diagnosis_result = ocp_service.diagnose_unknown_officers(
+            organization_id=request.args.get('organization_id', type=int)
+        )
         
         # Return appropriate response based on diagnosis
         if diagnosis_result.get("status") == "error":
@@ -168,13 +170,15 @@ def diagnose_unknown_officers():
         return jsonify({"status": "error", "message": "An unexpected error occurred during officer diagnosis."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/officers", methods=["GET"])
 @auth_required
 def get_officer_leaderboard():
-    """Get all officers with their total points in leaderboard format, with optional date filtering."""
+    """
+    Get all officers with their total points in leaderboard format.
+    Optional query params: start_date/end_date (YYYY-MM), organization_id, include_contributions=true.
+    """
     transaction = start_transaction(op="api", name="get_officer_leaderboard")
     route_error_handler.transaction = transaction
     route_error_handler.operation_name = "get_officer_leaderboard"
@@ -198,7 +202,12 @@ def get_officer_leaderboard():
             else:
                 end_datetime = datetime(year, month + 1, 1, 23, 59, 59) - timedelta(days=1)
 
-        officers = ocp_service.get_officer_leaderboard(start_date=start_datetime, end_date=end_datetime)
+        organization_id = request.args.get('organization_id', type=int)
+        include_contributions = request.args.get('include_contributions', 'false').lower() == 'true'
+        officers = ocp_service.get_officer_leaderboard(
+            start_date=start_datetime, end_date=end_datetime,
+            organization_id=organization_id, include_contributions=include_contributions
+        )
         return jsonify({
             "status": "success", 
             "officers": officers,
@@ -214,8 +223,7 @@ def get_officer_leaderboard():
         return jsonify({"status": "error", "message": "An unexpected error occurred fetching officer leaderboard."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/officer/<officer_identifier>/contributions", methods=["GET"])
 @auth_required
@@ -260,8 +268,7 @@ def get_officer_contributions(officer_identifier):
         return jsonify({"status": "error", "message": "An unexpected error occurred fetching officer contributions."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/<org_prefix>/add-contribution", methods=["POST"])
 @auth_required
@@ -295,8 +302,7 @@ def add_contribution(org_prefix):
         return jsonify({"status": "error", "message": "An unexpected error occurred adding contribution."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/contribution/<int:point_id>", methods=["PUT"])
 @auth_required
@@ -327,8 +333,7 @@ def update_contribution(point_id):
         return jsonify({"status": "error", "message": "An unexpected error occurred updating contribution."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/contribution/<int:point_id>", methods=["DELETE"])
 @auth_required
@@ -354,8 +359,7 @@ def delete_contribution(point_id):
         return jsonify({"status": "error", "message": "An unexpected error occurred deleting contribution."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/officer/<officer_id>", methods=["GET"])
 @auth_required
@@ -396,32 +400,69 @@ def get_officer_details(officer_id):
         return jsonify({"status": "error", "message": "An unexpected error occurred fetching officer details."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/events", methods=["GET"])
 def get_all_events():
-    """Get all contribution events across all officers."""
+    """
+    Get contribution events across all officers, newest first.
+    Optional query params: organization_id, start_date/end_date (YYYY-MM), officer_uuid, event_type,
+    limit (max 500) and offset. Without a limit all matching events are returned.
+    """
     transaction = start_transaction(op="api", name="get_all_events")
     route_error_handler.transaction = transaction
     route_error_handler.operation_name = "get_all_events"
     logger.info("Received GET request on /ocp/events")
     set_tag("request_type", "GET")
     
+    start_date_str = request.args.get('start_date') # Expected format: YYYY-MM
+    end_date_str = request.args.get('end_date')     # Expected format: YYYY-MM
+
+    start_datetime: Optional[datetime] = None
+    end_datetime: Optional[datetime] = None
+
     try:
-        events = ocp_service.get_all_events()
+        if start_date_str:
+            start_datetime = datetime.strptime(start_date_str + "-01", "%Y-%m-%d")
+        if end_date_str:
+            year, month = map(int, end_date_str.split('-'))
+            if month == 12:
+                end_datetime = datetime(year, month, 31, 23, 59, 59)
+            else:
+                end_datetime = datetime(year, month + 1, 1, 23, 59, 59) - timedelta(days=1)
+
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', 0, type=int)
+        if limit is not None:
+            limit = min(max(limit, 1), 500)
+        offset = max(offset, 0)
+
+        page = ocp_service.get_all_events(
+            organization_id=request.args.get('organization_id', type=int),
+            start_date=start_datetime,
+            end_date=end_datetime,
+            officer_uuid=request.args.get('officer_uuid'),
+            event_type=request.args.get('event_type'),
+            limit=limit,
+            offset=offset
+        )
         return jsonify({
             "status": "success", 
-            "events": events,
-            "events_count": len(events)
+            "events": page["events"],
+            "events_count": len(page["events"]),
+            "total": page["total"],
+            "limit": limit,
+            "offset": offset
         }), 200
+    except ValueError as e:
+        logger.warning(f"Invalid date format provided for events: {e}")
+        return jsonify({"status": "error", "message": f"Invalid date format. Please use YYYY-MM. Error: {str(e)}"}), 400
     except Exception as e:
         route_error_handler.handle_generic_error(e)
         return jsonify({"status": "error", "message": "An unexpected error occurred fetching all events."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
+        finish_transaction(transaction)
 
 @ocp_blueprint.route("/officer-names", methods=["GET"])
 @auth_required
@@ -450,5 +491,4 @@ def get_officer_names():
         return jsonify({"status": "error", "message": "An unexpected error occurred fetching officer names."}), 500
     finally:
         route_error_handler.transaction = None
-        if transaction:
-            transaction.finish()
\ No newline at end of file
+        finish_transaction(transaction)
\ No newline at end of file
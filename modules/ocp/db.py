@@ -4,9 +4,11 @@ class directly. It redirects to the centralized database manager in modules.util
 """
 
 import logging
+from sqlalchemy import text
 import shared
 from modules.utils.db import DBConnect
-from modules.ocp.models import Officer, OfficerPoints
+from modules.ocp.models import Officer, OfficerPoints, OfficerAlias
+from modules.ocp.identity import backfill_officer_aliases
 
 # Set up a module logger
 module_logger = logging.getLogger(__name__)
@@ -18,6 +20,22 @@ def create_ocp_tables():
     db_connect = shared.db_connect or DBConnect()
     Officer.__table__.create(db_connect.engine, checkfirst=True)
     OfficerPoints.__table__.create(db_connect.engine, checkfirst=True)
+    OfficerAlias.__table__.create(db_connect.engine, checkfirst=True)
+    # Indexes added after the table was first created are not picked up by create_all
+    for index in OfficerPoints.__table__.indexes:
+        index.create(db_connect.engine, checkfirst=True)
+    # Replaced by ix_officer_points_officer_ts; the leaderboard no longer filters points by organization
+    with db_connect.engine.begin() as connection:
+        connection.execute(text("DROP INDEX IF EXISTS ix_officer_points_org_officer_ts"))
+    # Officers created before name/email aliases existed are only found by name once they have them
+    db_session = db_connect.SessionLocal()
+    try:
+        added = backfill_officer_aliases(db_session)
+        db_session.commit()
+        if added:
+            module_logger.info(f"Backfilled {added} OCP officer aliases")
+    finally:
+        db_session.close()
 
 # Automatically create OCP tables on import
 try:
@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .models import Officer, OfficerAlias
+from .utils import normalize_name
+
+# Alias types, in the order they are trusted when resolving an officer
+ALIAS_NOTION_PERSON = "notion_person"
+ALIAS_EMAIL = "email"
+ALIAS_NAME = "name"
+ALIAS_TYPES = (ALIAS_NOTION_PERSON, ALIAS_EMAIL, ALIAS_NAME)
+
+IdentityKey = Tuple[str, str]
+
+
+def identity_keys(name: Optional[str] = None, email: Optional[str] = None,
+                  notion_person_id: Optional[str] = None) -> List[IdentityKey]:
+    """Normalized (alias_type, value) keys for an officer reference, most trusted first."""
+    keys = []
+    if notion_person_id:
+        keys.append((ALIAS_NOTION_PERSON, notion_person_id.strip()))
+    if email and email.strip():
+        keys.append((ALIAS_EMAIL, email.strip().lower()))
+    if name and normalize_name(name) != "unknown":
+        keys.append((ALIAS_NAME, normalize_name(name)))
+    return keys
+
+
+class OfficerIdentityIndex:
+    """
+    In-memory identity map of one organization's officers.
+
+    Every key resolves to exactly one officer UUID. Keys are exact (normalized names, lowercased
+    emails, Notion person IDs), so "Ann" never matches "Joanna". When two officers claim the same key
+    the first one loaded keeps it and the key is reported in ``conflicts``; stored aliases are loaded
+    before names and emails derived from officer rows, and officers in name/UUID order, so
+    resolution does not depend on query order.
+    """
+
+    def __init__(self, organization_id: int):
+        self.organization_id = organization_id
+        self._keys: Dict[IdentityKey, str] = {}
+        self.conflicts: Dict[IdentityKey, Set[str]] = {}
+
+    @classmethod
+    def load(cls, db_session, organization_id: int) -> "OfficerIdentityIndex":
+        """Build the index for an organization with two queries."""
+        index = cls(organization_id)
+        aliases = db_session.query(OfficerAlias.alias_type, OfficerAlias.value, OfficerAlias.officer_uuid).filter(
+            OfficerAlias.organization_id == organization_id
+        ).order_by(OfficerAlias.id)
+        for alias_type, value, officer_uuid in aliases:
+            index.add((alias_type, value), officer_uuid)
+        officers = db_session.query(Officer.uuid, Officer.name, Officer.email).filter(
+            Officer.organization_id == organization_id
+        ).order_by(Officer.name, Officer.uuid)
+        for officer_uuid, name, email in officers:
+            for key in identity_keys(name=name, email=email):
+                index.add(key, officer_uuid)
+        return index
+
+    def add(self, key: IdentityKey, officer_uuid: str) -> bool:
+        """Map a key to an officer. Returns True if the key is new; a key owned by another officer is kept."""
+        owner = self._keys.get(key)
+        if owner is None:
+            self._keys[key] = officer_uuid
+            return True
+        if owner != officer_uuid:
+            self.conflicts.setdefault(key, {owner}).add(officer_uuid)
+        return False
+
+    def get(self, key: IdentityKey) -> Optional[str]:
+        return self._keys.get(key)
+
+    def resolve(self, name: Optional[str] = None, email: Optional[str] = None,
+                notion_person_id: Optional[str] = None) -> Optional[str]:
+        """UUID of the officer matching the most trusted known key, or None."""
+        for key in identity_keys(name, email, notion_person_id):
+            officer_uuid = self._keys.get(key)
+            if officer_uuid:
+                return officer_uuid
+        return None
+
+    def register(self, officer_uuid: str, name: Optional[str] = None, email: Optional[str] = None,
+                 notion_person_id: Optional[str] = None) -> List[IdentityKey]:
+        """Add an officer's keys to the index and return the ones that were not known yet."""
+        return [key for key in identity_keys(name, email, notion_person_id) if self.add(key, officer_uuid)]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def store_officer_aliases(db_session, officers, source: str = "manual") -> int:
+    """
+    Store the name and email aliases of officers, skipping keys already stored for their organization.
+
+    Officers are keyed in name/UUID order, like ``OfficerIdentityIndex.load``, so a shared name goes
+    to the same officer. Returns the number of aliases added. Does not commit.
+    """
+    officers = sorted(officers, key=lambda officer: (officer.organization_id, officer.name or "", officer.uuid))
+    organization_ids = {officer.organization_id for officer in officers}
+    stored = set(db_session.query(OfficerAlias.organization_id, OfficerAlias.alias_type, OfficerAlias.value).filter(
+        OfficerAlias.organization_id.in_(organization_ids)
+    )) if organization_ids else set()
+
+    new_aliases = []
+    for officer in officers:
+        for alias_type, value in identity_keys(name=officer.name, email=officer.email):
+            if (officer.organization_id, alias_type, value) in stored:
+                continue
+            stored.add((officer.organization_id, alias_type, value))
+            new_aliases.append({
+                "organization_id": officer.organization_id,
+                "officer_uuid": officer.uuid,
+                "alias_type": alias_type,
+                "value": value,
+                "source": source,
+                "created_at": datetime.utcnow()
+            })
+    if new_aliases:
+        db_session.execute(
+            sqlite_insert(OfficerAlias).on_conflict_do_nothing(index_elements=["organization_id", "alias_type", "value"]),
+            new_aliases
+        )
+    return len(new_aliases)
+
+
+def backfill_officer_aliases(db_session) -> int:
+    """Store aliases for officers created before aliases existed, so lookups never scan officers. Does not commit."""
+    return store_officer_aliases(db_session, db_session.query(Officer).all(), source="backfill")
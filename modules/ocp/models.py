@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, UniqueConstraint
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -16,6 +16,7 @@ class Officer(Base):
     title = Column(String, nullable=False, default="Unknown")  # Officer title/role
     department = Column(String, nullable=False, default="Unknown")  # Engineering, Finance, Marketing, etc.
     points = relationship("OfficerPoints", backref="officer", cascade="all, delete-orphan")
+    aliases = relationship("OfficerAlias", backref="officer", cascade="all, delete-orphan")
     organization = relationship("Organization", backref="ocp_officers")
 
     def __repr__(self):
@@ -26,6 +27,8 @@ class OfficerPoints(Base):
     __tablename__ = "ocp_officer_points"  # Changed to avoid conflict
     __table_args__ = (
         UniqueConstraint('officer_uuid', 'notion_page_id', 'role', name='uq_officer_event_role'),
+        # Leaderboard aggregation joins each officer's points within a date range (see points.officer_totals)
+        Index('ix_officer_points_officer_ts', 'officer_uuid', 'timestamp'),
     )
     id = Column(Integer, primary_key=True, autoincrement=True)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -40,4 +43,21 @@ class OfficerPoints(Base):
     organization = relationship("Organization", backref="ocp_officer_points")
 
     def __repr__(self):
-        return f"<OfficerPoints(points={self.points}, event={self.event}, org_id={self.organization_id})>" 
\ No newline at end of file
+        return f"<OfficerPoints(points={self.points}, event={self.event}, org_id={self.organization_id})>" 
+
+class OfficerAlias(Base):
+    """Identity keys (normalized name, email, Notion person ID) that resolve to an officer within an organization."""
+    __tablename__ = "ocp_officer_aliases"
+    __table_args__ = (
+        UniqueConstraint('organization_id', 'alias_type', 'value', name='uq_officer_alias'),
+    )
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    officer_uuid = Column(String, ForeignKey("ocp_officers.uuid"), nullable=False, index=True)
+    alias_type = Column(String(20), nullable=False)  # name, email, notion_person
+    value = Column(String, nullable=False)  # Normalized: see modules.ocp.identity.identity_keys
+    source = Column(String(20), nullable=False, default="sync")  # sync, manual
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<OfficerAlias({self.alias_type}={self.value}, officer={self.officer_uuid})>"
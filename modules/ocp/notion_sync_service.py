@@ -5,6 +5,7 @@ from sentry_sdk import capture_exception, set_context, start_transaction
 
 from shared import config, logger
 from .service import OCPService
+from modules.organizations.config import OrganizationSettings
 from modules.calendar.utils import operation_span
 
 class NotionOCPSyncService:
@@ -17,6 +18,14 @@ class NotionOCPSyncService:
         
         self.logger.info("NotionOCPSync service initialized")
         
+    def sync_organization(self, org, transaction=None) -> Dict[str, Any]:
+        """Sync OCP data for a single organization, within its calendar sync horizon."""
+        # Points for events behind the calendar sync horizon are already recorded
+        horizon = OrganizationSettings.from_dict(org.config or {}).calendar_sync_horizon()
+        return self.ocp_service.sync_notion_to_ocp(
+            org.notion_database_id, org.id, transaction, since=horizon.date().isoformat() if horizon else None
+        )
+
     def sync_notion_to_ocp(self, transaction=None) -> Dict[str, Any]:
         """
         Orchestrates the sync process from Notion to OCP database for all organizations with OCP sync enabled.
@@ -47,7 +56,7 @@ class NotionOCPSyncService:
                 self.logger.info(f"[NotionOCPSyncService] Starting OCP sync for organization: {org.name} (ID: {org.id})")
                 try:
                     self.logger.info(f"[NotionOCPSyncService] Calling ocp_service.sync_notion_to_ocp for {org.name}")
-                    sync_result = self.ocp_service.sync_notion_to_ocp(org.notion_database_id, org.id, transaction)
+                    sync_result = self.sync_organization(org, transaction)
                     self.logger.info(f"[NotionOCPSyncService] OCP sync result for {org.name} (ID: {org.id}): {sync_result}")
                 except Exception as e:
                     self.logger.error(f"[NotionOCPSyncService] Exception during OCP sync for {org.name} (ID: {org.id}): {e}", exc_info=True)
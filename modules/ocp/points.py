@@ -0,0 +1,237 @@
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .models import Officer, OfficerPoints, OfficerAlias
+from .identity import OfficerIdentityIndex
+from .utils import POINT_VALUES
+from modules.utils.logging_config import SyncRunStats
+
+# Page IDs per IN (...) clause, well below SQLite's bound parameter limit
+PAGE_ID_CHUNK = 500
+# Breakdown columns of the leaderboard; anything else is counted under "Other"
+LEADERBOARD_EVENT_TYPES = ("GBM", "Special Event", "Special Contribution", "Unique Contribution")
+LEADERBOARD_ROLES = tuple(role for role in POINT_VALUES if role != "Default")
+
+
+def remove_page_points(db_session, organization_id: int, page_ids: Iterable[str]) -> int:
+    """
+    Delete the points synced from Notion pages that are no longer published (unpublished, archived
+    or deleted), so officers stop getting credit for them. Points without a Notion page are never
+    touched. Does not commit. Returns the number of records deleted.
+    """
+    page_ids = sorted({page_id for page_id in page_ids if page_id})
+    removed = 0
+    for start in range(0, len(page_ids), PAGE_ID_CHUNK):
+        removed += db_session.query(OfficerPoints).filter(
+            OfficerPoints.organization_id == organization_id,
+            OfficerPoints.notion_page_id.in_(page_ids[start:start + PAGE_ID_CHUNK])
+        ).delete(synchronize_session=False)
+    return removed
+
+
+def ingest_officer_rows(db_session, organization_id: int, officer_rows: List[Dict],
+                        stats: Optional[SyncRunStats] = None) -> Dict[str, int]:
+    """
+    Create missing officers and points records for parsed Notion officer rows of one organization.
+
+    The organization's identity index and the existing (officer, page, role) keys are loaded once,
+    officers are resolved in memory by Notion person ID, email and normalized name, and new points
+    and aliases are bulk inserted, ignoring rows that already exist. Does not commit.
+    """
+    stats = stats or SyncRunStats("ocp_ingest", organization_id=organization_id)
+    identities = OfficerIdentityIndex.load(db_session, organization_id)
+    # Emails are unique across organizations, so a new officer must not reuse one taken elsewhere
+    taken_emails = {email.lower() for (email,) in db_session.query(Officer.email).filter(Officer.email != None)}
+
+    page_ids = list({row["notion_page_id"] for row in officer_rows if row.get("notion_page_id")})
+    existing_keys = set()
+    for start in range(0, len(page_ids), PAGE_ID_CHUNK):
+        existing_keys.update(tuple(row) for row in db_session.query(
+            OfficerPoints.officer_uuid, OfficerPoints.notion_page_id, OfficerPoints.role
+        ).filter(
+            OfficerPoints.organization_id == organization_id,
+            OfficerPoints.notion_page_id.in_(page_ids[start:start + PAGE_ID_CHUNK])
+        ))
+
+    officers_created = 0
+    new_points = []
+    new_aliases = []
+    for officer_data in officer_rows:
+        email = (officer_data.get("email") or "").lower() or None
+        identity = dict(name=officer_data["name"], email=email, notion_person_id=officer_data.get("notion_person_id"))
+        officer_uuid = identities.resolve(**identity)
+        if officer_uuid is None:
+            officer = Officer(
+                uuid=str(uuid.uuid4()),
+                organization_id=organization_id,
+                email=email if email and email not in taken_emails else None,
+                name=officer_data["name"],
+                title=officer_data.get("title", "Unknown"),
+                department=officer_data.get("department", "Unknown")
+            )
+            db_session.add(officer)
+            officers_created += 1
+            if officer.email:
+                taken_emails.add(officer.email)
+            officer_uuid = officer.uuid
+            stats.debug("officer_created", "[OCPService] Creating new officer: %s (UUID: %s)", officer.name, officer.uuid)
+        # Remember every way this officer was referenced, so later lookups are direct hits
+        for alias_type, value in identities.register(officer_uuid, **identity):
+            new_aliases.append({
+                "organization_id": organization_id,
+                "officer_uuid": officer_uuid,
+                "alias_type": alias_type,
+                "value": value,
+                "source": "sync",
+                "created_at": datetime.utcnow()
+            })
+
+        key = (officer_uuid, officer_data.get("notion_page_id"), officer_data.get("role", "Unknown"))
+        if key in existing_keys:
+            stats.incr("points_existing")
+            continue
+        existing_keys.add(key)
+        new_points.append({
+            "organization_id": organization_id,
+            "points": officer_data.get("points", 1),
+            "event": officer_data.get("event", "Unknown Event"),
+            "role": key[2],
+            "event_type": officer_data.get("event_type", "Default"),
+            "timestamp": officer_data.get("event_date") or datetime.utcnow(),
+            "officer_uuid": officer_uuid,
+            "notion_page_id": key[1],
+            "event_metadata": {"source": "notion_sync"}
+        })
+
+    db_session.flush()
+    if new_aliases:
+        db_session.execute(
+            sqlite_insert(OfficerAlias).on_conflict_do_nothing(
+                index_elements=["organization_id", "alias_type", "value"]
+            ),
+            new_aliases
+        )
+    if new_points:
+        # Concurrent writers may have inserted the same keys; the unique constraint turns those into no-ops
+        db_session.execute(
+            sqlite_insert(OfficerPoints).on_conflict_do_nothing(
+                index_elements=["officer_uuid", "notion_page_id", "role"]
+            ),
+            new_points
+        )
+    stats.incr("officers_created", officers_created)
+    stats.incr("aliases_created", len(new_aliases))
+    stats.incr("points_created", len(new_points))
+    return {
+        "officers_processed": len(officer_rows),
+        "officers_created": officers_created,
+        "points_created": len(new_points)
+    }
+
+
+def officer_totals(db_session, organization_id: Optional[int] = None, start_date=None, end_date=None) -> List[Dict]:
+    """
+    Officers with their points totals and contribution breakdowns, highest total first.
+
+    Aggregated in a single GROUP BY query; officers without points in the date range are included
+    with zero totals.
+    """
+    # Points are matched by officer alone, as the points record's organization may not be the officer's.
+    # Date predicates live in the join so officers without matching points still appear.
+    join_on = [OfficerPoints.officer_uuid == Officer.uuid]
+    if start_date:
+        join_on.append(OfficerPoints.timestamp >= start_date)
+    if end_date:
+        join_on.append(OfficerPoints.timestamp <= end_date)
+
+    type_columns = [
+        func.sum(case((OfficerPoints.event_type == name, 1), else_=0)).label(f"type_{i}")
+        for i, name in enumerate(LEADERBOARD_EVENT_TYPES)
+    ]
+    role_columns = [
+        func.sum(case((OfficerPoints.role == role, OfficerPoints.points), else_=0)).label(f"role_{i}")
+        for i, role in enumerate(LEADERBOARD_ROLES)
+    ]
+    total_points = func.coalesce(func.sum(OfficerPoints.points), 0).label("total_points")
+    query = db_session.query(
+        Officer.uuid, Officer.email, Officer.name, Officer.title, Officer.department, Officer.organization_id,
+        total_points,
+        func.count(OfficerPoints.id).label("contribution_count"),
+        *type_columns,
+        *role_columns
+    ).outerjoin(OfficerPoints, and_(*join_on))
+    if organization_id is not None:
+        query = query.filter(Officer.organization_id == organization_id)
+    rows = query.group_by(Officer.uuid).order_by(total_points.desc(), Officer.name).all()
+
+    result = []
+    for row in rows:
+        contribution_counts = {name: getattr(row, f"type_{i}") or 0 for i, name in enumerate(LEADERBOARD_EVENT_TYPES)}
+        contribution_counts["Other"] = row.contribution_count - sum(contribution_counts.values())
+        role_points = {role: getattr(row, f"role_{i}") or 0 for i, role in enumerate(LEADERBOARD_ROLES)}
+        role_points["Other"] = row.total_points - sum(role_points.values())
+        result.append({
+            "uuid": row.uuid,
+            "email": row.email,
+            "name": row.name,
+            "title": row.title,
+            "department": row.department,
+            "organization_id": row.organization_id,
+            "total_points": row.total_points,
+            "contribution_count": row.contribution_count,
+            "contribution_counts": contribution_counts,
+            "points_by_role": role_points
+        })
+    return result
+
+
+def list_events(db_session, organization_id: Optional[int] = None, start_date=None, end_date=None,
+                officer_uuid: Optional[str] = None, event_type: Optional[str] = None,
+                limit: Optional[int] = None, offset: int = 0) -> Dict:
+    """
+    A page of points records with their officer's details, newest first, and the total number of
+    matching records. One outer-joined query; records without an officer get placeholder details.
+    """
+    query = db_session.query(OfficerPoints, Officer).outerjoin(
+        Officer, Officer.uuid == OfficerPoints.officer_uuid
+    )
+    if organization_id is not None:
+        query = query.filter(OfficerPoints.organization_id == organization_id)
+    if start_date:
+        query = query.filter(OfficerPoints.timestamp >= start_date)
+    if end_date:
+        query = query.filter(OfficerPoints.timestamp <= end_date)
+    if officer_uuid:
+        query = query.filter(OfficerPoints.officer_uuid == officer_uuid)
+    if event_type:
+        query = query.filter(OfficerPoints.event_type == event_type)
+
+    total = query.count()
+    query = query.order_by(OfficerPoints.timestamp.desc(), OfficerPoints.id.desc()).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = []
+    for event, officer in query:
+        result.append({
+            "id": event.id,
+            "organization_id": event.organization_id,
+            "points": event.points,
+            "event": event.event,
+            "role": event.role,
+            "event_type": event.event_type,
+            "timestamp": event.timestamp.isoformat() if event.timestamp else None,
+            "notion_page_id": event.notion_page_id,
+            "officer": {
+                "uuid": officer.uuid if officer else "unknown",
+                "name": officer.name if officer else "Unknown Officer",
+                "email": officer.email if officer else "unknown",
+                "title": officer.title if officer else "Unknown",
+                "department": officer.department if officer else "Unknown"
+            }
+        })
+    return {"events": result, "total": total}
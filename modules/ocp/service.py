@@ -2,14 +2,18 @@ import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from sentry_sdk import capture_exception, set_context, start_transaction
+from sqlalchemy import func
 
-from .models import Officer, OfficerPoints
+from .models import Officer, OfficerPoints, OfficerAlias
+from .identity import OfficerIdentityIndex, identity_keys, store_officer_aliases
+from .points import ingest_officer_rows, list_events, officer_totals, remove_page_points
 import shared
 from shared import logger
 from .utils import parse_notion_event_for_officers, calculate_points_for_role, calculate_points_for_event_type, normalize_name
 from modules.calendar.clients import NotionCalendarClient
 from modules.calendar.utils import operation_span
 from modules.utils.db import DBConnect
+from modules.utils.logging_config import SyncRunStats
 
 
 class OCPService:
@@ -37,13 +41,14 @@ class OCPService:
         else:
             logger.info("OCP service initialized with database manager")
     
-    def sync_notion_to_ocp(self, database_id: str, organization_id: int, transaction=None) -> Dict[str, Any]:
+    def sync_notion_to_ocp(self, database_id: str, organization_id: int, transaction=None, since: Optional[str] = None) -> Dict[str, Any]:
         """
         Sync officers and contribution points from Notion events for a specific organization.
         Args:
             database_id: Notion database ID to fetch events from
             organization_id: Organization ID to scope the sync
             transaction: Optional Sentry transaction for performance monitoring
+            since: Optional ISO date; only events starting on or after it are fetched
         Returns:
             Dict with status and result information
         """
@@ -57,88 +62,20 @@ class OCPService:
                     return {"status": "error", "message": "Missing Notion database ID or organization ID"}
                 
                 logger.info(f"[OCPService] Fetching Notion events for org_id={organization_id}")
-                notion_events = self.notion_client.fetch_events(database_id)
+                notion_events = self.notion_client.fetch_events(database_id, since=since)
                 logger.info(f"[OCPService] Fetched {len(notion_events) if notion_events else 0} events from Notion for org_id={organization_id}")
                 
                 if not notion_events:
                     logger.warning(f"[OCPService] No events found in Notion database {database_id}")
                     return {"status": "warning", "message": "No events found in Notion database"}
                 
-                # Process each event and extract officers
-                total_officers_processed = 0
-                total_points_created = 0
-                officers_created = 0
-                
-                for i, event in enumerate(notion_events):
-                    logger.info(f"[OCPService] Processing event {i+1}/{len(notion_events)}: {event.get('id', 'unknown')}")
-                    
-                    # Parse officers from this event
-                    officers_from_event = parse_notion_event_for_officers(event, debug=True)
-                    logger.info(f"[OCPService] Extracted {len(officers_from_event)} officers from event {i+1}")
-                    
-                    for j, officer_data in enumerate(officers_from_event):
-                        logger.info(f"[OCPService] Processing officer {j+1}/{len(officers_from_event)}: {officer_data.get('name', 'Unknown')}")
-                        
-                        try:
-                            # Get or create officer in database
-                            db_session = next(self.db.get_db())
-                            
-                            # Check if officer already exists
-                            existing_officer = self.get_officer_by_name(db_session, officer_data['name'])
-                            if existing_officer:
-                                logger.info(f"[OCPService] Found existing officer: {existing_officer.name} (UUID: {existing_officer.uuid})")
-                                officer = existing_officer
-                            else:
-                                logger.info(f"[OCPService] Creating new officer: {officer_data['name']}")
-                                officer = Officer(
-                                    organization_id=organization_id,
-                                    email=officer_data.get('email'),
-                                    name=officer_data['name'],
-                                    title=officer_data.get('title', 'Unknown'),
-                                    department=officer_data.get('department', 'Unknown')
-                                )
-                                officer = self.db.create_officer(db_session, officer, organization_id)
-                                officers_created += 1
-                                logger.info(f"[OCPService] Created officer: {officer.name} (UUID: {officer.uuid})")
-                            
-                            # Create points record
-                            # Check if points record already exists for this officer, event, and role
-                            existing_points = db_session.query(OfficerPoints).filter(
-                                OfficerPoints.officer_uuid == officer.uuid,
-                                OfficerPoints.notion_page_id == officer_data.get('notion_page_id'),
-                                OfficerPoints.role == officer_data.get('role', 'Unknown'),
-                                OfficerPoints.organization_id == organization_id
-                            ).first()
-                            
-                            if existing_points:
-                                logger.info(f"[OCPService] Points record already exists for officer {officer.name} in event {officer_data.get('event', 'Unknown Event')} with role {officer_data.get('role', 'Unknown')}. Skipping creation.")
-                                total_officers_processed += 1
-                                db_session.close()
-                                continue
-                            
-                            points_record = OfficerPoints(
-                                organization_id=organization_id,
-                                points=officer_data.get('points', 1),
-                                event=officer_data.get('event', 'Unknown Event'),
-                                role=officer_data.get('role', 'Unknown'),
-                                event_type=officer_data.get('event_type', 'Default'),
-                                timestamp=officer_data.get('event_date', datetime.utcnow()),
-                                officer_uuid=officer.uuid,
-                                notion_page_id=officer_data.get('notion_page_id'),
-                                event_metadata={"source": "notion_sync"}
-                            )
-                            
-                            created_points = self.db.create_officer_points(db_session, points_record, organization_id)
-                            total_points_created += 1
-                            logger.info(f"[OCPService] Created points record: {created_points.id} for officer {officer.name}")
-                            
-                            total_officers_processed += 1
-                            db_session.close()
-                        
-                        except Exception as e:
-                            logger.error(f"[OCPService] Error processing officer {officer_data.get('name', 'Unknown')}: {str(e)}")
-                            if 'db_session' in locals():
-                                db_session.close()
+                # Resolve and insert the points of all events in one batch
+                with operation_span(current_transaction, op="db", description="ingest_officer_points", logger=logger):
+                    counts = self._ingest_events(notion_events, organization_id)
+                total_officers_processed = counts["officers_processed"]
+                officers_created = counts["officers_created"]
+                total_points_created = counts["points_created"]
+                span.set_data("event_count", len(notion_events))
                 
                 logger.info(f"[OCPService] Sync completed for org {organization_id}: {total_officers_processed} officers processed, {officers_created} new officers created, {total_points_created} points records created")
                 return {
@@ -152,18 +89,179 @@ class OCPService:
                 logger.error(f"[OCPService] Error syncing OCP for org {organization_id}: {e}", exc_info=True)
                 return {"status": "error", "message": str(e)}
     
-    def get_officer_by_email(self, db_session, email):
-        """Get an officer by email."""
+    def _ingest_events(self, events: List[Dict], organization_id: int) -> Dict[str, int]:
+        """
+        Create missing officers and points records for every officer listed on the given Notion events,
+        in one session (see ``ingest_officer_rows``).
+        """
+        stats = SyncRunStats("ocp_ingest", logger, organization_id=organization_id)
+        stats.incr("events", len(events))
+        officer_rows = []
+        for event in events:
+            # Field-level parse tracing only for a sample of events, and only at DEBUG level
+            officer_rows.extend(parse_notion_event_for_officers(event, debug=stats.sample("parse")))
+        stats.incr("officer_entries", len(officer_rows))
+        if not officer_rows:
+            stats.log_summary()
+            return {"officers_processed": 0, "officers_created": 0, "points_created": 0}
+        
+        db_session = next(self.db.get_db())
+        try:
+            counts = ingest_officer_rows(db_session, organization_id, officer_rows, stats)
+            db_session.commit()
+            stats.log_summary()
+            return counts
+        except Exception:
+            db_session.rollback()
+            raise
+        finally:
+            db_session.close()
+    
+    def sync_notion_pages_to_ocp(self, pages: List[Dict], organization_id: int, transaction=None,
+                                 unpublished_page_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Targeted OCP sync for specific, already fetched Notion event pages.
+        Args:
+            pages: Published Notion pages to process
+            organization_id: Organization ID to scope the sync
+            transaction: Optional Sentry transaction for performance monitoring
+            unpublished_page_ids: Pages that were unpublished or deleted; their points are removed
+        Returns:
+            Dict with status and result information
+        """
+        current_transaction = transaction or start_transaction(op="sync", name="sync_notion_pages_to_ocp")
+        with operation_span(current_transaction, op="sync", description="sync_notion_pages_to_ocp", logger=logger) as span:
+            try:
+                totals = self._ingest_events(pages, organization_id)
+                totals["points_removed"] = self._remove_page_points(unpublished_page_ids or [], organization_id)
+                span.set_data("page_count", len(pages))
+                logger.info(f"[OCPService] Page sync completed for org {organization_id}: {len(pages)} pages, {totals['points_created']} points records created, {totals['points_removed']} removed")
+                return {
+                    "status": "success",
+                    "message": f"Synced OCP data for {len(pages)} pages in org {organization_id}",
+                    **totals
+                }
+            except Exception as e:
+                logger.error(f"[OCPService] Error syncing OCP pages for org {organization_id}: {e}", exc_info=True)
+                return {"status": "error", "message": str(e)}
+    
+    def _remove_page_points(self, page_ids: List[str], organization_id: int) -> int:
+        """Delete the points of Notion pages that are no longer published. Returns how many were deleted."""
+        if not page_ids:
+            return 0
+        db_session = next(self.db.get_db())
+        try:
+            removed = remove_page_points(db_session, organization_id, page_ids)
+            db_session.commit()
+            return removed
+        except Exception:
+            db_session.rollback()
+            raise
+        finally:
+            db_session.close()
+    
+    def get_officer_by_email(self, db_session, email, organization_id=None):
+        """Get an officer by email, including emails recorded as aliases."""
         if not email:
             return None
-        return db_session.query(Officer).filter(Officer.email == email).first()
+        officer = db_session.query(Officer).filter(Officer.email == email).first()
+        return officer or self._get_officer_by_alias(db_session, identity_keys(email=email), organization_id)
     
-    def get_officer_by_name(self, db_session, name):
-        """Get an officer by name using case-insensitive matching."""
+    def get_officer_by_name(self, db_session, name, organization_id=None):
+        """Get an officer by exact normalized name or name alias (no substring matching)."""
         if not name:
             return None
-        # Use case-insensitive matching instead of exact matching
-        return db_session.query(Officer).filter(Officer.name.ilike(f"%{name}%")).first()
+        # Every officer has a name alias (see store_officer_aliases), so this is a single index lookup
+        return self._get_officer_by_alias(db_session, identity_keys(name=name), organization_id)
+    
+    def _get_officer_by_alias(self, db_session, keys, organization_id=None):
+        """Resolve identity keys through the alias table's (organization, type, value) unique index."""
+        for alias_type, value in keys:
+            query = db_session.query(Officer).join(OfficerAlias, OfficerAlias.officer_uuid == Officer.uuid).filter(
+                OfficerAlias.alias_type == alias_type,
+                OfficerAlias.value == value
+            )
+            if organization_id is not None:
+                query = query.filter(OfficerAlias.organization_id == organization_id)
+            officer = query.order_by(OfficerAlias.organization_id, OfficerAlias.id).first()
+            if officer:
+                return officer
+        return None
+    
+    def diagnose_unknown_officers(self, organization_id=None) -> Dict[str, Any]:
+        """
+        Find contribution records that cannot be attributed to a known officer, in one pass over the history.
+        
+        Reports points whose officer is missing (with a suggested officer where the event title names
+        one), officers with placeholder names, and identity keys claimed by more than one officer.
+        """
+        try:
+            db_session = next(self.db.get_db())
+            try:
+                query = db_session.query(
+                    OfficerPoints.id, OfficerPoints.organization_id, OfficerPoints.officer_uuid,
+                    OfficerPoints.event, OfficerPoints.role, OfficerPoints.timestamp, OfficerPoints.notion_page_id
+                ).outerjoin(Officer, Officer.uuid == OfficerPoints.officer_uuid).filter(Officer.uuid == None)
+                if organization_id is not None:
+                    query = query.filter(OfficerPoints.organization_id == organization_id)
+                orphans = query.all()
+                
+                officers_query = db_session.query(Officer.organization_id).distinct()
+                if organization_id is not None:
+                    officers_query = officers_query.filter(Officer.organization_id == organization_id)
+                org_ids = {org_id for (org_id,) in officers_query} | {row.organization_id for row in orphans}
+                indexes = {org_id: OfficerIdentityIndex.load(db_session, org_id) for org_id in org_ids}
+                
+                orphaned_points = []
+                for row in orphans:
+                    possible_name = row.event.split(" - ")[0] if row.event and " - " in row.event else None
+                    suggestion = indexes[row.organization_id].resolve(name=possible_name) if possible_name else None
+                    orphaned_points.append({
+                        "id": row.id,
+                        "organization_id": row.organization_id,
+                        "officer_uuid": row.officer_uuid,
+                        "event": row.event,
+                        "role": row.role,
+                        "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+                        "notion_page_id": row.notion_page_id,
+                        "suggested_officer_uuid": suggestion
+                    })
+                
+                unknown_query = db_session.query(Officer).filter(
+                    (Officer.name == None) | (func.trim(Officer.name) == "") | (func.lower(Officer.name).in_(["unknown", "unknown officer"]))
+                )
+                if organization_id is not None:
+                    unknown_query = unknown_query.filter(Officer.organization_id == organization_id)
+                unknown_officers = [{
+                    "uuid": officer.uuid,
+                    "organization_id": officer.organization_id,
+                    "name": officer.name,
+                    "email": officer.email
+                } for officer in unknown_query]
+                
+                ambiguous_identities = [{
+                    "organization_id": org_id,
+                    "alias_type": alias_type,
+                    "value": value,
+                    "officer_uuids": sorted(uuids),
+                    "resolves_to": index.get((alias_type, value))
+                } for org_id, index in sorted(indexes.items()) for (alias_type, value), uuids in sorted(index.conflicts.items())]
+                
+                total_issues = len(orphaned_points) + len(unknown_officers) + len(ambiguous_identities)
+                return {
+                    "status": "success",
+                    "message": f"Found {total_issues} officer attribution issues",
+                    "total_issues": total_issues,
+                    "orphaned_points": orphaned_points,
+                    "unknown_officers": unknown_officers,
+                    "ambiguous_identities": ambiguous_identities
+                }
+            finally:
+                db_session.close()
+        except Exception as e:
+            logger.error(f"Error diagnosing unknown officers: {str(e)}")
+            capture_exception(e)
+            return {"status": "error", "message": str(e)}
     
     def get_officer_contributions(self, officer_id: str, start_date=None, end_date=None) -> List[Dict]:
         """Get all contributions for a specific officer by ID (can be email or UUID), with optional date filtering."""
@@ -218,63 +316,55 @@ class OCPService:
             capture_exception(e)
             return []
     
-    def get_all_officers(self, start_date=None, end_date=None) -> List[Dict]:
-        """Get all officers with their total points for the leaderboard, with optional date filtering."""
+    def get_all_officers(self, start_date=None, end_date=None, organization_id=None,
+                         include_contributions=False) -> List[Dict]:
+        """
+        Get all officers with their total points for the leaderboard, with optional date and organization filtering.
+        
+        Totals and breakdowns come from one GROUP BY query (see ``officer_totals``). Individual
+        contributions are only loaded when ``include_contributions`` is set.
+        """
         try:
             db_session = next(self.db.get_db())
-            officers = db_session.query(Officer).all()
-            
-            result = []
-            for officer in officers:
-                # Calculate total points with optional date filtering
-                points_query = db_session.query(OfficerPoints).filter(OfficerPoints.officer_uuid == officer.uuid)
-                
-                # Apply date filtering if provided
-                if start_date:
-                    points_query = points_query.filter(OfficerPoints.timestamp >= start_date)
-                if end_date:
-                    points_query = points_query.filter(OfficerPoints.timestamp <= end_date)
-                
-                points = points_query.all()
-                total_points = sum(point.points for point in points)
-                
-                # Count contributions by type
-                contribution_counts = {
-                    "GBM": 0,
-                    "Special Event": 0,
-                    "Special Contribution": 0,
-                    "Unique Contribution": 0,
-                    "Other": 0
-                }
-                
-                for point in points:
-                    event_type = point.event_type or "Other"
-                    if event_type in contribution_counts:
-                        contribution_counts[event_type] += 1
-                    else:
-                        contribution_counts["Other"] += 1
-                
-                result.append({
-                    "uuid": officer.uuid,
-                    "email": officer.email,
-                    "name": officer.name,
-                    "title": officer.title,
-                    "department": officer.department,
-                    "total_points": total_points,
-                    "contribution_counts": contribution_counts
-                })
+            try:
+                result = officer_totals(db_session, organization_id, start_date, end_date)
                 
-            # Sort by total points descending (for leaderboard)
-            result.sort(key=lambda x: x["total_points"], reverse=True)
-            
-            db_session.close()
-            return result
+                if include_contributions and result:
+                    contributions = self._get_contributions_by_officer(
+                        db_session, [officer["uuid"] for officer in result], start_date, end_date
+                    )
+                    for officer in result:
+                        officer["contributions"] = contributions.get(officer["uuid"], [])
+                return result
+            finally:
+                db_session.close()
             
         except Exception as e:
             logger.error(f"Error getting all officers: {str(e)}")
             capture_exception(e)
             return []
     
+    def _get_contributions_by_officer(self, db_session, officer_uuids: List[str], start_date=None, end_date=None) -> Dict[str, List[Dict]]:
+        """Contributions of several officers in one query, grouped by officer UUID."""
+        query = db_session.query(OfficerPoints).filter(OfficerPoints.officer_uuid.in_(officer_uuids))
+        if start_date:
+            query = query.filter(OfficerPoints.timestamp >= start_date)
+        if end_date:
+            query = query.filter(OfficerPoints.timestamp <= end_date)
+        
+        grouped = {}
+        for point in query.order_by(OfficerPoints.timestamp.desc()):
+            grouped.setdefault(point.officer_uuid, []).append({
+                "id": point.id,
+                "points": point.points,
+                "event": point.event,
+                "role": point.role,
+                "event_type": point.event_type,
+                "timestamp": point.timestamp.isoformat() if point.timestamp else None,
+                "notion_page_id": point.notion_page_id
+            })
+        return grouped
+    
     def add_officer_points(self, data: Dict, organization_id=None) -> Dict[str, Any]:
         """
         Add custom contribution points for one or more officers.
@@ -316,9 +406,9 @@ class OCPService:
                     continue
                 
                 # Get or create officer (org-aware)
-                officer = self.db.get_officer_by_name(db_session, officer_name, organization_id)
+                officer = self.get_officer_by_name(db_session, officer_name, organization_id)
                 if not officer and data.get("email"):
-                    officer = self.db.get_officer_by_email(db_session, data["email"], organization_id)
+                    officer = self.get_officer_by_email(db_session, data["email"], organization_id)
                 
                 if not officer:
                     officer = Officer(
@@ -329,6 +419,8 @@ class OCPService:
                         department=data.get("department", "Unknown")
                     )
                     officer = self.db.create_officer(db_session, officer, organization_id)
+                    store_officer_aliases(db_session, [officer])
+                    db_session.commit()
                     created_officers.append(officer_name)
                     logger.info(f"Created new officer: {officer_name}")
                 
@@ -493,9 +585,11 @@ class OCPService:
             capture_exception(e)
             return {"status": "error", "message": f"Error deleting officer points: {str(e)}"}
     
-    def get_officer_leaderboard(self, start_date=None, end_date=None) -> List[Dict]:
-        """Get a leaderboard of officers sorted by total points, with optional date filtering."""
-        return self.get_all_officers(start_date=start_date, end_date=end_date)
+    def get_officer_leaderboard(self, start_date=None, end_date=None, organization_id=None,
+                                include_contributions=False) -> List[Dict]:
+        """Get a leaderboard of officers sorted by total points, with optional date and organization filtering."""
+        return self.get_all_officers(start_date=start_date, end_date=end_date, organization_id=organization_id,
+                                     include_contributions=include_contributions)
     
     def get_officer_details(self, officer_id: str, start_date=None, end_date=None) -> Dict:
         """
@@ -588,60 +682,25 @@ class OCPService:
             capture_exception(e)
             return None
     
-    def get_all_events(self) -> List[Dict]:
+    def get_all_events(self, organization_id=None, start_date=None, end_date=None, officer_uuid=None,
+                       event_type=None, limit=None, offset=0) -> Dict[str, Any]:
         """
-        Get all contribution events from all officers.
+        Get contribution events with officer details attached, newest first.
+        
+        Read-only (see ``list_events``); points whose officer no longer exists are returned with
+        placeholder officer details (see scripts/repair_ocp_orphans.py to fix those).
         
         Returns:
-            List of all events with officer details attached
+            Dict with the page of ``events`` and the ``total`` number of matching events
         """
         try:
             db_session = next(self.db.get_db())
-            
-            # Query all events
-            events = db_session.query(OfficerPoints).order_by(OfficerPoints.timestamp.desc()).all()
-            
-            result = []
-            for event in events:
-                # Get officer details for each event
-                officer = db_session.query(Officer).filter(Officer.uuid == event.officer_uuid).first()
-                
-                # If officer not found by UUID, try to find by name from the event
-                if not officer and event.event:
-                    # Extract potential officer name from the event title or metadata
-                    possible_officer_name = event.event.split(" - ")[0] if " - " in event.event else None
-                    if possible_officer_name:
-                        officer = self.get_officer_by_name(db_session, possible_officer_name)
-                        
-                        # If found, update the event's officer_uuid for future lookups
-                        if officer:
-                            event.officer_uuid = officer.uuid
-                            db_session.commit()
-                            logger.info(f"Updated event {event.id} with correct officer UUID {officer.uuid}")
-                
-                event_data = {
-                    "id": event.id,
-                    "points": event.points,
-                    "event": event.event,
-                    "role": event.role,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                    "notion_page_id": event.notion_page_id,
-                    "officer": {
-                        "uuid": officer.uuid if officer else "unknown",
-                        "name": officer.name if officer else "Unknown Officer",
-                        "email": officer.email if officer else "unknown",
-                        "title": officer.title if officer else "Unknown",
-                        "department": officer.department if officer else "Unknown"
-                    }
-                }
-                
-                result.append(event_data)
-                
-            db_session.close()
-            return result
+            try:
+                return list_events(db_session, organization_id, start_date, end_date, officer_uuid, event_type, limit, offset)
+            finally:
+                db_session.close()
             
         except Exception as e:
             logger.error(f"Error getting all events: {str(e)}")
             capture_exception(e)
-            return []
\ No newline at end of file
+            return {"events": [], "total": 0}
\ No newline at end of file
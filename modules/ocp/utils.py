@@ -111,13 +111,14 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
     
     Args:
         notion_event: Raw Notion event data
-        debug: Whether to print debug information
+        debug: Whether to log per-field debug information (only at DEBUG level)
     
     Returns:
         List of dictionaries, each containing:
         {
             "name": str,
             "email": str or None,
+            "notion_person_id": str or None,
             "role": str,
             "points": int,
             "event": str,
@@ -129,15 +130,16 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
         }
     """
     result = []
-    # No longer tracking officers without email
+    # Per-field tracing is only emitted at DEBUG level; callers sample which events request it
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
     
     properties = notion_event.get("properties", {})
     notion_page_id = notion_event.get("id")
     
     if debug:
-        print("\n========= NOTION EVENT PARSING DEBUG =========")
-        print(f"Notion Page ID: {notion_page_id}")
-        print(f"Available properties: {', '.join(properties.keys())}")
+        logger.debug("\n========= NOTION EVENT PARSING DEBUG =========")
+        logger.debug(f"Notion Page ID: {notion_page_id}")
+        logger.debug(f"Available properties: {', '.join(properties.keys())}")
     
     # Extract event name
     event_name = extract_property(properties, "Name", "title")
@@ -146,13 +148,13 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
         event_name = "Unnamed Event"
     
     if debug:
-        print(f"Event Name: {event_name}")
+        logger.debug(f"Event Name: {event_name}")
     
     # Extract event type (to determine points)
     event_type = extract_property(properties, "Event Type", "select") or "Default"
     
     if debug:
-        print(f"Event Type: {event_type}")
+        logger.debug(f"Event Type: {event_type}")
     
     # Extract event date
     date_prop = extract_property(properties, "Date", "date")
@@ -161,30 +163,30 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
         try:
             event_date = datetime.fromisoformat(date_prop["start"].replace("Z", "+00:00"))
             if debug:
-                print(f"Event Date: {event_date}")
+                logger.debug(f"Event Date: {event_date}")
         except (ValueError, TypeError):
             logger.warning(f"Could not parse date for event {event_name}, id: {notion_page_id}")
             if debug:
-                print(f"Failed to parse date: {date_prop}")
+                logger.debug(f"Failed to parse date: {date_prop}")
     elif debug:
-        print("No event date found")
+        logger.debug("No event date found")
     
     # Get all officers by role
     officers_by_role = get_event_officers(properties)
     
     if debug:
-        print("\nOfficers by Role:")
+        logger.debug("\nOfficers by Role:")
         for role, officers in officers_by_role.items():
-            print(f"  Role: {role}, Officers: {len(officers)}")
+            logger.debug(f"  Role: {role}, Officers: {len(officers)}")
             for i, officer in enumerate(officers):
-                print(f"    Officer #{i+1} ID: {officer.get('id', 'No ID')}")
-                print(f"    Officer #{i+1} Name: {officer.get('name', 'Unknown')}")
-                print(f"    Officer #{i+1} Object Type: {type(officer).__name__}")
+                logger.debug(f"    Officer #{i+1} ID: {officer.get('id', 'No ID')}")
+                logger.debug(f"    Officer #{i+1} Name: {officer.get('name', 'Unknown')}")
+                logger.debug(f"    Officer #{i+1} Object Type: {type(officer).__name__}")
                 
                 # If the officer object contains a 'person' subobject, examine that too
                 if 'person' in officer:
                     person = officer.get('person', {})
-                    print(f"      Person Object Keys: {list(person.keys())}")
+                    logger.debug(f"      Person Object Keys: {list(person.keys())}")
     
     # Process each role and its officers
     for role, officers in officers_by_role.items():
@@ -198,29 +200,29 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
         points = max(role_points, event_type_points)
         
         if debug:
-            print(f"\nProcessing role: {role}")
-            print(f"  Base points for role: {role_points}")
-            print(f"  Points for event type '{event_type}': {event_type_points}")
-            print(f"  Final points: {points}")
+            logger.debug(f"\nProcessing role: {role}")
+            logger.debug(f"  Base points for role: {role_points}")
+            logger.debug(f"  Points for event type '{event_type}': {event_type_points}")
+            logger.debug(f"  Final points: {points}")
         
         for officer in officers:
             if debug:
-                print("\n  Officer Raw Data:")
+                logger.debug("\n  Officer Raw Data:")
                 # Pretty print all keys and non-nested values
                 for key, value in officer.items():
                     if isinstance(value, dict):
-                        print(f"    {key}: {type(value).__name__} with keys {list(value.keys())}")
+                        logger.debug(f"    {key}: {type(value).__name__} with keys {list(value.keys())}")
                     elif isinstance(value, list):
-                        print(f"    {key}: {type(value).__name__} with {len(value)} items")
+                        logger.debug(f"    {key}: {type(value).__name__} with {len(value)} items")
                     else:
-                        print(f"    {key}: {value}")
+                        logger.debug(f"    {key}: {value}")
                         
                 # If there's a person object, show its contents in detail
                 if "person" in officer:
                     person_data = officer.get("person", {})
-                    print(f"    person object details:")
+                    logger.debug(f"    person object details:")
                     for person_key, person_value in person_data.items():
-                        print(f"      {person_key}: {person_value}")
+                        logger.debug(f"      {person_key}: {person_value}")
             
             # Person objects from Notion have name and id, might have email or person objects
             officer_name = officer.get("name", "Unknown")
@@ -228,14 +230,14 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
             # Skip if officer name is empty or unknown
             if not officer_name or officer_name.lower() == "unknown":
                 if debug:
-                    print(f"  Skipping officer with missing/unknown name: {officer_name}")
+                    logger.debug(f"  Skipping officer with missing/unknown name: {officer_name}")
                 logger.warning(f"Skipping officer with missing name in event {event_name}")
                 continue
                 
             # Make sure we're using a real name, not just "Unknown"
             if officer_name.lower() in ["unknown", "unnamed", "no name", "none", ""]:
                 if debug:
-                    print(f"  Skipping officer with placeholder name: {officer_name}")
+                    logger.debug(f"  Skipping officer with placeholder name: {officer_name}")
                 logger.warning(f"Skipping officer with placeholder name in event {event_name}")
                 continue
                 
@@ -243,20 +245,20 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
             officer_name = " ".join(officer_name.strip().split())
             
             if debug:
-                print(f"  Officer Name (cleaned): {officer_name}")
+                logger.debug(f"  Officer Name (cleaned): {officer_name}")
             
             # Try to get email in different ways
             officer_email = None
             if "email" in officer:
                 officer_email = officer["email"]
                 if debug:
-                    print(f"  Email (from officer object): {officer_email}")
+                    logger.debug(f"  Email (from officer object): {officer_email}")
             elif "person" in officer and "email" in officer["person"]:
                 officer_email = officer["person"]["email"]
                 if debug:
-                    print(f"  Email (from person object): {officer_email}")
+                    logger.debug(f"  Email (from person object): {officer_email}")
             elif debug:
-                print("  No email found for officer")
+                logger.debug("  No email found for officer")
                 
             # Try to extract department and title if available
             department = "Unknown"
@@ -268,17 +270,18 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
                 if "department" in person_data:
                     department = person_data["department"]
                     if debug:
-                        print(f"  Department: {department}")
+                        logger.debug(f"  Department: {department}")
                 if "title" in person_data:
                     title = person_data["title"]
                     if debug:
-                        print(f"  Title: {title}")
+                        logger.debug(f"  Title: {title}")
             
             # Remove tracking of officers without email
             
             contribution = {
                 "name": officer_name,
                 "email": officer_email,
+                "notion_person_id": officer.get("id"),
                 "role": role,
                 "points": points,
                 "event": event_name,
@@ -290,16 +293,16 @@ def parse_notion_event_for_officers(notion_event: Dict, debug=False) -> List[Dic
             }
             
             if debug:
-                print("  Final contribution data:")
+                logger.debug("  Final contribution data:")
                 for key, value in contribution.items():
-                    print(f"    {key}: {value}")
+                    logger.debug(f"    {key}: {value}")
             
             result.append(contribution)
     
     # Remove logging about missing emails
     
     if debug:
-        print(f"\nTotal contributions extracted: {len(result)}")
-        print("========= END NOTION EVENT PARSING DEBUG =========\n")
+        logger.debug(f"\nTotal contributions extracted: {len(result)}")
+        logger.debug("========= END NOTION EVENT PARSING DEBUG =========\n")
     
     return result 
\ No newline at end of file
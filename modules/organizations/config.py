@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 
 @dataclass
@@ -29,6 +30,7 @@ class OrganizationSettings:
     # Calendar settings
     enable_calendar_integration: bool = True
     calendar_sync_interval: int = 3600  # seconds
+    calendar_sync_horizon_days: int = 90  # events that started longer ago are frozen and archived; 0 syncs all history
     
     def __post_init__(self):
         if self.discord_admin_roles is None:
@@ -63,7 +65,8 @@ class OrganizationSettings:
             },
             "calendar_integration": {
                 "enabled": self.enable_calendar_integration,
-                "sync_interval": self.calendar_sync_interval
+                "sync_interval": self.calendar_sync_interval,
+                "sync_horizon_days": self.calendar_sync_horizon_days
             }
         }
 
@@ -86,5 +89,13 @@ class OrganizationSettings:
             require_member_verification=data.get("member_management", {}).get("require_verification", True),
             verification_method=data.get("member_management", {}).get("verification_method", "email"),
             enable_calendar_integration=data.get("calendar_integration", {}).get("enabled", True),
-            calendar_sync_interval=data.get("calendar_integration", {}).get("sync_interval", 3600)
-        ) 
\ No newline at end of file
+            calendar_sync_interval=data.get("calendar_integration", {}).get("sync_interval", 3600),
+            calendar_sync_horizon_days=data.get("calendar_integration", {}).get("sync_horizon_days", 90)
+        )
+
+    def calendar_sync_horizon(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Start-date cutoff before which calendar events are frozen (UTC), or None when the horizon is disabled."""
+        if not self.calendar_sync_horizon_days or self.calendar_sync_horizon_days <= 0:
+            return None
+        now = now or datetime.now(timezone.utc)
+        return now - timedelta(days=self.calendar_sync_horizon_days) 
\ No newline at end of file
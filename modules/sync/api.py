@@ -0,0 +1,93 @@
+# modules/sync/api.py
+import threading
+
+from flask import Blueprint, jsonify, request, current_app
+from sentry_sdk import set_tag
+from modules.utils.tracing import start_transaction, finish_transaction
+
+from shared import logger
+from modules.calendar.errors import APIErrorHandler
+from modules.auth.decoraters import auth_required
+
+route_error_handler = APIErrorHandler(logger, "SyncAPI_Route")
+
+sync_blueprint = Blueprint("sync", __name__)
+
+
+@sync_blueprint.route("/runs", methods=["GET"])
+@auth_required
+def list_sync_runs():
+    """
+    Recent sync runs with durations and counts, newest first.
+    Accessible via: /api/sync/runs?limit=20&status=failed
+    """
+    transaction = start_transaction(op="api", name="list_sync_runs")
+    route_error_handler.transaction = transaction
+    route_error_handler.operation_name = "list_sync_runs"
+    set_tag("request_type", "GET")
+
+    try:
+        try:
+            limit = min(max(int(request.args.get("limit", 20)), 1), 200)
+        except ValueError:
+            return jsonify({"status": "error", "message": "limit must be an integer"}), 400
+
+        runs = current_app.sync_job_service.list_runs(limit=limit, status=request.args.get("status"))
+        return jsonify({"status": "success", "runs": runs, "count": len(runs)}), 200
+    except Exception as e:
+        route_error_handler.handle_generic_error(e)
+        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
+    finally:
+        route_error_handler.transaction = None
+        finish_transaction(transaction)
+
+
+@sync_blueprint.route("/runs/<int:run_id>", methods=["GET"])
+@auth_required
+def get_sync_run(run_id):
+    """
+    A single sync run with per-organization checkpoints.
+    Accessible via: /api/sync/runs/{run_id}
+    """
+    transaction = start_transaction(op="api", name="get_sync_run")
+    route_error_handler.transaction = transaction
+    route_error_handler.operation_name = "get_sync_run"
+    set_tag("request_type", "GET")
+
+    try:
+        run = current_app.sync_job_service.get_run(run_id)
+        if run is None:
+            return jsonify({"status": "error", "message": f"Sync run {run_id} not found"}), 404
+        return jsonify({"status": "success", "run": run}), 200
+    except Exception as e:
+        route_error_handler.handle_generic_error(e)
+        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
+    finally:
+        route_error_handler.transaction = None
+        finish_transaction(transaction)
+
+
+@sync_blueprint.route("/runs", methods=["POST"])
+@auth_required
+def trigger_sync_run():
+    """
+    Start a full sync run in the background. Organizations already being synced are skipped.
+    Accessible via: /api/sync/runs
+    """
+    transaction = start_transaction(op="admin", name="trigger_sync_run")
+    route_error_handler.transaction = transaction
+    route_error_handler.operation_name = "trigger_sync_run"
+    set_tag("request_type", "POST")
+
+    try:
+        service = current_app.sync_job_service
+        run_id = service.start_run(trigger="api")
+        threading.Thread(target=service.execute_run, args=(run_id,), name=f"SyncRun-{run_id}", daemon=True).start()
+        logger.info(f"Started sync run {run_id} from API")
+        return jsonify({"status": "accepted", "run_id": run_id}), 202
+    except Exception as e:
+        route_error_handler.handle_generic_error(e)
+        return jsonify({"status": "error", "message": "An unexpected error occurred"}), 500
+    finally:
+        route_error_handler.transaction = None
+        finish_transaction(transaction)
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Text, UniqueConstraint
+from sqlalchemy.orm import relationship
+from modules.utils.base import Base
+
+
+class SyncRun(Base):
+    """One execution of the Notion sync (scheduled, manual, or resumed)."""
+    __tablename__ = "sync_runs"
+
+    id = Column(Integer, primary_key=True)
+    trigger = Column(String(50), nullable=False, default="scheduled")  # scheduled, manual, api
+    stages = Column(JSON, nullable=True)  # Stages to run per organization, e.g. ["calendar", "ocp"]
+    reconcile = Column(Boolean, nullable=False, default=False)  # Force a full Google Calendar listing per organization
+    status = Column(String(20), nullable=False, default="running", index=True)  # running, success, partial_success, failed, interrupted
+    worker_id = Column(String(255), nullable=True)  # host:pid of the process currently executing the run
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    heartbeat_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    resume_count = Column(Integer, default=0)
+    summary = Column(JSON, nullable=True)  # Aggregated counts, filled in when the run finishes
+    error = Column(Text, nullable=True)
+
+    checkpoints = relationship("SyncRunCheckpoint", back_populates="run", cascade="all, delete-orphan",
+                               order_by="SyncRunCheckpoint.id")
+
+    def __repr__(self):
+        return f"<SyncRun(id={self.id}, trigger='{self.trigger}', status='{self.status}')>"
+
+    @property
+    def duration_seconds(self):
+        end = self.finished_at or datetime.utcnow()
+        return round((end - self.started_at).total_seconds(), 3) if self.started_at else None
+
+    def to_dict(self, include_checkpoints=False):
+        """Convert to dictionary."""
+        data = {
+            "id": self.id,
+            "trigger": self.trigger,
+            "stages": self.stages or [],
+            "reconcile": bool(self.reconcile),
+            "status": self.status,
+            "worker_id": self.worker_id,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds,
+            "resume_count": self.resume_count,
+            "summary": self.summary or {},
+            "error": self.error
+        }
+        if include_checkpoints:
+            data["organizations"] = [checkpoint.to_dict() for checkpoint in self.checkpoints]
+        return data
+
+
+class SyncRunCheckpoint(Base):
+    """Per-organization progress of a sync run; completed checkpoints are skipped on resume."""
+    __tablename__ = "sync_run_checkpoints"
+    __table_args__ = (
+        UniqueConstraint('run_id', 'organization_id', name='uq_sync_checkpoint_run_org'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(Integer, ForeignKey("sync_runs.id"), nullable=False, index=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    organization_name = Column(String(100), nullable=True)
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, success, failed, skipped
+    stages = Column(JSON, nullable=True)  # Per-stage results: {"calendar": {...}, "ocp": {...}}
+    message = Column(Text, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    run = relationship("SyncRun", back_populates="checkpoints")
+
+    def __repr__(self):
+        return f"<SyncRunCheckpoint(run_id={self.run_id}, org_id={self.organization_id}, status='{self.status}')>"
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        duration = None
+        if self.started_at and self.finished_at:
+            duration = round((self.finished_at - self.started_at).total_seconds(), 3)
+        return {
+            "organization_id": self.organization_id,
+            "organization_name": self.organization_name,
+            "status": self.status,
+            "stages": self.stages or {},
+            "message": self.message,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": duration
+        }
+
+
+class SyncLock(Base):
+    """Single-flight lock per organization, shared by every process using the database."""
+    __tablename__ = "sync_locks"
+
+    organization_id = Column(Integer, ForeignKey("organizations.id"), primary_key=True)
+    owner = Column(String(255), nullable=False)  # host:pid plus run ID of the holder
+    acquired_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)  # A crashed holder's lock can be taken over after this
+
+    def __repr__(self):
+        return f"<SyncLock(org_id={self.organization_id}, owner='{self.owner}')>"
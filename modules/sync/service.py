@@ -0,0 +1,349 @@
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sentry_sdk import capture_exception, set_tag, start_transaction
+from sqlalchemy.exc import IntegrityError
+
+from shared import logger, db_connect
+from modules.calendar.service import MultiOrgCalendarService
+from modules.calendar.utils import operation_span
+from modules.ocp.notion_sync_service import NotionOCPSyncService
+from modules.organizations.models import Organization
+from modules.utils.logging_config import log_event
+from .models import SyncRun, SyncRunCheckpoint, SyncLock
+
+# A lock not renewed for this long is assumed to belong to a crashed process and can be taken over.
+# Holders renew it, together with the run heartbeat, after every stage of an organization's sync.
+LOCK_TTL = timedelta(minutes=30)
+# A running sync whose heartbeat is older than this is considered interrupted and is resumed
+STALE_RUN_AFTER = timedelta(minutes=30)
+
+FINISHED_CHECKPOINT_STATUSES = ("success", "failed", "skipped")
+ALL_STAGES = ("calendar", "ocp")
+
+
+class SyncJobService:
+    """
+    Persisted, resumable Notion sync runs.
+
+    Every run is a ``SyncRun`` row with one ``SyncRunCheckpoint`` per organization. Organizations
+    are synced one at a time under a per-organization ``SyncLock``, so scheduled runs, manual syncs
+    and the standalone worker never sync the same organization concurrently. Checkpoints are
+    committed as soon as an organization finishes; a run interrupted by a deploy or crash is picked
+    up again by ``resume_interrupted_runs`` and continues with the organizations not yet done.
+    """
+
+    def __init__(self, logger_instance=None, calendar_service=None, ocp_sync_service=None):
+        self.logger = logger_instance or logger
+        self.db_connect = db_connect
+        self.calendar_service = calendar_service or MultiOrgCalendarService(self.logger)
+        self.ocp_sync_service = ocp_sync_service or NotionOCPSyncService(self.logger)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    # --- Locks ---
+
+    def acquire_lock(self, organization_id: int, owner: str) -> bool:
+        """Take the organization's sync lock. Returns False if another live holder has it."""
+        db = next(self.db_connect.get_db())
+        now = datetime.utcnow()
+        try:
+            try:
+                db.add(SyncLock(organization_id=organization_id, owner=owner, acquired_at=now, expires_at=now + LOCK_TTL))
+                db.commit()
+                return True
+            except IntegrityError:
+                db.rollback()
+            # Take over an expired lock; the conditional update keeps this atomic across processes
+            taken = db.query(SyncLock).filter(
+                SyncLock.organization_id == organization_id,
+                SyncLock.expires_at < now
+            ).update({"owner": owner, "acquired_at": now, "expires_at": now + LOCK_TTL}, synchronize_session=False)
+            db.commit()
+            if taken:
+                self.logger.warning(f"Took over expired sync lock for organization {organization_id}")
+            return bool(taken)
+        finally:
+            db.close()
+
+    def renew_lock(self, organization_id: int, owner: str) -> bool:
+        """Push back the expiry of a lock this owner holds. Returns False if the lock was lost."""
+        db = next(self.db_connect.get_db())
+        try:
+            renewed = db.query(SyncLock).filter(
+                SyncLock.organization_id == organization_id,
+                SyncLock.owner == owner
+            ).update({"expires_at": datetime.utcnow() + LOCK_TTL}, synchronize_session=False)
+            db.commit()
+            return bool(renewed)
+        finally:
+            db.close()
+
+    def release_lock(self, organization_id: int, owner: str):
+        """Release the organization's sync lock if this owner still holds it."""
+        db = next(self.db_connect.get_db())
+        try:
+            db.query(SyncLock).filter(
+                SyncLock.organization_id == organization_id,
+                SyncLock.owner == owner
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    # --- Runs ---
+
+    def start_run(self, trigger: str = "scheduled", organization_ids: Optional[List[int]] = None,
+                  stages: Sequence[str] = ALL_STAGES, reconcile: bool = False) -> int:
+        """Create a run with a pending checkpoint for every organization to sync. Returns the run ID."""
+        db = next(self.db_connect.get_db())
+        try:
+            query = db.query(Organization).filter(
+                Organization.is_active == True,
+                Organization.notion_database_id != None,
+                Organization.notion_database_id != ""
+            )
+            if organization_ids is not None:
+                query = query.filter(Organization.id.in_(organization_ids))
+            else:
+                query = query.filter(
+                    (Organization.calendar_sync_enabled == True) | (Organization.ocp_sync_enabled == True)
+                )
+            organizations = query.order_by(Organization.id).all()
+
+            run = SyncRun(trigger=trigger, stages=list(stages), reconcile=reconcile, status="running", worker_id=self.worker_id)
+            run.checkpoints = [
+                SyncRunCheckpoint(organization_id=org.id, organization_name=org.name, status="pending")
+                for org in organizations
+            ]
+            db.add(run)
+            db.commit()
+            self.logger.info(f"Created sync run {run.id} ({trigger}) for {len(organizations)} organizations")
+            return run.id
+        finally:
+            db.close()
+
+    def execute_run(self, run_id: int, transaction=None, reconcile: bool = False) -> Dict[str, Any]:
+        """
+        Sync every organization of a run that has not finished yet, then finalize the run.
+        ``reconcile`` forces a full Google Calendar listing even if the run was not started with it.
+        """
+        op_name = "execute_sync_run"
+        current_transaction = transaction or start_transaction(op="sync", name=op_name)
+        set_tag("sync_run_id", run_id)
+
+        with operation_span(current_transaction, op="sync_run", description=op_name, logger=self.logger) as span:
+            db = next(self.db_connect.get_db())
+            try:
+                run = db.get(SyncRun, run_id)
+                if run is None:
+                    return {"status": "error", "message": f"Sync run {run_id} not found"}
+
+                owner = f"{self.worker_id}/run-{run_id}"
+                reconcile = reconcile or bool(run.reconcile)
+                pending = [cp for cp in run.checkpoints if cp.status not in FINISHED_CHECKPOINT_STATUSES]
+                span.set_data("pending_organizations", len(pending))
+
+                for checkpoint in pending:
+                    if not self.acquire_lock(checkpoint.organization_id, owner):
+                        checkpoint.status = "skipped"
+                        checkpoint.message = "Another sync is already running for this organization"
+                        checkpoint.finished_at = datetime.utcnow()
+                        run.heartbeat_at = datetime.utcnow()
+                        db.commit()
+                        self.logger.info(f"Run {run_id}: skipped organization {checkpoint.organization_id}, sync already in progress")
+                        continue
+
+                    try:
+                        checkpoint.status = "running"
+                        checkpoint.started_at = datetime.utcnow()
+                        run.heartbeat_at = checkpoint.started_at
+                        db.commit()
+
+                        stages = self._sync_organization(
+                            checkpoint.organization_id, run.stages or ALL_STAGES, current_transaction, reconcile,
+                            on_stage_done=lambda: self._heartbeat(run_id, checkpoint.organization_id, owner)
+                        )
+                        failed = [name for name, stage in stages.items() if stage.get("status") not in ("success", "warning")]
+                        checkpoint.stages = stages
+                        checkpoint.status = "failed" if failed else "success"
+                        checkpoint.message = "; ".join(f"{name}: {stages[name].get('message')}" for name in failed) or None
+                    except Exception as e:
+                        capture_exception(e)
+                        self.logger.error(f"Run {run_id}: error syncing organization {checkpoint.organization_id}: {e}", exc_info=True)
+                        checkpoint.status = "failed"
+                        checkpoint.message = str(e)
+                    finally:
+                        self.release_lock(checkpoint.organization_id, owner)
+                        checkpoint.finished_at = datetime.utcnow()
+                        run.heartbeat_at = checkpoint.finished_at
+                        db.commit()
+
+                self._finalize_run(run)
+                db.commit()
+                log_event(self.logger, logging.INFO, "sync_run.summary", run_id=run_id, trigger=run.trigger,
+                          status=run.status, duration_seconds=run.duration_seconds, **(run.summary or {}))
+                return {"status": run.status, "run": run.to_dict(include_checkpoints=True)}
+
+            except Exception as e:
+                capture_exception(e)
+                self.logger.error(f"Error executing sync run {run_id}: {e}", exc_info=True)
+                db.rollback()
+                run = db.get(SyncRun, run_id)
+                if run is not None:
+                    run.status = "failed"
+                    run.error = str(e)
+                    run.finished_at = datetime.utcnow()
+                    db.commit()
+                return {"status": "error", "message": str(e)}
+            finally:
+                db.close()
+                if transaction is None:
+                    current_transaction.finish()
+
+    def run(self, trigger: str = "scheduled", organization_ids: Optional[List[int]] = None,
+            stages: Sequence[str] = ALL_STAGES, transaction=None, reconcile: bool = False) -> Dict[str, Any]:
+        """Create and execute a run in the calling thread."""
+        run_id = self.start_run(trigger, organization_ids, stages, reconcile)
+        return self.execute_run(run_id, transaction)
+
+    def resume_interrupted_runs(self) -> List[Dict[str, Any]]:
+        """Claim and continue runs left running by a process that stopped heartbeating."""
+        db = next(self.db_connect.get_db())
+        try:
+            cutoff = datetime.utcnow() - STALE_RUN_AFTER
+            stale_ids = [run_id for (run_id,) in db.query(SyncRun.id).filter(
+                SyncRun.status == "running",
+                SyncRun.heartbeat_at < cutoff
+            ).order_by(SyncRun.id).all()]
+
+            claimed = []
+            for run_id in stale_ids:
+                # Conditional update so only one process resumes a given run
+                updated = db.query(SyncRun).filter(
+                    SyncRun.id == run_id,
+                    SyncRun.status == "running",
+                    SyncRun.heartbeat_at < cutoff
+                ).update({
+                    "worker_id": self.worker_id,
+                    "heartbeat_at": datetime.utcnow(),
+                    "resume_count": SyncRun.resume_count + 1
+                }, synchronize_session=False)
+                db.commit()
+                if updated:
+                    claimed.append(run_id)
+        finally:
+            db.close()
+
+        results = []
+        for run_id in claimed:
+            self.logger.warning(f"Resuming interrupted sync run {run_id} from its last checkpoint")
+            results.append(self.execute_run(run_id))
+        return results
+
+    def list_runs(self, limit: int = 20, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent runs first, without per-organization detail."""
+        db = next(self.db_connect.get_db())
+        try:
+            query = db.query(SyncRun)
+            if status:
+                query = query.filter(SyncRun.status == status)
+            return [run.to_dict() for run in query.order_by(SyncRun.id.desc()).limit(limit).all()]
+        finally:
+            db.close()
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """A single run with its per-organization checkpoints."""
+        db = next(self.db_connect.get_db())
+        try:
+            run = db.get(SyncRun, run_id)
+            return run.to_dict(include_checkpoints=True) if run else None
+        finally:
+            db.close()
+
+    # --- Internals ---
+
+    def _heartbeat(self, run_id: int, organization_id: int, owner: str):
+        """Renew the organization's lock and the run heartbeat so a long sync is not taken over or resumed."""
+        if not self.renew_lock(organization_id, owner):
+            self.logger.warning(f"Run {run_id}: lost the sync lock for organization {organization_id}")
+        db = next(self.db_connect.get_db())
+        try:
+            db.query(SyncRun).filter(SyncRun.id == run_id).update(
+                {"heartbeat_at": datetime.utcnow()}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def _sync_organization(self, organization_id: int, stages: Sequence[str], transaction=None,
+                           reconcile: bool = False, on_stage_done=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the calendar and OCP stages enabled for one organization and return compact per-stage results.
+        ``on_stage_done`` is called after each stage.
+        """
+        db = next(self.db_connect.get_db())
+        try:
+            org = db.query(Organization).filter(Organization.id == organization_id).first()
+            if org is None:
+                return {"organization": {"status": "error", "message": f"Organization {organization_id} not found"}}
+
+            results = {}
+            if "calendar" in stages and org.calendar_sync_enabled:
+                result = self.calendar_service.sync_organization_notion_to_google(org.id, transaction, reconcile=reconcile)
+                statuses = [event.get("status") for event in result.get("events_processed", [])]
+                results["calendar"] = {
+                    "status": result.get("status"),
+                    "message": result.get("message"),
+                    "events_created": statuses.count("created"),
+                    "events_updated": statuses.count("updated"),
+                    "events_unchanged": statuses.count("unchanged")
+                }
+                if on_stage_done:
+                    on_stage_done()
+            if "ocp" in stages and org.ocp_sync_enabled:
+                result = self.ocp_sync_service.sync_organization(org, transaction)
+                results["ocp"] = {
+                    "status": result.get("status"),
+                    "message": result.get("message"),
+                    "officers_created": result.get("officers_created", 0),
+                    "points_created": result.get("points_created", 0)
+                }
+                if on_stage_done:
+                    on_stage_done()
+            return results
+        finally:
+            db.close()
+
+    def _finalize_run(self, run: SyncRun):
+        """Aggregate checkpoint results into the run summary and final status."""
+        checkpoints = run.checkpoints
+        counts = {status: sum(1 for cp in checkpoints if cp.status == status) for status in FINISHED_CHECKPOINT_STATUSES}
+        summary = {
+            "organizations_total": len(checkpoints),
+            "organizations_succeeded": counts["success"],
+            "organizations_failed": counts["failed"],
+            "organizations_skipped": counts["skipped"],
+            "events_created": 0,
+            "events_updated": 0,
+            "events_unchanged": 0,
+            "ocp_officers_created": 0,
+            "ocp_points_created": 0
+        }
+        for checkpoint in checkpoints:
+            stages = checkpoint.stages or {}
+            for key in ("events_created", "events_updated", "events_unchanged"):
+                summary[key] += stages.get("calendar", {}).get(key, 0)
+            summary["ocp_officers_created"] += stages.get("ocp", {}).get("officers_created", 0)
+            summary["ocp_points_created"] += stages.get("ocp", {}).get("points_created", 0)
+
+        run.summary = summary
+        run.finished_at = datetime.utcnow()
+        if counts["failed"] == 0:
+            run.status = "success"
+        elif counts["success"] > 0:
+            run.status = "partial_success"
+        else:
+            run.status = "failed"
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeDebouncer:
+    """
+    Coalesces bursts of change notifications per key and flushes them once things go quiet.
+
+    Each ``submit(key, items)`` merges ``items`` into the pending set for ``key`` and (re)arms a
+    timer. The pending set is handed to ``flush_fn(key, items)`` once no new items have arrived for
+    ``quiet_seconds``, or at the latest ``max_wait_seconds`` after the first pending item, so a
+    steady stream of edits cannot postpone a flush forever. Flushes for the same key never overlap:
+    items arriving while a flush runs are queued for the next one.
+    """
+
+    def __init__(self, flush_fn: Callable[[Hashable, Set[str]], None], quiet_seconds: float = 5.0,
+                 max_wait_seconds: float = 30.0, logger_instance=None):
+        self.flush_fn = flush_fn
+        self.quiet_seconds = quiet_seconds
+        self.max_wait_seconds = max(max_wait_seconds, quiet_seconds)
+        self.logger = logger_instance or logger
+
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Set[str]] = {}
+        self._first_seen: Dict[Hashable, float] = {}
+        self._timers: Dict[Hashable, threading.Timer] = {}
+        self._running: Set[Hashable] = set()
+
+    def submit(self, key: Hashable, items: Iterable[str]) -> int:
+        """Queue items for key. Returns the number of items now pending for that key."""
+        items = set(items)
+        with self._lock:
+            if not items:
+                return len(self._pending.get(key, ()))
+            pending = self._pending.setdefault(key, set())
+            pending.update(items)
+            now = time.monotonic()
+            first_seen = self._first_seen.setdefault(key, now)
+            if key not in self._running:
+                self._arm(key, now, first_seen)
+            return len(pending)
+
+    def pending(self, key: Hashable) -> Set[str]:
+        """Snapshot of the items currently waiting for key."""
+        with self._lock:
+            return set(self._pending.get(key, ()))
+
+    def flush(self, key: Hashable) -> bool:
+        """Flush key immediately on the calling thread. Returns False if nothing was flushed."""
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if timer:
+                timer.cancel()
+        return self._run(key)
+
+    def cancel_all(self):
+        """Drop every pending item and stop all timers (used on shutdown)."""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._pending.clear()
+            self._first_seen.clear()
+
+    def _arm(self, key: Hashable, now: float, first_seen: float):
+        """(Re)start the timer for key. Caller must hold the lock."""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        delay = min(self.quiet_seconds, max(0.0, first_seen + self.max_wait_seconds - now))
+        timer = threading.Timer(delay, self._run, args=(key,))
+        timer.daemon = True
+        self._timers[key] = timer
+        timer.start()
+
+    def _run(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._running:
+                return False
+            items = self._pending.pop(key, None)
+            self._first_seen.pop(key, None)
+            self._timers.pop(key, None)
+            if not items:
+                return False
+            self._running.add(key)
+
+        try:
+            self.logger.info(f"Flushing {len(items)} coalesced change(s) for {key}")
+            self.flush_fn(key, items)
+        except Exception as e:
+            self.logger.error(f"Error flushing changes for {key}: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                # Changes that arrived during the flush get their own debounce window
+                if self._pending.get(key):
+                    now = time.monotonic()
+                    self._first_seen[key] = now
+                    self._arm(key, now, now)
+        return True
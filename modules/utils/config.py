@@ -43,6 +43,9 @@ class Config:
                 self.SERVER_PORT = 5000
                 self.SERVER_DEBUG = True
                 self.TIMEZONE = "America/Phoenix"
+                self.NOTION_WEBHOOK_SECRET = os.environ.get("NOTION_WEBHOOK_SECRET")
+                self.NOTION_SYNC_INTERVAL_MINUTES = int(os.environ.get("NOTION_SYNC_INTERVAL_MINUTES", "120"))
+                self.SYNC_IN_PROCESS = os.environ.get("SYNC_IN_PROCESS", "true").lower() == "true"
                 
                 # Optional configs
                 self.SENTRY_DSN = None
@@ -99,6 +102,12 @@ class Config:
                 self.SERVER_PORT = int(os.environ.get("SERVER_PORT", "5000"))
                 self.SERVER_DEBUG = os.environ.get("SERVER_DEBUG", "false").lower() == "true"
                 self.TIMEZONE = os.environ.get("TIMEZONE", "America/Phoenix")
+                # Shared secret for Notion change notifications (webhook disabled when unset)
+                self.NOTION_WEBHOOK_SECRET = os.environ.get("NOTION_WEBHOOK_SECRET")
+                # Full-database sync interval; can be raised once change notifications are set up
+                self.NOTION_SYNC_INTERVAL_MINUTES = int(os.environ.get("NOTION_SYNC_INTERVAL_MINUTES", "120"))
+                # Run the scheduled sync inside the API process; set to false when sync_worker.py runs separately
+                self.SYNC_IN_PROCESS = os.environ.get("SYNC_IN_PROCESS", "true").lower() == "true"
 
                 # Monitoring Configuration (Optional)
                 self.SENTRY_DSN = os.environ.get("SENTRY_DSN")
@@ -48,8 +48,10 @@ class DBConnect:
         print("Database tables created successfully")
         """Check if database file exists and create tables if needed"""
         try:
-            # Ensure data directory exists
-            os.makedirs(os.path.dirname(self.SQLALCHEMY_DATABASE_URL.replace('sqlite:///', '')), exist_ok=True)
+            # Ensure data directory exists (none for relative file names or sqlite:///:memory:)
+            db_dir = os.path.dirname(self.SQLALCHEMY_DATABASE_URL.replace('sqlite:///', ''))
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
             
             # Check if the database file exists
             db_path = self.SQLALCHEMY_DATABASE_URL.replace('sqlite:///', '')
@@ -57,11 +59,12 @@ class DBConnect:
                 logger.info(f"Database file does not exist at {db_path}. Creating tables...")
                 # Import all models to register them with Base
                 from modules.points.models import User, Points
-                from modules.ocp.models import Officer, OfficerPoints
-                from modules.calendar.models import CalendarEventLink
-                from modules.bot.models import JeopardyGame, ActiveGame
-                from modules.merch.models import Product, Order, OrderItem
+                from modules.ocp.models import Officer, OfficerPoints, OfficerAlias
+                from modules.calendar.models import CalendarEventLink, CalendarEventSnapshot, CalendarEventArchive, CalendarArchiveBackfill
+                from modules.bot.models import JeopardyGame, ActiveGame, ActiveGameEvent
+                from modules.merch.models import Product, Order, OrderItem, StockHold
                 from modules.organizations.models import Organization, OrganizationConfig, Officer as OrgOfficer
+                from modules.sync.models import SyncRun, SyncRunCheckpoint, SyncLock
                 
                 Base.metadata.create_all(bind=self.engine)
                 logger.info("Database tables created successfully")
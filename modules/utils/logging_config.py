@@ -1,9 +1,47 @@
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
 import colorlog
 
+# Records waiting to be written; beyond this, new records are dropped rather than blocking the caller
+LOG_QUEUE_SIZE = 10000
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the logging thread: records are dropped (and counted) when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+
+
 # Configure logging with colors and improved formatting
 def setup_logger():
-    """Configure and return the root logger with color formatting"""
+    """
+    Configure and return the root logger with color formatting.
+
+    Callers only enqueue records; a background listener thread formats and writes them, so slow
+    stdout (container log drivers, terminals) never stalls sync jobs or request handlers.
+    The level comes from LOG_LEVEL (default INFO).
+    """
+    global _listener
+
     handler = colorlog.StreamHandler()
     formatter = colorlog.ColoredFormatter(
         fmt='%(log_color)s[%(asctime)s] %(levelname)-8s %(name)-20s %(message)s',
@@ -17,20 +55,105 @@ def setup_logger():
         }
     )
     handler.setFormatter(formatter)
-    
+
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    
+    root_logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
     # Remove existing handlers to avoid duplicates
-    for hdlr in root_logger.handlers:
+    for hdlr in list(root_logger.handlers):
         root_logger.removeHandler(hdlr)
-    
-    root_logger.addHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    root_logger.addHandler(NonBlockingQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
     return root_logger
 
+
+@atexit.register
+def _flush_logs():
+    """Write out queued records before the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
+
+
 # Initialize root logger
 logger = setup_logger()
 
 def get_logger(name):
     """Get a logger for a specific module with proper formatting"""
-    return logging.getLogger(name) 
\ No newline at end of file
+    return logging.getLogger(name)
+
+
+def format_fields(**fields) -> str:
+    """Render fields as ``key=value`` pairs, quoting values that contain spaces."""
+    parts = []
+    for key, value in fields.items():
+        text = str(value)
+        if not text or " " in text or "=" in text:
+            text = '"' + text.replace('"', '\\"') + '"'
+        parts.append(f"{key}={text}")
+    return " ".join(parts)
+
+
+def log_event(log: logging.Logger, level: int, event: str, **fields):
+    """Log a structured ``event key=value ...`` line; nothing is formatted when the level is disabled."""
+    if log.isEnabledFor(level):
+        log.log(level, f"{event} {format_fields(**fields)}".rstrip())
+
+
+class LogSampler:
+    """Lets the first ``first`` occurrences of each key through, then one in every ``every``."""
+
+    def __init__(self, first: int = 5, every: int = 100):
+        self.first = first
+        self.every = every
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def allow(self, key: str = "default") -> bool:
+        with self._lock:
+            self._counts[key] += 1
+            count = self._counts[key]
+        return count <= self.first or (self.every > 0 and count % self.every == 0)
+
+
+class SyncRunStats:
+    """
+    Counters for one run of a sync pipeline.
+
+    Hot loops call ``incr`` instead of logging per item and use ``debug`` for sampled detail; the
+    run ends with a single structured summary line from ``log_summary``.
+    """
+
+    def __init__(self, pipeline: str, log: Optional[logging.Logger] = None, sampler: Optional[LogSampler] = None, **context):
+        self.pipeline = pipeline
+        self.logger = log or logging.getLogger(pipeline)
+        self.sampler = sampler or LogSampler()
+        self.context = context
+        self.counters = Counter()
+        self._started = time.monotonic()
+
+    def incr(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def sample(self, key: str = "default") -> bool:
+        """True when DEBUG is enabled and this occurrence of ``key`` is sampled."""
+        return self.logger.isEnabledFor(logging.DEBUG) and self.sampler.allow(key)
+
+    def debug(self, key: str, msg: str, *args):
+        """Sampled debug message; ``msg`` is only formatted when it is actually emitted."""
+        if self.sample(key):
+            self.logger.debug(msg, *args)
+
+    @property
+    def duration_seconds(self) -> float:
+        return round(time.monotonic() - self._started, 3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self.counters, "duration_seconds": self.duration_seconds}
+
+    def log_summary(self, level: int = logging.INFO):
+        log_event(self.logger, level, f"{self.pipeline}.summary", **self.context, **self.as_dict())
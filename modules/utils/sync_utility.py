@@ -1,13 +1,21 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from sentry_sdk import capture_exception, set_context, start_transaction
 
-from shared import config, logger
+from shared import config, logger, db_connect
 from modules.calendar.service import MultiOrgCalendarService
 from modules.ocp.notion_sync_service import NotionOCPSyncService
 from modules.calendar.utils import operation_span
+from modules.organizations.models import Organization
 from .sync_common import SyncCommonUtils
+from .change_debouncer import ChangeDebouncer
+from modules.sync.service import SyncJobService
+
+# Page change notifications are coalesced until Notion has been quiet for this long...
+PAGE_CHANGE_QUIET_SECONDS = 5
+# ...but never held back longer than this after the first one
+PAGE_CHANGE_MAX_WAIT_SECONDS = 30
 
 class UnifiedSyncService:
     """
@@ -21,6 +29,13 @@ class UnifiedSyncService:
         self.calendar_service = MultiOrgCalendarService(self.logger)
         self.ocp_sync_service = NotionOCPSyncService(self.logger)
         self.common_utils = SyncCommonUtils(self.logger)
+        self.job_service = SyncJobService(self.logger, self.calendar_service, self.ocp_sync_service)
+        self.page_changes = ChangeDebouncer(
+            self._flush_page_changes,
+            quiet_seconds=PAGE_CHANGE_QUIET_SECONDS,
+            max_wait_seconds=PAGE_CHANGE_MAX_WAIT_SECONDS,
+            logger_instance=self.logger
+        )
         
         self.logger.info("UnifiedSyncService initialized with MultiOrgCalendarService")
         
@@ -152,6 +167,87 @@ class UnifiedSyncService:
             if own_transaction:
                 transaction.finish()
     
+    def queue_page_changes(self, organization_id: int, page_ids: List[str]) -> int:
+        """
+        Queue changed Notion pages for a targeted sync. Bursts are debounced and coalesced per
+        organization, so many notifications for the same pages result in a single sync.
+        Returns the number of pages now pending for the organization.
+        """
+        return self.page_changes.submit(organization_id, page_ids)
+    
+    def _flush_page_changes(self, organization_id: int, page_ids: Set[str]):
+        owner = f"{self.job_service.worker_id}/pages"
+        if not self.job_service.acquire_lock(organization_id, owner):
+            # A full sync holds the organization; try the pages again once the debounce window passes
+            self.logger.info(f"Organization {organization_id} is being synced, requeueing {len(page_ids)} changed pages")
+            self.page_changes.submit(organization_id, page_ids)
+            return
+        try:
+            result = self.sync_notion_pages(organization_id, sorted(page_ids))
+        finally:
+            self.job_service.release_lock(organization_id, owner)
+        if result.get("status") == "error":
+            self.logger.error(f"Targeted page sync failed for organization {organization_id}: {result.get('message')}")
+    
+    def sync_notion_pages(self, organization_id: int, page_ids: List[str], transaction=None) -> Dict[str, Any]:
+        """
+        Sync specific Notion pages of one organization to Google Calendar and, if enabled, OCP.
+        
+        Args:
+            organization_id: Organization the pages belong to.
+            page_ids: Notion page IDs that changed.
+            transaction: Optional existing Sentry transaction.
+            
+        Returns:
+            A dictionary containing the status and results of both sync operations.
+        """
+        op_name = "sync_notion_pages"
+        transaction, own_transaction = self.common_utils.create_sync_transaction(op_name, transaction)
+        
+        try:
+            self.logger.info(f"Starting {op_name} for organization {organization_id}: {len(page_ids)} pages")
+            
+            with operation_span(transaction, op="calendar_sync", description="sync_organization_pages", logger=self.logger):
+                calendar_result = self.calendar_service.sync_organization_pages(organization_id, page_ids, transaction)
+            
+            result = {
+                "status": calendar_result.get("status"),
+                "message": calendar_result.get("message"),
+                "calendar_sync": {k: v for k, v in calendar_result.items() if k not in ("pages", "unpublished_page_ids")},
+                "ocp_sync": {}
+            }
+            if calendar_result.get("status") == "error":
+                return result
+            
+            db = next(db_connect.get_db())
+            try:
+                org = db.query(Organization).filter(Organization.id == organization_id).first()
+                ocp_enabled = bool(org and org.ocp_sync_enabled)
+            finally:
+                db.close()
+            
+            if ocp_enabled and (calendar_result.get("pages") or calendar_result.get("unpublished_page_ids")):
+                # Unpublished and deleted pages lose their points, so officers stop getting credit for them
+                with operation_span(transaction, op="ocp_sync", description="sync_notion_pages_to_ocp", logger=self.logger):
+                    ocp_result = self.ocp_sync_service.ocp_service.sync_notion_pages_to_ocp(
+                        calendar_result.get("pages", []), organization_id, transaction,
+                        unpublished_page_ids=calendar_result.get("unpublished_page_ids", [])
+                    )
+                result["ocp_sync"] = ocp_result
+                if ocp_result.get("status") != "success" and result["status"] == "success":
+                    result["status"] = "warning"
+            
+            self.logger.info(f"{op_name} completed for organization {organization_id} with status: {result['status']}")
+            return result
+            
+        except Exception as e:
+            error_msg = f"Unexpected error during page sync: {str(e)}"
+            self.logger.error(f"{op_name}: {error_msg}", exc_info=True)
+            return self.common_utils.create_error_result(error_msg, op_name, transaction)
+        finally:
+            if own_transaction:
+                transaction.finish()
+    
     def get_sync_status(self) -> Dict[str, Any]:
         """
         Get the current status of both sync services.
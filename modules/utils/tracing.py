@@ -0,0 +1,93 @@
+# modules/utils/tracing.py
+"""
+Request-scoped Sentry tracing context.
+
+The current transaction is kept in a ``ContextVar`` instead of on shared module-level objects, so
+every thread (and every asyncio task) sees only the transaction of the request it is serving.
+Routes start their transaction with ``start_transaction`` from this module; ``operation_span`` and
+``APIErrorHandler`` pick it up from here when no transaction is passed explicitly.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+import sentry_sdk
+
+_current_transaction: ContextVar[Optional[Any]] = ContextVar("current_transaction", default=None)
+
+
+def get_current_transaction():
+    """Transaction of the request or job running in this context, if any."""
+    return _current_transaction.get()
+
+
+def start_transaction(op: str, name: str, **kwargs):
+    """Start a Sentry transaction and make it the current transaction of this context."""
+    transaction = sentry_sdk.start_transaction(op=op, name=name, **kwargs)
+    _current_transaction.set(transaction)
+    return transaction
+
+
+def finish_transaction(transaction):
+    """Finish a transaction and clear it from this context if it is still the current one."""
+    if transaction is None:
+        return
+    if _current_transaction.get() is transaction:
+        _current_transaction.set(None)
+    transaction.finish()
+
+
+@contextmanager
+def traced_transaction(op: str, name: str, **kwargs):
+    """Run a block inside a new current transaction, restoring the previous one afterwards."""
+    transaction = sentry_sdk.start_transaction(op=op, name=name, **kwargs)
+    token = _current_transaction.set(transaction)
+    try:
+        yield transaction
+    finally:
+        _current_transaction.reset(token)
+        transaction.finish()
+
+
+class ContextLocal:
+    """
+    Descriptor for a per-instance attribute whose value is local to the current context.
+
+    Assigning it in one request thread does not change what other threads see; reads fall back to
+    the value given at construction time (or ``default``) when nothing was assigned in this context.
+    The per-instance ``ContextVar`` is created by ``set_default``, or under a lock on first use, so
+    concurrent first accesses cannot each create their own variable and lose an assignment.
+    """
+
+    def __init__(self, default=None):
+        self.default = default
+        self.name = None
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def _var(self, instance) -> ContextVar:
+        key = f"_{self.name}_var"
+        var = instance.__dict__.get(key)
+        if var is None:
+            with self._lock:
+                var = instance.__dict__.get(key)
+                if var is None:
+                    var = ContextVar(f"{type(instance).__name__}.{self.name}.{id(instance)}")
+                    instance.__dict__[key] = var
+        return var
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self._var(instance).get(instance.__dict__.get(f"_{self.name}_default", self.default))
+
+    def __set__(self, instance, value):
+        self._var(instance).set(value)
+
+    def set_default(self, instance, value):
+        """Value seen in contexts that never assigned the attribute."""
+        instance.__dict__[f"_{self.name}_default"] = value
+        self._var(instance)
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Offline load test for a Jeopardy game night.
+
+Drives the real GameCog, GameSession and QuestionPost code against fake Discord objects: a guild
+full of members, channels, roles and messages whose REST calls take a configurable latency and
+are held to Discord-like rate limits (a call over a limit is counted as a rate-limit hit and waits
+for the bucket to reset, like the Discord client does). Players click the Buzz In button as a
+stream of interactions, each delivered to the bot after a random gateway delay and stamped with a
+snowflake id for the time it was clicked.
+
+Reported: interaction-to-ack latency, buzz outcomes (one winner per round, earliest click wins),
+REST calls per kind, rate-limit hits, render and setup statistics and event-loop lag percentiles.
+With --api, threads also poll the /api/bot/* endpoints through the Flask test client while the game
+runs (this imports the app, so the usual environment variables must be set).
+
+Nothing connects to Discord or needs a bot token.
+
+Usage:
+    python scripts/load_test_game.py                          # 200 players, 10 questions
+    python scripts/load_test_game.py --players 400 --spread 0.2
+    python scripts/load_test_game.py --api --json report.json
+"""
+
+import os
+import sys
+import argparse
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.bot.discord_modules.buzzer import DISCORD_EPOCH_MS
+from modules.bot.discord_modules.cogs.GameCog import GameCog
+from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
+from modules.bot.discord_modules.dispatcher import BotDispatcher
+from modules.bot.discord_modules.ratelimit import RateLimitBucket
+
+logger = logging.getLogger(__name__)
+
+# Requests allowed per window for each fake route, and the global limit. These approximate what
+# Discord enforces; adjust them to what production logs show.
+ROUTE_LIMITS = {
+    "messages": (5, 5.0),   # per channel: sends, edits and reactions
+    "members": (10, 1.0),   # per guild: role changes and voice moves
+    "guild": (5, 1.0),      # per guild: creating and deleting channels and roles
+}
+GLOBAL_LIMIT = (50, 1.0)
+# Discord fails an interaction that is not acknowledged within this many seconds
+ACK_DEADLINE = 3.0
+
+
+def percentiles(values, points=(50, 90, 99)):
+    """Nearest-rank percentiles (and the max) of a list of numbers, or None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    result = {f"p{point}": ordered[min(len(ordered) - 1, max(0, round(point / 100 * len(ordered)) - 1))]
+              for point in points}
+    result["max"] = ordered[-1]
+    return result
+
+
+def _ms(stats):
+    return {key: round(value * 1000, 1) for key, value in stats.items()} if stats else None
+
+
+class FakeDiscord:
+    """
+    The REST side of the fake gateway: every call sleeps for the configured latency after passing
+    the global and route rate limits, and is counted by kind.
+    """
+
+    def __init__(self, latency=0.08, jitter=0.04, rng=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.calls = Counter()
+        self.rate_limit_hits = Counter()
+        self.rate_limit_wait = 0.0
+        self._global = RateLimitBucket(*GLOBAL_LIMIT)
+        self._routes = {}
+        self._ids = 0
+
+    def snowflake(self, at=None) -> int:
+        """A unique snowflake for the wall-clock time ``at`` (now by default)."""
+        self._ids += 1
+        created_ms = int((time.time() if at is None else at) * 1000)
+        return ((created_ms - DISCORD_EPOCH_MS) << 22) | (self._ids & 0x3FFFFF)
+
+    async def request(self, kind, route=None, scope=None):
+        """
+        Run one REST call of ``kind`` on the rate-limit ``route`` of ``scope`` (a guild or channel id).
+        Calls without a route are interaction responses, which the global limit does not apply to.
+        """
+        self.calls[kind] += 1
+        buckets = []
+        if route is not None:
+            key = (route, scope)
+            if key not in self._routes:
+                self._routes[key] = RateLimitBucket(*ROUTE_LIMITS[route])
+            buckets = [self._global, self._routes[key]]
+        limited = False
+        while buckets:
+            wait = max(bucket.delay() for bucket in buckets)
+            if wait <= 0:
+                break
+            # Discord answers 429 and the client sleeps for retry_after before retrying
+            if not limited:
+                limited = True
+                self.rate_limit_hits[route] += 1
+            self.rate_limit_wait += wait
+            await asyncio.sleep(wait)
+        for bucket in buckets:
+            bucket.consume()
+        await asyncio.sleep(max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter)))
+
+
+class FakeRole:
+    def __init__(self, api, guild, name):
+        self.api = api
+        self.guild = guild
+        self.id = api.snowflake()
+        self.name = name
+
+    async def delete(self):
+        await self.api.request("delete_role", "guild", self.guild.id)
+        self.guild.objects.pop(self.id, None)
+
+
+class FakeMessage:
+    def __init__(self, api, channel, embed=None, view=None):
+        self.api = api
+        self.channel = channel
+        self.id = api.snowflake()
+        self.embed = embed
+        self.view = view
+
+    async def edit(self, embed=None, view=None, **kwargs):
+        await self.api.request("edit_message", "messages", self.channel.id)
+        self.embed = embed or self.embed
+        self.view = view or self.view
+        return self
+
+    async def add_reaction(self, emoji):
+        await self.api.request("add_reaction", "messages", self.channel.id)
+
+
+class FakeChannel:
+    """A text, voice or stage channel, or a category."""
+
+    def __init__(self, api, guild, name):
+        self.api = api
+        self.guild = guild
+        self.id = api.snowflake()
+        self.name = name
+        self.messages = {}
+
+    async def send(self, content=None, embed=None, view=None, **kwargs):
+        await self.api.request("send_message", "messages", self.id)
+        message = FakeMessage(self.api, self, embed, view)
+        self.messages[message.id] = message
+        return message
+
+    async def fetch_message(self, message_id):
+        await self.api.request("fetch_message", "messages", self.id)
+        return self.messages[message_id]
+
+    async def edit(self, **kwargs):
+        await self.api.request("edit_channel", "guild", self.guild.id)
+
+    async def delete(self):
+        await self.api.request("delete_channel", "guild", self.guild.id)
+        self.guild.objects.pop(self.id, None)
+
+
+class FakeMember:
+    def __init__(self, api, guild, name):
+        self.api = api
+        self.guild = guild
+        self.id = api.snowflake()
+        self.name = name
+        self.roles = []
+
+    def __str__(self):
+        return self.name
+
+    async def add_roles(self, *roles):
+        await self.api.request("add_roles", "members", self.guild.id)
+        self.roles.extend(roles)
+
+    async def move_to(self, channel):
+        await self.api.request("move_member", "members", self.guild.id)
+
+    async def request_to_speak(self):
+        await self.api.request("request_to_speak", "members", self.guild.id)
+
+
+class FakeGuild:
+    def __init__(self, api, players):
+        self.api = api
+        self.id = api.snowflake()
+        self.name = "Load Test Server"
+        self.objects = {}
+        self.default_role = FakeRole(api, self, "@everyone")
+        self.members = {}
+        for number in range(players):
+            member = FakeMember(api, self, f"player{number}")
+            self.members[member.id] = member
+
+    async def _create(self, factory, kind, name):
+        await self.api.request(kind, "guild", self.id)
+        created = factory(self.api, self, name)
+        self.objects[created.id] = created
+        return created
+
+    async def create_role(self, name=None, **kwargs):
+        return await self._create(FakeRole, "create_role", name)
+
+    async def create_category(self, name, **kwargs):
+        return await self._create(FakeChannel, "create_channel", name)
+
+    async def create_text_channel(self, name, **kwargs):
+        return await self._create(FakeChannel, "create_channel", name)
+
+    async def create_voice_channel(self, name, **kwargs):
+        return await self._create(FakeChannel, "create_channel", name)
+
+    async def create_stage_channel(self, name, **kwargs):
+        return await self._create(FakeChannel, "create_channel", name)
+
+    def get_channel(self, channel_id):
+        return self.objects.get(channel_id)
+
+    def get_role(self, role_id):
+        return self.objects.get(role_id)
+
+    def get_member(self, member_id):
+        return self.members.get(member_id)
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def defer(self, **kwargs):
+        self.interaction.acked_at = asyncio.get_running_loop().time()
+        await self.interaction.api.request("interaction_ack")
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, ephemeral=False, **kwargs):
+        await self.interaction.api.request("followup")
+        self.interaction.replies.append(content)
+
+
+class FakeInteraction:
+    """A Buzz In click, as delivered to the bot."""
+
+    def __init__(self, api, user, message, clicked_at):
+        self.api = api
+        # Discord stamps the interaction when the click reaches it
+        self.id = api.snowflake(clicked_at)
+        self.user = user
+        self.message = message
+        self.clicked_at = clicked_at
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.delivered_at = None
+        self.acked_at = None
+        self.finished_at = None
+        self.replies = []
+
+    async def edit_original_response(self, view=None, **kwargs):
+        await self.api.request("edit_original_response")
+
+
+class FakeBot:
+    """The parts of the bot GameCog and the API use."""
+
+    def __init__(self, guilds):
+        self.guilds = guilds
+        self.cogs = {}
+        self.dispatcher = None
+
+    def is_ready(self):
+        return True
+
+    def get_guild(self, guild_id):
+        return next((guild for guild in self.guilds if guild.id == guild_id), None)
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    def execute(self, cog_name, command, *args, **kwargs):
+        # HelperCog (reaction listeners) is not part of the simulation
+        cog = self.cogs.get(cog_name)
+        return getattr(cog, command)(*args, **kwargs) if cog else None
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a task that sleeps for ``interval``."""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+
+class ApiPoller:
+    """Threads that poll the game endpoints through the Flask test client."""
+
+    ENDPOINTS = ("/api/bot/getactivegamestate", "/api/bot/getactivegameprogress", "/api/bot/activesessions")
+
+    def __init__(self, app, clients=4, interval=0.05):
+        self.app = app
+        self.clients = clients
+        self.interval = interval
+        self.latencies = defaultdict(list)
+        self.statuses = Counter()
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        for number in range(self.clients):
+            thread = threading.Thread(target=self._run, args=(number,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self, number):
+        client = self.app.test_client()
+        endpoint_index = number
+        while not self._stop.is_set():
+            endpoint = self.ENDPOINTS[endpoint_index % len(self.ENDPOINTS)]
+            endpoint_index += 1
+            started = time.perf_counter()
+            status = client.get(endpoint).status_code
+            with self._lock:
+                self.latencies[endpoint].append(time.perf_counter() - started)
+                self.statuses[f"{endpoint} {status}"] += 1
+            self._stop.wait(self.interval)
+
+    def report(self):
+        return {
+            "latency_ms": {endpoint: _ms(percentiles(values)) for endpoint, values in self.latencies.items()},
+            "statuses": dict(self.statuses),
+        }
+
+
+def game_package(teams, categories, per_category):
+    """A game package with generated teams, categories and questions."""
+    names = [f"Category {number + 1}" for number in range(categories)]
+    return {
+        "game": {
+            "name": "Load Test", "description": "Simulated game night",
+            "teams": [f"Team {number + 1}" for number in range(teams)],
+            "categories": names, "per_category": per_category,
+        },
+        "questions": {
+            name: [
+                {"question": f"{name} question {value}", "answer": "answer", "value": value}
+                for value in (100 * (number + 1) for number in range(per_category))
+            ]
+            for name in names
+        },
+    }
+
+
+class GameNightSimulation:
+    """
+    Plays a game night on the fake gateway and collects the measurements.
+
+    Args:
+        players (int): Members in the guild; all of them enroll.
+        teams (int): Number of teams.
+        questions (int): Questions to reveal.
+        click_rate (float): Share of players who buzz on each round.
+        reaction_time (float): Seconds after the question is posted before the first click.
+        spread (float): Seconds over which the clicks of a round are spread.
+        gateway_delay (tuple): Min and max seconds between a click and the bot receiving it.
+        wrong_rate (float): Chance the buzzing team answers wrong and the question is shown again.
+        latency (float): Seconds each REST call takes, +- ``jitter``.
+        seed (int): Seed for reproducible runs.
+    """
+
+    def __init__(self, players=200, teams=8, questions=10, click_rate=0.6, reaction_time=0.3, spread=0.5,
+                 gateway_delay=(0.02, 0.25), wrong_rate=0.3, latency=0.08, jitter=0.04, seed=None):
+        self.players = players
+        self.teams = teams
+        self.questions = questions
+        self.click_rate = click_rate
+        self.reaction_time = reaction_time
+        self.spread = spread
+        self.gateway_delay = gateway_delay
+        self.wrong_rate = wrong_rate
+        self.rng = random.Random(seed)
+        self.api = FakeDiscord(latency, jitter, random.Random(seed))
+        self.guild = FakeGuild(self.api, players)
+        self.bot = FakeBot([self.guild])
+        self.cog = GameCog(self.bot)
+        self.bot.cogs["GameCog"] = self.cog
+        self.interactions = []
+        self.rounds = []
+        self.timings = {}
+
+    async def setup(self):
+        """Sets, announces and starts the game with every member enrolled."""
+        self.bot.dispatcher = BotDispatcher(asyncio.get_running_loop())
+        categories = max(1, -(-self.questions // 5))
+        game = JeopardyGame(game_package(self.teams, categories, 5))
+        guild_id = self.guild.id
+        await self.cog.run(guild_id, "set_game", game, "Friday", "7pm")
+        started = time.perf_counter()
+        await self.cog.run(guild_id, "setup_game")
+        self.timings["setup_game"] = time.perf_counter() - started
+        for member in self.guild.members.values():
+            self.cog.add_member(member)
+        started = time.perf_counter()
+        await self.cog.run(guild_id, "start_game")
+        self.timings["start_game"] = time.perf_counter() - started
+
+    async def play(self):
+        """Reveals each question, streams the clicks and awards the winning team."""
+        session = self.cog.get_session(self.guild.id)
+        for question in session.game.questions[:self.questions]:
+            await self.cog.run(self.guild.id, "show_question", question.id)
+            for attempt in range(self.teams):
+                winner = await self._buzz_round(session, question.id)
+                if winner is None or self.rng.random() >= self.wrong_rate:
+                    break
+                # Wrong answer: show the question again for the remaining teams
+                await self.cog.run(self.guild.id, "show_question", question.id)
+            await self.cog.run(self.guild.id, "show_answer", question.id)
+            if winner is not None:
+                team = next(team for team in session.game.teams if team.role in winner.user.roles)
+                await self.cog.run(self.guild.id, "award_points", team.name, question.value)
+        await self.cog.run(self.guild.id, "end_game")
+
+    async def _buzz_round(self, session, uuid):
+        loop = asyncio.get_running_loop()
+        post = session.question_post[uuid]
+        message = post["message_id"]
+        button = message.view.children[0]
+        excluded = set(post["rolesAnswered"])
+        clickers = self.rng.sample(list(self.guild.members.values()), int(self.players * self.click_rate))
+
+        now_wall, now_loop = time.time(), loop.time()
+        tasks, interactions = [], []
+        for member in clickers:
+            clicked = self.reaction_time + self.rng.uniform(0, self.spread)
+            interaction = FakeInteraction(self.api, member, message, now_wall + clicked)
+            interactions.append(interaction)
+            tasks.append(self._deliver(interaction, button, now_loop + clicked + self.rng.uniform(*self.gateway_delay)))
+        await asyncio.gather(*tasks)
+        self.interactions.extend(interactions)
+
+        # Every other click is answered with an ephemeral followup
+        winners = [interaction for interaction in interactions if interaction.acked_at and not interaction.replies]
+        eligible = [interaction for interaction in interactions
+                    if not any(role in excluded for role in interaction.user.roles)]
+        winner = winners[0] if len(winners) == 1 else None
+        # Clicks that reach the bot after the buzz window closed cannot win, however early they were
+        window_end = min((interaction.delivered_at for interaction in eligible), default=0) + session.buzzer.window
+        in_window = [interaction for interaction in eligible if interaction.delivered_at <= window_end]
+        earliest = min((interaction.id >> 22 for interaction in in_window), default=None)
+        self.rounds.append({
+            "winners": len(winners),
+            "fair": winner is not None and (winner.id >> 22) == earliest,
+            "late_earlier_click": min((interaction.id >> 22 for interaction in eligible), default=None) != earliest,
+        })
+        return winner
+
+    async def _deliver(self, interaction, button, at):
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(max(0.0, at - loop.time()))
+        interaction.delivered_at = loop.time()
+        try:
+            # The Discord client runs each component callback in its own task
+            await asyncio.create_task(button.callback(interaction))
+        except Exception as e:
+            logger.error(f"Buzz callback failed: {e}")
+            interaction.replies.append(f"error: {e}")
+        interaction.finished_at = loop.time()
+
+    def report(self, started, lag):
+        acks = [interaction.acked_at - interaction.delivered_at
+                for interaction in self.interactions if interaction.acked_at is not None]
+        handled = [interaction.finished_at - interaction.delivered_at for interaction in self.interactions]
+        replies = Counter(reply for interaction in self.interactions for reply in interaction.replies)
+        session = self.cog.sessions.get(self.guild.id)
+        return {
+            "players": self.players,
+            "teams": self.teams,
+            "questions": self.questions,
+            "rounds": len(self.rounds),
+            "interactions": len(self.interactions),
+            "wall_seconds": round(time.perf_counter() - started, 2),
+            "timings_seconds": {name: round(value, 2) for name, value in self.timings.items()},
+            "ack_latency_ms": _ms(percentiles(acks)),
+            "acks_over_deadline": sum(1 for ack in acks if ack > ACK_DEADLINE),
+            "unacked": len(self.interactions) - len(acks),
+            "handling_ms": _ms(percentiles(handled)),
+            "buzz": {
+                "rounds_with_one_winner": sum(1 for round_ in self.rounds if round_["winners"] == 1),
+                "fair_rounds": sum(1 for round_ in self.rounds if round_["fair"]),
+                "rounds_with_late_earlier_click": sum(1 for round_ in self.rounds if round_["late_earlier_click"]),
+                "replies": dict(replies),
+            },
+            "rest_calls": dict(self.api.calls),
+            "rate_limit_hits": dict(self.api.rate_limit_hits),
+            "rate_limit_wait_seconds": round(self.api.rate_limit_wait, 2),
+            "renderer": dict(session.renderer.stats) if session else None,
+            "operations": session.get_progress() if session else None,
+            "loop_lag_ms": _ms(percentiles(lag)),
+        }
+
+
+async def run_simulation(simulation, api_app=None, api_clients=4):
+    """Runs a GameNightSimulation and returns its report (with the API polling report if enabled)."""
+    started = time.perf_counter()
+    monitor = LoopLagMonitor()
+    monitor.start()
+    poller = None
+    await simulation.setup()
+    if api_app is not None:
+        api_app.auth_bot = simulation.bot
+        poller = ApiPoller(api_app, api_clients)
+        poller.start()
+    try:
+        await simulation.play()
+    finally:
+        if poller is not None:
+            # The pollers wait on the bot loop, so stop them off the loop
+            await asyncio.get_running_loop().run_in_executor(None, poller.stop)
+        await monitor.stop()
+    report = simulation.report(started, monitor.samples)
+    if poller is not None:
+        report["api"] = poller.report()
+    simulation.bot.dispatcher.shutdown()
+    return report
+
+
+def print_report(report):
+    print("Game night load test")
+    print("=" * 60)
+    for key in ("players", "teams", "questions", "rounds", "interactions", "wall_seconds"):
+        print(f"{key:<28}{report[key]}")
+    for key in ("timings_seconds", "ack_latency_ms", "handling_ms", "loop_lag_ms", "rest_calls",
+                "rate_limit_hits", "renderer"):
+        print(f"{key:<28}{report[key]}")
+    print(f"{'acks_over_deadline':<28}{report['acks_over_deadline']} (unacked: {report['unacked']})")
+    buzz = report["buzz"]
+    print(f"{'rounds_with_one_winner':<28}{buzz['rounds_with_one_winner']}/{report['rounds']}")
+    print(f"{'fair_rounds':<28}{buzz['fair_rounds']}/{report['rounds']} "
+          f"({buzz['rounds_with_late_earlier_click']} with an earlier click arriving after the window)")
+    print(f"{'replies':<28}{buzz['replies']}")
+    print(f"{'rate_limit_wait_seconds':<28}{report['rate_limit_wait_seconds']}")
+    for name, progress in (report["operations"] or {}).items():
+        print(f"{'operations ' + name:<28}{progress['done'] - progress['failed']}/{progress['total']} "
+              f"in {progress['elapsed_seconds']}s, {progress['retries']} retries")
+    if "api" in report:
+        for endpoint, latency in report["api"]["latency_ms"].items():
+            print(f"{'api ' + endpoint:<44}{latency}")
+        print(f"{'api statuses':<44}{report['api']['statuses']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate a Jeopardy game night on a fake Discord gateway.")
+    parser.add_argument("--players", type=int, default=200, help="Members in the guild (all enroll)")
+    parser.add_argument("--teams", type=int, default=8, help="Number of teams")
+    parser.add_argument("--questions", type=int, default=10, help="Questions to reveal")
+    parser.add_argument("--click-rate", type=float, default=0.6, help="Share of players who buzz each round")
+    parser.add_argument("--spread", type=float, default=0.5, help="Seconds over which a round's clicks arrive")
+    parser.add_argument("--wrong-rate", type=float, default=0.3, help="Chance an answer is wrong and the question reopens")
+    parser.add_argument("--latency", type=float, default=0.08, help="Seconds per Discord REST call")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible run")
+    parser.add_argument("--api", action="store_true", help="Also poll the /api/bot endpoints (imports the app)")
+    parser.add_argument("--api-clients", type=int, default=4, help="Polling threads with --api")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report to a JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    app = None
+    if args.api:
+        from main import app
+    # The game logs every action at INFO; keep the report readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    simulation = GameNightSimulation(
+        players=args.players, teams=args.teams, questions=args.questions, click_rate=args.click_rate,
+        spread=args.spread, wrong_rate=args.wrong_rate, latency=args.latency, seed=args.seed,
+    )
+    result = asyncio.run(run_simulation(simulation, app, args.api_clients))
+    print_report(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"Report written to {args.json}")
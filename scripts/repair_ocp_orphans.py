@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Maintenance script to re-attach OCP points records whose officer no longer exists.
+
+The OCP events feed used to repair these while serving GET requests; it is now read-only and
+shows them as "Unknown Officer" until this script is run. A record is re-attached when the part of
+its event name before " - " matches exactly one officer of the same organization (by normalized name).
+
+Usage:
+    python scripts/repair_ocp_orphans.py           # report what would change
+    python scripts/repair_ocp_orphans.py --apply   # write the changes
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.utils.db import DBConnect
+from modules.ocp.models import Officer, OfficerPoints
+from modules.ocp.utils import normalize_name
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def repair_ocp_orphans(apply: bool = False, db_url: str = "sqlite:///./data/user.db"):
+    """Find points records without an officer and re-attach those that can be matched unambiguously."""
+    db_connect = DBConnect(db_url)
+    db = db_connect.SessionLocal()
+    try:
+        orphans = db.query(OfficerPoints).outerjoin(
+            Officer, Officer.uuid == OfficerPoints.officer_uuid
+        ).filter(Officer.uuid == None).all()
+        logger.info(f"Found {len(orphans)} points records without an officer")
+        if not orphans:
+            return {"orphans": 0, "repaired": 0}
+
+        # Index officers once per organization by normalized name; ambiguous names map to None
+        officers_by_name = {}
+        for officer in db.query(Officer).filter(Officer.organization_id.in_({p.organization_id for p in orphans})):
+            key = (officer.organization_id, normalize_name(officer.name))
+            officers_by_name[key] = None if key in officers_by_name else officer
+
+        repaired = 0
+        for points in orphans:
+            possible_name = points.event.split(" - ")[0] if points.event and " - " in points.event else None
+            officer = officers_by_name.get((points.organization_id, normalize_name(possible_name))) if possible_name else None
+            if officer is None:
+                logger.info(f"Points record {points.id} ({points.event!r}): no unambiguous officer match")
+                continue
+            logger.info(f"Points record {points.id} ({points.event!r}) -> {officer.name} ({officer.uuid})")
+            if apply:
+                points.officer_uuid = officer.uuid
+            repaired += 1
+
+        if apply:
+            db.commit()
+            logger.info(f"Re-attached {repaired} of {len(orphans)} orphaned points records")
+        else:
+            logger.info(f"Dry run: {repaired} of {len(orphans)} orphaned points records can be re-attached (use --apply)")
+        return {"orphans": len(orphans), "repaired": repaired}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error repairing orphaned OCP points: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-attach OCP points records whose officer no longer exists.")
+    parser.add_argument("--apply", action="store_true", help="Write the changes instead of only reporting them")
+    args = parser.parse_args()
+    repair_ocp_orphans(apply=args.apply)
@@ -35,8 +35,8 @@ CORS(app,
      }},
 )
 
-# Initialize configuration
-config = Config()
+# Initialize configuration (TESTING=true uses the test defaults, as the test runner does)
+config = Config(testing=os.environ.get("TESTING", "false").lower() == "true")
 
 # Initialize Sentry (ensure SENTRY_DSN is set in your environment)
 if config.SENTRY_DSN:
@@ -115,14 +115,19 @@ def create_auth_bot(loop: asyncio.AbstractEventLoop) -> BotFork:
     intents = discord.Intents.default()
     intents.members = True
     intents.guilds = True
+    # Enrollment reactions are handled from raw guild reaction events; DM reactions are never used
+    intents.guild_reactions = True
+    intents.dm_reactions = False
 
     # Use BotFork for the auth_bot_instance
     auth_bot_instance = BotFork(intents=intents, loop=loop) 
     try:
         from modules.bot.discord_modules.cogs.HelperCog import HelperCog
         from modules.bot.discord_modules.cogs.GameCog import GameCog
+        from modules.bot.game_store import GameStore
         auth_bot_instance.add_cog(HelperCog(auth_bot_instance))
-        auth_bot_instance.add_cog(GameCog(auth_bot_instance))
+        # The active game is persisted so it can be resumed after a restart
+        auth_bot_instance.add_cog(GameCog(auth_bot_instance, store=GameStore(db_connect)))
         logger.info("Auth bot cogs (HelperCog, GameCog) registered with BotFork instance.")
     except Exception as e:
         logger.error(f"Error registering auth bot cogs: {e}", exc_info=True)
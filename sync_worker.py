@@ -0,0 +1,60 @@
+"""
+Standalone Notion sync worker.
+
+Runs the scheduled Notion -> Google Calendar / OCP sync outside the API process so deploys and
+restarts of the API do not cut syncs short. Run the API with SYNC_IN_PROCESS=false when using it.
+
+Usage:
+    python sync_worker.py           # resume interrupted runs, then sync on NOTION_SYNC_INTERVAL_MINUTES
+    python sync_worker.py --once    # resume interrupted runs, run one full sync and exit
+"""
+import argparse
+import sys
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+from shared import config, logger, db_connect
+from modules.sync.service import SyncJobService
+
+
+def run_sync(job_service: SyncJobService, trigger: str = "scheduled"):
+    """Resume runs interrupted by a previous worker, then run a full sync."""
+    try:
+        for result in job_service.resume_interrupted_runs():
+            logger.info(f"Resumed sync run finished with status {result.get('status')}")
+        result = job_service.run(trigger=trigger)
+        logger.info(f"Sync run finished with status {result.get('status')}: {result.get('run', {}).get('summary')}")
+        return result
+    except Exception as e:
+        logger.error(f"Error during worker sync: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Notion sync outside the API process.")
+    parser.add_argument("--once", action="store_true", help="Run a single sync and exit")
+    args = parser.parse_args()
+
+    # Make sure the sync tables exist when the worker starts before the API
+    db_connect.check_and_create_tables()
+    job_service = SyncJobService(logger)
+
+    if args.once:
+        result = run_sync(job_service, trigger="manual")
+        return 0 if result.get("status") in ("success", "partial_success") else 1
+
+    scheduler = BlockingScheduler()
+    scheduler.add_job(run_sync, 'interval', args=[job_service], minutes=config.NOTION_SYNC_INTERVAL_MINUTES,
+                      id='worker_notion_sync_job', max_instances=1, coalesce=True)
+    logger.info(f"Sync worker {job_service.worker_id} started; syncing every {config.NOTION_SYNC_INTERVAL_MINUTES} minutes")
+    # Pick up anything a previous worker left unfinished right away instead of waiting a full interval
+    run_sync(job_service)
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Sync worker stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+import os
+
+# Modules that import ``shared`` need the test configuration defaults (CI sets this as well)
+os.environ.setdefault("TESTING", "true")
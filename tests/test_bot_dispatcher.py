@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the bot dispatcher used by the game API.
+Runs an event loop in a background thread, like the bot's, and checks results, timeouts and back-pressure.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.dispatcher import BotBusy, BotCallTimeout, BotDispatcher, BotUnavailable
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def test_runs_coroutines_and_functions_on_the_loop(loop):
+    dispatcher = BotDispatcher(loop)
+
+    async def add(a, b):
+        assert asyncio.get_running_loop() is loop
+        return a + b
+
+    assert dispatcher.run(add, 2, 3) == 5
+    assert dispatcher.run(lambda: threading.current_thread().name) != threading.current_thread().name
+    with pytest.raises(ZeroDivisionError):
+        dispatcher.run(lambda: 1 / 0)
+    assert dispatcher.pending == 0
+
+
+def test_timeout_cancels_and_full_queue_is_rejected(loop):
+    dispatcher = BotDispatcher(loop, max_pending=1)
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(BotCallTimeout):
+        dispatcher.run(hang, timeout=0.1)
+    assert cancelled.wait(2)
+
+    future = dispatcher.submit(hang, timeout=60)
+    with pytest.raises(BotBusy):
+        dispatcher.submit(hang)
+    dispatcher.shutdown()
+    with pytest.raises(BotUnavailable):
+        dispatcher.submit(hang)
+    assert future.cancelled()
+
+
+def test_stopped_loop_is_unavailable():
+    dispatcher = BotDispatcher(asyncio.new_event_loop())
+    with pytest.raises(BotUnavailable):
+        dispatcher.run(lambda: None)
+    dispatcher.loop.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the buzz-in arbiter.
+Checks that the earliest interaction wins regardless of arrival order and that teams that
+already answered cannot buzz again.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.buzzer import BuzzArbiter, DISCORD_EPOCH_MS, snowflake_time_ms
+
+
+def snowflake(ms_after_epoch):
+    return ms_after_epoch << 22
+
+
+def test_snowflake_time():
+    assert snowflake_time_ms(snowflake(1234)) == DISCORD_EPOCH_MS + 1234
+
+
+def test_earliest_interaction_wins_over_arrival_order():
+    async def scenario():
+        arbiter = BuzzArbiter(window=0.05)
+        arbiter.open("q1")
+        # The later click is handled first
+        late = asyncio.create_task(arbiter.buzz("q1", 1, "red", snowflake(2000)))
+        await asyncio.sleep(0)
+        early = asyncio.create_task(arbiter.buzz("q1", 2, "blue", snowflake(1990)))
+        return await late, await early, arbiter
+
+    late, early, arbiter = asyncio.run(scenario())
+    assert early.won and early.winner.member_id == 2
+    assert late.status == "lost" and late.winner.member_id == 2
+    assert arbiter.is_excluded("q1", "blue")
+
+
+def test_closed_after_winner_and_reopen_keeps_exclusions():
+    async def scenario():
+        arbiter = BuzzArbiter(window=0.01)
+        arbiter.open("q1")
+        first = await arbiter.buzz("q1", 1, "red", snowflake(10))
+        after = await arbiter.buzz("q1", 2, "blue", snowflake(20))
+        arbiter.open("q1", ["red"])
+        excluded = await arbiter.buzz("q1", 3, "red", snowflake(30))
+        second = await arbiter.buzz("q1", 2, "blue", snowflake(40))
+        return first, after, excluded, second
+
+    first, after, excluded, second = asyncio.run(scenario())
+    assert first.won
+    assert after.status == "closed"
+    assert excluded.status == "excluded"
+    assert second.won
+
+
+def test_close_during_window_reports_closed():
+    async def scenario():
+        arbiter = BuzzArbiter(window=1)
+        arbiter.open("q1")
+        pending = asyncio.create_task(arbiter.buzz("q1", 1, "red", snowflake(10)))
+        await asyncio.sleep(0)
+        arbiter.close("q1")
+        return await pending, await arbiter.buzz("q1", 2, "blue", snowflake(20))
+
+    pending, unknown = asyncio.run(scenario())
+    assert pending.status == "closed"
+    assert unknown.status == "closed"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script for the calendar events read model.
+Checks date-range parsing and filtering, the ETag / If-None-Match handling of the public events
+endpoint and that a stale snapshot is refreshed by a single background job.
+"""
+
+import sys
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask import Flask
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.organizations.models import Organization
+from modules.calendar import api as calendar_api
+from modules.calendar.read_model import CalendarReadModel, filter_events_by_range, parse_range_boundary
+from modules.merch.models import Order  # noqa: F401 - resolves the User.orders relationship
+
+UTC = timezone.utc
+
+EVENTS = [
+    {"id": "multi-day", "start": "2025-03-05", "end": "2025-03-09"},
+    {"id": "evening", "start": "2025-03-10T18:00:00-07:00", "end": "2025-03-10T20:00:00-07:00"},
+    {"id": "all-day", "start": "2025-03-11", "end": "2025-03-12"},
+    {"id": "undated", "start": "TBD"},
+]
+
+
+def ids(events):
+    return [event["id"] for event in events]
+
+
+def test_parse_range_boundary_dates_and_datetimes():
+    """Dates are local midnights (end dates inclusive), ISO datetimes keep their offset."""
+    assert parse_range_boundary(None) is None
+    assert parse_range_boundary("") is None
+    # The test configuration uses America/Phoenix (UTC-7 all year)
+    assert parse_range_boundary("2025-03-11") == datetime(2025, 3, 11, 7, tzinfo=UTC)
+    assert parse_range_boundary("2025-03-11", is_end=True) == datetime(2025, 3, 12, 7, tzinfo=UTC)
+    assert parse_range_boundary(" 2025-03-11T10:00:00Z ", is_end=True) == datetime(2025, 3, 11, 10, tzinfo=UTC)
+    assert parse_range_boundary("2025-03-11T10:00:00") == datetime(2025, 3, 11, 17, tzinfo=UTC)
+
+
+@pytest.mark.parametrize("value", ["2025-13-01", "2025/03/11", "tomorrow", "2025-03-11T25:00", "11-03-2025"])
+def test_parse_range_boundary_rejects_bad_input(value):
+    with pytest.raises(ValueError):
+        parse_range_boundary(value)
+
+
+def test_filter_events_by_range():
+    """Events overlapping [start, end) are kept; end dates are exclusive and undated events dropped."""
+    assert filter_events_by_range(EVENTS) is EVENTS
+
+    day = (parse_range_boundary("2025-03-11"), parse_range_boundary("2025-03-11", is_end=True))
+    assert ids(filter_events_by_range(EVENTS, *day)) == ["all-day"]
+
+    # The all-day event ends at midnight of the 12th, so it does not overlap the 12th
+    assert ids(filter_events_by_range(EVENTS, parse_range_boundary("2025-03-12"))) == []
+    assert ids(filter_events_by_range(EVENTS, end=parse_range_boundary("2025-03-10"))) == ["multi-day"]
+    assert ids(filter_events_by_range(EVENTS, parse_range_boundary("2025-03-08"),
+                                      parse_range_boundary("2025-03-10", is_end=True))) == ["multi-day", "evening"]
+
+    # A zero-length event at the range start still overlaps it
+    instant = [{"id": "instant", "start": "2025-03-11T00:00:00-07:00"}]
+    assert ids(filter_events_by_range(instant, parse_range_boundary("2025-03-11"))) == ["instant"]
+
+
+class FakeEventsService:
+    """Serves EVENTS the way MultiOrgCalendarService does from a snapshot."""
+
+    def __init__(self):
+        self.snapshot_etag = "snapshot-1"
+        self.calls = []
+
+    def get_organization_events_for_frontend(self, organization_id, parent_transaction=None, start=None, end=None):
+        self.calls.append((organization_id, start, end))
+        events = filter_events_by_range(EVENTS, start, end)
+        return {"status": "success", "organization_id": organization_id, "events": events,
+                "total_events": len(events), "etag": self.snapshot_etag}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    db_connect = DBConnect(f"sqlite:///{tmp_path / 'calendar.db'}")
+    session = db_connect.SessionLocal()
+    session.add(Organization(id=1, name="SoDA", prefix="soda", guild_id="1", notion_database_id="db-1"))
+    session.add(Organization(id=2, name="No Notion", prefix="bare", guild_id="2"))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(calendar_api, "db_connect", db_connect)
+
+    app = Flask(__name__)
+    app.register_blueprint(calendar_api.calendar_blueprint, url_prefix="/api/calendar")
+    app.multi_org_calendar_service = FakeEventsService()
+    return app.test_client()
+
+
+def test_events_endpoint_etag_depends_on_range(client):
+    full = client.get("/api/calendar/soda/events")
+    day = client.get("/api/calendar/soda/events?start=2025-03-11&end=2025-03-11")
+    other_day = client.get("/api/calendar/soda/events?start=2025-03-10&end=2025-03-10")
+
+    assert full.status_code == day.status_code == other_day.status_code == 200
+    assert ids(day.get_json()["events"]) == ["all-day"]
+    assert ids(other_day.get_json()["events"]) == ["evening"]
+    assert len({full.headers["ETag"], day.headers["ETag"], other_day.headers["ETag"]}) == 3
+    assert client.get("/api/calendar/soda/events?start=2025-03-11&end=2025-03-11").headers["ETag"] == day.headers["ETag"]
+
+    # A new snapshot changes every range's ETag
+    client.application.multi_org_calendar_service.snapshot_etag = "snapshot-2"
+    assert client.get("/api/calendar/soda/events").headers["ETag"] != full.headers["ETag"]
+
+
+def test_events_endpoint_if_none_match(client):
+    first = client.get("/api/calendar/soda/events?start=2025-03-11")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/api/calendar/soda/events?start=2025-03-11", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    # The same ETag does not match a different range
+    other = client.get("/api/calendar/soda/events?start=2025-03-12", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_events_endpoint_rejects_bad_range_and_unconfigured_org(client):
+    assert client.get("/api/calendar/soda/events?start=yesterday").status_code == 400
+    assert client.get("/api/calendar/soda/events?end=2025-02-30").status_code == 400
+    assert client.get("/api/calendar/bare/events").status_code == 400
+    assert client.get("/api/calendar/missing/events").status_code == 404
+    assert client.application.multi_org_calendar_service.calls == []
+
+
+def test_stale_snapshot_is_refreshed_once_in_background(tmp_path):
+    started, release, done = threading.Event(), threading.Event(), threading.Event()
+    refreshed = []
+
+    def refresh(organization_id):
+        started.set()
+        release.wait(5)
+        refreshed.append(organization_id)
+        done.set()
+
+    read_model = CalendarReadModel(refresh, fresh_seconds=60)
+    read_model.db_connect = DBConnect(f"sqlite:///{tmp_path / 'calendar.db'}")
+
+    snapshot = read_model.store_snapshot(7, "SoDA", [EVENTS[2], EVENTS[0]])
+    assert [event["id"] for event in read_model.get_snapshot(7)["events"]] == ["multi-day", "all-day"]
+    assert not read_model.is_stale(snapshot)
+    old = dict(snapshot, refreshed_at=(datetime.utcnow() - timedelta(seconds=61)).isoformat())
+    assert read_model.is_stale(old)
+
+    assert read_model.schedule_refresh(7)
+    assert started.wait(5)
+    # Requests arriving while the refresh runs keep the stale copy and do not start another one
+    assert not read_model.schedule_refresh(7)
+    release.set()
+    assert done.wait(5)
+    for _ in range(100):
+        if read_model.schedule_refresh(7):
+            break
+        threading.Event().wait(0.01)
+    else:
+        pytest.fail("refresh flag was not cleared after the refresh finished")
+    assert done.wait(5)
+    assert refreshed[0] == 7
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Test script for the Notion to Google Calendar sync.
+Checks that events are created, updated or skipped through their links, that removed pages are
+deleted, and that reconciliation rebuilds the link index from a full calendar listing only when due.
+Also checks that events before the sync horizon are archived and left alone in Google Calendar.
+"""
+
+import sys
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.calendar import service as calendar_service
+from modules.calendar.models import CalendarArchiveBackfill, CalendarEventArchive, CalendarEventDTO, CalendarEventLink
+from modules.calendar.service import MultiOrgCalendarService
+from modules.merch.models import Order  # noqa: F401 - resolves the User.orders relationship
+
+CALENDAR_ID = "org-calendar"
+HORIZON = datetime(2025, 3, 8, tzinfo=timezone.utc)
+
+
+class FakeCalendarClient:
+    """In-memory stand-in for GoogleCalendarClient that records every API call."""
+
+    def __init__(self):
+        self.events = {}
+        self.calls = []
+        self._next_id = 0
+
+    def add_event(self, event_id, notion_page_id=None, start="2025-03-10T18:00:00-07:00"):
+        event = {"id": event_id, "summary": event_id, "start": {"dateTime": start}}
+        if notion_page_id:
+            event["extendedProperties"] = {"private": {"notionPageId": notion_page_id}}
+        self.events[event_id] = event
+
+    def create_event(self, calendar_id, event_data, notion_page_id, parent_transaction=None):
+        self._next_id += 1
+        event_id = f"gcal-{self._next_id}"
+        self.calls.append(("create", notion_page_id))
+        self.events[event_id] = {**event_data, "id": event_id,
+                                 "extendedProperties": {"private": {"notionPageId": notion_page_id}}}
+        return f"https://calendar.example/{event_id}", event_id
+
+    def update_event(self, calendar_id, event_id, event_data, notion_page_id, parent_transaction=None):
+        self.calls.append(("update", event_id))
+        self.events[event_id].update(event_data)
+        return f"https://calendar.example/{event_id}"
+
+    def batch_delete_events(self, calendar_id, event_ids, description="batch_delete", parent_transaction=None):
+        self.calls.append(("delete", sorted(event_ids)))
+        for event_id in event_ids:
+            self.events.pop(event_id, None)
+        return len(event_ids), 0
+
+    def get_all_events(self, calendar_id, time_min=None, parent_transaction=None):
+        self.calls.append(("list", time_min))
+        return list(self.events.values())
+
+
+def make_event(page_id, summary=None, day=10):
+    return CalendarEventDTO(
+        summary=summary or f"Event {page_id}",
+        start={"dateTime": f"2025-03-{day:02d}T18:00:00-07:00", "timeZone": "America/Phoenix"},
+        end={"dateTime": f"2025-03-{day:02d}T20:00:00-07:00", "timeZone": "America/Phoenix"},
+        notion_page_id=page_id,
+    )
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_service, "_LAST_RECONCILED", {})
+    service = MultiOrgCalendarService()
+    service.db_connect = DBConnect(f"sqlite:///{tmp_path / 'calendar.db'}")
+    service.gcal_client = FakeCalendarClient()
+    return service
+
+
+def sync(service, events, reconcile=False, horizon=None):
+    results = service.update_organization_google_calendar(
+        events, CALENDAR_ID, "notion-db", organization_id=1, reconcile=reconcile, horizon=horizon
+    )
+    return {result["notion_page_id"]: result["status"] for result in results}
+
+
+def links(service):
+    session = service.db_connect.SessionLocal()
+    try:
+        return {link.notion_page_id: link.google_calendar_event_id for link in session.query(CalendarEventLink).all()}
+    finally:
+        session.close()
+
+
+def test_create_update_and_unchanged_skip(service):
+    gcal = service.gcal_client
+    assert sync(service, [make_event("page-a"), make_event("page-b")]) == {"page-a": "created", "page-b": "created"}
+    assert gcal.calls == [("list", None), ("create", "page-a"), ("create", "page-b")]
+    assert links(service) == {"page-a": "gcal-1", "page-b": "gcal-2"}
+
+    gcal.calls.clear()
+    assert sync(service, [make_event("page-a"), make_event("page-b")]) == {"page-a": "unchanged", "page-b": "unchanged"}
+    assert gcal.calls == []
+
+    assert sync(service, [make_event("page-a", summary="Renamed"), make_event("page-b")]) == {
+        "page-a": "updated", "page-b": "unchanged"
+    }
+    assert gcal.calls == [("update", "gcal-1")]
+    assert gcal.events["gcal-1"]["summary"] == "Renamed"
+
+
+def test_deleted_page_removes_its_event(service):
+    gcal = service.gcal_client
+    sync(service, [make_event("page-a"), make_event("page-b")])
+    gcal.calls.clear()
+
+    assert sync(service, [make_event("page-a")]) == {"page-a": "unchanged"}
+    assert gcal.calls == [("delete", ["gcal-2"])]
+    assert links(service) == {"page-a": "gcal-1"}
+    assert set(gcal.events) == {"gcal-1"}
+
+
+def test_empty_calendar_is_not_listed_on_every_run(service):
+    gcal = service.gcal_client
+    assert sync(service, []) == {}
+    assert sync(service, []) == {}
+    assert gcal.calls == [("list", None)]
+
+    # Once the interval has passed the listing is due again
+    calendar_service._LAST_RECONCILED[(1, CALENDAR_ID)] -= calendar_service.RECONCILE_INTERVAL * 2
+    sync(service, [])
+    assert gcal.calls == [("list", None), ("list", None)]
+
+
+def test_reconcile_rebuilds_links_from_the_calendar(service):
+    gcal = service.gcal_client
+    sync(service, [make_event("page-a")])
+    gcal.events.clear()
+    gcal.calls.clear()
+    # The calendar was edited outside the sync: page-a's event was replaced by two copies, an event
+    # of a deleted page is still there, and an unmanaged event must be left alone
+    gcal.add_event("copy-1", "page-a")
+    gcal.add_event("copy-2", "page-a")
+    gcal.add_event("orphan", "page-gone")
+    gcal.add_event("personal")
+
+    assert sync(service, [make_event("page-a"), make_event("page-b")], reconcile=True) == {
+        "page-a": "updated", "page-b": "created"
+    }
+    assert gcal.calls == [("list", None), ("delete", ["copy-2", "orphan"]), ("update", "copy-1"), ("create", "page-b")]
+    assert links(service) == {"page-a": "copy-1", "page-b": "gcal-2"}
+    assert set(gcal.events) == {"copy-1", "personal", "gcal-2"}
+
+    gcal.calls.clear()
+    assert sync(service, [make_event("page-a"), make_event("page-b")]) == {"page-a": "unchanged", "page-b": "unchanged"}
+    assert gcal.calls == []
+
+
+class FakeNotionClient:
+    """Returns raw Notion pages, honouring the ``since`` start-date filter like the real query."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def fetch_events(self, database_id, parent_transaction=None, since=None):
+        self.calls.append(since)
+        return [page for page in self.pages if since is None or page["properties"]["Date"]["date"]["start"][:10] >= since]
+
+
+def notion_page(page_id, day):
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": f"Event {page_id}"}]},
+            "Date": {"type": "date", "date": {"start": f"2025-03-{day:02d}T18:00:00-07:00",
+                                              "end": f"2025-03-{day:02d}T20:00:00-07:00"}},
+        },
+    }
+
+
+def archive(service):
+    session = service.db_connect.SessionLocal()
+    try:
+        return {row.notion_page_id: row.google_calendar_event_id for row in session.query(CalendarEventArchive).all()}
+    finally:
+        session.close()
+
+
+def test_events_before_the_horizon_are_archived_not_deleted(service):
+    gcal = service.gcal_client
+    sync(service, [make_event("old", day=1), make_event("current", day=20)])
+    gcal.calls.clear()
+
+    # Once the horizon moves past "old" it is no longer part of the Notion query
+    assert sync(service, [make_event("current", day=20)], horizon=HORIZON) == {"current": "unchanged"}
+    assert gcal.calls == []
+    assert links(service) == {"current": "gcal-2"}
+    assert archive(service) == {"old": "gcal-1"}
+    assert set(gcal.events) == {"gcal-1", "gcal-2"}
+
+    # A page that is actually gone is still deleted
+    assert sync(service, [], horizon=HORIZON) == {}
+    assert gcal.calls == [("delete", ["gcal-2"])]
+    assert archive(service) == {"old": "gcal-1"}
+
+
+def test_frozen_events_are_not_touched_when_reconciling(service):
+    gcal = service.gcal_client
+    gcal.add_event("frozen", "page-old", start="2025-03-01T18:00:00-07:00")
+    gcal.add_event("frozen-copy", "page-old", start="2025-03-01T18:00:00-07:00")
+    gcal.add_event("orphan", "page-gone", start="2025-03-20T18:00:00-07:00")
+
+    assert sync(service, [make_event("page-new", day=20)], reconcile=True, horizon=HORIZON) == {"page-new": "created"}
+    assert gcal.calls == [("list", HORIZON.isoformat()), ("delete", ["orphan"]), ("create", "page-new")]
+    assert {"frozen", "frozen-copy"} <= set(gcal.events)
+    assert "page-old" not in links(service)
+
+
+def test_archive_backfill_is_idempotent(service):
+    org = SimpleNamespace(id=1, notion_database_id="notion-db")
+    service.notion_client = FakeNotionClient([notion_page("old-1", 1), notion_page("old-2", 5), notion_page("current", 20)])
+
+    current = service._fetch_published_events(org, HORIZON)
+    assert [event.notion_page_id for event in current] == ["current"]
+    assert archive(service) == {"old-1": None, "old-2": None}
+
+    # Later fetches only ask Notion for events inside the horizon
+    current = service._fetch_published_events(org, HORIZON)
+    assert [event.notion_page_id for event in current] == ["current"]
+    assert service.notion_client.calls == [None, "2025-03-08"]
+
+    # A repeated backfill keeps one entry per page and the Google Calendar IDs already archived
+    sync(service, [make_event("old-1", day=1)])
+    sync(service, [], horizon=HORIZON)
+    service._backfill_archive(1, [make_event("old-1", summary="Renamed", day=1), make_event("old-2", day=5)])
+    assert archive(service) == {"old-1": "gcal-1", "old-2": None}
+    session = service.db_connect.SessionLocal()
+    try:
+        assert session.query(CalendarEventArchive).count() == 2
+        assert session.query(CalendarEventArchive).filter_by(notion_page_id="old-1").one().event["title"] == "Renamed"
+        assert session.query(CalendarArchiveBackfill).one().archived_count == 2
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-organization Notion webhook.
+Checks the subscription verification handshake and that notifications are only queued when they
+carry the configured secret or a valid signature.
+"""
+
+import sys
+import os
+import hashlib
+import hmac
+import json
+import logging
+
+import pytest
+from flask import Flask
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.organizations.models import Organization
+from modules.calendar import api as calendar_api
+from modules.merch.models import Order  # noqa: F401 - resolves the User.orders relationship
+
+SECRET = "secret_notion_token"
+URL = "/api/calendar/soda/notion-webhook"
+
+
+class FakeSyncService:
+    def __init__(self):
+        self.queued = []
+
+    def queue_page_changes(self, organization_id, page_ids):
+        self.queued.append((organization_id, list(page_ids)))
+        return len(page_ids)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    db_connect = DBConnect(f"sqlite:///{tmp_path / 'calendar.db'}")
+    session = db_connect.SessionLocal()
+    session.add(Organization(id=1, name="SoDA", prefix="soda", guild_id="1", notion_database_id="db-1"))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(calendar_api, "db_connect", db_connect)
+    monkeypatch.setattr(calendar_api.config, "NOTION_WEBHOOK_SECRET", None)
+
+    app = Flask(__name__)
+    app.register_blueprint(calendar_api.calendar_blueprint, url_prefix="/api/calendar")
+    app.unified_sync_service = FakeSyncService()
+    return app.test_client()
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def test_verification_handshake_before_secret_is_configured(client, caplog):
+    """The verification token is answered and logged even though no secret is set yet."""
+    with caplog.at_level(logging.WARNING):
+        response = client.post(URL, json={"verification_token": SECRET})
+    assert response.status_code == 200
+    assert any(SECRET in record.getMessage() and record.levelno == logging.WARNING for record in caplog.records)
+
+    # Ordinary notifications stay disabled until the token is configured
+    assert client.post(URL, json={"entity": {"type": "page", "id": "page-1"}}).status_code == 503
+    assert client.application.unified_sync_service.queued == []
+
+
+def test_signed_notification_is_queued(client, monkeypatch):
+    monkeypatch.setattr(calendar_api.config, "NOTION_WEBHOOK_SECRET", SECRET)
+    body = json.dumps({"type": "page.properties_updated", "entity": {"type": "page", "id": "page-1"}}).encode()
+
+    response = client.post(URL, data=body, content_type="application/json",
+                           headers={"X-Notion-Signature": sign(body)})
+    assert response.status_code == 202
+    assert response.get_json()["queued_pages"] == ["page-1"]
+
+    response = client.post(URL, json={"page_ids": ["page-2", "page-2"]}, headers={"X-Webhook-Secret": SECRET})
+    assert response.status_code == 202
+    assert client.application.unified_sync_service.queued == [(1, ["page-1"]), (1, ["page-2"])]
+
+
+def test_bad_signatures_are_rejected(client, monkeypatch):
+    monkeypatch.setattr(calendar_api.config, "NOTION_WEBHOOK_SECRET", SECRET)
+    body = json.dumps({"entity": {"type": "page", "id": "page-1"}}).encode()
+
+    for headers in (
+        {},
+        {"X-Notion-Signature": sign(body, "another-secret")},
+        {"X-Notion-Signature": sign(body + b" ")},
+        {"X-Notion-Signature": sign(body)[len("sha256="):]},
+        {"X-Webhook-Secret": "wrong"},
+    ):
+        response = client.post(URL, data=body, content_type="application/json", headers=headers)
+        assert response.status_code == 401, headers
+
+    assert client.application.unified_sync_service.queued == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the ChangeDebouncer used by the Notion page-change webhook.
+Checks that bursts are coalesced per key and that max_wait bounds the delay.
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.change_debouncer import ChangeDebouncer
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+        self.event = threading.Event()
+
+    def __call__(self, key, items):
+        self.calls.append((key, set(items)))
+        self.event.set()
+
+
+def test_burst_is_coalesced_per_key():
+    """Several submits within the quiet window produce one flush per key."""
+    recorder = Recorder()
+    debouncer = ChangeDebouncer(recorder, quiet_seconds=0.2, max_wait_seconds=5)
+
+    debouncer.submit(1, ["a", "b"])
+    debouncer.submit(1, ["b", "c"])
+    debouncer.submit(2, ["x"])
+    assert debouncer.pending(1) == {"a", "b", "c"}
+
+    time.sleep(0.6)
+    print(f"Flushes: {recorder.calls}")
+    assert sorted(recorder.calls, key=lambda call: call[0]) == [(1, {"a", "b", "c"}), (2, {"x"})]
+    assert debouncer.pending(1) == set()
+
+
+def test_max_wait_bounds_delay():
+    """A steady stream of changes still flushes once max_wait has elapsed."""
+    recorder = Recorder()
+    debouncer = ChangeDebouncer(recorder, quiet_seconds=0.3, max_wait_seconds=0.5)
+
+    start = time.monotonic()
+    while not recorder.event.is_set() and time.monotonic() - start < 2:
+        debouncer.submit("org", [f"page-{time.monotonic()}"])
+        time.sleep(0.05)
+
+    elapsed = time.monotonic() - start
+    print(f"First flush after {elapsed:.2f}s")
+    assert recorder.event.is_set()
+    assert elapsed < 1.0
+    debouncer.cancel_all()
+
+
+def test_manual_flush():
+    """flush() runs synchronously and clears the pending set."""
+    recorder = Recorder()
+    debouncer = ChangeDebouncer(recorder, quiet_seconds=10)
+
+    debouncer.submit(1, ["a"])
+    assert debouncer.flush(1) is True
+    assert recorder.calls == [(1, {"a"})]
+    assert debouncer.flush(1) is False
+
+
+if __name__ == "__main__":
+    test_burst_is_coalesced_per_key()
+    test_max_wait_bounds_delay()
+    test_manual_flush()
+    print("All ChangeDebouncer tests passed")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded-concurrency Discord operation runner.
+Checks the concurrency cap, per-bucket and global rates, retries after 429 / 5xx responses and
+progress reporting.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.op_runner import DiscordOperationError, DiscordOpRunner
+
+
+class HTTPError(Exception):
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def test_concurrency_is_bounded_and_results_keep_order():
+    in_flight = {"now": 0, "max": 0}
+
+    async def add_role(member):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return member
+
+    async def scenario():
+        runner = DiscordOpRunner(concurrency=4)
+        operations = [(f"member {i}", lambda i=i: add_role(i), "member_roles") for i in range(20)]
+        return runner, await runner.run("assign_roles", operations)
+
+    runner, results = asyncio.run(scenario())
+    assert results == list(range(20))
+    assert in_flight["max"] == 4
+    report = runner.progress_report()["assign_roles"]
+    assert (report["total"], report["done"], report["failed"], report["finished"]) == (20, 20, 0, True)
+
+
+def test_rate_limits_and_server_errors_are_retried():
+    calls = {"limited": 0, "flaky": 0}
+
+    async def limited():
+        calls["limited"] += 1
+        if calls["limited"] == 1:
+            raise HTTPError(429, retry_after=0.05)
+        return "created"
+
+    async def flaky():
+        calls["flaky"] += 1
+        raise HTTPError(503)
+
+    async def forbidden():
+        raise HTTPError(403)
+
+    async def scenario():
+        runner = DiscordOpRunner(max_attempts=3, backoff=0.01)
+        results = await runner.run("setup", [
+            ("limited", limited, "roles"),
+            ("flaky", flaky, "roles"),
+            ("forbidden", forbidden, "channels"),
+        ])
+        return runner, results
+
+    runner, results = asyncio.run(scenario())
+    assert results[0] == "created"
+    assert calls == {"limited": 2, "flaky": 3}
+    assert isinstance(results[2], HTTPError) and results[2].status == 403
+    report = runner.progress_report()["setup"]
+    assert report["failed"] == 2 and report["retries"] == 3
+    with pytest.raises(DiscordOperationError):
+        runner.raise_for_failures("setup")
+
+
+def test_buckets_use_their_own_rate_under_the_global_limit():
+    sent = {}
+
+    async def call(bucket):
+        sent.setdefault(bucket, []).append(time.monotonic())
+
+    async def scenario():
+        runner = DiscordOpRunner(concurrency=50, bucket_rates={"fast": (20, 0.2)}, global_rate=(30, 0.2))
+        started = time.monotonic()
+        await runner.run("setup", [
+            *((f"member {i}", lambda: call("member_roles"), "member_roles") for i in range(12)),
+            *((f"fast {i}", lambda: call("fast"), "fast") for i in range(25)),
+            *((f"channel {i}", lambda: call(123), 123) for i in range(6)),
+        ])
+        return started
+
+    started = asyncio.run(scenario())
+    # 10 role changes per second on members, 5 per second for other buckets, 30 per 0.2s overall
+    assert sum(t - started < 0.9 for t in sent["member_roles"]) == 10
+    assert sum(t - started < 0.9 for t in sent[123]) == 5
+    assert sum(t - started < 0.15 for times in sent.values() for t in times) == 30
+    assert sum(len(times) for times in sent.values()) == 43
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
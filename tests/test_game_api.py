@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the long-running game API calls.
+Checks that starting and cleaning a game run in the background on the bot loop and that their
+outcome is reported by the progress endpoint.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.models import JeopardyGame  # noqa: F401 - registers the game tables before shared creates them
+from modules.bot import api as bot_api
+from modules.bot.discord_modules.cogs.GameCog import NoGameSession
+from modules.bot.discord_modules.dispatcher import BotDispatcher
+
+
+class FakeGameCog:
+    """Runs session calls like GameCog.run for a single server whose long calls wait for ``release``."""
+
+    def __init__(self):
+        self.has_game = True
+        self.release = threading.Event()
+        self.error = None
+        self.calls = []
+
+    async def run(self, guild_id, method_name, *args, **kwargs):
+        if not self.has_game:
+            raise NoGameSession(f"No game session for guild {guild_id}")
+        self.calls.append(method_name)
+        if method_name == "is_setup":
+            return True
+        if method_name == "get_progress":
+            return {"assign_roles": {"total": 40, "done": 10, "failed": 0}}
+        while not self.release.is_set():
+            await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        if method_name == "clear_game":
+            self.has_game = False
+        return True
+
+
+class FakeBot:
+    def __init__(self, loop):
+        self.cog = FakeGameCog()
+        self.dispatcher = BotDispatcher(loop)
+
+    def is_ready(self):
+        return True
+
+    def get_cog(self, name):
+        return self.cog if name == "GameCog" else None
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+@pytest.fixture
+def client(loop, monkeypatch):
+    monkeypatch.setattr(bot_api, "_background_calls", {})
+    app = Flask(__name__)
+    app.register_blueprint(bot_api.game_blueprint, url_prefix="/api/game")
+    app.auth_bot = FakeBot(loop)
+    return app.test_client()
+
+
+def wait_for_background(client, method_name):
+    for _ in range(200):
+        response = client.get("/api/game/getactivegameprogress")
+        status = response.get_json()["background"][method_name]["status"]
+        if status != "running":
+            return response
+        time.sleep(0.01)
+    pytest.fail(f"{method_name} did not finish")
+
+
+def test_start_runs_in_background_and_reports_progress(client):
+    cog = client.application.auth_bot.cog
+    response = client.post("/api/game/startactivegame")
+    assert response.status_code == 202
+
+    progress = client.get("/api/game/getactivegameprogress")
+    assert progress.status_code == 200
+    assert progress.get_json() == {
+        "assign_roles": {"total": 40, "done": 10, "failed": 0},
+        "background": {"start_game": {"status": "running"}},
+    }
+    # Starting again while the first start runs is refused instead of racing it
+    assert client.post("/api/game/startactivegame").status_code == 409
+
+    cog.release.set()
+    assert wait_for_background(client, "start_game").get_json()["background"] == {"start_game": {"status": "done"}}
+    assert cog.calls.count("start_game") == 1
+
+
+def test_background_failure_is_reported(client):
+    cog = client.application.auth_bot.cog
+    cog.error = ValueError("No teams are set up in the game.")
+    cog.release.set()
+    assert client.post("/api/game/startactivegame").status_code == 202
+    assert wait_for_background(client, "start_game").get_json()["background"] == {
+        "start_game": {"status": "failed", "error": "No teams are set up in the game."}
+    }
+
+
+def test_clean_reports_its_outcome_after_the_session_is_dropped(client):
+    cog = client.application.auth_bot.cog
+    assert client.post("/api/game/cleanactivegame").status_code == 202
+    cog.release.set()
+    response = wait_for_background(client, "clear_game")
+    assert response.get_json() == {"background": {"clear_game": {"status": "done"}}}
+    assert not cog.has_game
+
+
+def test_missing_game_is_reported_before_submitting(client):
+    cog = client.application.auth_bot.cog
+    cog.has_game = False
+    assert client.post("/api/game/startactivegame").status_code == 404
+    assert client.post("/api/game/cleanactivegame").status_code == 404
+    assert client.get("/api/game/getactivegameprogress").status_code == 404
+    assert cog.calls == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the Jeopardy game library.
+Checks package validation and normalization, keyed lookups and that cached games are handed out as copies.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.bot.game_library import GameLibrary, normalize_game_package
+
+
+def package(name="Trivia Night", uuid="game-1", values=("200", 100)):
+    return {
+        "game": {
+            "name": f" {name} ", "description": "Test game", "players": 4, "categories": [],
+            "per_category": "2", "teams": ["Red", "Blue"], "uuid": uuid,
+        },
+        "questions": {"Python": [
+            {"question": f"Q{value}", "answer": "A", "value": value, "uuid": f"q{value}"} for value in values
+        ]},
+    }
+
+
+@pytest.fixture
+def library(tmp_path):
+    return GameLibrary(DBConnect(f"sqlite:///{tmp_path / 'games.db'}"))
+
+
+def test_normalize_game_package():
+    normalized = normalize_game_package(package())
+    assert normalized["game"]["name"] == "Trivia Night"
+    assert normalized["game"]["per_category"] == 2
+    assert normalized["game"]["categories"] == ["Python"]
+    assert [q["value"] for q in normalized["questions"]["Python"]] == [100, 200]
+    with pytest.raises(ValueError):
+        normalize_game_package({"game": {"name": "x"}, "questions": {}})
+    with pytest.raises(ValueError):
+        normalize_game_package(package(values=("lots",)))
+
+
+def test_lookup_by_name_or_uuid_and_update(library):
+    assert library.add_or_update(package())["status"] == "created"
+    assert library.list_games() == [{"name": "Trivia Night", "description": "Test game", "uuid": "game-1"}]
+
+    first = library.new_game(name="Trivia Night")
+    first.award_points("Red", 100)
+    second = library.new_game(uuid="game-1")
+    assert second.get_team("Red").score == 0
+    assert library.stats == {"hits": 1, "misses": 1}
+    assert library.get_package(name="Missing") is None
+
+    assert library.add_or_update(package(name="Renamed", values=(300,)))["status"] == "updated"
+    assert library.get_package(name="Trivia Night") is None
+    assert library.new_game(uuid="game-1").get_board() == {"Python": [300]}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
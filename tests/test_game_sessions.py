@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for routing calls to per-server game sessions.
+Checks that missing sessions and methods raise their own exceptions, that errors raised inside
+a session method are not mistaken for them, and that the read-only calls the API polls work.
+"""
+
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.cogs.GameCog import GameCog, GameCogUnavailable, NoGameSession
+from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
+
+GAME = {
+    "game": {
+        "name": "Trivia Night", "description": "Test game", "teams": ["Red", "Blue"],
+        "categories": ["Python"], "per_category": 2,
+    },
+    "questions": {"Python": [
+        {"question": f"Q{value}", "answer": f"A{value}", "value": value} for value in (100, 200)
+    ]},
+}
+
+
+@pytest.fixture
+def cog():
+    return GameCog(SimpleNamespace(guilds=[SimpleNamespace(id=111)]))
+
+
+def test_unknown_or_private_methods_are_unavailable(cog):
+    cog.get_session(111, create=True)
+    for method_name in ("no_such_method", "_call"):
+        with pytest.raises(GameCogUnavailable):
+            asyncio.run(cog.run(111, method_name))
+
+
+def test_missing_session_is_reported_separately(cog):
+    with pytest.raises(NoGameSession):
+        asyncio.run(cog.run(222, "get_game"))
+    with pytest.raises(NoGameSession):
+        asyncio.run(cog.run(None, "end_game"))
+
+
+def test_lookup_errors_inside_a_method_propagate_unchanged(cog):
+    session = cog.get_session(111, create=True)
+    session.get_game = lambda: {}["missing"]
+    with pytest.raises(KeyError):
+        asyncio.run(cog.run(None, "get_game"))
+
+
+def test_read_only_calls_return_the_game_and_its_state(cog):
+    session = cog.get_session(111, create=True)
+    assert asyncio.run(cog.run(111, "get_state")) is None
+    session.game = JeopardyGame(GAME)
+    session.game.start()
+
+    assert asyncio.run(cog.run(111, "get_state")) == session.game.to_state()
+    assert asyncio.run(cog.run(None, "get_game")) == session.game.to_json()
+    assert cog.sessions_report() == [
+        {"guild_id": 111, "game": "Trivia Night", "is_setup": False, "is_started": True, "busy": False}
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for active game persistence.
+Checks that a game rebuilt from its snapshot and recorded actions matches the live game.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.bot.models import ActiveGameEvent
+from modules.bot.game_store import GameStore
+from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import JeopardyGame
+
+GAME = {
+    "game": {
+        "name": "Trivia Night", "description": "Test game", "teams": ["Red", "Blue"],
+        "categories": ["Python"], "per_category": 3,
+    },
+    "questions": {"Python": [
+        {"question": f"Q{value}", "answer": f"A{value}", "value": value} for value in (100, 200, 300)
+    ]},
+}
+
+
+class Member:
+    def __init__(self, member_id):
+        self.id = member_id
+
+
+@pytest.fixture
+def db_connect(tmp_path):
+    return DBConnect(f"sqlite:///{tmp_path / 'games.db'}")
+
+
+def play(store, game):
+    """Applies and records a few actions like GameCog does."""
+    def act(event_type, **payload):
+        game.apply_event(event_type, payload)
+        store.record(game, event_type, payload)
+
+    for member_id in (1, 2, 3):
+        act("join", member_id=member_id)
+    act("leave", member_id=3)
+    act("start")
+    act("teams", teams={"Red": [1], "Blue": [2]})
+    first, second = game.questions[0].id, game.questions[1].id
+    act("reveal", uuid=first)
+    act("answer", uuid=first)
+    act("award", team="Red", points=100)
+    act("reveal", uuid=second)
+
+
+def test_resume_rebuilds_game_from_snapshot_and_events(db_connect):
+    store = GameStore(db_connect, snapshot_every=4)
+    game = JeopardyGame(GAME)
+    store.start(game, "Friday", "7pm")
+    play(store, game)
+    assert store.seq == 10 and store.snapshot_seq == 8
+
+    db = db_connect.SessionLocal()
+    assert [event.seq for event in db.query(ActiveGameEvent).order_by(ActiveGameEvent.seq)] == [9, 10]
+    db.close()
+
+    restarted = GameStore(db_connect, snapshot_every=4)
+    game_data, events, helper = restarted.load()
+    resumed = JeopardyGame.from_state(game_data["state"])
+    for event_type, payload in events:
+        resumed.apply_event(event_type, payload)
+
+    assert resumed.to_state() == game.to_state()
+    assert game_data["date"] == "Friday" and restarted.seq == 10
+    assert resumed.get_board() == game.get_board()
+    assert resumed.get_question(game.questions[1].id).revealed
+
+    assert resumed.bind_members(lambda member_id: Member(member_id) if member_id != 2 else None) == [2]
+    assert [member.id for member in resumed.get_team("Red").members] == [1]
+    assert resumed.get_team("Blue").members == []
+
+
+def test_new_game_and_clear_replace_stored_game(db_connect):
+    store = GameStore(db_connect)
+    store.start(JeopardyGame(GAME), "Friday", "7pm")
+    store.save_helper({"guild_id": 1})
+    second = JeopardyGame({**GAME, "game": {**GAME["game"], "name": "Second"}})
+    store.start(second, "Saturday", "8pm")
+    game_data, events, helper = GameStore(db_connect).load()
+    assert game_data["state"]["game"]["name"] == "Second"
+    assert (events, helper) == ([], {})
+
+    store.clear()
+    assert GameStore(db_connect).load() is None
+
+
+def test_guild_stores_are_independent(db_connect):
+    base = GameStore(db_connect)
+    first, second = base.for_guild(111), base.for_guild(222)
+    first.start(JeopardyGame(GAME), "Friday", "7pm")
+    second.start(JeopardyGame({**GAME, "game": {**GAME["game"], "name": "Second"}}), "Saturday", "8pm")
+    first.record(JeopardyGame(GAME), "join", {"member_id": 1})
+    assert sorted(base.stored_guild_ids()) == [111, 222]
+
+    second.clear()
+    assert base.stored_guild_ids() == [111]
+    game_data, events, helper = base.for_guild(111).load()
+    assert game_data["state"]["game"]["name"] == "Trivia Night"
+    assert events == [("join", {"member_id": 1})]
+    assert base.for_guild(222).load() is None and base.load() is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
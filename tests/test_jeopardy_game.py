@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the Jeopardy game state.
+Checks question and team lookups and that the board is updated in place as questions are answered.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.cogs.jeopardy.Jeopardy import ANSWERED_CELL, JeopardyGame
+
+
+@pytest.fixture
+def game():
+    return JeopardyGame({
+        "game": {
+            "name": "Trivia Night", "description": "Test game", "teams": ["Red", "Blue"],
+            "categories": ["Python", "History"], "per_category": 2,
+        },
+        "questions": {
+            "Python": [
+                {"question": "Q2", "answer": "A2", "value": 200},
+                {"question": "Q1", "answer": "A1", "value": 100},
+            ],
+            "History": [{"question": "Q3", "answer": "A3", "value": 100}],
+        },
+    })
+
+
+def test_lookups_and_board_updates(game):
+    assert game.get_board() == {"Python": [100, 200], "History": [100]}
+    question = game.questions[0]
+    assert game.get_question(question.id) is game.get_question_by_uuid(question.id) is question
+
+    answered, found = game.answer_question(question.id)
+    assert answered and found is question
+    assert game.get_board()["Python"] == [100, ANSWERED_CELL]
+    assert game.answer_question("missing") == (False, None)
+    assert game.mark_question_as_answered("History", 100)
+    assert game.get_questions_in_sorted_categories_and_by_points()["History"] == [ANSWERED_CELL]
+
+
+def test_teams_by_name(game):
+    assert game.award_points("Blue", "300")
+    assert not game.award_points("Green", 100)
+    assert game.add_member_to_team("Red", 42)
+    assert game.get_team("Red").members == [42]
+    assert game.get_winners() == ["Blue"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
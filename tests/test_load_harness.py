@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline game night load test.
+Runs a small simulated game and checks buzz arbitration and the report it produces.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts import load_test_game
+from scripts.load_test_game import GameNightSimulation, percentiles, run_simulation
+
+
+def test_percentiles():
+    assert percentiles([]) is None
+    stats = percentiles(list(range(1, 101)))
+    assert (stats["p50"], stats["p99"], stats["max"]) == (50, 99, 100)
+
+
+def test_small_game_night(monkeypatch):
+    # Generous limits keep the run short; the limiter itself is covered by the rate limit tests
+    monkeypatch.setattr(load_test_game, "ROUTE_LIMITS", {route: (1000, 1.0) for route in load_test_game.ROUTE_LIMITS})
+    monkeypatch.setattr(load_test_game, "GLOBAL_LIMIT", (1000, 1.0))
+    simulation = GameNightSimulation(
+        players=30, teams=4, questions=3, click_rate=0.5, reaction_time=0.0, spread=0.05,
+        gateway_delay=(0.0, 0.02), wrong_rate=0.5, latency=0.0, jitter=0.0, seed=7,
+    )
+    report = asyncio.run(run_simulation(simulation))
+
+    assert report["rounds"] >= 3
+    assert report["buzz"]["rounds_with_one_winner"] == report["rounds"]
+    assert report["buzz"]["fair_rounds"] == report["rounds"]
+    assert report["unacked"] == 0 and report["acks_over_deadline"] == 0
+    assert report["rest_calls"]["add_roles"] == 30
+    assert report["operations"]["assign_roles"]["failed"] == 0
+    assert sum(team.score for team in simulation.cog.get_session(simulation.guild.id).game.teams) > 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for the sync logging helpers in logging_config.
+Checks debug sampling, structured field formatting and per-run summary counters.
+"""
+
+import sys
+import os
+import logging
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.logging_config import LogSampler, SyncRunStats, format_fields
+
+
+def test_sampler_lets_first_then_every_nth_through():
+    """The first N occurrences of a key pass, then one in every `every`; keys are independent."""
+    sampler = LogSampler(first=2, every=5)
+    allowed = [i + 1 for i in range(20) if sampler.allow("parse")]
+    print(f"Allowed occurrences: {allowed}")
+    assert allowed == [1, 2, 5, 10, 15, 20]
+    assert sampler.allow("other")
+
+
+def test_format_fields_quotes_values_with_spaces():
+    assert format_fields(org=3, status="ok") == "org=3 status=ok"
+    assert format_fields(message="two words", empty="") == 'message="two words" empty=""'
+
+
+def test_run_stats_summary_and_debug_gating(caplog):
+    """Counters end up in one summary line; sampled debug stays silent unless DEBUG is enabled."""
+    log = logging.getLogger("tests.sync_stats")
+    log.setLevel(logging.INFO)
+    stats = SyncRunStats("ocp_ingest", log, organization_id=7)
+    stats.incr("events", 3)
+    stats.incr("points_created")
+    stats.incr("points_created")
+
+    with caplog.at_level(logging.INFO, logger="tests.sync_stats"):
+        stats.debug("officer", "should not appear %s", "at INFO")
+        assert not stats.sample("officer")
+        stats.log_summary()
+
+    messages = [record.getMessage() for record in caplog.records if record.name == "tests.sync_stats"]
+    print(f"Logged: {messages}")
+    assert len(messages) == 1
+    assert messages[0].startswith("ocp_ingest.summary organization_id=7 events=3 points_created=2 duration_seconds=")
+    assert stats.as_dict()["points_created"] == 2
+
+
+if __name__ == "__main__":
+    test_sampler_lets_first_then_every_nth_through()
+    test_format_fields_quotes_values_with_spaces()
+    print("Run the summary test with pytest (it uses the caplog fixture).")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk merch product operations.
+Checks that a valid batch is applied in one go and that any failing item leaves everything unchanged.
+"""
+
+import sys
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.base import Base
+from modules.points.models import User  # noqa: F401 - registers the models merch relationships refer to
+from modules.organizations.models import Organization
+from modules.merch.models import Product
+from modules.merch.bulk import apply_product_operations
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Organization(id=1, name="Test Org", prefix="test", guild_id="1"),
+        Organization(id=2, name="Other Org", prefix="other", guild_id="2"),
+    ])
+    session.add(Product(id=1, organization_id=1, name="Shirt", price=20.0, stock=5))
+    session.add(Product(id=2, organization_id=2, name="Foreign", price=1.0, stock=5))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_batch_is_applied_in_order(db):
+    result = apply_product_operations(db, 1, [
+        {"op": "create", "name": "Hat", "price": "15", "stock": 3},
+        {"op": "update", "id": 1, "price": 18.5, "stock": 10},
+        {"op": "stock", "id": 1, "delta": -4},
+    ])
+    print(f"Bulk results: {result['results']}")
+    assert result["status"] == "success"
+    assert [r["status"] for r in result["results"]] == ["ok", "ok", "ok"]
+    hat_id = result["results"][0]["id"]
+    db.expire_all()
+    assert (db.get(Product, 1).price, db.get(Product, 1).stock) == (18.5, 6)
+    assert db.get(Product, hat_id).name == "Hat"
+
+
+def test_failing_item_applies_nothing(db):
+    invalid = apply_product_operations(db, 1, [
+        {"op": "stock", "id": 1, "delta": 2},
+        {"op": "update", "id": 2, "name": "Not ours"},
+        {"op": "create", "name": "No price", "stock": 1},
+    ])
+    assert [r["status"] for r in invalid["results"]] == ["valid", "error", "error"]
+
+    short = apply_product_operations(db, 1, [
+        {"op": "create", "name": "Hat", "price": 15, "stock": 3},
+        {"op": "stock", "id": 1, "delta": -6},
+    ])
+    assert short["status"] == "error"
+    assert short["results"][1]["error"] == "Stock would go below zero"
+    db.expire_all()
+    assert db.get(Product, 1).stock == 5
+    assert db.query(Product).filter(Product.name == "Hat").count() == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for merch stock reservation.
+Checks that concurrent buyers cannot oversell, that failed reservations leave stock untouched,
+that checkout holds are claimed once and returned to stock when they expire, and that malformed
+order items are rejected with a 400.
+"""
+
+import sys
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.base import Base
+from modules.points.models import User  # noqa: F401 - registers the models merch relationships refer to
+from modules.organizations.models import Organization
+from modules.merch.models import Product, StockHold
+from modules.merch.inventory import InventoryService, StockReservationError, aggregate_quantities
+
+
+class _TestDB:
+    """Minimal stand-in for DBConnect with a file-backed SQLite database shared across threads."""
+
+    def __init__(self, path):
+        self.engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    db_connect = _TestDB(tmp_path / "merch.db")
+    db = db_connect.SessionLocal()
+    db.add(Organization(id=1, name="Test Org", prefix="test", guild_id="1"))
+    db.add(Product(id=1, organization_id=1, name="Shirt", price=20.0, stock=3))
+    db.add(Product(id=2, organization_id=1, name="Sticker", price=1.0, stock=100))
+    db.commit()
+    db.close()
+    return InventoryService(db_connect)
+
+
+def _stock(inventory, product_id):
+    db = inventory.db_connect.SessionLocal()
+    try:
+        return db.get(Product, product_id).stock
+    finally:
+        db.close()
+
+
+def test_concurrent_buyers_never_oversell(inventory):
+    """Ten buyers race for three shirts: exactly three reservations succeed and stock ends at zero."""
+    results = []
+    barrier = threading.Barrier(10)
+
+    def buy():
+        db = inventory.db_connect.SessionLocal()
+        try:
+            barrier.wait()
+            inventory.reserve(db, 1, {1: 1})
+            db.commit()
+            results.append(True)
+        except StockReservationError:
+            db.rollback()
+            results.append(False)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=buy) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"Successful purchases: {results.count(True)}")
+    assert results.count(True) == 3
+    assert _stock(inventory, 1) == 0
+
+
+def test_failed_reservation_rolls_back_every_item(inventory):
+    db = inventory.db_connect.SessionLocal()
+    with pytest.raises(StockReservationError) as error:
+        inventory.reserve(db, 1, {2: 5, 1: 4})
+    db.rollback()
+    db.close()
+    assert error.value.product_id == 1
+    assert _stock(inventory, 1) == 3
+    assert _stock(inventory, 2) == 100
+
+
+def test_hold_is_claimed_once_and_expired_holds_return_stock(inventory):
+    db = inventory.db_connect.SessionLocal()
+    hold = inventory.create_hold(db, 1, {1: 2})
+    assert _stock(inventory, 1) == 1
+
+    # The order uses one of the two held shirts plus stickers; the unused shirt goes back
+    inventory.reserve_for_order(db, 1, {1: 1, 2: 10}, hold["token"])
+    db.commit()
+    assert (_stock(inventory, 1), _stock(inventory, 2)) == (2, 90)
+    with pytest.raises(StockReservationError):
+        inventory.claim_hold(db, 1, hold["token"])
+    db.rollback()
+
+    inventory.create_hold(db, 1, {1: 2})
+    db.close()
+    assert _stock(inventory, 1) == 0
+    assert inventory.sweep_expired_holds(now=datetime.utcnow() + timedelta(hours=1)) == 1
+    assert _stock(inventory, 1) == 2
+
+    db = inventory.db_connect.SessionLocal()
+    assert db.query(StockHold).count() == 0
+    db.close()
+
+
+def test_aggregate_quantities_sums_items_and_rejects_malformed_ones():
+    items = [{"product_id": "1", "quantity": "2"}, {"product_id": 1, "quantity": 1.0}, {"product_id": 2, "quantity": 5}]
+    assert aggregate_quantities(items) == {1: 3, 2: 5}
+
+    for item in ({"product_id": "shirt", "quantity": 1}, {"product_id": 1, "quantity": "two"},
+                 {"product_id": None, "quantity": 1}, {"product_id": 1, "quantity": 1.5},
+                 {"product_id": 1, "quantity": True}, {"product_id": 1, "quantity": 0}):
+        with pytest.raises(StockReservationError) as excinfo:
+            aggregate_quantities([item])
+        assert excinfo.value.status_code == 400
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
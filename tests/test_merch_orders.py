@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for merch order listings.
+Checks keyset pagination (including orders created at the same instant), filters and CSV export.
+"""
+
+import sys
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.base import Base
+from modules.points.models import User
+from modules.organizations.models import Organization
+from modules.merch.models import Product, Order, OrderItem
+from modules.merch.orders import iter_orders, orders_csv, parse_order_filters, query_orders
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Organization(id=1, name="Test Org", prefix="test", guild_id="1"))
+    session.add(User(id=1, name="Sparky", email="sparky@asu.edu"))
+    session.add(Product(id=1, organization_id=1, name="Shirt", price=20.0, stock=10))
+    same_instant = datetime(2025, 3, 1, 12, 0, 0)
+    for order_id in range(1, 8):
+        status = 'cancelled' if order_id == 4 else 'pending'
+        session.add(Order(id=order_id, organization_id=1, user_id=1, total_amount=20.0, status=status,
+                          created_at=same_instant if order_id <= 4 else datetime(2025, 3, order_id)))
+        session.add(OrderItem(organization_id=1, order_id=order_id, product_id=1, quantity=1, price_at_time=20.0))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_keyset_pages_cover_every_order_once(db):
+    seen, cursor = [], None
+    while True:
+        filters = parse_order_filters({'limit': '3', 'cursor': cursor} if cursor else {'limit': '3'})
+        orders, cursor = query_orders(db, 1, **filters)
+        seen.extend(order.id for order in orders)
+        if cursor is None:
+            break
+    print(f"Orders in page order: {seen}")
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_filters_and_csv_export(db):
+    filters = parse_order_filters({'status': 'pending', 'start': '2025-03-01', 'end': '2025-03-01'})
+    orders, cursor = query_orders(db, 1, **filters)
+    assert [order.id for order in orders] == [3, 2, 1]
+    assert cursor is None
+    with pytest.raises(ValueError):
+        parse_order_filters({'status': 'lost'})
+
+    lines = "".join(orders_csv(iter_orders(db, 1, page_size=2))).splitlines()
+    assert lines[0].startswith("order_id,created_at,status")
+    assert len(lines) == 8
+    assert lines[1].split(",")[:5] == ["7", "2025-03-07T00:00:00", "pending", "1", "Sparky"]
+
+
+def test_datetime_filters_with_an_offset_are_converted_to_utc():
+    filters = parse_order_filters({'start': '2025-03-01T17:00:00-07:00', 'end': '2025-03-02T01:30:00Z'})
+    assert filters == {'start': datetime(2025, 3, 2, 0, 0), 'end': datetime(2025, 3, 2, 1, 30)}
+    assert parse_order_filters({'start': '2025-03-01T17:00:00'}) == {'start': datetime(2025, 3, 1, 17, 0)}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the merch storefront cache.
+Checks pagination, ETag changes on stock deltas and reloads when a product comes back into stock.
+"""
+
+import sys
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.base import Base
+from modules.points.models import User  # noqa: F401 - registers the models merch relationships refer to
+from modules.organizations.models import Organization
+from modules.merch.models import Product
+from modules.merch.storefront import StorefrontCache
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Organization(id=1, name="Test Org", prefix="test", guild_id="1"))
+    session.add_all([
+        Product(id=1, organization_id=1, name="Shirt", price=20.0, stock=2),
+        Product(id=2, organization_id=1, name="Hat", price=15.0, stock=0),
+        Product(id=3, organization_id=1, name="Sticker", price=1.0, stock=50),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_pages_only_contain_in_stock_products(db):
+    cache = StorefrontCache()
+    first = cache.get_page(db, 1, limit=1, offset=0)
+    second = cache.get_page(db, 1, limit=1, offset=1)
+    assert [p['name'] for p in first['products']] == ["Shirt"]
+    assert [p['name'] for p in second['products']] == ["Sticker"]
+    assert first['total'] == second['total'] == 2
+    assert first['etag'] != second['etag']
+
+
+def test_stock_deltas_update_cache_without_reload(db):
+    cache = StorefrontCache()
+    before = cache.get_page(db, 1)
+
+    # Changes made behind the cache's back are not seen; deltas reported after commit are
+    db.query(Product).filter(Product.id == 1).update({"stock": 0})
+    db.commit()
+    assert cache.get_page(db, 1)['etag'] == before['etag']
+    cache.apply_stock_deltas(1, {1: -2, 3: -5})
+    after = cache.get_page(db, 1)
+    print(f"Products after deltas: {after['products']}")
+    assert [(p['id'], p['stock']) for p in after['products']] == [(3, 45)]
+    assert after['etag'] != before['etag']
+
+    # A sold-out product coming back forces a reload from the database
+    db.query(Product).filter(Product.id == 2).update({"stock": 4})
+    db.commit()
+    cache.apply_stock_deltas(1, {2: 4})
+    assert [p['id'] for p in cache.get_page(db, 1)['products']] == [2, 3]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test script for OCP officer identity resolution.
+Checks that officers are matched by exact normalized keys only, that conflicting aliases are
+resolved deterministically and reported, and that every officer gets aliases for name lookups.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.organizations.models import Organization
+from modules.ocp.models import Officer, OfficerAlias, OfficerPoints
+from modules.ocp.identity import (
+    OfficerIdentityIndex, backfill_officer_aliases, identity_keys, ALIAS_EMAIL, ALIAS_NAME, ALIAS_NOTION_PERSON
+)
+from modules.ocp.service import OCPService
+from modules.merch.models import Order  # noqa: F401 - resolves the User.orders relationship
+
+
+@pytest.fixture
+def db_connect(tmp_path):
+    return DBConnect(f"sqlite:///{tmp_path / 'ocp.db'}")
+
+
+@pytest.fixture
+def db(db_connect):
+    session = db_connect.SessionLocal()
+    for org_id in (1, 2):
+        session.add(Organization(id=org_id, name=f"Org {org_id}", prefix=f"org{org_id}", guild_id=str(org_id)))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_identity_keys_are_normalized_and_ordered_by_trust():
+    assert identity_keys(name="  Ada  Lovelace ", email=" Ada@Example.COM ", notion_person_id=" person-1 ") == [
+        (ALIAS_NOTION_PERSON, "person-1"),
+        (ALIAS_EMAIL, "ada@example.com"),
+        (ALIAS_NAME, "adalovelace"),
+    ]
+    assert identity_keys(name="Ada-Lovelace") == identity_keys(name="ada lovelace")
+    assert identity_keys(name="Unknown", email="  ") == []
+    assert identity_keys() == []
+
+
+def test_names_match_exactly_not_by_substring():
+    index = OfficerIdentityIndex(1)
+    index.register("joanna", name="Joanna Smith")
+    index.register("ann", name="Ann")
+    assert index.resolve(name="Ann") == "ann"
+    assert index.resolve(name="Joanna") is None
+    assert index.resolve(name="anna") is None
+    # A nickname only resolves once it has been registered as an alias of that officer
+    assert index.resolve(name="Jo Smith") is None
+    index.register("joanna", name="Jo Smith")
+    assert index.resolve(name="jo smith") == "joanna"
+
+
+def test_most_trusted_key_wins():
+    index = OfficerIdentityIndex(1)
+    index.register("by-person", notion_person_id="person-1")
+    index.register("by-email", email="ada@example.com")
+    index.register("by-name", name="Ada Lovelace")
+    assert index.resolve(name="Ada Lovelace", email="ada@example.com", notion_person_id="person-1") == "by-person"
+    assert index.resolve(name="Ada Lovelace", email="ADA@example.com") == "by-email"
+    assert index.resolve(name="Ada Lovelace", notion_person_id="person-2") == "by-name"
+
+
+def test_conflicting_keys_keep_first_owner_and_are_reported():
+    index = OfficerIdentityIndex(1)
+    assert index.register("first", name="Sam Lee", email="sam@example.com") == [
+        (ALIAS_EMAIL, "sam@example.com"), (ALIAS_NAME, "samlee")
+    ]
+    assert index.register("second", name="Sam Lee", notion_person_id="person-2") == [(ALIAS_NOTION_PERSON, "person-2")]
+    assert index.resolve(name="sam lee") == "first"
+    assert index.conflicts == {(ALIAS_NAME, "samlee"): {"first", "second"}}
+    assert len(index) == 3
+
+
+def test_load_prefers_stored_aliases_and_scopes_to_the_organization(db):
+    db.add_all([
+        Officer(uuid="b-uuid", organization_id=1, name="Chris Park", email="chris@example.com"),
+        Officer(uuid="a-uuid", organization_id=1, name="Chris Park"),
+        Officer(uuid="other-org", organization_id=2, name="Dana Kim"),
+        OfficerAlias(organization_id=1, officer_uuid="b-uuid", alias_type=ALIAS_NAME, value="chrispark", source="sync"),
+        OfficerAlias(organization_id=1, officer_uuid="a-uuid", alias_type=ALIAS_NOTION_PERSON, value="person-a", source="sync"),
+    ])
+    db.commit()
+
+    index = OfficerIdentityIndex.load(db, 1)
+    # The stored alias owns the shared name even though "a-uuid" sorts first
+    assert index.resolve(name="Chris Park") == "b-uuid"
+    assert index.conflicts == {(ALIAS_NAME, "chrispark"): {"a-uuid", "b-uuid"}}
+    assert index.resolve(notion_person_id="person-a") == "a-uuid"
+    assert index.resolve(email="CHRIS@example.com") == "b-uuid"
+    assert index.resolve(name="Dana Kim") is None
+    assert OfficerIdentityIndex.load(db, 2).resolve(name="dana  kim") == "other-org"
+
+
+
+def aliases(db):
+    return sorted((a.organization_id, a.officer_uuid, a.alias_type, a.value, a.source) for a in db.query(OfficerAlias))
+
+
+def test_backfill_stores_missing_name_and_email_aliases_once(db):
+    db.add_all([
+        Officer(uuid="b-uuid", organization_id=1, name="Chris Park", email="Chris@Example.com"),
+        Officer(uuid="a-uuid", organization_id=1, name="Chris Park"),
+        Officer(uuid="c-uuid", organization_id=2, name="Chris Park"),
+        Officer(uuid="d-uuid", organization_id=1, name="Dana Kim"),
+        OfficerAlias(organization_id=1, officer_uuid="d-uuid", alias_type=ALIAS_NAME, value="danakim", source="sync"),
+    ])
+    db.commit()
+
+    assert backfill_officer_aliases(db) == 3
+    db.commit()
+    # A shared name goes to the officer the identity index would pick (name, then UUID order)
+    assert aliases(db) == [
+        (1, "a-uuid", ALIAS_NAME, "chrispark", "backfill"),
+        (1, "b-uuid", ALIAS_EMAIL, "chris@example.com", "backfill"),
+        (1, "d-uuid", ALIAS_NAME, "danakim", "sync"),
+        (2, "c-uuid", ALIAS_NAME, "chrispark", "backfill"),
+    ]
+    assert OfficerIdentityIndex.load(db, 1).resolve(name="chris park") == "a-uuid"
+    assert backfill_officer_aliases(db) == 0
+
+
+def test_officer_names_resolve_only_through_aliases(db_connect, db):
+    db.add(Officer(uuid="ada", organization_id=1, name="Ada Lovelace"))
+    db.commit()
+    service = OCPService(db_connect=db_connect, notion_client=object())
+
+    # Without an alias there is no fallback scan over the officers
+    assert service.get_officer_by_name(db, "Ada Lovelace", 1) is None
+    backfill_officer_aliases(db)
+    db.commit()
+    assert service.get_officer_by_name(db, "ada  lovelace", 1).uuid == "ada"
+    assert service.get_officer_by_name(db, "Ada-Lovelace").uuid == "ada"
+    assert service.get_officer_by_name(db, "Ada Lovelace", 2) is None
+    assert service.get_officer_by_name(db, "Ada") is None
+
+
+
+def test_custom_points_find_officers_through_aliases(db_connect, db):
+    db.add(Officer(uuid="ada", organization_id=1, name="Ada Lovelace"))
+    db.commit()
+    backfill_officer_aliases(db)
+    db.commit()
+    service = OCPService(db_connect=db_connect, notion_client=object())
+
+    result = service.add_officer_points({"names": ["ada  LOVELACE", "Grace Hopper"], "event": "Workshop", "points": 2}, 1)
+    assert result["status"] == "success"
+    db.expire_all()
+    grace = db.query(Officer).filter(Officer.name == "Grace Hopper").one()
+    assert db.query(Officer).count() == 2
+    assert sorted(p.officer_uuid for p in db.query(OfficerPoints)) == sorted(["ada", grace.uuid])
+
+    # The new officer is found by a name variant the next time
+    service.add_officer_points({"name": "grace-hopper", "event": "Hackathon"}, 1)
+    db.expire_all()
+    assert db.query(Officer).count() == 2
+    assert db.query(OfficerPoints).filter(OfficerPoints.officer_uuid == grace.uuid).count() == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for OCP points storage.
+Checks the Notion points ingest, the leaderboard aggregation, the paginated events feed, and that
+points of unpublished or deleted Notion pages are removed without touching other records.
+"""
+
+import sys
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.organizations.models import Organization
+from modules.ocp.models import Officer, OfficerPoints, OfficerAlias
+from modules.ocp.points import ingest_officer_rows, list_events, officer_totals, remove_page_points
+
+
+@pytest.fixture
+def db(tmp_path):
+    session = DBConnect(f"sqlite:///{tmp_path / 'ocp.db'}").SessionLocal()
+    for org_id in (1, 2):
+        session.add(Organization(id=org_id, name=f"Org {org_id}", prefix=f"org{org_id}", guild_id=str(org_id)))
+        session.add(Officer(uuid=f"officer-{org_id}", organization_id=org_id, name=f"Officer {org_id}"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def add_points(db, organization_id, page_id, role="Event Lead", officer_uuid=None, points=3, event_type="GBM",
+               timestamp=datetime(2025, 3, 1)):
+    db.add(OfficerPoints(
+        organization_id=organization_id, officer_uuid=officer_uuid or f"officer-{organization_id}", points=points,
+        event=f"Event {page_id}", role=role, event_type=event_type, timestamp=timestamp, notion_page_id=page_id
+    ))
+
+
+def test_remove_page_points_only_deletes_given_pages_of_the_org(db):
+    add_points(db, 1, "page-a")
+    add_points(db, 1, "page-a", role="Event Staff")
+    add_points(db, 1, "page-b")
+    add_points(db, 1, None)
+    add_points(db, 2, "page-a")
+    db.commit()
+
+    assert remove_page_points(db, 1, ["page-a", "page-missing", None]) == 2
+    db.commit()
+
+    remaining = sorted((row.organization_id, row.notion_page_id or "") for row in db.query(OfficerPoints))
+    assert remaining == [(1, ""), (1, "page-b"), (2, "page-a")]
+    assert remove_page_points(db, 1, []) == 0
+
+
+def test_officer_totals_aggregates_points_by_type_and_role(db):
+    db.add(Officer(uuid="officer-idle", organization_id=1, name="Idle Officer"))
+    add_points(db, 1, "page-a", points=2)
+    add_points(db, 1, "page-b", role="Event Staff", event_type="Special Event")
+    add_points(db, 1, "page-c", role="Mentor", event_type="Workshop", points=5)
+    add_points(db, 1, "page-d", timestamp=datetime(2024, 1, 1))
+    # Filed under another organization than the officer's, still the officer's points
+    add_points(db, 2, "page-e", officer_uuid="officer-1", points=1)
+    add_points(db, 2, "page-a")
+    db.commit()
+
+    totals = officer_totals(db, organization_id=1, start_date=datetime(2025, 1, 1))
+    assert [(officer["uuid"], officer["total_points"]) for officer in totals] == [("officer-1", 11), ("officer-idle", 0)]
+    officer = totals[0]
+    assert officer["contribution_count"] == 4
+    assert officer["contribution_counts"] == {
+        "GBM": 2, "Special Event": 1, "Special Contribution": 0, "Unique Contribution": 0, "Other": 1
+    }
+    assert officer["points_by_role"]["Event Lead"] == 3 and officer["points_by_role"]["Event Staff"] == 3
+    assert officer["points_by_role"]["Other"] == 5
+    assert totals[1]["contribution_counts"]["Other"] == 0 and totals[1]["points_by_role"]["Other"] == 0
+
+    assert [officer["total_points"] for officer in officer_totals(db)] == [14, 3, 0]
+
+
+def test_officer_totals_date_range_uses_the_officer_timestamp_index(db):
+    statements = []
+    engine = db.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "ocp_officer_points" in statement and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        officer_totals(db, 1, start_date=datetime(2025, 1, 1), end_date=datetime(2025, 6, 1))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    plan = " ".join(str(row[-1]) for row in db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters))
+    assert "ix_officer_points_officer_ts" in plan
+
+
+def test_list_events_pages_newest_first(db):
+    for day in (1, 2, 3, 4):
+        add_points(db, 1, f"page-{day}", timestamp=datetime(2025, 3, day))
+    add_points(db, 1, "page-tie", role="Event Staff", timestamp=datetime(2025, 3, 4))
+    add_points(db, 1, "page-orphan", officer_uuid="officer-deleted", timestamp=datetime(2025, 2, 1))
+    add_points(db, 2, "page-other", timestamp=datetime(2025, 3, 5))
+    db.commit()
+
+    first = list_events(db, organization_id=1, limit=2)
+    assert first["total"] == 6
+    assert [event["notion_page_id"] for event in first["events"]] == ["page-tie", "page-4"]
+    last = list_events(db, organization_id=1, limit=2, offset=4)
+    assert [event["notion_page_id"] for event in last["events"]] == ["page-1", "page-orphan"]
+    assert last["events"][1]["officer"]["name"] == "Unknown Officer"
+
+    filtered = list_events(db, organization_id=1, start_date=datetime(2025, 3, 2), end_date=datetime(2025, 3, 3),
+                           officer_uuid="officer-1")
+    assert filtered["total"] == 2 and len(filtered["events"]) == 2
+    assert list_events(db, organization_id=1, limit=2, offset=10) == {"events": [], "total": 6}
+    assert list_events(db)["total"] == 7
+
+
+def officer_row(name, page_id, role="Event Lead", **extra):
+    return {"name": name, "notion_page_id": page_id, "role": role, "points": 3, "event": f"Event {page_id}",
+            "event_type": "GBM", "event_date": datetime(2025, 3, 1), **extra}
+
+
+def test_ingest_creates_officers_and_skips_existing_points(db):
+    rows = [
+        officer_row("Ada Lovelace", "page-a", email="Ada@Example.com", notion_person_id="person-ada"),
+        officer_row("Grace Hopper", "page-a", role="Event Staff"),
+    ]
+    assert ingest_officer_rows(db, 1, rows) == {"officers_processed": 2, "officers_created": 2, "points_created": 2}
+    db.commit()
+    ada = db.query(Officer).filter(Officer.name == "Ada Lovelace").one()
+    assert ada.organization_id == 1 and ada.email == "ada@example.com"
+
+    # Same Notion person under a new display name, an already recorded row, and a new page
+    rows = [
+        officer_row("Ada L.", "page-a", notion_person_id="person-ada"),
+        officer_row("grace  hopper", "page-a", role="Event Staff"),
+        officer_row("Ada Lovelace", "page-b"),
+    ]
+    assert ingest_officer_rows(db, 1, rows) == {"officers_processed": 3, "officers_created": 0, "points_created": 1}
+    db.commit()
+    points = sorted((p.officer_uuid == ada.uuid, p.notion_page_id, p.role) for p in db.query(OfficerPoints))
+    assert points == [(False, "page-a", "Event Staff"), (True, "page-a", "Event Lead"), (True, "page-b", "Event Lead")]
+    assert db.query(OfficerAlias).filter(OfficerAlias.value == "adal").one().officer_uuid == ada.uuid
+
+
+def test_ingest_does_not_reuse_an_email_of_another_organization(db):
+    db.query(Officer).filter(Officer.uuid == "officer-2").update({"email": "ada@example.com"})
+    db.commit()
+    assert ingest_officer_rows(db, 1, [officer_row("Ada Lovelace", "page-a", email="ada@example.com")])["officers_created"] == 1
+    db.commit()
+    officer = db.query(Officer).filter(Officer.name == "Ada Lovelace").one()
+    assert officer.organization_id == 1 and officer.email is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for OrganizationSettings calendar sync horizon.
+"""
+
+import sys
+import os
+from datetime import datetime, timezone, timedelta
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.organizations.config import OrganizationSettings
+
+
+def test_horizon_round_trip():
+    """sync_horizon_days survives to_dict/from_dict and older configs get the default."""
+    settings = OrganizationSettings(calendar_sync_horizon_days=30)
+    restored = OrganizationSettings.from_dict(settings.to_dict())
+    assert restored.calendar_sync_horizon_days == 30
+
+    legacy = OrganizationSettings.from_dict({"calendar_integration": {"enabled": True, "sync_interval": 3600}})
+    assert legacy.calendar_sync_horizon_days == 90
+
+
+def test_horizon_cutoff():
+    """The horizon is counted back from now, and 0 disables it."""
+    now = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    settings = OrganizationSettings(calendar_sync_horizon_days=10)
+    print(f"Horizon: {settings.calendar_sync_horizon(now)}")
+    assert settings.calendar_sync_horizon(now) == now - timedelta(days=10)
+    assert OrganizationSettings(calendar_sync_horizon_days=0).calendar_sync_horizon(now) is None
+
+
+if __name__ == "__main__":
+    test_horizon_round_trip()
+    test_horizon_cutoff()
+    print("All OrganizationSettings tests passed")
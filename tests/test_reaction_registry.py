@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the reaction listener registry.
+Checks keyed lookups, weakly held callbacks and listener expiry, and that reactions whose member
+cannot be resolved never reach the callbacks.
+"""
+
+import sys
+import os
+import gc
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.reactions import ReactionRegistry
+from modules.bot.discord_modules.cogs.HelperCog import HelperCog
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Cog:
+    def __init__(self):
+        self.enrolled = []
+
+    def enroll(self, member):
+        self.enrolled.append(member)
+
+
+def test_lookup_by_message_and_emoji():
+    registry = ReactionRegistry(clock=Clock())
+    cog = Cog()
+    registry.register(10, "✅", on_add=cog.enroll)
+    assert 10 in registry and 11 not in registry
+    assert registry.get(10, "❌") is None
+    registry.get(10, "✅").on_add("member")
+    assert cog.enrolled == ["member"]
+    assert registry.get(10, "✅").on_remove is None
+    assert registry.unregister(10, "✅") and len(registry) == 0
+
+
+def test_dead_callbacks_and_expired_listeners_are_dropped():
+    clock = Clock()
+    registry = ReactionRegistry(default_ttl=60, clock=clock)
+    cog = Cog()
+    registry.register(1, "✅", on_add=cog.enroll)
+    registry.register(2, "✅", on_add=cog.enroll, ttl=None)
+    registry.register(3, "✅", on_add=Cog().enroll, ttl=None)
+    gc.collect()
+    assert registry.get(3, "✅") is None
+
+    clock.now = 61
+    assert registry.purge_expired() == 1
+    assert 1 not in registry
+    assert registry.get(2, "✅") is not None
+
+
+class Guild:
+    """A server whose member cache is empty and that only knows ``members`` when fetching."""
+
+    def __init__(self, guild_id, members):
+        self.id = guild_id
+        self.members = members
+
+    def get_member(self, user_id):
+        return None
+
+    async def fetch_member(self, user_id):
+        if user_id not in self.members:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Member")
+        return SimpleNamespace(id=user_id, guild=self)
+
+
+def test_unresolved_members_are_not_passed_to_callbacks():
+    guild = Guild(1, members={7})
+    bot = SimpleNamespace(user=SimpleNamespace(id=99), get_guild=lambda guild_id: guild if guild_id == 1 else None)
+    helper = HelperCog(bot)
+    cog = Cog()
+    helper.reactions.register(10, "✅", on_add=cog.enroll, on_remove=cog.enroll)
+
+    def payload(user_id, guild_id):
+        return SimpleNamespace(message_id=10, emoji="✅", user_id=user_id, guild_id=guild_id, member=None)
+
+    # The user left the server, or the reaction came from a server the bot is not in
+    asyncio.run(helper.on_raw_reaction_add(payload(8, 1)))
+    asyncio.run(helper.on_raw_reaction_remove(payload(8, 1)))
+    asyncio.run(helper.on_raw_reaction_remove(payload(7, 2)))
+    assert cog.enrolled == []
+
+    asyncio.run(helper.on_raw_reaction_remove(payload(7, 1)))
+    assert [(member.id, member.guild.id) for member in cog.enrolled] == [(7, 1)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the scoreboard / gameboard render scheduler.
+Checks that bursts of updates become one edit, unchanged content is skipped and 429s are retried.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bot.discord_modules.ratelimit import RateLimitBucket
+from modules.bot.discord_modules.render_scheduler import RenderScheduler
+
+
+class RateLimited(Exception):
+    status = 429
+    retry_after = 0.05
+
+
+def test_burst_is_coalesced_and_unchanged_edits_are_skipped():
+    state = {"score": 0}
+    published = []
+
+    async def publish(payload):
+        published.append(payload)
+
+    async def scenario():
+        scheduler = RenderScheduler(window=0.05)
+        scheduler.register("scoreboard", lambda: dict(state), publish)
+        for _ in range(50):
+            state["score"] += 10
+            scheduler.mark_dirty("scoreboard")
+        await asyncio.sleep(0.2)
+        scheduler.mark_dirty("scoreboard")
+        await scheduler.flush()
+        return scheduler.stats
+
+    stats = asyncio.run(scenario())
+    print(f"Render stats: {stats}")
+    assert published == [{"score": 500}]
+    assert stats["unchanged"] == 1
+
+
+def test_rate_limits_delay_but_converge_to_latest_state():
+    state = {"score": 0}
+    published = []
+    attempts = []
+
+    async def publish(payload):
+        attempts.append(payload)
+        if len(attempts) == 2:
+            raise RateLimited()
+        published.append(payload)
+
+    async def scenario():
+        scheduler = RenderScheduler(window=0.0, rate=1, per=0.1)
+        scheduler.register("scoreboard", lambda: dict(state), publish)
+        for score in (1, 2, 3):
+            state["score"] = score
+            scheduler.mark_dirty("scoreboard")
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.5)
+        return scheduler.stats
+
+    stats = asyncio.run(scenario())
+    assert published[0] == {"score": 1}
+    assert published[-1] == {"score": 3}
+    assert stats["rate_limited"] == 1
+
+
+def test_bucket_window_and_block():
+    bucket = RateLimitBucket(2, 5.0)
+    bucket.consume(now=0.0)
+    bucket.consume(now=1.0)
+    assert bucket.delay(now=2.0) == 3.0
+    assert bucket.delay(now=5.5) == 0.0
+    bucket.block(10.0, now=6.0)
+    assert bucket.delay(now=6.0) == 10.0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script for persisted Notion sync runs.
+Checks the per-organization sync lock and its takeover once expired, that an interrupted run is
+resumed by a single worker from its checkpoints, and how the run status is aggregated.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.db import DBConnect
+from modules.organizations.models import Organization
+from modules.sync.models import SyncLock, SyncRun
+from modules.sync.service import SyncJobService, STALE_RUN_AFTER
+from modules.calendar import api as calendar_api
+from modules.merch.models import Order  # noqa: F401 - resolves the User.orders relationship
+
+
+class FakeCalendarService:
+    """Records calendar stage calls; ``results`` maps an organization ID to its sync result."""
+
+    def __init__(self):
+        self.calls = []
+        self.results = {}
+        self.on_sync = None
+
+    def sync_organization_notion_to_google(self, organization_id, parent_transaction=None, reconcile=False):
+        self.calls.append((organization_id, reconcile))
+        if self.on_sync:
+            self.on_sync(organization_id)
+        return self.results.get(organization_id, {
+            "status": "success", "message": "Synced", "events_processed": [{"status": "created"}, {"status": "unchanged"}]
+        })
+
+
+class FakeOCPSyncService:
+    def sync_organization(self, org, transaction=None):
+        return {"status": "success", "message": "Synced", "officers_created": 1, "points_created": 3}
+
+
+@pytest.fixture
+def db_connect():
+    db_connect = DBConnect("sqlite:///:memory:")
+    session = db_connect.SessionLocal()
+    for org_id in (1, 2, 3):
+        session.add(Organization(id=org_id, name=f"Org {org_id}", prefix=f"org{org_id}", guild_id=str(org_id),
+                                 notion_database_id=f"db-{org_id}", calendar_sync_enabled=True))
+    session.add(Organization(id=4, name="No Notion", prefix="org4", guild_id="4", calendar_sync_enabled=True))
+    session.commit()
+    session.close()
+    return db_connect
+
+
+def make_service(db_connect, worker_id):
+    service = SyncJobService(calendar_service=FakeCalendarService(), ocp_sync_service=FakeOCPSyncService())
+    service.db_connect = db_connect
+    service.worker_id = worker_id
+    return service
+
+
+def test_lock_is_exclusive_while_held(db_connect):
+    service = make_service(db_connect, "worker-a")
+    assert service.acquire_lock(1, "a")
+    assert not service.acquire_lock(1, "b")
+    assert not service.renew_lock(1, "b")
+    assert service.renew_lock(1, "a")
+    # Only the holder can release it, and other organizations are independent
+    service.release_lock(1, "b")
+    assert not service.acquire_lock(1, "b")
+    assert service.acquire_lock(2, "b")
+    service.release_lock(1, "a")
+    assert service.acquire_lock(1, "b")
+
+
+def test_expired_lock_is_taken_over_once(db_connect):
+    first, second = make_service(db_connect, "worker-a"), make_service(db_connect, "worker-b")
+    assert first.acquire_lock(1, "crashed")
+    session = db_connect.SessionLocal()
+    session.query(SyncLock).update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    session.commit()
+
+    assert [first.acquire_lock(1, "a"), second.acquire_lock(1, "b")] == [True, False]
+    assert session.query(SyncLock.owner).scalar() == "a"
+    # The previous holder has lost the lock and cannot renew or release it
+    assert not first.renew_lock(1, "crashed")
+    first.release_lock(1, "crashed")
+    assert session.query(SyncLock.owner).scalar() == "a"
+    session.close()
+
+
+def test_stale_run_is_resumed_by_one_worker_from_its_checkpoint(db_connect):
+    crashed, first, second = (make_service(db_connect, name) for name in ("worker-crashed", "worker-a", "worker-b"))
+    run_id = crashed.start_run("scheduled", organization_ids=[1, 2, 3, 4], stages=("calendar",))
+
+    # The crashed worker finished org 1 and died syncing org 2, leaving its lock behind
+    session = db_connect.SessionLocal()
+    run = session.get(SyncRun, run_id)
+    assert [cp.organization_id for cp in run.checkpoints] == [1, 2, 3]
+    run.checkpoints[0].status = "success"
+    run.checkpoints[0].stages = {"calendar": {"status": "success", "events_created": 5}}
+    run.checkpoints[1].status = "running"
+    long_ago = datetime.utcnow() - STALE_RUN_AFTER - timedelta(minutes=1)
+    run.heartbeat_at = long_ago
+    session.add(SyncLock(organization_id=2, owner="worker-crashed/run-1", acquired_at=long_ago, expires_at=long_ago))
+    session.commit()
+    session.close()
+
+    # A second worker polling while the run is being resumed must not pick it up as well
+    concurrent = []
+    first.calendar_service.on_sync = lambda organization_id: concurrent.append(second.resume_interrupted_runs())
+
+    results = first.resume_interrupted_runs()
+    assert [result["status"] for result in results] == ["success"]
+    assert first.calendar_service.calls == [(2, False), (3, False)]
+    assert concurrent == [[], []]
+    assert second.resume_interrupted_runs() == []
+    assert second.calendar_service.calls == []
+
+    run = first.get_run(run_id)
+    assert run["worker_id"] == "worker-a"
+    assert run["resume_count"] == 1
+    assert [cp["status"] for cp in run["organizations"]] == ["success", "success", "success"]
+    assert run["summary"]["events_created"] == 7
+    session = db_connect.SessionLocal()
+    assert session.query(SyncLock).count() == 0
+    session.close()
+
+
+def test_run_status_is_aggregated_from_checkpoints(db_connect):
+    service = make_service(db_connect, "worker-a")
+    service.calendar_service.results[2] = {"status": "error", "message": "Notion unavailable"}
+
+    result = service.run("manual", organization_ids=[1, 2, 3])
+    assert result["status"] == "partial_success"
+    run = result["run"]
+    assert [cp["status"] for cp in run["organizations"]] == ["success", "failed", "success"]
+    assert run["organizations"][1]["message"] == "calendar: Notion unavailable"
+    assert run["summary"] == {
+        "organizations_total": 3, "organizations_succeeded": 2, "organizations_failed": 1,
+        "organizations_skipped": 0, "events_created": 2, "events_updated": 0, "events_unchanged": 2,
+        "ocp_officers_created": 0, "ocp_points_created": 0
+    }
+
+    # An organization locked by another sync is skipped, which does not fail the run
+    assert service.acquire_lock(1, "someone-else")
+    result = service.run("manual", organization_ids=[1, 3])
+    assert result["status"] == "success"
+    assert [cp["status"] for cp in result["run"]["organizations"]] == ["skipped", "success"]
+    assert result["run"]["summary"]["organizations_skipped"] == 1
+
+    service.calendar_service.results[3] = {"status": "error", "message": "Quota exceeded"}
+    assert service.run("manual", organization_ids=[2, 3])["status"] == "failed"
+
+
+def test_manual_sync_requires_a_notion_database(db_connect, monkeypatch):
+    from shared import tokenManger
+
+    monkeypatch.setattr(calendar_api, "db_connect", db_connect)
+    app = Flask(__name__)
+    app.register_blueprint(calendar_api.calendar_blueprint, url_prefix="/api/calendar")
+    app.sync_job_service = make_service(db_connect, "worker-a")
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {tokenManger.generate_token('tester')}"}
+
+    response = client.post("/api/calendar/org4/sync", headers=headers)
+    assert response.status_code == 400
+    assert app.sync_job_service.list_runs() == []
+
+    response = client.post("/api/calendar/org1/sync?reconcile=true", headers=headers)
+    assert response.status_code == 200
+    assert app.sync_job_service.calendar_service.calls == [(1, True)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
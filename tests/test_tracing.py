@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the request-scoped tracing context.
+Checks that the current transaction and APIErrorHandler state do not leak between threads.
+"""
+
+import sys
+import os
+import logging
+import threading
+
+# Add the project root to the Python path to import modules properly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.utils.tracing import ContextLocal, finish_transaction, get_current_transaction, start_transaction
+from modules.calendar.errors import APIErrorHandler
+
+
+def test_current_transaction_is_per_thread():
+    """A transaction started in one thread is not visible in another, and is cleared when finished."""
+    transaction = start_transaction(op="test", name="main_thread")
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(get_current_transaction()))
+    worker.start()
+    worker.join()
+
+    assert get_current_transaction() is transaction
+    assert seen == [None]
+    finish_transaction(transaction)
+    assert get_current_transaction() is None
+
+
+def test_error_handler_state_is_isolated_between_threads():
+    """Concurrent requests assigning the shared handler's transaction each read back their own."""
+    handler = APIErrorHandler(logging.getLogger("tests.tracing"), "default_operation")
+    barrier = threading.Barrier(4)
+    results = {}
+
+    def request(index):
+        handler.transaction = f"transaction-{index}"
+        handler.operation_name = f"operation-{index}"
+        barrier.wait()
+        results[index] = (handler.transaction, handler.operation_name)
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"Per-thread handler state: {results}")
+    assert results == {i: (f"transaction-{i}", f"operation-{i}") for i in range(4)}
+    assert handler.transaction is None
+    assert handler.operation_name == "default_operation"
+
+
+def test_context_local_first_use_from_many_threads_creates_one_variable():
+    """Threads touching a fresh attribute at the same time all assign the same context variable."""
+    class Holder:
+        value = ContextLocal(default="unset")
+
+    holder = Holder()
+    barrier = threading.Barrier(8)
+    variables, results = set(), {}
+
+    def request(index):
+        barrier.wait()
+        holder.value = index
+        variables.add(id(holder.__dict__["_value_var"]))
+        results[index] = holder.value
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(variables) == 1
+    assert results == {i: i for i in range(8)}
+    assert holder.value == "unset"
+
+    # set_default creates the variable up front
+    other = Holder()
+    Holder.value.set_default(other, "configured")
+    assert "_value_var" in other.__dict__ and other.value == "configured"
+
+
+if __name__ == "__main__":
+    test_current_transaction_is_per_thread()
+    test_error_handler_state_is_isolated_between_threads()
+    test_context_local_first_use_from_many_threads_creates_one_variable()
+    print("All tracing tests passed.")